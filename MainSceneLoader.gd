@@ -15,6 +15,8 @@ var player: CharacterBody3D
 
 # Algorithm scenes loaded from external JSON file
 @export var algorithms_config_file: String = "res://algorithms.json"
+# Verified, minified catalog written by compile_catalog.py; preferred when present
+@export var compiled_catalog_file: String = "res://algorithms.min.json"
 var scene_paths = []
 
 func _ready():
@@ -91,6 +93,8 @@ func load_algorithm_scenes():
 
 func load_scenes_from_json():
 	"""Load algorithm scenes from the JSON configuration file"""
+	if load_scenes_from_compiled_catalog():
+		return
 	var file = FileAccess.open(algorithms_config_file, FileAccess.READ)
 	if file:
 		var json = JSON.new()
@@ -114,6 +118,28 @@ func load_scenes_from_json():
 		# Fallback to empty list if JSON fails
 		scene_paths = []
 
+func load_scenes_from_compiled_catalog() -> bool:
+	"""Load the catalog compile_catalog.py verified; its paths exist and are listed once.
+	Returns false when it is missing, unreadable or older than algorithms.json"""
+	if not FileAccess.file_exists(compiled_catalog_file):
+		return false
+	var data = JSON.parse_string(FileAccess.get_file_as_string(compiled_catalog_file))
+	if not data is Dictionary or not data.has("categories"):
+		print("Failed to parse compiled catalog: ", compiled_catalog_file)
+		return false
+	# Compiled from an older algorithms.json: the edited source wins
+	if FileAccess.file_exists(algorithms_config_file) and \
+			data.get("source_sha256", "") != FileAccess.get_sha256(algorithms_config_file):
+		print("Compiled catalog is out of date, loading ", algorithms_config_file)
+		return false
+	for category in data.categories:
+		for scene_path in data.categories[category]:
+			if is_3d_scene(scene_path):
+				algorithm_scenes.append(scene_path)
+				scene_paths.append(scene_path)  # Keep scene_paths for compatibility
+	print("Loaded %d scenes from %s" % [algorithm_scenes.size(), compiled_catalog_file])
+	return true
+
 func load_next_scene():
 	"""Load the next algorithm scene in the list"""
 	if algorithm_scenes.is_empty():
@@ -144,7 +170,7 @@ func load_scene_at_index(index: int):
 	var scene_path = algorithm_scenes[index]
 	print("Loading scene: ", scene_path)
 	
-	var scene_resource = load(scene_path)
+	var scene_resource = PreloadManifest.take(scene_path)
 	if scene_resource:
 		loaded_scene_instance = scene_resource.instantiate()
 		if loaded_scene_instance:
@@ -160,12 +186,20 @@ func load_scene_at_index(index: int):
 			
 			print("Successfully loaded: ", scene_path)
 			update_scene_info()
+			prefetch_next_scene()
 		else:
 			print("Failed to instantiate scene: ", scene_path)
 			loaded_scene_instance = null
 	else:
 		print("Failed to load scene resource: ", scene_path)
 
+func prefetch_next_scene():
+	"""Start loading the next scene's resources in the background"""
+	if algorithm_scenes.size() < 2:
+		return
+	var next_index = (current_scene_index + 1) % algorithm_scenes.size()
+	PreloadManifest.prefetch_scene(algorithm_scenes[next_index])
+
 func unload_current_scene():
 	"""Unload the currently loaded algorithm scene"""
 	if loaded_scene_instance:
@@ -504,7 +504,7 @@ func generate_pixel_sort_pattern(uv: Vector2, layer: int, t: float) -> Color:
 	if sort_trigger:
 		brightness = smoothstep(0.0, 1.0, uv.y + layer * 0.2)
 	
-	var sorted_color = (brightness + layer * 0.3) % 1.0
+	var sorted_color = fmod(brightness + layer * 0.3, 1.0)
 	
 	return Color(sorted_color, sorted_color * 0.8, sorted_color * 0.6, 0.7)
 
@@ -35,6 +35,12 @@ var step_names = [
 	"6. Compare Cross-Boundary Pairs",
 	"7. Show Final Result"
 ]
+@onready var points_node: Node3D = $Points
+@onready var distance_lines_node: Node3D = $DistanceLines
+@onready var division_line: CSGBox3D = $DivisionLine
+@onready var closest_pair_line: CSGCylinder3D = $ClosestPairLine
+@onready var algorithm_step_indicator: CSGBox3D = $AlgorithmStepIndicator
+@onready var complexity_indicator: CSGBox3D = $ComplexityIndicator
 
 func _ready():
 	generate_random_points()
@@ -44,7 +50,7 @@ func _ready():
 
 func generate_random_points():
 	points.clear()
-	for child in $Points.get_children():
+	for child in points_node.get_children():
 		child.queue_free()
 	point_objects.clear()
 	
@@ -60,7 +66,7 @@ func generate_random_points():
 		var point_sphere = CSGSphere3D.new()
 		point_sphere.radius = 0.2
 		point_sphere.position = Vector3(point.x, point.y, 0.1)
-		$Points.add_child(point_sphere)
+		points_node.add_child(point_sphere)
 		point_objects.append(point_sphere)
 		
 		# Add point labels
@@ -69,7 +75,7 @@ func generate_random_points():
 		label.font_size = 24
 		label.position = Vector3(point.x, point.y + 0.4, 0.1)
 		label.billboard = BaseMaterial3D.BILLBOARD_ENABLED
-		$Points.add_child(label)
+		points_node.add_child(label)
 
 func setup_materials():
 	# Point materials - more vibrant and visible
@@ -89,7 +95,7 @@ func setup_materials():
 	division_material.transparency = BaseMaterial3D.TRANSPARENCY_ALPHA
 	division_material.emission_enabled = true
 	division_material.emission = Color(0.5, 0.2, 0.0, 1.0)
-	$DivisionLine.material_override = division_material
+	division_line.material_override = division_material
 	
 	# Closest pair line material - more dramatic
 	var closest_material = StandardMaterial3D.new()
@@ -97,20 +103,20 @@ func setup_materials():
 	closest_material.emission_enabled = true
 	closest_material.emission = Color(0.8, 0.0, 0.0, 1.0)
 	closest_material.metallic = 0.8
-	$ClosestPairLine.material_override = closest_material
+	closest_pair_line.material_override = closest_material
 	
 	# Indicator materials
 	var step_material = StandardMaterial3D.new()
 	step_material.albedo_color = Color(0.0, 1.0, 0.6, 1.0)
 	step_material.emission_enabled = true
 	step_material.emission = Color(0.0, 0.4, 0.2, 1.0)
-	$AlgorithmStepIndicator.material_override = step_material
+	algorithm_step_indicator.material_override = step_material
 	
 	var complexity_material = StandardMaterial3D.new()
 	complexity_material.albedo_color = Color(1.0, 0.6, 0.0, 1.0)
 	complexity_material.emission_enabled = true
 	complexity_material.emission = Color(0.5, 0.3, 0.0, 1.0)
-	$ComplexityIndicator.material_override = complexity_material
+	complexity_indicator.material_override = complexity_material
 
 func setup_ui():
 	# Create step label
@@ -246,7 +252,7 @@ func animate_distance_comparison():
 
 func create_temporary_distance_line(i: int, j: int, distance: float):
 	# Remove old temporary lines
-	for child in $DistanceLines.get_children():
+	for child in distance_lines_node.get_children():
 		child.queue_free()
 	
 	# Create new temporary line
@@ -275,7 +281,7 @@ func create_temporary_distance_line(i: int, j: int, distance: float):
 	temp_material.emission = Color(0.5, 0.5, 0.0, 1.0)
 	line.material_override = temp_material
 	
-	$DistanceLines.add_child(line)
+	distance_lines_node.add_child(line)
 
 func update_ui():
 	if step_labels.size() >= 2:
@@ -316,8 +322,8 @@ func create_coordinate_grid():
 func show_division():
 	# Show division line at median x-coordinate
 	var median_x = points[points.size() / 2].x
-	$DivisionLine.position.x = median_x
-	$DivisionLine.visible = true
+	division_line.position.x = median_x
+	division_line.visible = true
 
 func highlight_left_half():
 	var median_x = points[points.size() / 2].x
@@ -350,7 +356,7 @@ func highlight_right_half():
 
 func highlight_closest_pair():
 	# Clear temporary distance lines
-	for child in $DistanceLines.get_children():
+	for child in distance_lines_node.get_children():
 		child.queue_free()
 	
 	# Reset all points to default color first
@@ -379,40 +385,40 @@ func highlight_closest_pair():
 		var line_center = Vector3((point1.x + point2.x) * 0.5, (point1.y + point2.y) * 0.5, 0.1)
 		var line_length = point1.distance_to(point2)
 		
-		$ClosestPairLine.position = line_center
-		$ClosestPairLine.height = line_length
-		$ClosestPairLine.radius = 0.15  # Make line thicker
+		closest_pair_line.position = line_center
+		closest_pair_line.height = line_length
+		closest_pair_line.radius = 0.15  # Make line thicker
 		
 		# Orient line between points
 		var direction = Vector3(point2.x - point1.x, point2.y - point1.y, 0).normalized()
 		if direction != Vector3.UP:
 			var axis = Vector3.UP.cross(direction).normalized()
 			var angle = acos(Vector3.UP.dot(direction))
-			$ClosestPairLine.transform.basis = Basis(axis, angle)
+			closest_pair_line.transform.basis = Basis(axis, angle)
 		
-		$ClosestPairLine.visible = true
+		closest_pair_line.visible = true
 
 func clear_distance_lines():
-	for child in $DistanceLines.get_children():
+	for child in distance_lines_node.get_children():
 		child.queue_free()
 	distance_lines.clear()
-	$ClosestPairLine.visible = false
-	$DivisionLine.visible = false
+	closest_pair_line.visible = false
+	division_line.visible = false
 
 func animate_algorithm_visualization():
 	# Animate division line with more prominent effect
-	if $DivisionLine.visible:
+	if division_line.visible:
 		var pulse = 1.0 + sin(time * 6.0) * 0.2
-		$DivisionLine.scale.y = pulse
+		division_line.scale.y = pulse
 		# Add slight rotation for more visual interest
-		$DivisionLine.rotation.z = sin(time * 2.0) * 0.1
+		division_line.rotation.z = sin(time * 2.0) * 0.1
 	
 	# Animate closest pair line with dramatic pulsing
-	if $ClosestPairLine.visible:
+	if closest_pair_line.visible:
 		var pulse = 1.0 + sin(time * 8.0) * 0.3
-		$ClosestPairLine.scale = Vector3(pulse, 1.0, pulse)
+		closest_pair_line.scale = Vector3(pulse, 1.0, pulse)
 		# Add glow effect
-		var material = $ClosestPairLine.material_override as StandardMaterial3D
+		var material = closest_pair_line.material_override as StandardMaterial3D
 		material.emission = Color(0.8, 0.0, 0.0, 1.0) * (1.0 + sin(time * 10.0) * 0.5)
 	
 	# Enhanced floating animation for points
@@ -428,15 +434,15 @@ func animate_algorithm_visualization():
 func animate_indicators():
 	# Algorithm step indicator
 	var step_height = (algorithm_step + 1) * 0.3
-	$AlgorithmStepIndicator.size.y = step_height
-	$AlgorithmStepIndicator.position.y = -4 + step_height/2
+	algorithm_step_indicator.size.y = step_height
+	algorithm_step_indicator.position.y = -4 + step_height/2
 	
 	# Complexity indicator (O(n log n))
 	var complexity_height = log(point_count) * 0.5
-	$ComplexityIndicator.size.y = complexity_height
-	$ComplexityIndicator.position.y = -4 + complexity_height/2
+	complexity_indicator.size.y = complexity_height
+	complexity_indicator.position.y = -4 + complexity_height/2
 	
 	# Pulsing effect
 	var pulse = 1.0 + sin(time * 3.0) * 0.1
-	$AlgorithmStepIndicator.scale.x = pulse
-	$ComplexityIndicator.scale.x = pulse
+	algorithm_step_indicator.scale.x = pulse
+	complexity_indicator.scale.x = pulse
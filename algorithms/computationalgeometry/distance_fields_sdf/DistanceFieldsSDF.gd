@@ -5,6 +5,8 @@ var field_resolution = 40
 var field_size = 8.0
 var sdf_points = []
 var primitive_shapes = []
+@onready var field_resolution_node: CSGCylinder3D = $FieldResolution
+@onready var distance_range: CSGBox3D = $DistanceRange
 
 func _ready():
 	create_primitive_shapes()
@@ -119,8 +121,8 @@ func _process(delta):
 func animate_indicators():
 	# Field resolution indicator
 	var resolution_height = (field_resolution / 50.0) * 2.0 + 0.5
-	$FieldResolution.height = resolution_height
-	$FieldResolution.position.y = -3 + resolution_height/2
+	field_resolution_node.height = resolution_height
+	field_resolution_node.position.y = -3 + resolution_height/2
 	
 	# Distance range indicator  
 	var max_distance = 0.0
@@ -128,5 +130,5 @@ func animate_indicators():
 		max_distance = max(max_distance, abs(point.distance))
 	
 	var range_height = min(max_distance / 5.0, 1.0) * 2.0 + 0.5
-	$DistanceRange.size.y = range_height
-	$DistanceRange.position.y = -3 + range_height/2
+	distance_range.size.y = range_height
+	distance_range.position.y = -3 + range_height/2
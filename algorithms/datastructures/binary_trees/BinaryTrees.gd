@@ -21,6 +21,10 @@ var current_operation = TreeOperation.INSERT
 var search_target = 0
 var traversal_order = []
 var current_traversal_index = 0
+@onready var tree_nodes_node: Node3D = $TreeNodes
+@onready var root_marker_node: CSGCylinder3D = $RootMarker
+@onready var traversal_indicator_node: CSGBox3D = $TraversalIndicator
+@onready var height_indicator_node: CSGCylinder3D = $HeightIndicator
 
 # Tree node class
 class TreeNode:
@@ -227,7 +231,7 @@ func create_visual_node(node: TreeNode):
 	sphere.material_override = node_material
 	
 	# FIXED: Use get_node_or_null for safer node access
-	var tree_nodes = get_node_or_null("TreeNodes")
+	var tree_nodes = tree_nodes_node
 	if tree_nodes:
 		tree_nodes.add_child(sphere)
 	else:
@@ -255,7 +259,7 @@ func calculate_positions():
 	
 	# Update root marker
 	if root and root.visual_object:
-		var root_marker = get_node_or_null("RootMarker")
+		var root_marker = root_marker_node
 		if root_marker and root_marker is Node3D:
 			root_marker.position = Vector3(root.visual_object.position.x, root.visual_object.position.y + 1, 0)
 
@@ -459,7 +463,7 @@ func animate_delete_highlighting():
 
 func animate_indicators():
 	# Traversal indicator
-	var traversal_indicator = get_node_or_null("TraversalIndicator")
+	var traversal_indicator = traversal_indicator_node
 	if traversal_indicator and traversal_indicator is CSGBox3D:
 		var traversal_height = (int(current_operation) + 1) * 0.3
 		traversal_indicator.size.y = traversal_height
@@ -470,7 +474,7 @@ func animate_indicators():
 		traversal_indicator.scale.x = pulse
 	
 	# Height indicator (tree height)
-	var height_indicator = get_node_or_null("HeightIndicator")
+	var height_indicator = height_indicator_node
 	if height_indicator and height_indicator is CSGBox3D:
 		var tree_height = get_tree_height()
 		var height_indicator_height = tree_height * 0.4 + 0.5
@@ -7,6 +7,10 @@ var time := 0.0
 var construction_step := 0
 var max_depth := 4
 var current_depth := 0
+@onready var construction_process: Node3D = $ConstructionProcess
+@onready var traversal_demo: Node3D = $TraversalDemo
+@onready var space_partitions: Node3D = $SpacePartitions
+@onready var bsp_tree_structure: Node3D = $BSPTreeStructure
 
 # BSP Tree structure
 class BSPNode:
@@ -84,7 +88,7 @@ func create_initial_space():
 	container.add_child(initial_box)
 
 func animate_construction_process():
-	var container = $ConstructionProcess
+	var container = construction_process
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -125,7 +129,7 @@ func show_construction_step(container: Node3D, step: int):
 					container.add_child(region)
 
 func demonstrate_traversal():
-	var container = $TraversalDemo
+	var container = traversal_demo
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -195,7 +199,7 @@ func show_traversal_path(container: Node3D, query_point: Vector3):
 			current_region.size[axis] *= 0.5
 
 func visualize_space_partitions():
-	var container = $SpacePartitions
+	var container = space_partitions
 	
 	# Clear old partitions except the first (base) box
 	var children = container.get_children()
@@ -229,7 +233,7 @@ func visualize_space_partitions():
 		container.add_child(plane)
 
 func update_tree_structure():
-	var container = $BSPTreeStructure
+	var container = bsp_tree_structure
 	
 	# Clear previous tree visualization
 	for child in container.get_children():
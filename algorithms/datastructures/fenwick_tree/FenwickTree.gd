@@ -13,6 +13,10 @@ var fenwick_tree := []
 var current_query_index := 0
 var current_update_index := 0
 var update_value := 0
+@onready var binary_indexed_tree: Node3D = $BinaryIndexedTree
+@onready var prefix_sums: Node3D = $PrefixSums
+@onready var update_visualization: Node3D = $UpdateVisualization
+@onready var binary_representation: Node3D = $BinaryRepresentation
 
 func _ready():
 	initialize_fenwick_tree()
@@ -58,7 +62,7 @@ func range_query(left: int, right: int) -> int:
 		return query_fenwick(right) - query_fenwick(left - 1)
 
 func visualize_binary_indexed_tree():
-	var container = $BinaryIndexedTree
+	var container = binary_indexed_tree
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -124,7 +128,7 @@ func show_responsibility_connections(container: Node3D, index: int):
 		container.add_child(connection)
 
 func show_prefix_sum_calculation():
-	var container = $PrefixSums
+	var container = prefix_sums
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -173,7 +177,7 @@ func show_prefix_sum_calculation():
 	container.add_child(result_sphere)
 
 func demonstrate_update_operation():
-	var container = $UpdateVisualization
+	var container = update_visualization
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -227,7 +231,7 @@ func demonstrate_update_operation():
 		container.add_child(element)
 
 func show_binary_representation():
-	var container = $BinaryRepresentation
+	var container = binary_representation
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -16,6 +16,10 @@ var weighted_graph := {}
 var node_positions := []
 var traversal_order := []
 var visited_nodes := {}
+@onready var directed_graph_node: Node3D = $DirectedGraph
+@onready var undirected_graph_node: Node3D = $UndirectedGraph
+@onready var weighted_graph_node: Node3D = $WeightedGraph
+@onready var graph_traversal: Node3D = $GraphTraversal
 
 func _ready():
 	initialize_graphs()
@@ -78,7 +82,7 @@ func setup_node_positions():
 		node_positions.append(pos)
 
 func animate_directed_graph():
-	var container = $DirectedGraph
+	var container = directed_graph_node
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -106,7 +110,7 @@ func animate_directed_graph():
 			create_directed_edge(container, node_positions[from_node], node_positions[to_node])
 
 func animate_undirected_graph():
-	var container = $UndirectedGraph
+	var container = undirected_graph_node
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -139,7 +143,7 @@ func animate_undirected_graph():
 				processed_edges[edge_key] = true
 
 func animate_weighted_graph():
-	var container = $WeightedGraph
+	var container = weighted_graph_node
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -259,7 +263,7 @@ func create_weighted_edge(container: Node3D, from_pos: Vector3, to_pos: Vector3,
 	container.add_child(weight_label)
 
 func demonstrate_graph_traversal():
-	var container = $GraphTraversal
+	var container = graph_traversal
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -18,6 +18,11 @@ enum HashOperation {
 }
 
 var current_operation = HashOperation.INSERT
+@onready var hash_buckets: Node3D = $HashBuckets
+@onready var collision_chains: Node3D = $CollisionChains
+@onready var hash_function_node: CSGBox3D = $HashFunction
+@onready var load_factor_indicator_node: CSGCylinder3D = $LoadFactorIndicator
+@onready var collision_indicator: CSGSphere3D = $CollisionIndicator
 
 # Bucket class to represent hash table buckets
 class HashBucket:
@@ -46,7 +51,7 @@ func _ready():
 	insert_initial_data()
 
 func setup_hash_buckets():
-	var bucket_parent = $HashBuckets
+	var bucket_parent = hash_buckets
 	
 	for i in range(bucket_count):
 		var bucket = HashBucket.new(i)
@@ -186,7 +191,7 @@ func create_visual_element(pair: KeyValuePair, bucket: HashBucket):
 	element_material.emission = element_material.albedo_color * 0.4
 	sphere.material_override = element_material
 	
-	$HashBuckets.add_child(sphere)
+	hash_buckets.add_child(sphere)
 	pair.visual_object = sphere
 	
 	# Create chain connection if this is not the first element
@@ -215,7 +220,7 @@ func create_chain_connection(bucket: HashBucket, position: int):
 	chain_material.emission = Color(0.2, 0.2, 0.05, 1.0)
 	chain_link.material_override = chain_material
 	
-	$CollisionChains.add_child(chain_link)
+	collision_chains.add_child(chain_link)
 	bucket.chain_visuals.append(chain_link)
 
 func update_bucket_display(bucket: HashBucket):
@@ -278,9 +283,9 @@ func rehash_table():
 	buckets.clear()
 	
 	# Remove all visual objects
-	for child in $HashBuckets.get_children():
+	for child in hash_buckets.get_children():
 		child.queue_free()
-	for child in $CollisionChains.get_children():
+	for child in collision_chains.get_children():
 		child.queue_free()
 	
 	# Double bucket count
@@ -323,7 +328,7 @@ func get_load_factor() -> float:
 func animate_hash_map():
 	# Animate hash function
 	var hash_pulse = 1.0 + sin(time * 4.0) * 0.2
-	$HashFunction.scale = Vector3.ONE * hash_pulse
+	hash_function_node.scale = Vector3.ONE * hash_pulse
 	
 	# Animate elements based on current operation
 	match current_operation:
@@ -387,7 +392,7 @@ func animate_indicators():
 	# Load factor indicator
 	var load_factor = get_load_factor()
 	var load_height = load_factor * 3.0 + 0.5
-	var load_factor_indicator = get_node_or_null("LoadFactorIndicator")
+	var load_factor_indicator = load_factor_indicator_node
 	if load_factor_indicator and load_factor_indicator is CSGBox3D:
 		load_factor_indicator.size.y = load_height
 		load_factor_indicator.position.y = -3 + load_height/2
@@ -395,18 +400,18 @@ func animate_indicators():
 	# Collision indicator
 	var collision_ratio = min(1.0, collision_count / 5.0)
 	var collision_scale = 1.0 + collision_ratio * 2.0
-	$CollisionIndicator.scale = Vector3.ONE * collision_scale
+	collision_indicator.scale = Vector3.ONE * collision_scale
 	
 	# Color change based on collisions
-	var collision_material = $CollisionIndicator.material_override as StandardMaterial3D
+	var collision_material = collision_indicator.material_override as StandardMaterial3D
 	if collision_material:
 		collision_material.albedo_color = Color(1.0, 1.0 - collision_ratio, 1.0 - collision_ratio, 1.0)
 		collision_material.emission = collision_material.albedo_color * 0.5
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 3.0) * 0.1
-	$LoadFactorIndicator.scale.x = pulse
+	load_factor_indicator_node.scale.x = pulse
 	
 	# Hash function animation
 	var hash_rotation = time * 45.0
-	$HashFunction.rotation_degrees.y = hash_rotation
+	hash_function_node.rotation_degrees.y = hash_rotation
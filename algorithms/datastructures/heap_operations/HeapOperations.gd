@@ -19,6 +19,11 @@ enum HeapOperation {
 }
 
 var current_operation = HeapOperation.INSERT
+@onready var heap_nodes_node: Node3D = $HeapNodes
+@onready var heap_edges_node: Node3D = $HeapEdges
+@onready var heap_type_indicator: CSGBox3D = $HeapTypeIndicator
+@onready var operation_indicator_node: CSGCylinder3D = $OperationIndicator
+@onready var heap_size_indicator: CSGSphere3D = $HeapSizeIndicator
 
 # Heap node visual representation
 class HeapNodeVisual:
@@ -251,7 +256,7 @@ func create_visual_node(node_visual: HeapNodeVisual):
 	node_material.emission = node_material.albedo_color * 0.4
 	sphere.material_override = node_material
 	
-	$HeapNodes.add_child(sphere)
+	heap_nodes_node.add_child(sphere)
 	node_visual.visual_object = sphere
 
 func rebuild_visual_heap():
@@ -353,7 +358,7 @@ func create_heap_edge(parent_index: int, child_index: int):
 	edge_material.emission = Color(0.2, 0.2, 0.2, 1.0)
 	edge.material_override = edge_material
 	
-	$HeapEdges.add_child(edge)
+	heap_edges_node.add_child(edge)
 	heap_edges.append(edge)
 
 func animate_heap():
@@ -423,10 +428,10 @@ func animate_type_switch():
 func animate_indicators():
 	# Heap type indicator
 	var type_text_scale = 1.0 + sin(time * 3.0) * 0.1
-	$HeapTypeIndicator.scale = Vector3.ONE * type_text_scale
+	heap_type_indicator.scale = Vector3.ONE * type_text_scale
 	
 	# Update heap type indicator color
-	var type_material = $HeapTypeIndicator.material_override as StandardMaterial3D
+	var type_material = heap_type_indicator.material_override as StandardMaterial3D
 	if type_material:
 		if is_max_heap:
 			type_material.albedo_color = Color(1.0, 0.3, 0.3, 1.0)
@@ -437,16 +442,16 @@ func animate_indicators():
 	
 	# Operation indicator
 	var op_height = (current_operation + 1) * 0.2 + 0.3
-	var operation_indicator = get_node_or_null("OperationIndicator")
+	var operation_indicator = operation_indicator_node
 	if operation_indicator and operation_indicator is CSGCylinder3D:
 		operation_indicator.height = op_height
 		operation_indicator.position.y = 3 + op_height/2
 	
 	# Heap size indicator
 	var size_scale = 1.0 + (heap_array.size() / 15.0) * 0.8
-	$HeapSizeIndicator.scale = Vector3.ONE * size_scale
+	heap_size_indicator.scale = Vector3.ONE * size_scale
 	
 	# Pulsing operation indicator
 	var op_pulse = 1.0 + sin(time * 4.0) * 0.2
-	$OperationIndicator.scale.x = op_pulse
-	$OperationIndicator.scale.z = op_pulse
+	operation_indicator_node.scale.x = op_pulse
+	operation_indicator_node.scale.z = op_pulse
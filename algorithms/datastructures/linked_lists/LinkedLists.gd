@@ -20,6 +20,11 @@ enum ListOperation {
 
 var current_operation = ListOperation.INSERT_HEAD
 var search_target = 0
+@onready var list_nodes_node: Node3D = $ListNodes
+@onready var list_pointers_node: Node3D = $ListPointers
+@onready var head_pointer_node: CSGCylinder3D = $HeadPointer
+@onready var operation_indicator_node: CSGBox3D = $OperationIndicator
+@onready var list_size_indicator_node: CSGCylinder3D = $ListSizeIndicator
 
 # Node data
 class ListNode:
@@ -178,7 +183,7 @@ func create_visual_node(node: ListNode):
 	sphere.material_override = node_material
 	
 	# FIXED: Use get_node_or_null for safer node access
-	var list_nodes = get_node_or_null("ListNodes")
+	var list_nodes = list_nodes_node
 	if list_nodes:
 		list_nodes.add_child(sphere)
 	else:
@@ -195,7 +200,7 @@ func update_node_positions():
 
 func update_pointers():
 	# Clear existing pointers
-	var list_pointers = get_node_or_null("ListPointers")
+	var list_pointers = list_pointers_node
 	if list_pointers:
 		for child in list_pointers.get_children():
 			child.queue_free()
@@ -206,7 +211,7 @@ func update_pointers():
 		create_pointer(i, i + 1)
 	
 	# Update head pointer position - FIXED: Check if it's a Node3D
-	var head_pointer = get_node_or_null("HeadPointer")
+	var head_pointer = head_pointer_node
 	if head_pointer and head_pointer is Node3D:
 		if nodes.size() > 0:
 			head_pointer.position = Vector3(-6 + 0 * node_spacing, 1.5, 0)
@@ -232,7 +237,7 @@ func create_pointer(from_index: int, to_index: int):
 	pointer.material_override = pointer_material
 	
 	# FIXED: Use get_node_or_null for safer node access
-	var list_pointers = get_node_or_null("ListPointers")
+	var list_pointers = list_pointers_node
 	if list_pointers:
 		list_pointers.add_child(pointer)
 	else:
@@ -288,7 +293,7 @@ func animate_list():
 		pointer.scale = Vector3(pointer_pulse, 1.0, pointer_pulse)
 	
 	# Animate head pointer - FIXED: Check if it's a Node3D
-	var head_pointer = get_node_or_null("HeadPointer")
+	var head_pointer = head_pointer_node
 	if head_pointer and head_pointer is Node3D:
 		var head_pulse = 1.0 + sin(time * 5.0) * 0.2
 		head_pointer.scale = Vector3.ONE * head_pulse
@@ -296,7 +301,7 @@ func animate_list():
 func animate_indicators():
 	# Operation indicator - FIXED: Check if it's a Node3D before setting position
 	var op_height = (int(current_operation) + 1) * 0.3
-	var operation_indicator = get_node_or_null("OperationIndicator")
+	var operation_indicator = operation_indicator_node
 	if operation_indicator and operation_indicator is CSGCylinder3D:
 		operation_indicator.height = op_height
 		if operation_indicator is Node3D:
@@ -304,7 +309,7 @@ func animate_indicators():
 	
 	# List size indicator - FIXED: Check if it's a Node3D before setting position
 	var size_height = nodes.size() * 0.2 + 0.5
-	var list_size_indicator = get_node_or_null("ListSizeIndicator")
+	var list_size_indicator = list_size_indicator_node
 	if list_size_indicator and list_size_indicator is CSGCylinder3D:
 		list_size_indicator.height = size_height
 		if list_size_indicator is Node3D:
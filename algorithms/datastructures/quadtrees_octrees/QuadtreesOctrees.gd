@@ -5,6 +5,10 @@ extends Node3D
 
 var time := 0.0
 var insertion_timer := 0.0
+@onready var quadtree_visualization: Node3D = $QuadtreeVisualization
+@onready var octree_visualization: Node3D = $OctreeVisualization
+@onready var spatial_queries: Node3D = $SpatialQueries
+@onready var dynamic_insertion: Node3D = $DynamicInsertion
 
 # Quadtree structure (2D)
 class QuadNode:
@@ -71,7 +75,7 @@ func create_initial_points():
 		oct_points.append(Vector3(randf_range(-4.5, 4.5), randf_range(-4.5, 4.5), randf_range(-4.5, 4.5)))
 
 func animate_quadtree():
-	var container = $QuadtreeVisualization
+	var container = quadtree_visualization
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -106,7 +110,7 @@ func animate_quadtree():
 		container.add_child(point_marker)
 
 func animate_octree():
-	var container = $OctreeVisualization
+	var container = octree_visualization
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -297,7 +301,7 @@ func visualize_octree(container: Node3D, node: OctNode, depth: int):
 			visualize_octree(container, child, depth + 1)
 
 func demonstrate_spatial_queries():
-	var container = $SpatialQueries
+	var container = spatial_queries
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -336,7 +340,7 @@ func demonstrate_spatial_queries():
 	container.add_child(query_3d)
 
 func show_dynamic_insertion():
-	var container = $DynamicInsertion
+	var container = dynamic_insertion
 	
 	# Clear previous visualization
 	for child in container.get_children():
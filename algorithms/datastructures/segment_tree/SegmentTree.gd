@@ -17,6 +17,10 @@ var query_left := 0
 var query_right := 3
 var update_index := 0
 var update_value := 0
+@onready var tree_structure: Node3D = $TreeStructure
+@onready var array_representation: Node3D = $ArrayRepresentation
+@onready var range_queries: Node3D = $RangeQueries
+@onready var update_operations: Node3D = $UpdateOperations
 
 func _ready():
 	# Create necessary containers if they don't exist
@@ -100,7 +104,7 @@ func update_tree(node: int, start: int, end: int, index: int, value: int):
 		segment_tree[node] = segment_tree[left_child] + segment_tree[right_child]
 
 func animate_tree_structure():
-	var container = get_node_or_null("TreeStructure")
+	var container = tree_structure
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -214,7 +218,7 @@ func create_tree_connection(container: Node3D, from: Vector3, to: Vector3):
 	container.add_child(connection)
 
 func show_array_representation():
-	var container = get_node_or_null("ArrayRepresentation")
+	var container = array_representation
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -249,7 +253,7 @@ func show_array_representation():
 		container.add_child(index_label)
 
 func demonstrate_range_queries():
-	var container = get_node_or_null("RangeQueries")
+	var container = range_queries
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -302,7 +306,7 @@ func demonstrate_range_queries():
 	container.add_child(result_display)
 
 func show_update_operations():
-	var container = get_node_or_null("UpdateOperations")
+	var container = update_operations
 	
 	# Clear previous visualization
 	for child in container.get_children():
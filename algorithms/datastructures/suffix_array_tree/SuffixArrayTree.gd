@@ -9,6 +9,10 @@ var text := "BANANA$"
 var pattern := "ANA"
 var suffix_array := []
 var lcp_array := []  # Longest Common Prefix array
+@onready var suffix_array_node: Node3D = $SuffixArray
+@onready var suffix_tree: Node3D = $SuffixTree
+@onready var pattern_matching: Node3D = $PatternMatching
+@onready var string_processing: Node3D = $StringProcessing
 
 # Suffix tree structure (simplified)
 class SuffixNode:
@@ -134,7 +138,7 @@ func insert_suffix(node: SuffixNode, suffix_start: int):
 			insert_suffix(child, suffix_start + common_length)
 
 func visualize_suffix_array():
-	var container = $SuffixArray
+	var container = suffix_array_node
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -198,7 +202,7 @@ func show_suffix_chars(container: Node3D, chars: String, position: Vector3):
 		container.add_child(char_cube)
 
 func visualize_suffix_tree():
-	var container = $SuffixTree
+	var container = suffix_tree
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -286,7 +290,7 @@ func create_tree_edge(container: Node3D, from: Vector3, to: Vector3, edge_char:
 	container.add_child(char_label)
 
 func demonstrate_pattern_matching():
-	var container = $PatternMatching
+	var container = pattern_matching
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -347,7 +351,7 @@ func demonstrate_pattern_matching():
 		container.add_child(pattern_cube)
 
 func show_string_processing():
-	var container = $StringProcessing
+	var container = string_processing
 	
 	# Clear previous visualization
 	for child in container.get_children():
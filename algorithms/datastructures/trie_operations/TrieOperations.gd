@@ -17,6 +17,11 @@ enum TrieOperation {
 }
 
 var current_operation = TrieOperation.INSERT_WORD
+@onready var trie_nodes: Node3D = $TrieNodes
+@onready var trie_edges_node: Node3D = $TrieEdges
+@onready var word_counter: CSGBox3D = $WordCounter
+@onready var prefix_indicator: CSGCylinder3D = $PrefixIndicator
+@onready var root_node: CSGSphere3D = $RootNode
 
 # Trie node structure
 class TrieNode:
@@ -255,7 +260,7 @@ func create_visual_node(node: TrieNode):
 	node_material.emission = node_material.albedo_color * 0.3
 	sphere.material_override = node_material
 	
-	$TrieNodes.add_child(sphere)
+	trie_nodes.add_child(sphere)
 	node.visual_object = sphere
 
 func calculate_positions():
@@ -330,7 +335,7 @@ func create_trie_edge(parent: TrieNode, child: TrieNode):
 	edge_material.emission = edge_material.albedo_color * 0.2
 	edge.material_override = edge_material
 	
-	$TrieEdges.add_child(edge)
+	trie_edges_node.add_child(edge)
 	trie_edges.append(edge)
 
 func update_end_of_word_visuals():
@@ -396,21 +401,21 @@ func animate_autocomplete():
 func animate_indicators():
 	# Word counter
 	var counter_height = word_count * 0.2 + 0.5
-	$WordCounter.size.y = counter_height
-	$WordCounter.position.y = -3 + counter_height/2
+	word_counter.size.y = counter_height
+	word_counter.position.y = -3 + counter_height/2
 	
 	# Prefix indicator
 	var prefix_height = search_path.size() * 0.15 + 0.3
-	var prefixindicator = get_node_or_null("PrefixIndicator")
+	var prefixindicator = prefix_indicator
 	if prefixindicator and prefixindicator is CSGCylinder3D:
 		prefixindicator.height = prefix_height
 		prefixindicator.position.y = -3 + prefix_height/2
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 3.0) * 0.1
-	$WordCounter.scale.x = pulse
-	$PrefixIndicator.scale.x = pulse
+	word_counter.scale.x = pulse
+	prefix_indicator.scale.x = pulse
 	
 	# Root node special animation
 	var root_pulse = 1.0 + sin(time * 2.0) * 0.2
-	$RootNode.scale = Vector3.ONE * root_pulse
+	root_node.scale = Vector3.ONE * root_pulse
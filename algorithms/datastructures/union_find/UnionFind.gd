@@ -16,6 +16,9 @@ enum UFOperation {
 }
 
 var current_operation = UFOperation.MAKE_SET
+@onready var connections_node: Node3D = $Connections
+@onready var component_indicator: CSGBox3D = $ComponentIndicator
+@onready var union_operation_indicator: CSGCylinder3D = $UnionOperationIndicator
 
 # Union-Find element
 class UFElement:
@@ -236,7 +239,7 @@ func create_connection(element1: UFElement, element2: UFElement):
 	connection_material.emission = Color(0.2, 0.2, 0.05, 1.0)
 	connection.material_override = connection_material
 	
-	$Connections.add_child(connection)
+	connections_node.add_child(connection)
 	connections.append(connection)
 
 func clear_connections():
@@ -324,22 +327,22 @@ func get_path_to_root_length(element: UFElement) -> int:
 func animate_indicators():
 	# Component count indicator
 	var component_height = components_count * 0.3 + 0.5
-	var componentindicator = get_node_or_null("ComponentIndicator")
+	var componentindicator = component_indicator
 	if componentindicator and componentindicator is CSGCylinder3D:
 		componentindicator.height = component_height
 		componentindicator.position.y = -4 + component_height/2
 	
 	# Union operation indicator
 	var union_height = (current_operation + 1) * 0.2 + 0.3
-	var unionoperationindicator = get_node_or_null("UnionOperationIndicator")
+	var unionoperationindicator = union_operation_indicator
 	if unionoperationindicator and unionoperationindicator is CSGCylinder3D:
 		unionoperationindicator.height = union_height
 		unionoperationindicator.position.y = -4 + union_height/2
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 3.0) * 0.1
-	$ComponentIndicator.scale.x = pulse
-	$UnionOperationIndicator.scale.x = pulse
+	component_indicator.scale.x = pulse
+	union_operation_indicator.scale.x = pulse
 	
 	# Animate connections
 	for connection in connections:
@@ -9,6 +9,8 @@ var spring_strength = 0.1
 var repulsion_strength = 50.0
 var damping = 0.9
 var total_energy = 0.0
+@onready var force_indicator_node: CSGCylinder3D = $ForceIndicator
+@onready var energy_level: CSGBox3D = $EnergyLevel
 
 class ForceGraphNode:
 	var id: int
@@ -273,14 +275,14 @@ func animate_indicators():
 		avg_force /= nodes.size()
 	
 	var force_height = min(avg_force / 10.0, 1.0) * 2.0 + 0.5
-	var force_indicator = get_node_or_null("ForceIndicator")
+	var force_indicator = force_indicator_node
 	if force_indicator and force_indicator is CSGBox3D:
 		force_indicator.size.y = force_height
 		force_indicator.position.y = -3 + force_height/2
 	
 	# Energy level indicator
 	var energy_height = min(total_energy / 100.0, 1.0) * 2.0 + 0.5
-	var energy_indicator = get_node_or_null("EnergyLevel")
+	var energy_indicator = energy_level
 	if energy_indicator and energy_indicator is CSGBox3D:
 		energy_indicator.size.y = energy_height
 		energy_indicator.position.y = -3 + energy_height/2
@@ -16,6 +16,10 @@ var grammar_rules := {
 
 var derivation_history := []
 var parse_tree_nodes := []
+@onready var grammar_rules_node: Node3D = $GrammarRules
+@onready var parse_tree: Node3D = $ParseTree
+@onready var derivation_process: Node3D = $DerivationProcess
+@onready var language_generation: Node3D = $LanguageGeneration
 
 func _ready():
 	initialize_grammar()
@@ -63,7 +67,7 @@ func apply_derivation_step():
 		derivation_history.append(current_string)
 
 func visualize_grammar_rules():
-	var container = $GrammarRules
+	var container = grammar_rules_node
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -113,7 +117,7 @@ func visualize_grammar_rules():
 		rule_index += 1
 
 func show_parse_tree():
-	var container = $ParseTree
+	var container = parse_tree
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -177,7 +181,7 @@ func create_parse_tree_recursive(container: Node3D, symbol: String, position: Ve
 			create_parse_tree_recursive(container, child_symbol, child_pos, depth + 1, max_depth, child_spacing)
 
 func demonstrate_derivation():
-	var container = $DerivationProcess
+	var container = derivation_process
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -210,7 +214,7 @@ func demonstrate_derivation():
 			container.add_child(symbol_cube)
 
 func display_language_generation():
-	var container = $LanguageGeneration
+	var container = language_generation
 	
 	# Clear previous visualization
 	for child in container.get_children():
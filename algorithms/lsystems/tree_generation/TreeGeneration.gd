@@ -20,6 +20,10 @@ var rules = {
 var turtle_stack = []
 var branch_segments = []
 var leaf_positions = []
+@onready var tree_branches: Node3D = $TreeBranches
+@onready var tree_leaves: Node3D = $TreeLeaves
+@onready var generation_indicator: CSGBox3D = $GenerationIndicator
+@onready var rule_display: CSGBox3D = $RuleDisplay
 
 func _ready():
 	setup_materials()
@@ -55,9 +59,9 @@ func generate_initial_tree():
 
 func clear_tree():
 	# Clear existing branches and leaves
-	for child in $TreeBranches.get_children():
+	for child in tree_branches.get_children():
 		child.queue_free()
-	for child in $TreeLeaves.get_children():
+	for child in tree_leaves.get_children():
 		child.queue_free()
 	
 	branch_segments.clear()
@@ -141,7 +145,7 @@ func create_branch_segment(start_pos, end_pos, thickness):
 	branch_material.emission = Color(0.1 * brown_intensity, 0.05 * brown_intensity, 0.02 * brown_intensity, 1.0)
 	branch.material_override = branch_material
 	
-	$TreeBranches.add_child(branch)
+	tree_branches.add_child(branch)
 	branch_segments.append(branch)
 
 func create_leaf(position):
@@ -157,7 +161,7 @@ func create_leaf(position):
 	leaf_material.emission = Color(0.05, 0.2 * green_variation, 0.08, 1.0)
 	leaf.material_override = leaf_material
 	
-	$TreeLeaves.add_child(leaf)
+	tree_leaves.add_child(leaf)
 	leaf_positions.append(leaf)
 
 func _process(delta):
@@ -204,14 +208,14 @@ func animate_growth():
 func animate_indicators():
 	# Generation indicator height
 	var gen_height = (generation + 1) * 0.3
-	var generationindicator = get_node_or_null("GenerationIndicator")
+	var generationindicator = generation_indicator
 	if generationindicator and generationindicator is CSGCylinder3D:
 		generationindicator.height = gen_height
 		generationindicator.position.y = -2 + gen_height/2
 	
 	# Rule display pulsing
 	var pulse = 1.0 + sin(time * 3.0) * 0.2
-	$RuleDisplay.scale = Vector3.ONE * pulse
+	rule_display.scale = Vector3.ONE * pulse
 	
 	# Gentle swaying of leaves
 	for leaf in leaf_positions:
@@ -40,6 +40,9 @@ var _mat_output := StandardMaterial3D.new()
 var _mat_matrix := StandardMaterial3D.new()
 var _mat_focus := StandardMaterial3D.new()
 var _mat_qkv := StandardMaterial3D.new()
+@onready var query_core: MeshInstance3D = $QueryKeyValue/QueryCore
+@onready var key_core: MeshInstance3D = $QueryKeyValue/KeyCore
+@onready var value_core: MeshInstance3D = $QueryKeyValue/ValueCore
 
 func _ready() -> void:
 	_setup_materials()
@@ -205,9 +208,9 @@ func _animate_input_tokens(delta: float) -> void:
 
 func _animate_qkv(delta: float) -> void:
 	var nodes := [
-		$QueryKeyValue/QueryCore,
-		$QueryKeyValue/KeyCore,
-		$QueryKeyValue/ValueCore
+		query_core,
+		key_core,
+		value_core
 	]
 	var speeds := [1.0, 0.8, 1.2]
 	for i in range(nodes.size()):
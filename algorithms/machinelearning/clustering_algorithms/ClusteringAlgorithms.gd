@@ -8,6 +8,12 @@ var silhouette_score: float = 0.0
 var particle_count: int = 15
 var flow_particles: Array = []
 var cluster_particles: Array = []
+@onready var centroid1core: CSGSphere3D = $Centroids/Centroid1/Centroid1Core
+@onready var centroid2core: CSGSphere3D = $Centroids/Centroid2/Centroid2Core
+@onready var centroid3core: CSGSphere3D = $Centroids/Centroid3/Centroid3Core
+@onready var algorithm_core_node: CSGBox3D = $ClusteringAlgorithm/AlgorithmCore
+@onready var inertia_indicator_node: CSGSphere3D = $TrainingMetrics/InertiaMeter/InertiaIndicator
+@onready var silhouette_indicator_node: CSGSphere3D = $TrainingMetrics/SilhouetteMeter/SilhouetteIndicator
 
 func _ready():
 	# Initialize Clustering Algorithms visualization
@@ -110,7 +116,7 @@ func animate_clusters(delta):
 
 func animate_centroids(delta):
 	# Animate centroid cores
-	var centroids = [$Centroids/Centroid1/Centroid1Core, $Centroids/Centroid2/Centroid2Core, $Centroids/Centroid3/Centroid3Core]
+	var centroids = [centroid1core, centroid2core, centroid3core]
 	
 	for i in range(centroids.size()):
 		var centroid = centroids[i]
@@ -129,7 +135,7 @@ func animate_centroids(delta):
 
 func animate_clustering_algorithm(delta):
 	# Animate clustering algorithm core
-	var algorithm_core = $ClusteringAlgorithm/AlgorithmCore
+	var algorithm_core = algorithm_core_node
 	if algorithm_core:
 		# Rotate algorithm
 		algorithm_core.rotation.y += delta * 0.4
@@ -169,7 +175,7 @@ func animate_data_flow(delta):
 
 func update_training_metrics(delta):
 	# Update inertia meter
-	var inertia_indicator = $TrainingMetrics/InertiaMeter/InertiaIndicator
+	var inertia_indicator = inertia_indicator_node
 	if inertia_indicator:
 		var target_x = lerp(-2, 2, 1.0 - inertia_score)
 		inertia_indicator.position.x = lerp(inertia_indicator.position.x, target_x, delta * 2.0)
@@ -180,7 +186,7 @@ func update_training_metrics(delta):
 		inertia_indicator.material_override.albedo_color = Color(red_component, green_component, 0.2, 1)
 	
 	# Update silhouette meter
-	var silhouette_indicator = $TrainingMetrics/SilhouetteMeter/SilhouetteIndicator
+	var silhouette_indicator = silhouette_indicator_node
 	if silhouette_indicator:
 		var target_x = lerp(-2, 2, silhouette_score)
 		silhouette_indicator.position.x = lerp(silhouette_indicator.position.x, target_x, delta * 2.0)
@@ -6,6 +6,12 @@ var training_progress: float = 0.0
 var accuracy: float = 0.0
 var grid_size: int = 6
 var layers: Array = []
+@onready var image_grid: Node3D = $InputImage/ImageGrid
+@onready var kernel1: Node3D = $Kernels/Kernel1
+@onready var kernel2: Node3D = $Kernels/Kernel2
+@onready var feature_map1: Node3D = $FeatureMaps/FeatureMap1
+@onready var feature_map2: Node3D = $FeatureMaps/FeatureMap2
+@onready var accuracy_indicator_node: CSGSphere3D = $TrainingMetrics/AccuracyMeter/AccuracyIndicator
 
 func _ready():
 	# Initialize CNN visualization
@@ -182,7 +188,7 @@ func setup_training_metrics():
 
 func animate_image_grids(delta):
 	# Animate input image with some variation
-	var input_grid = $InputImage/ImageGrid
+	var input_grid = image_grid
 	for i in range(input_grid.get_child_count()):
 		var pixel = input_grid.get_child(i)
 		if pixel:
@@ -195,7 +201,7 @@ func animate_image_grids(delta):
 
 func animate_kernels(delta):
 	# Animate kernels with sliding motion
-	var kernels = [$Kernels/Kernel1, $Kernels/Kernel2]
+	var kernels = [kernel1, kernel2]
 	for kernel_idx in range(kernels.size()):
 		var kernel = kernels[kernel_idx]
 		if kernel:
@@ -212,7 +218,7 @@ func animate_kernels(delta):
 
 func animate_feature_maps(delta):
 	# Animate feature maps with activation patterns
-	var feature_maps = [$FeatureMaps/FeatureMap1, $FeatureMaps/FeatureMap2]
+	var feature_maps = [feature_map1, feature_map2]
 	for map_idx in range(feature_maps.size()):
 		var feature_map = feature_maps[map_idx]
 		if feature_map:
@@ -237,7 +243,7 @@ func animate_feature_maps(delta):
 
 func update_training_metrics(delta):
 	# Update accuracy meter
-	var accuracy_indicator = $TrainingMetrics/AccuracyMeter/AccuracyIndicator
+	var accuracy_indicator = accuracy_indicator_node
 	if accuracy_indicator:
 		var target_x = lerp(-6, 6, accuracy)
 		accuracy_indicator.position.x = lerp(accuracy_indicator.position.x, target_x, delta * 2.0)
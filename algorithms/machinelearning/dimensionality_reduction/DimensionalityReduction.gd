@@ -9,6 +9,11 @@ var particle_count: int = 25
 var flow_particles: Array = []
 var high_dim_particles: Array = []
 var low_dim_particles: Array = []
+@onready var algorithm_core_node: CSGBox3D = $ReductionAlgorithm/AlgorithmCore
+@onready var pca_core_node: CSGSphere3D = $ReductionAlgorithm/ReductionProcess/PCACore
+@onready var tsne_core_node: CSGSphere3D = $ReductionAlgorithm/ReductionProcess/TSNECore
+@onready var variance_indicator_node: CSGSphere3D = $ReductionMetrics/VarianceExplained/VarianceIndicator
+@onready var error_indicator_node: CSGSphere3D = $ReductionMetrics/ReconstructionError/ErrorIndicator
 
 func _ready():
 	# Initialize Dimensionality Reduction visualization
@@ -120,7 +125,7 @@ func animate_high_dimensional_data(delta):
 
 func animate_reduction_algorithm(delta):
 	# Animate reduction algorithm core
-	var algorithm_core = $ReductionAlgorithm/AlgorithmCore
+	var algorithm_core = algorithm_core_node
 	if algorithm_core:
 		# Rotate algorithm
 		algorithm_core.rotation.y += delta * 0.5
@@ -135,7 +140,7 @@ func animate_reduction_algorithm(delta):
 			algorithm_core.material_override.emission = Color(0.2, 0.8, 0.2, 1) * intensity
 	
 	# Animate PCA core
-	var pca_core = $ReductionAlgorithm/ReductionProcess/PCACore
+	var pca_core = pca_core_node
 	if pca_core:
 		pca_core.rotation.y += delta * 0.8
 		var pca_activation = sin(time * 1.5) * 0.5 + 0.5
@@ -149,7 +154,7 @@ func animate_reduction_algorithm(delta):
 			pca_core.material_override.emission = Color(0.8, 0.2, 0.2, 1) * intensity
 	
 	# Animate t-SNE core
-	var tsne_core = $ReductionAlgorithm/ReductionProcess/TSNECore
+	var tsne_core = tsne_core_node
 	if tsne_core:
 		tsne_core.rotation.y += delta * 1.0
 		var tsne_activation = cos(time * 1.8) * 0.5 + 0.5
@@ -204,7 +209,7 @@ func animate_data_flow(delta):
 
 func update_reduction_metrics(delta):
 	# Update variance explained meter
-	var variance_indicator = $ReductionMetrics/VarianceExplained/VarianceIndicator
+	var variance_indicator = variance_indicator_node
 	if variance_indicator:
 		var target_x = lerp(-2, 2, variance_explained)
 		variance_indicator.position.x = lerp(variance_indicator.position.x, target_x, delta * 2.0)
@@ -215,7 +220,7 @@ func update_reduction_metrics(delta):
 		variance_indicator.material_override.albedo_color = Color(red_component, green_component, 0.2, 1)
 	
 	# Update reconstruction error meter
-	var error_indicator = $ReductionMetrics/ReconstructionError/ErrorIndicator
+	var error_indicator = error_indicator_node
 	if error_indicator:
 		var target_x = lerp(-2, 2, 1.0 - reconstruction_error)
 		error_indicator.position.x = lerp(error_indicator.position.x, target_x, delta * 2.0)
@@ -9,6 +9,11 @@ var kill_radius = 8.0
 var sticking_radius = 0.3
 var particle_timer = 0.0
 var particle_interval = 0.1
+@onready var walking_particles_node: Node3D = $WalkingParticles
+@onready var aggregate_structure: Node3D = $AggregateStructure
+@onready var seed: CSGSphere3D = $Seed
+@onready var particle_count: CSGCylinder3D = $ParticleCount
+@onready var structure_size_node = $StructureSize
 
 class WalkingParticle:
 	var position: Vector2
@@ -55,7 +60,7 @@ func initialize_dla():
 	walking_particles.clear()
 	
 	# Clear existing structure
-	for child in $AggregateStructure.get_children():
+	for child in aggregate_structure.get_children():
 		child.queue_free()
 	
 	# Create initial seed visualization
@@ -94,7 +99,7 @@ func spawn_random_particle():
 	walking_material.emission = Color(0.3, 0.3, 0.1, 1.0)
 	particle_sphere.material_override = walking_material
 	
-	$WalkingParticles.add_child(particle_sphere)
+	walking_particles_node.add_child(particle_sphere)
 	particle.visual_object = particle_sphere
 	
 	walking_particles.append(particle)
@@ -159,7 +164,7 @@ func create_aggregate_point(position: Vector2, generation: int):
 	aggregate_material.emission = aggregate_material.albedo_color * 0.5
 	point_sphere.material_override = aggregate_material
 	
-	$AggregateStructure.add_child(point_sphere)
+	aggregate_structure.add_child(point_sphere)
 
 func animate_dla():
 	# Animate walking particles
@@ -168,8 +173,8 @@ func animate_dla():
 		particle.visual_object.scale = Vector3.ONE * pulse
 	
 	# Animate aggregate structure
-	for i in range($AggregateStructure.get_child_count()):
-		var aggregate_point = $AggregateStructure.get_child(i)
+	for i in range(aggregate_structure.get_child_count()):
+		var aggregate_point = aggregate_structure.get_child(i)
 		var wave = sin(time * 4.0 + i * 0.1) * 0.1
 		aggregate_point.position.z = wave
 		
@@ -179,24 +184,24 @@ func animate_dla():
 	
 	# Animate seed
 	var seed_pulse = 1.0 + sin(time * 6.0) * 0.3
-	$Seed.scale = Vector3.ONE * seed_pulse
+	seed.scale = Vector3.ONE * seed_pulse
 
 func animate_indicators():
 	# Particle count indicator
 	var active_particles = walking_particles.size()
 	var particle_height = (float(active_particles) / max_particles) * 2.0 + 0.5
-	$ParticleCount.height = particle_height
-	$ParticleCount.position.y = -3 + particle_height/2
+	particle_count.height = particle_height
+	particle_count.position.y = -3 + particle_height/2
 	
 	# Structure size indicator
 	var structure_size = aggregate_points.size()
 	var max_structure = 200  # Rough estimate
 	var structure_height = (float(structure_size) / max_structure) * 2.0 + 0.5
-	$StructureSize.height = structure_height
-	$StructureSize.position.y = -3 + structure_height/2
+	structure_size_node.height = structure_height
+	structure_size_node.position.y = -3 + structure_height/2
 	
 	# Update structure size color based on growth
-	var structure_material = $StructureSize.material_override as StandardMaterial3D
+	var structure_material = structure_size_node.material_override as StandardMaterial3D
 	if structure_material:
 		var growth_intensity = float(structure_size) / 50.0
 		structure_material.albedo_color = Color(
@@ -209,8 +214,8 @@ func animate_indicators():
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 4.0) * 0.1
-	$ParticleCount.scale.x = pulse
-	$StructureSize.scale.x = pulse
+	particle_count.scale.x = pulse
+	structure_size_node.scale.x = pulse
 	
 	# Reset if structure gets too large
 	if aggregate_points.size() > 150:
@@ -13,6 +13,9 @@ enum TileType {
 	KITE,
 	DART
 }
+@onready var penrose_tiles: Node3D = $PenroseTiles
+@onready var iteration_control: CSGCylinder3D = $IterationControl
+@onready var tile_count_node: CSGBox3D = $TileCount
 
 class PenroseTile:
 	var type: TileType
@@ -148,7 +151,7 @@ func subdivide_dart(dart: PenroseTile) -> Array:
 	return [new_kite, new_dart]
 
 func clear_visual_tiles():
-	for child in $PenroseTiles.get_children():
+	for child in penrose_tiles.get_children():
 		child.queue_free()
 
 func update_visual_representation():
@@ -224,12 +227,12 @@ func create_visual_tile(tile: PenroseTile):
 	tile_mesh.material_override = tile_material
 	tile.visual_object = tile_mesh
 	
-	$PenroseTiles.add_child(tile_mesh)
+	penrose_tiles.add_child(tile_mesh)
 
 func animate_penrose_tiling():
 	# Animate tiles with subtle effects
-	for i in range($PenroseTiles.get_child_count()):
-		var tile_visual = $PenroseTiles.get_child(i)
+	for i in range(penrose_tiles.get_child_count()):
+		var tile_visual = penrose_tiles.get_child(i)
 		
 		# Gentle pulsing
 		var pulse = 1.0 + sin(time * 3.0 + i * 0.2) * 0.1
@@ -241,23 +244,23 @@ func animate_penrose_tiling():
 func animate_indicators():
 	# Iteration control
 	var iter_height = (current_iteration + 1) * 0.4 + 0.5
-	$IterationControl.height = iter_height
-	$IterationControl.position.y = -3 + iter_height/2
+	iteration_control.height = iter_height
+	iteration_control.position.y = -3 + iter_height/2
 	
 	# Tile count indicator
 	var tile_count = tiles.size()
 	var max_tiles = 1000  # Rough estimate
 	var count_height = (float(tile_count) / max_tiles) * 2.0 + 0.5
-	$TileCount.size.y = count_height
-	$TileCount.position.y = -3 + count_height/2
+	tile_count_node.size.y = count_height
+	tile_count_node.position.y = -3 + count_height/2
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 4.0) * 0.1
-	$IterationControl.scale.x = pulse
-	$TileCount.scale.x = pulse
+	iteration_control.scale.x = pulse
+	tile_count_node.scale.x = pulse
 	
 	# Update colors based on iteration
-	var iter_material = $IterationControl.material_override as StandardMaterial3D
+	var iter_material = iteration_control.material_override as StandardMaterial3D
 	if iter_material:
 		var intensity = float(current_iteration) / max_iterations
 		iter_material.albedo_color = Color(
@@ -21,6 +21,10 @@ var affects = [
 	{"name": "surprise", "intensity": 0.9, "transmission": 0.7, "color": Color(0.9, 0.9, 0.2)},
 	{"name": "disgust", "intensity": 0.6, "transmission": 0.4, "color": Color(0.4, 0.8, 0.2)}
 ]
+@onready var emotional_bodies_node: Node3D = $EmotionalBodies
+@onready var affective_transmission: Node3D = $AffectiveTransmission
+@onready var intensity_flows: Node3D = $IntensityFlows
+@onready var digital_touch: Node3D = $DigitalTouch
 
 class EmotionalBody:
 	var position: Vector3
@@ -98,7 +102,7 @@ func update_emotional_states():
 		level.current = lerp(level.current, level.target, 0.1)
 
 func simulate_emotional_bodies():
-	var container = $EmotionalBodies
+	var container = emotional_bodies_node
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -295,7 +299,7 @@ func get_emotional_deformation(affect_name: String, index: int) -> Vector3:
 			return base_scale
 
 func visualize_affective_transmission():
-	var container = $AffectiveTransmission
+	var container = affective_transmission
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -337,7 +341,7 @@ func visualize_affective_transmission():
 			i += 1
 
 func demonstrate_intensity_flows():
-	var container = $IntensityFlows
+	var container = intensity_flows
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -387,7 +391,7 @@ func demonstrate_intensity_flows():
 				container.add_child(intensity_pillar)
 
 func show_digital_touch_responses():
-	var container = $DigitalTouch
+	var container = digital_touch
 	
 	# Clear previous visualization
 	for child in container.get_children():
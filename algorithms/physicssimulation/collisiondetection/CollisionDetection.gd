@@ -10,6 +10,8 @@ var paused = false
 var show_spatial_grid = true
 var spatial_grid_size = 2.0
 var spatial_grid = {}
+@onready var collision_info: Node3D = $CollisionInfo
+@onready var spatial_grid_node: Node3D = $SpatialGrid
 
 func _ready():
 	_initialize_objects()
@@ -169,7 +171,7 @@ func _highlight_potential_collision(obj1, obj2):
 	indicator.position = (obj1.position + obj2.position) / 2
 	indicator.position.y += 1.0
 	
-	$CollisionInfo.add_child(indicator)
+	collision_info.add_child(indicator)
 
 func _visualize_collision(obj1, obj2):
 	# Create visual indicator for actual collision
@@ -184,15 +186,15 @@ func _visualize_collision(obj1, obj2):
 	indicator.position = (obj1.position + obj2.position) / 2
 	indicator.position.y += 1.5
 	
-	$CollisionInfo.add_child(indicator)
+	collision_info.add_child(indicator)
 
 func _clear_collision_visuals():
-	for child in $CollisionInfo.get_children():
+	for child in collision_info.get_children():
 		child.queue_free()
 
 func _update_spatial_grid():
 	# Show/hide spatial grid
-	$SpatialGrid.visible = show_spatial_grid
+	spatial_grid_node.visible = show_spatial_grid
 
 func _connect_ui():
 	$UI/VBoxContainer/ResetButton.pressed.connect(_on_reset_pressed)
@@ -23,6 +23,9 @@ var pendulum_angle = PI / 4
 var pendulum_angular_velocity = 0.0
 var pendulum_length = 3.0
 var pendulum_damping = 0.98
+@onready var hinge_system_node: Node3D = $ConstraintSystems/HingeSystem
+@onready var slider_system_node: Node3D = $ConstraintSystems/SliderSystem
+@onready var pendulum_system_node: Node3D = $ConstraintSystems/PendulumSystem
 
 func _ready():
 	_connect_ui()
@@ -86,7 +89,7 @@ func _update_pendulum_system(delta):
 
 func _update_constraint_visualization():
 	# Update hinge system
-	var hinge_system = $ConstraintSystems/HingeSystem
+	var hinge_system = hinge_system_node
 	var arm1 = hinge_system.get_node("HingeJoint/Arm1")
 	var arm2 = hinge_system.get_node("HingeJoint/Arm2")
 	
@@ -94,13 +97,13 @@ func _update_constraint_visualization():
 	arm2.rotation.z = -hinge_angle * 0.5
 	
 	# Update slider system
-	var slider_system = $ConstraintSystems/SliderSystem
+	var slider_system = slider_system_node
 	var slider_block = slider_system.get_node("SliderTrack/SliderBlock")
 	
 	slider_block.position.x = slider_position
 	
 	# Update pendulum system
-	var pendulum_system = $ConstraintSystems/PendulumSystem
+	var pendulum_system = pendulum_system_node
 	var pendulum_bob = pendulum_system.get_node("PendulumString/PendulumBob")
 	
 	var bob_x = pendulum_length * sin(pendulum_angle)
@@ -18,6 +18,7 @@ var fluid_drag_center: Node3D
 
 var time: float = 0.0
 var spawn_timer: float = 0.0
+@onready var fluid_drag_particles_node: Node3D = $FluidDragField/FluidDragParticles
 
 func _ready() -> void:
 	randomize()
@@ -54,7 +55,7 @@ func spawn_new_particle() -> void:
 		randf_range(-spawn_distance, spawn_distance),
 		randf_range(-spawn_distance, spawn_distance)
 	)
-	$FluidDragField/FluidDragParticles.add_child(p)
+	fluid_drag_particles_node.add_child(p)
 	fluid_drag_particles.append(p)
 	particle_velocity.append(Vector3.ZERO)
 	particle_ages.append(0.0)
@@ -17,6 +17,10 @@ var bounce_factor := 1.5
 var squish_responsiveness := 2.0
 var color_vibrancy := 1.0
 var playful_gravity := -5.0
+@onready var tactile_interactions: Node3D = $TactileInteractions
+@onready var joyful_responses: Node3D = $JoyfulResponses
+@onready var playful_physics: Node3D = $PlayfulPhysics
+@onready var emotional_resonance: Node3D = $EmotionalResonance
 
 class SoftObject:
 	var position: Vector3
@@ -99,7 +103,7 @@ func update_joy_level():
 	joy_level = lerp(joy_level, clamp(interaction_activity, 0.2, 1.0), 0.1)
 
 func simulate_tactile_interactions():
-	var container = $TactileInteractions
+	var container = tactile_interactions
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -214,7 +218,7 @@ func create_soft_body_visualization(container: Node3D, soft_obj: SoftObject):
 	container.add_child(soft_sphere)
 
 func animate_joyful_responses():
-	var container = $JoyfulResponses
+	var container = joyful_responses
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -271,7 +275,7 @@ func animate_joyful_responses():
 		container.add_child(joy_wave)
 
 func create_playful_physics():
-	var container = $PlayfulPhysics
+	var container = playful_physics
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -387,7 +391,7 @@ func create_playground_element(container: Node3D, element_name: String, base_pos
 			container.add_child(fulcrum)
 
 func visualize_emotional_resonance():
-	var container = $EmotionalResonance
+	var container = emotional_resonance
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -20,6 +20,11 @@ var insertion_index := 0
 var deletion_index := 0
 var search_target := 0
 var search_index := 0
+@onready var insertion_demo: Node3D = $DataManipulation/InsertionDemo
+@onready var deletion_demo: Node3D = $DataManipulation/DeletionDemo
+@onready var search_demo: Node3D = $DataManipulation/SearchDemo
+@onready var indexing_visualization: Node3D = $IndexingVisualization
+@onready var access_patterns: Node3D = $AccessPatterns
 
 func _ready():
 	initialize_arrays()
@@ -181,7 +186,7 @@ func demonstrate_operations(delta):
 			demonstrate_search()
 
 func demonstrate_insertion():
-	var container = $DataManipulation/InsertionDemo
+	var container = insertion_demo
 	
 	# Clear previous demonstration
 	for child in container.get_children():
@@ -209,7 +214,7 @@ func demonstrate_insertion():
 	insertion_index = (insertion_index + 1) % 8
 
 func demonstrate_deletion():
-	var container = $DataManipulation/DeletionDemo
+	var container = deletion_demo
 	
 	# Clear previous demonstration
 	for child in container.get_children():
@@ -233,7 +238,7 @@ func demonstrate_deletion():
 	deletion_index = (deletion_index + 1) % 8
 
 func demonstrate_search():
-	var container = $DataManipulation/SearchDemo
+	var container = search_demo
 	
 	# Clear previous demonstration
 	for child in container.get_children():
@@ -268,7 +273,7 @@ func demonstrate_search():
 		search_target = randi() % 8
 
 func update_indexing_visualization():
-	var container = $IndexingVisualization
+	var container = indexing_visualization
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -301,7 +306,7 @@ func update_indexing_visualization():
 		container.add_child(pointer)
 
 func show_access_patterns():
-	var container = $AccessPatterns
+	var container = access_patterns
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -302,16 +302,14 @@ func create_cylinder_subtraction(combiner: CSGCombiner3D):
 	var cylinder = CSGCylinder3D.new()
 	cylinder.name = "BaseCylinder"
 	cylinder.height = 2.0
-	cylinder.top_radius = 1.0
-	cylinder.bottom_radius = 1.0
+	cylinder.radius = 1.0
 	combiner.add_child(cylinder)
 	
 	for i in range(8):
 		var small_cyl = CSGCylinder3D.new()
 		small_cyl.name = "SubCylinder" + str(i)
 		small_cyl.height = 2.5
-		small_cyl.top_radius = 0.15
-		small_cyl.bottom_radius = 0.15
+		small_cyl.radius = 0.15
 		small_cyl.operation = CSGShape3D.OPERATION_SUBTRACTION
 		var angle = i * PI / 4
 		small_cyl.position = Vector3(cos(angle) * 0.6, 0, sin(angle) * 0.6)
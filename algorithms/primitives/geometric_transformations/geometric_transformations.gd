@@ -14,6 +14,13 @@ enum TransformationType {
 }
 
 var current_transformation = TransformationType.ROTATION
+@onready var point: CSGSphere3D = $Point
+@onready var line: CSGCylinder3D = $Line
+@onready var plane: CSGBox3D = $Plane
+@onready var cube: Node3D = $Cube
+@onready var rotation_indicator: CSGCylinder3D = $TransformationControls/RotationIndicator
+@onready var scale_indicator: CSGBox3D = $TransformationControls/ScaleIndicator
+@onready var translation_indicator: CSGSphere3D = $TransformationControls/TranslationIndicator
 
 func _ready():
 	setup_materials()
@@ -74,21 +81,21 @@ func setup_materials():
 
 func setup_initial_transforms():
 	# Reset all objects to base positions
-	$Point.position = Vector3(-6, 0, 0)
-	$Line.position = Vector3(-2, 0, 0)
-	$Plane.position = Vector3(2, 0, 0)
-	$Cube.position = Vector3(6, 0, 0)
+	point.position = Vector3(-6, 0, 0)
+	line.position = Vector3(-2, 0, 0)
+	plane.position = Vector3(2, 0, 0)
+	cube.position = Vector3(6, 0, 0)
 	
 	# Reset scales and rotations
-	$Point.scale = Vector3.ONE
-	$Line.scale = Vector3.ONE
-	$Plane.scale = Vector3.ONE
-	$Cube.scale = Vector3.ONE
+	point.scale = Vector3.ONE
+	line.scale = Vector3.ONE
+	plane.scale = Vector3.ONE
+	cube.scale = Vector3.ONE
 	
-	$Point.rotation = Vector3.ZERO
-	$Line.rotation = Vector3.ZERO
-	$Plane.rotation = Vector3.ZERO
-	$Cube.rotation = Vector3.ZERO
+	point.rotation = Vector3.ZERO
+	line.rotation = Vector3.ZERO
+	plane.rotation = Vector3.ZERO
+	cube.rotation = Vector3.ZERO
 
 func _process(delta):
 	time += delta
@@ -126,56 +133,56 @@ func apply_transformations():
 func apply_rotation_transformations(progress):
 	# Point: Simple pulsing (0D -> can't really rotate, so pulse instead)
 	var pulse = 1.0 + sin(time * 4.0) * 0.3
-	$Point.scale = Vector3.ONE * pulse
+	point.scale = Vector3.ONE * pulse
 	
 	# Line: Rotate around Y-axis
-	$Line.rotation.y = progress * PI * 2.0
+	line.rotation.y = progress * PI * 2.0
 	
 	# Plane: Rotate around X and Z axes
-	$Plane.rotation.x = progress * PI
-	$Plane.rotation.z = progress * PI * 0.5
+	plane.rotation.x = progress * PI
+	plane.rotation.z = progress * PI * 0.5
 	
 	# Cube: Complex rotation around multiple axes
-	$Cube.rotation.x = progress * PI * 1.5
-	$Cube.rotation.y = progress * PI * 2.0
-	$Cube.rotation.z = progress * PI * 0.75
+	cube.rotation.x = progress * PI * 1.5
+	cube.rotation.y = progress * PI * 2.0
+	cube.rotation.z = progress * PI * 0.75
 
 func apply_scaling_transformations(progress):
 	# Point: Scale uniformly
 	var scale_factor = 1.0 + progress * 2.0
-	$Point.scale = Vector3.ONE * scale_factor
+	point.scale = Vector3.ONE * scale_factor
 	
 	# Line: Scale length (Y-axis)
-	$Line.scale.y = 1.0 + progress * 2.0
+	line.scale.y = 1.0 + progress * 2.0
 	
 	# Plane: Non-uniform scaling
-	$Plane.scale.x = 1.0 + progress * 1.5
-	$Plane.scale.z = 1.0 + progress * 0.5
+	plane.scale.x = 1.0 + progress * 1.5
+	plane.scale.z = 1.0 + progress * 0.5
 	
 	# Cube: Asymmetric scaling
-	$Cube.scale.x = 1.0 + sin(progress * PI) * 1.0
-	$Cube.scale.y = 1.0 + cos(progress * PI) * 1.0
-	$Cube.scale.z = 1.0 + progress * 0.8
+	cube.scale.x = 1.0 + sin(progress * PI) * 1.0
+	cube.scale.y = 1.0 + cos(progress * PI) * 1.0
+	cube.scale.z = 1.0 + progress * 0.8
 
 func apply_translation_transformations(progress):
 	var base_positions = [Vector3(-6, 0, 0), Vector3(-2, 0, 0), Vector3(2, 0, 0), Vector3(6, 0, 0)]
 	
 	# Point: Linear motion
-	$Point.position = base_positions[0] + Vector3(0, sin(progress * PI) * 2.0, 0)
+	point.position = base_positions[0] + Vector3(0, sin(progress * PI) * 2.0, 0)
 	
 	# Line: Circular motion
 	var angle = progress * PI * 2.0
-	$Line.position = base_positions[1] + Vector3(cos(angle) * 1.0, sin(angle) * 1.0, 0)
+	line.position = base_positions[1] + Vector3(cos(angle) * 1.0, sin(angle) * 1.0, 0)
 	
 	# Plane: Figure-8 motion
-	$Plane.position = base_positions[2] + Vector3(
+	plane.position = base_positions[2] + Vector3(
 		sin(progress * PI * 2.0) * 1.0,
 		sin(progress * PI * 4.0) * 0.5,
 		cos(progress * PI * 2.0) * 0.5
 	)
 	
 	# Cube: Complex 3D path
-	$Cube.position = base_positions[3] + Vector3(
+	cube.position = base_positions[3] + Vector3(
 		sin(progress * PI * 3.0) * 0.8,
 		cos(progress * PI * 2.0) * 1.2,
 		sin(progress * PI * 4.0) * 0.6
@@ -187,7 +194,7 @@ func apply_shearing_transformations(progress):
 	
 	# Point: No shearing (0D), but add wobble effect
 	var wobble = sin(time * 6.0) * 0.1
-	$Point.position.x = -6 + wobble
+	point.position.x = -6 + wobble
 	
 	# Line: Shear along one axis
 	var line_transform = Transform3D()
@@ -197,7 +204,7 @@ func apply_shearing_transformations(progress):
 		Vector3(0, 0, 1.0)
 	)
 	line_transform.origin = Vector3(-2, 0, 0)
-	$Line.transform = line_transform
+	line.transform = line_transform
 	
 	# Plane: Shear in multiple directions
 	var plane_transform = Transform3D()
@@ -207,7 +214,7 @@ func apply_shearing_transformations(progress):
 		Vector3(0, 0, 1.0)
 	)
 	plane_transform.origin = Vector3(2, 0, 0)
-	$Plane.transform = plane_transform
+	plane.transform = plane_transform
 	
 	# Cube: Complex 3D shearing
 	var cube_transform = Transform3D()
@@ -217,15 +224,15 @@ func apply_shearing_transformations(progress):
 		Vector3(shear_amount * 0.1, shear_amount * 0.2, 1.0)
 	)
 	cube_transform.origin = Vector3(6, 0, 0)
-	$Cube.transform = cube_transform
+	cube.transform = cube_transform
 
 func animate_indicators():
 	# Highlight current transformation indicator
 	var indicators = [
-		$TransformationControls/RotationIndicator,
-		$TransformationControls/ScaleIndicator,
-		$TransformationControls/TranslationIndicator,
-		$TransformationControls/RotationIndicator  # Rotation for shearing (placeholder)
+		rotation_indicator,
+		scale_indicator,
+		translation_indicator,
+		rotation_indicator  # Rotation for shearing (placeholder)
 	]
 	
 	# Reset all indicators
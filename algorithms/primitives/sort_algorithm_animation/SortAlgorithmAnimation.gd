@@ -29,6 +29,12 @@ var quick_pivot := 0
 var bubble_elements := []
 var merge_elements := []
 var quick_elements := []
+@onready var bubble_sort_area: Node3D = $BubbleSortArea
+@onready var merge_sort_area: Node3D = $MergeSortArea
+@onready var quick_sort_area: Node3D = $QuickSortArea
+@onready var comparison_visualizer: Node3D = $ComparisonVisualizer
+@onready var swap_visualizer: Node3D = $SwapVisualizer
+@onready var performance_metrics: Node3D = $PerformanceMetrics
 
 func _ready():
 	initialize_arrays()
@@ -273,7 +279,7 @@ func highlight_elements(elements: Array, indices: Array, color: Color):
 			material.emission = color * 0.4
 
 func recreate_bubble_elements():
-	var container = $BubbleSortArea
+	var container = bubble_sort_area
 	
 	# Clear existing elements
 	for element in bubble_elements:
@@ -298,7 +304,7 @@ func recreate_bubble_elements():
 		bubble_elements.append(element)
 
 func recreate_merge_elements():
-	var container = $MergeSortArea
+	var container = merge_sort_area
 	
 	# Clear existing elements
 	for element in merge_elements:
@@ -325,7 +331,7 @@ func recreate_merge_elements():
 		merge_elements.append(element)
 
 func recreate_quick_elements():
-	var container = $QuickSortArea
+	var container = quick_sort_area
 	
 	# Clear existing elements
 	for element in quick_elements:
@@ -350,7 +356,7 @@ func recreate_quick_elements():
 		quick_elements.append(element)
 
 func visualize_comparisons():
-	var container = $ComparisonVisualizer
+	var container = comparison_visualizer
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -372,7 +378,7 @@ func visualize_comparisons():
 	container.add_child(comparison_bar)
 
 func visualize_swaps():
-	var container = $SwapVisualizer
+	var container = swap_visualizer
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -394,7 +400,7 @@ func visualize_swaps():
 	container.add_child(swap_bar)
 
 func update_performance_metrics():
-	var container = $PerformanceMetrics
+	var container = performance_metrics
 	
 	# Clear previous visualization
 	for child in container.get_children():
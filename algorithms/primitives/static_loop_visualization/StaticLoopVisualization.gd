@@ -17,6 +17,12 @@ var nested_inner_index := 0
 # Performance metrics
 var iteration_count := 0
 var total_operations := 0
+@onready var for_loop_visualization: Node3D = $ForLoopVisualization
+@onready var while_loop_visualization: Node3D = $WhileLoopVisualization
+@onready var nested_loop_visualization: Node3D = $NestedLoopVisualization
+@onready var iterator_patterns: Node3D = $IteratorPatterns
+@onready var loop_control: Node3D = $LoopControl
+@onready var performance_metrics: Node3D = $PerformanceMetrics
 
 func _ready():
 	create_loop_visualizations()
@@ -122,7 +128,7 @@ func create_nested_loop_elements():
 			container.add_child(element)
 
 func animate_for_loop():
-	var container = $ForLoopVisualization
+	var container = for_loop_visualization
 	var pointer = container.get_node("ForLoopPointer")
 	
 	# Update for loop index based on timer
@@ -148,7 +154,7 @@ func animate_for_loop():
 			material.emission_enabled = false
 
 func animate_while_loop():
-	var container = $WhileLoopVisualization
+	var container = while_loop_visualization
 	var condition_checker = container.get_node("ConditionChecker")
 	
 	# Update while loop counter
@@ -180,7 +186,7 @@ func animate_while_loop():
 			element.position.x = 0.0
 
 func animate_nested_loops():
-	var container = $NestedLoopVisualization
+	var container = nested_loop_visualization
 	
 	# Update nested loop indices
 	if loop_timer > 0.5:
@@ -212,7 +218,7 @@ func animate_nested_loops():
 				element.scale = Vector3(1.0, 1.0, 1.0)
 
 func show_iterator_patterns():
-	var container = $IteratorPatterns
+	var container = iterator_patterns
 	
 	# Clear previous elements
 	for child in container.get_children():
@@ -263,7 +269,7 @@ func show_iterator_patterns():
 			container.add_child(element)
 
 func demonstrate_loop_control():
-	var container = $LoopControl
+	var container = loop_control
 	
 	# Clear previous elements
 	for child in container.get_children():
@@ -301,7 +307,7 @@ func demonstrate_loop_control():
 		container.add_child(element)
 
 func update_performance_metrics():
-	var container = $PerformanceMetrics
+	var container = performance_metrics
 	
 	# Clear previous elements
 	for child in container.get_children():
@@ -18,6 +18,10 @@ enum NavigationPattern {
 var current_pattern = NavigationPattern.SPIRAL
 var pattern_timer = 0.0
 var pattern_interval = 8.0
+@onready var grid_lines: Node3D = $GridLines
+@onready var navigator: CSGSphere3D = $Navigator
+@onready var coordinate_display: CSGBox3D = $CoordinateDisplay
+@onready var grid_mode_indicator: CSGCylinder3D = $GridModeIndicator
 
 func _ready():
 	create_grid_lines()
@@ -196,7 +200,7 @@ func navigate_spiral(progress):
 		sin(angle) * radius
 	)
 	
-	$Navigator.position = navigator_position
+	navigator.position = navigator_position
 
 func navigate_maze_runner(progress):
 	# Create a maze-like path using step functions
@@ -221,7 +225,7 @@ func navigate_maze_runner(progress):
 	else:
 		navigator_position = maze_points[-1]
 	
-	$Navigator.position = navigator_position
+	navigator.position = navigator_position
 
 func navigate_coordinate_sweep(progress):
 	# Sweep through coordinate system in organized pattern
@@ -248,7 +252,7 @@ func navigate_coordinate_sweep(progress):
 				lerp(-6.0, 6.0, phase)
 			)
 	
-	$Navigator.position = navigator_position
+	navigator.position = navigator_position
 
 func navigate_random_walk():
 	# Random walk with grid snapping
@@ -267,7 +271,7 @@ func navigate_random_walk():
 		new_position.y = 0.2
 		
 		navigator_position = new_position
-		$Navigator.position = navigator_position
+		navigator.position = navigator_position
 
 func update_trail():
 	# Add current position to trail
@@ -324,7 +328,7 @@ func animate_grid_effects():
 	# Pulse grid lines
 	var pulse = 1.0 + sin(time * 2.0) * 0.2
 	
-	for child in $GridLines.get_children():
+	for child in grid_lines.get_children():
 		var material = child.material_override as StandardMaterial3D
 		if material:
 			var base_emission = Color(0.0, 0.3, 0.3, 1.0)
@@ -332,17 +336,17 @@ func animate_grid_effects():
 	
 	# Animate navigator
 	var nav_pulse = 1.0 + sin(time * 4.0) * 0.3
-	$Navigator.scale = Vector3.ONE * nav_pulse
+	navigator.scale = Vector3.ONE * nav_pulse
 
 func update_coordinate_display():
 	# Update coordinate display based on navigator position
 	var coord_height = (abs(navigator_position.x) + abs(navigator_position.z)) * 0.1 + 0.5
-	$CoordinateDisplay.size.y = coord_height
-	$CoordinateDisplay.position.y = 4 + coord_height/2
+	coordinate_display.size.y = coord_height
+	coordinate_display.position.y = 4 + coord_height/2
 	
 	# Update grid mode indicator
 	var mode_height = (current_pattern + 1) * 0.3
-	var gridmodeindicator = get_node_or_null("GridModeIndicator")
+	var gridmodeindicator = grid_mode_indicator
 	if gridmodeindicator and gridmodeindicator is CSGCylinder3D:
 		gridmodeindicator.height = mode_height
 		gridmodeindicator.position.y = 4 + mode_height/2
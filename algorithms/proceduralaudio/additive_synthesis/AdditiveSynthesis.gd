@@ -7,6 +7,8 @@ var harmonic_oscillators = []
 var summation_nodes = []
 var output_waveform = []
 var waveform_resolution = 64
+@onready var fundamental_freq_node: CSGCylinder3D = $FundamentalFreq
+@onready var harmonic_count_node = $HarmonicCount
 
 func _ready():
 	create_harmonic_oscillators()
@@ -271,19 +273,19 @@ func animate_output_waveform():
 func animate_controls():
 	# Fundamental frequency control
 	var fund_height = (fundamental_freq / 400.0) * 1.5 + 0.5
-	$FundamentalFreq.height = fund_height
-	$FundamentalFreq.position.y = -3 + fund_height/2
+	fundamental_freq_node.height = fund_height
+	fundamental_freq_node.position.y = -3 + fund_height/2
 	
 	# Harmonic count indicator
 	var active_harmonics = count_active_harmonics()
 	var count_height = (active_harmonics / float(harmonic_count)) * 1.5 + 0.5
-	$HarmonicCount.height = count_height
-	$HarmonicCount.position.y = -3 + count_height/2
+	harmonic_count_node.height = count_height
+	harmonic_count_node.position.y = -3 + count_height/2
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 4.0) * 0.1
-	$FundamentalFreq.scale.x = pulse
-	$HarmonicCount.scale.x = pulse
+	fundamental_freq_node.scale.x = pulse
+	harmonic_count_node.scale.x = pulse
 
 func count_active_harmonics() -> int:
 	var count = 0
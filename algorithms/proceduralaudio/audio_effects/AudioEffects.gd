@@ -20,6 +20,12 @@ var input_signal := []
 var reverb_buffer := []
 var delay_buffer := []
 var output_signal := []
+@onready var reverb_visualization: Node3D = $ReverbVisualization
+@onready var delay_visualization: Node3D = $DelayVisualization
+@onready var chorus_visualization: Node3D = $ChorusVisualization
+@onready var distortion_visualization: Node3D = $DistortionVisualization
+@onready var effect_chain: Node3D = $EffectChain
+@onready var frequency_analysis: Node3D = $FrequencyAnalysis
 
 func _ready():
 	initialize_audio_buffers()
@@ -71,7 +77,7 @@ func generate_input_signal():
 		input_signal[i] = sin(t * TAU * 440) * 0.5 + sin(t * TAU * 880) * 0.25 + sin(t * TAU * 1320) * 0.125
 
 func visualize_reverb_effect():
-	var container = $ReverbVisualization
+	var container = reverb_visualization
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -119,7 +125,7 @@ func visualize_reverb_effect():
 	container.add_child(chamber)
 
 func visualize_delay_effect():
-	var container = $DelayVisualization
+	var container = delay_visualization
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -162,7 +168,7 @@ func visualize_delay_effect():
 	container.add_child(delay_line)
 
 func visualize_chorus_effect():
-	var container = $ChorusVisualization
+	var container = chorus_visualization
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -213,7 +219,7 @@ func visualize_chorus_effect():
 			container.add_child(connection)
 
 func visualize_distortion_effect():
-	var container = $DistortionVisualization
+	var container = distortion_visualization
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -276,7 +282,7 @@ func visualize_distortion_effect():
 	container.add_child(curve_display)
 
 func show_effect_chain():
-	var container = $EffectChain
+	var container = effect_chain
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -330,7 +336,7 @@ func show_effect_chain():
 			container.add_child(arrow)
 
 func show_frequency_analysis():
-	var container = $FrequencyAnalysis
+	var container = frequency_analysis
 	
 	# Clear previous visualization
 	for child in container.get_children():
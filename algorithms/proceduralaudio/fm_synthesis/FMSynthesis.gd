@@ -8,6 +8,12 @@ var fm_ratio = 1.0
 var spectrum_nodes = []
 var modulation_path_nodes = []
 var spectrum_resolution = 32
+@onready var carrier: CSGSphere3D = $Carrier
+@onready var modulator: CSGSphere3D = $Modulator
+@onready var carrier_freq_node: CSGCylinder3D = $CarrierFreq
+@onready var modulator_freq_node: CSGCylinder3D = $ModulatorFreq
+@onready var modulation_index_node: CSGCylinder3D = $ModulationIndex
+@onready var fm_ratio_node = $FMRatio
 
 func _ready():
 	create_modulation_path()
@@ -117,12 +123,12 @@ func animate_fm_synthesis():
 	# Animate carrier oscillator
 	var carrier_phase = time * carrier_freq * 2.0 * PI
 	var carrier_scale = 1.0 + sin(carrier_phase) * 0.3
-	$Carrier.scale = Vector3.ONE * carrier_scale
+	carrier.scale = Vector3.ONE * carrier_scale
 	
 	# Animate modulator oscillator
 	var modulator_phase = time * modulator_freq * 2.0 * PI
 	var modulator_scale = 1.0 + sin(modulator_phase) * 0.4
-	$Modulator.scale = Vector3.ONE * modulator_scale
+	modulator.scale = Vector3.ONE * modulator_scale
 	
 	# Animate modulation path
 	animate_modulation_path()
@@ -238,38 +244,38 @@ func bessel_j2_approx(x: float) -> float:
 func animate_controls():
 	# Carrier frequency control
 	var carrier_height = (carrier_freq / 800.0) * 1.5 + 0.5
-	$CarrierFreq.height = carrier_height
-	$CarrierFreq.position.y = -3 + carrier_height/2
+	carrier_freq_node.height = carrier_height
+	carrier_freq_node.position.y = -3 + carrier_height/2
 	
 	# Modulator frequency control
 	var mod_height = (modulator_freq / 800.0) * 1.5 + 0.5
-	$ModulatorFreq.height = mod_height
-	$ModulatorFreq.position.y = -3 + mod_height/2
+	modulator_freq_node.height = mod_height
+	modulator_freq_node.position.y = -3 + mod_height/2
 	
 	# Modulation index control
 	var index_height = (modulation_index / 10.0) * 1.5 + 0.5
-	$ModulationIndex.height = index_height
-	$ModulationIndex.position.y = -3 + index_height/2
+	modulation_index_node.height = index_height
+	modulation_index_node.position.y = -3 + index_height/2
 	
 	# FM ratio indicator
 	var ratio_height = fm_ratio * 0.8 + 0.5
-	$FMRatio.height = ratio_height
-	$FMRatio.position.y = -3 + ratio_height/2
+	fm_ratio_node.height = ratio_height
+	fm_ratio_node.position.y = -3 + ratio_height/2
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 4.0) * 0.1
-	$CarrierFreq.scale.x = pulse
-	$ModulatorFreq.scale.x = pulse
-	$ModulationIndex.scale.x = pulse
-	$FMRatio.scale.x = pulse
+	carrier_freq_node.scale.x = pulse
+	modulator_freq_node.scale.x = pulse
+	modulation_index_node.scale.x = pulse
+	fm_ratio_node.scale.x = pulse
 	
 	# Update carrier and modulator emission based on their signals
-	var carrier_material = $Carrier.material_override as StandardMaterial3D
+	var carrier_material = carrier.material_override as StandardMaterial3D
 	if carrier_material:
 		var carrier_intensity = (sin(time * carrier_freq * 2.0 * PI) + 1.0) * 0.5
 		carrier_material.emission = Color(0.5, 0.1, 0.1, 1.0) * (0.5 + carrier_intensity)
 	
-	var modulator_material = $Modulator.material_override as StandardMaterial3D
+	var modulator_material = modulator.material_override as StandardMaterial3D
 	if modulator_material:
 		var mod_intensity = (sin(time * modulator_freq * 2.0 * PI) + 1.0) * 0.5
 		modulator_material.emission = Color(0.1, 0.1, 0.5, 1.0) * (0.5 + mod_intensity)
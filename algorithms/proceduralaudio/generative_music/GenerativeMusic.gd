@@ -25,6 +25,10 @@ var rhythm_generations := []
 # Fractal melody state
 var fractal_iteration := 0
 var fractal_seed := [0, 2, 4, 2]
+@onready var algorithmic_composer: Node3D = $AlgorithmicComposer
+@onready var markov_chain_node: Node3D = $MarkovChain
+@onready var cellular_automata: Node3D = $CellularAutomata
+@onready var fractal_melodies: Node3D = $FractalMelodies
 
 func _ready():
 	beat_duration = 60.0 / tempo
@@ -68,7 +72,7 @@ func initialize_fractal_system():
 	fractal_iteration = 0
 
 func update_algorithmic_composer():
-	var container = $AlgorithmicComposer
+	var container = algorithmic_composer
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -104,7 +108,7 @@ func update_algorithmic_composer():
 			container.add_child(connection)
 
 func animate_markov_chain():
-	var container = $MarkovChain
+	var container = markov_chain_node
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -182,7 +186,7 @@ func get_transition_probability(from_note: int, to_note: int) -> float:
 	return 0.0
 
 func animate_cellular_automata():
-	var container = $CellularAutomata
+	var container = cellular_automata
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -253,7 +257,7 @@ func update_rhythm_ca():
 		rhythm_generations.remove_at(0)
 
 func generate_fractal_melodies():
-	var container = $FractalMelodies
+	var container = fractal_melodies
 	
 	# Clear previous visualization
 	for child in container.get_children():
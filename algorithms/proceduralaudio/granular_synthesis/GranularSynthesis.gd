@@ -18,6 +18,10 @@ var grain_scatter := 0.05  # Random variation
 var active_grains := []
 var waveform_data := []
 var output_buffer := []
+@onready var grain_cluster: Node3D = $GrainCluster
+@onready var waveform_source: Node3D = $WaveformSource
+@onready var grain_parameters: Node3D = $GrainParameters
+@onready var output_synthesis: Node3D = $OutputSynthesis
 
 # Grain structure
 class Grain:
@@ -105,7 +109,7 @@ func spawn_grain():
 	active_grains.append(grain)
 
 func animate_existing_grains(delta: float):
-	var container = $GrainCluster
+	var container = grain_cluster
 	
 	# Clear previous grain visualization
 	for child in container.get_children():
@@ -152,7 +156,7 @@ func animate_existing_grains(delta: float):
 		i += 1
 
 func visualize_waveform_source():
-	var container = $WaveformSource
+	var container = waveform_source
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -216,7 +220,7 @@ func visualize_waveform_source():
 	container.add_child(read_head)
 
 func show_granular_parameters():
-	var container = $GrainParameters
+	var container = grain_parameters
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -262,7 +266,7 @@ func show_granular_parameters():
 		container.add_child(label)
 
 func demonstrate_output_synthesis():
-	var container = $OutputSynthesis
+	var container = output_synthesis
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -18,6 +18,10 @@ var critical_bands := [
 	1270, 1480, 1720, 2000, 2320, 2700, 3150, 3700, 4400, 5300,
 	6400, 7700, 9500, 12000, 15500
 ]
+@onready var frequency_masking: Node3D = $FrequencyMasking
+@onready var temporal_masking: Node3D = $TemporalMasking
+@onready var critical_bands_node: Node3D = $CriticalBands
+@onready var loudness_perception: Node3D = $LoudnessPerception
 
 func _ready():
 	pass
@@ -40,7 +44,7 @@ func update_masking_parameters():
 	probe_amplitude = 0.2 + sin(time * 0.9) * 0.2
 
 func visualize_frequency_masking():
-	var container = $FrequencyMasking
+	var container = frequency_masking
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -114,7 +118,7 @@ func frequency_to_bark(frequency: float) -> float:
 	return 13.0 * atan(0.00076 * frequency) + 3.5 * atan(pow(frequency / 7500.0, 2))
 
 func visualize_temporal_masking():
-	var container = $TemporalMasking
+	var container = temporal_masking
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -188,7 +192,7 @@ func visualize_temporal_masking():
 			container.add_child(threshold_curve)
 
 func show_critical_bands():
-	var container = $CriticalBands
+	var container = critical_bands_node
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -245,7 +249,7 @@ func show_critical_bands():
 			container.add_child(overlap)
 
 func demonstrate_loudness_perception():
-	var container = $LoudnessPerception
+	var container = loudness_perception
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -29,6 +29,9 @@ enum OscillatorType {
 }
 
 var oscillator_count = 4
+@onready var filter_frequency_node: CSGCylinder3D = $FilterFrequency
+@onready var filter_resonance_node: CSGCylinder3D = $FilterResonance
+@onready var filter_type = $FilterType
 
 func _ready():
 	create_oscillators()
@@ -341,21 +344,21 @@ func animate_spectrum():
 func animate_controls():
 	# Filter frequency control
 	var freq_height = (filter_frequency / 1000.0) * 1.5 + 0.5
-	$FilterFrequency.height = freq_height
-	$FilterFrequency.position.y = -3 + freq_height/2
+	filter_frequency_node.height = freq_height
+	filter_frequency_node.position.y = -3 + freq_height/2
 	
 	# Filter resonance control
 	var res_height = filter_resonance * 1.5 + 0.5
-	$FilterResonance.height = res_height
-	$FilterResonance.position.y = -3 + res_height/2
+	filter_resonance_node.height = res_height
+	filter_resonance_node.position.y = -3 + res_height/2
 	
 	# Filter type indicator
 	var type_height = (current_filter + 1) * 0.3 + 0.5
-	$FilterType.height = type_height
-	$FilterType.position.y = -3 + type_height/2
+	filter_type.height = type_height
+	filter_type.position.y = -3 + type_height/2
 	
 	# Update filter type color
-	var type_material = $FilterType.material_override as StandardMaterial3D
+	var type_material = filter_type.material_override as StandardMaterial3D
 	if type_material:
 		match current_filter:
 			FilterType.LOW_PASS:
@@ -371,9 +374,9 @@ func animate_controls():
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 4.0) * 0.1
-	$FilterFrequency.scale.x = pulse
-	$FilterResonance.scale.x = pulse
-	$FilterType.scale.x = pulse
+	filter_frequency_node.scale.x = pulse
+	filter_resonance_node.scale.x = pulse
+	filter_type.scale.x = pulse
 
 func get_filter_name() -> String:
 	match current_filter:
@@ -6,13 +6,23 @@ extends Node3D
 @export var spawn_height: float = 10.0
 @export var spawn_radius: float = 3.0
 @export var settle_time: float = 3.0
+# Also settle once total kinetic energy drops below this (0 = off), checked every energy_check_interval s
+@export var energy_threshold: float = 0.0
+@export var energy_check_interval: float = 0.25
 @export var voxel_size: float = 0.5
 @export var generate_on_start: bool = true
+# Pile dump for cube_mound_reference.py (P key)
+@export var pile_dump_path: String = "user://cube_pile.json"
 
 var cubes: Array = []
 var state: String = "idle"  # idle, dropping, settling, generating, done
 var timer: float = 0.0
+var energy_timer: float = 0.0
+var sleeping_count: int = 0  # kept up to date by sleeping_state_changed
 var generated_mesh: MeshInstance3D = null
+# Stats of the last pile, read by cube_mound_benchmark.gd
+var settle_seconds: float = 0.0
+var generation_usec: int = 0
 
 @onready var ground = $Ground
 
@@ -28,6 +38,7 @@ func start_generation():
 	clear_generated_mesh()
 	
 	print("Dropping %d cubes..." % num_cubes)
+	sleeping_count = 0
 	drop_cubes()
 	state = "dropping"
 	timer = 0.0
@@ -71,6 +82,7 @@ func drop_cubes():
 		mesh_instance.material_override = material
 		cube.add_child(mesh_instance)
 		
+		cube.sleeping_state_changed.connect(_on_cube_sleeping_state_changed.bind(cube))
 		add_child(cube)
 		cubes.append(cube)
 	
@@ -83,73 +95,74 @@ func _process(delta):
 		if timer > 0.5:
 			state = "settling"
 			timer = 0.0
+			energy_timer = 0.0
+			if sleeping_count == cubes.size():
+				settle("all cubes asleep")
 	
 	elif state == "settling":
 		timer += delta
 		
-		# Check if all cubes are sleeping (settled)
-		var all_settled = true
-		for cube in cubes:
-			if cube is RigidBody3D and not cube.sleeping:
-				all_settled = false
-				break
-		
 		# Force generation after settle_time regardless
-		if timer > settle_time or all_settled:
-			print("Cubes settled! Generating mesh...")
-			state = "generating"
-			# Generate mesh in next frame to show message
-			await get_tree().process_frame
-			generate_mesh_from_cubes()
-			state = "done"
-			print("Mesh generation complete!")
+		if timer > settle_time:
+			settle("settle_time reached")
+		elif energy_threshold > 0.0:
+			energy_timer += delta
+			if energy_timer >= energy_check_interval:
+				energy_timer = 0.0
+				if pile_kinetic_energy() < energy_threshold:
+					settle("kinetic energy below threshold")
+
+# Sleep changes are counted as they happen, so no per-frame scan of the cubes
+func _on_cube_sleeping_state_changed(cube: RigidBody3D):
+	sleeping_count += 1 if cube.sleeping else -1
+	if state == "settling" and sleeping_count == cubes.size():
+		settle("all cubes asleep")
+
+func pile_kinetic_energy() -> float:
+	# Solid cube inertia is m * s^2 / 6 about any axis through its center
+	var inertia_factor = cube_size * cube_size / 6.0
+	var energy = 0.0
+	for cube in cubes:
+		energy += 0.5 * cube.mass * (cube.linear_velocity.length_squared()
+			+ inertia_factor * cube.angular_velocity.length_squared())
+	return energy
+
+func settle(reason: String):
+	print("Cubes settled after %.2f s (%s)! Generating mesh..." % [timer, reason])
+	settle_seconds = timer
+	state = "generating"
+	# Generate mesh in next frame to show message
+	await get_tree().process_frame
+	generate_mesh_from_cubes()
+	state = "done"
+	print("Mesh generation complete!")
 
 func generate_mesh_from_cubes():
-	# Get all cube positions
-	var positions = []
+	# Cube transforms relative to the mound (cubes are direct children)
+	var transforms = []
 	for cube in cubes:
 		if cube is RigidBody3D:
-			positions.append(cube.global_position)
+			transforms.append(cube.transform)
 	
-	if positions.is_empty():
+	if transforms.is_empty():
 		print("No cubes to generate mesh from!")
 		return
 	
-	# Find bounds
-	var min_bounds = positions[0]
-	var max_bounds = positions[0]
-	
-	for pos in positions:
-		min_bounds.x = min(min_bounds.x, pos.x)
-		min_bounds.y = min(min_bounds.y, pos.y)
-		min_bounds.z = min(min_bounds.z, pos.z)
-		max_bounds.x = max(max_bounds.x, pos.x)
-		max_bounds.y = max(max_bounds.y, pos.y)
-		max_bounds.z = max(max_bounds.z, pos.z)
-	
-	# Expand bounds by cube size
-	min_bounds -= Vector3.ONE * cube_size
-	max_bounds += Vector3.ONE * cube_size
-	
-	# Create voxel grid
-	var grid_size = ((max_bounds - min_bounds) / voxel_size).ceil()
-	var voxel_grid = {}
-	
-	# Mark voxels occupied by cubes
-	for pos in positions:
-		var voxel_pos = ((pos - min_bounds) / voxel_size).floor()
-		
-		# Mark cube volume as occupied (cube_size in voxels)
-		var half_extent = int(ceil(cube_size / voxel_size))
-		for x in range(-half_extent, half_extent + 1):
-			for y in range(-half_extent, half_extent + 1):
-				for z in range(-half_extent, half_extent + 1):
-					var check_pos = voxel_pos + Vector3(x, y, z)
-					var key = "%d,%d,%d" % [check_pos.x, check_pos.y, check_pos.z]
-					voxel_grid[key] = true
-	
-	# Generate mesh from surface voxels
-	var surface_mesh = create_mesh_from_voxels(voxel_grid, min_bounds, grid_size)
+	# Rasterize each cube's oriented box into a dense grid, then merge faces
+	var start_time = Time.get_ticks_usec()
+	var voxels = CubeMoundVoxels.new(voxel_size)
+	voxels.allocate(transforms, cube_size)
+	for xform in transforms:
+		voxels.rasterize_box(xform, cube_size * 0.5)
+	var surface_mesh = voxels.build_greedy_mesh()
+	generation_usec = Time.get_ticks_usec() - start_time
+	
+	var triangle_count = 0
+	if surface_mesh.get_surface_count() > 0:
+		triangle_count = surface_mesh.surface_get_array_index_len(0) / 3
+	print("Voxels: %d filled of %v, %d triangles in %.1f ms" % [
+		voxels.filled_count(), voxels.size, triangle_count, generation_usec / 1000.0
+	])
 	
 	# Create mesh instance
 	generated_mesh = MeshInstance3D.new()
@@ -167,100 +180,6 @@ func generate_mesh_from_cubes():
 	for cube in cubes:
 		cube.visible = false
 
-func create_mesh_from_voxels(voxel_grid: Dictionary, min_bounds: Vector3, grid_size: Vector3) -> ArrayMesh:
-	var st = SurfaceTool.new()
-	st.begin(Mesh.PRIMITIVE_TRIANGLES)
-	
-	# For each occupied voxel, check neighbors and add faces for exposed sides
-	for key in voxel_grid.keys():
-		var parts = key.split(",")
-		var x = int(parts[0])
-		var y = int(parts[1])
-		var z = int(parts[2])
-		var pos = Vector3(x, y, z)
-		
-		# Check each face direction
-		var directions = [
-			Vector3(1, 0, 0),   # Right
-			Vector3(-1, 0, 0),  # Left
-			Vector3(0, 1, 0),   # Up
-			Vector3(0, -1, 0),  # Down
-			Vector3(0, 0, 1),   # Forward
-			Vector3(0, 0, -1)   # Back
-		]
-		
-		for dir in directions:
-			var neighbor_pos = pos + dir
-			var neighbor_key = "%d,%d,%d" % [neighbor_pos.x, neighbor_pos.y, neighbor_pos.z]
-			
-			# If neighbor is not occupied, this face is exposed
-			if not voxel_grid.has(neighbor_key):
-				add_voxel_face(st, pos, dir, min_bounds)
-	
-	st.generate_normals()
-	return st.commit()
-
-func add_voxel_face(st: SurfaceTool, voxel_pos: Vector3, normal: Vector3, min_bounds: Vector3):
-	# Convert voxel position to world position
-	var world_pos = min_bounds + voxel_pos * voxel_size
-	var half_size = voxel_size * 0.5
-	
-	# Define vertices based on face normal
-	var vertices = []
-	
-	if normal == Vector3(1, 0, 0):  # Right face (+X)
-		vertices = [
-			world_pos + Vector3(half_size, -half_size, -half_size),
-			world_pos + Vector3(half_size, -half_size, half_size),
-			world_pos + Vector3(half_size, half_size, half_size),
-			world_pos + Vector3(half_size, half_size, -half_size)
-		]
-	elif normal == Vector3(-1, 0, 0):  # Left face (-X)
-		vertices = [
-			world_pos + Vector3(-half_size, -half_size, half_size),
-			world_pos + Vector3(-half_size, -half_size, -half_size),
-			world_pos + Vector3(-half_size, half_size, -half_size),
-			world_pos + Vector3(-half_size, half_size, half_size)
-		]
-	elif normal == Vector3(0, 1, 0):  # Top face (+Y)
-		vertices = [
-			world_pos + Vector3(-half_size, half_size, -half_size),
-			world_pos + Vector3(half_size, half_size, -half_size),
-			world_pos + Vector3(half_size, half_size, half_size),
-			world_pos + Vector3(-half_size, half_size, half_size)
-		]
-	elif normal == Vector3(0, -1, 0):  # Bottom face (-Y)
-		vertices = [
-			world_pos + Vector3(-half_size, -half_size, half_size),
-			world_pos + Vector3(half_size, -half_size, half_size),
-			world_pos + Vector3(half_size, -half_size, -half_size),
-			world_pos + Vector3(-half_size, -half_size, -half_size)
-		]
-	elif normal == Vector3(0, 0, 1):  # Front face (+Z)
-		vertices = [
-			world_pos + Vector3(-half_size, -half_size, half_size),
-			world_pos + Vector3(-half_size, half_size, half_size),
-			world_pos + Vector3(half_size, half_size, half_size),
-			world_pos + Vector3(half_size, -half_size, half_size)
-		]
-	elif normal == Vector3(0, 0, -1):  # Back face (-Z)
-		vertices = [
-			world_pos + Vector3(half_size, -half_size, -half_size),
-			world_pos + Vector3(half_size, half_size, -half_size),
-			world_pos + Vector3(-half_size, half_size, -half_size),
-			world_pos + Vector3(-half_size, -half_size, -half_size)
-		]
-	
-	# Add two triangles for the quad
-	st.set_normal(normal)
-	st.add_vertex(vertices[0])
-	st.add_vertex(vertices[1])
-	st.add_vertex(vertices[2])
-	
-	st.add_vertex(vertices[0])
-	st.add_vertex(vertices[2])
-	st.add_vertex(vertices[3])
-
 func clear_cubes():
 	for cube in cubes:
 		if is_instance_valid(cube):
@@ -285,6 +204,36 @@ func _input(event):
 		elif event.keycode == KEY_R:
 			# Regenerate with different random positions
 			get_tree().reload_current_scene()
+		elif event.keycode == KEY_P:
+			save_pile()
+
+# Write cube transforms (basis columns, then origin) and the generated
+# mesh, so cube_mound_reference.py can rebuild and check it
+func save_pile():
+	var data = {"cube_size": cube_size, "voxel_size": voxel_size, "cubes": []}
+	for cube in cubes:
+		if cube is RigidBody3D:
+			var t = cube.transform
+			data["cubes"].append([
+				t.basis.x.x, t.basis.x.y, t.basis.x.z,
+				t.basis.y.x, t.basis.y.y, t.basis.y.z,
+				t.basis.z.x, t.basis.z.y, t.basis.z.z,
+				t.origin.x, t.origin.y, t.origin.z
+			])
+	
+	if generated_mesh and generated_mesh.mesh.get_surface_count() > 0:
+		var arrays = generated_mesh.mesh.surface_get_arrays(0)
+		var vertices = []
+		for v in arrays[Mesh.ARRAY_VERTEX]:
+			vertices.append_array([v.x, v.y, v.z])
+		data["mesh"] = {"vertices": vertices, "indices": Array(arrays[Mesh.ARRAY_INDEX])}
+	
+	var file = FileAccess.open(pile_dump_path, FileAccess.WRITE)
+	if file == null:
+		print("Could not write ", pile_dump_path)
+		return
+	file.store_string(JSON.stringify(data))
+	print("Pile saved to ", ProjectSettings.globalize_path(pile_dump_path))
 
 func _exit_tree():
 	clear_cubes()
@@ -0,0 +1,87 @@
+# cube_mound_benchmark.gd - Seeded pile drop for headless timing
+# Run: godot --headless --path . res://algorithms/proceduralgeneration/cubemound/cube_mound_benchmark.tscn -- --benchmark-out=user://cm.json
+# Summarize with benchmark_report.py in the project root
+extends Node3D
+
+@export var random_seed: int = 12345
+@export var max_seconds: float = 30.0
+@export var output_path: String = "user://benchmarks/cube_mound.json"
+
+@onready var mound = $CubeMound
+
+var frames: Array = []
+var elapsed: float = 0.0
+
+func _ready():
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--benchmark-out="):
+			output_path = arg.trim_prefix("--benchmark-out=")
+	# Spawn positions, rotations and colors all come from the global RNG.
+	# The physics solver is not bit-for-bit deterministic, so settle times
+	# still vary a little between runs.
+	seed(random_seed)
+	mound.start_generation()
+	print("Benchmark: %d cubes, voxel_size %.2f, seed %d" % [mound.num_cubes, mound.voxel_size, random_seed])
+
+func _process(delta):
+	elapsed += delta
+	record(delta)
+	if mound.state == "done" or elapsed > max_seconds:
+		finish()
+
+func record(delta: float):
+	var vertices = 0
+	var triangles = 0
+	if mound.generated_mesh and mound.generated_mesh.mesh.get_surface_count() > 0:
+		vertices = mound.generated_mesh.mesh.surface_get_array_len(0)
+		triangles = mound.generated_mesh.mesh.surface_get_array_index_len(0) / 3
+	
+	frames.append({
+		"frame_ms": delta * 1000.0,
+		"process_ms": Performance.get_monitor(Performance.TIME_PROCESS) * 1000.0,
+		"physics_ms": Performance.get_monitor(Performance.TIME_PHYSICS_PROCESS) * 1000.0,
+		"awake_cubes": mound.cubes.size() - mound.sleeping_count,
+		"active_bodies": Performance.get_monitor(Performance.PHYSICS_3D_ACTIVE_OBJECTS),
+		"collision_pairs": Performance.get_monitor(Performance.PHYSICS_3D_COLLISION_PAIRS),
+		"vertices": vertices,
+		"triangles": triangles,
+		"objects": Performance.get_monitor(Performance.OBJECT_COUNT),
+		"nodes": Performance.get_monitor(Performance.OBJECT_NODE_COUNT),
+		"resources": Performance.get_monitor(Performance.OBJECT_RESOURCE_COUNT),
+		"draw_calls": Performance.get_monitor(Performance.RENDER_TOTAL_DRAW_CALLS_IN_FRAME),
+		"primitives": Performance.get_monitor(Performance.RENDER_TOTAL_PRIMITIVES_IN_FRAME),
+		"static_memory_mb": Performance.get_monitor(Performance.MEMORY_STATIC) / 1048576.0
+	})
+
+func finish():
+	set_process(false)
+	if mound.state != "done":
+		push_warning("Benchmark: pile did not finish within %.0f s (state %s)" % [max_seconds, mound.state])
+	var report = {
+		"benchmark": "cube_mound",
+		"engine": Engine.get_version_info()["string"],
+		"settings": {
+			"num_cubes": mound.num_cubes,
+			"cube_size": mound.cube_size,
+			"voxel_size": mound.voxel_size,
+			"random_seed": random_seed
+		},
+		"results": {
+			"completed": 1 if mound.state == "done" else 0,
+			"settle_ms": mound.settle_seconds * 1000.0,
+			"generation_ms": mound.generation_usec / 1000.0,
+			"vertices": frames[-1]["vertices"],
+			"triangles": frames[-1]["triangles"]
+		},
+		"frames": frames
+	}
+	
+	DirAccess.make_dir_recursive_absolute(output_path.get_base_dir())
+	var file = FileAccess.open(output_path, FileAccess.WRITE)
+	if file == null:
+		push_error("Benchmark: could not write %s" % output_path)
+	else:
+		file.store_string(JSON.stringify(report))
+		file.close()
+		print("Benchmark: %d frames written to %s" % [frames.size(), ProjectSettings.globalize_path(output_path)])
+	get_tree().quit()
@@ -2,20 +2,110 @@
 """
 Godot 4 Cube Mound Mesh Generator
 Drops physics cubes, lets them pile up, then generates a mesh from the result
+- Scene settings from the command line (--num-cubes, --voxel-size, ...)
+- Batch variants into separate folders (--variants SPEC.json)
 """
 
+import argparse
+import hashlib
+import json
 import os
-
-def create_file(filename, content):
-    with open(filename, 'w', encoding='utf-8') as f:
+import re
+import sys
+
+# res:// paths of the files written here (not the .tres paths in examples)
+_LOCAL_PATH = re.compile(r"res://(?=[a-z_]+\.(?:gd|tscn)\b)")
+_GLOBAL_CLASSES = re.compile(r"\b(CubeMoundVoxels)\b")
+
+def create_file(out_dir, filename, content):
+    """Write a file unless it already has this content, so Godot only
+    rescans and reimports files that actually changed"""
+    path = os.path.normpath(os.path.join(out_dir, filename))
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            old_hash = hashlib.sha256(f.read().encode('utf-8')).digest()
+        if old_hash == hashlib.sha256(content.encode('utf-8')).digest():
+            print(f"Unchanged: {path}")
+            return False
+    with open(path, 'w', encoding='utf-8') as f:
         f.write(content)
-    print(f"Created: {filename}")
-
-def main():
-    print("=" * 60)
-    print("Godot 4 Cube Mound Mesh Generator - Installer")
-    print("=" * 60)
-    print("\nCreating cube mound system files...\n")
+    print(f"Created: {path}")
+    return True
+
+def load_variants(parser, argv, args):
+    """(out_dir, options) per variant in the --variants spec, or the
+    command line options alone. Spec keys are the long option names."""
+    if not args.variants:
+        return [(args.output, args)]
+    with open(args.variants, encoding='utf-8') as f:
+        spec = json.load(f)
+    if isinstance(spec, dict):
+        spec = spec.get("variants", [])
+    variants = []
+    for entry in spec:
+        entry = dict(entry)
+        name = entry.pop("name", None)
+        if not name:
+            parser.error(f"{args.variants}: every variant needs a name")
+        extra = []
+        for key, value in entry.items():
+            extra += ["--" + key.replace("_", "-"), str(value)]
+        variants.append((os.path.join(args.output, name), parser.parse_args(argv + extra)))
+    return variants
+
+def project_res_dir(out_dir):
+    """res:// folder of out_dir in the Godot project containing it; "res://"
+    when out_dir is (or is not inside) a project"""
+    path = os.path.abspath(out_dir)
+    root = path
+    while not os.path.exists(os.path.join(root, "project.godot")):
+        parent = os.path.dirname(root)
+        if parent == root:
+            return "res://"
+        root = parent
+    rel = os.path.relpath(path, root).replace(os.sep, "/")
+    return "res://" if rel == "." else "res://%s/" % rel
+
+def class_suffix(out_dir):
+    """CamelCase suffix for the global classes of a variant folder"""
+    name = os.path.basename(os.path.normpath(out_dir))
+    return "".join(part[:1].upper() + part[1:] for part in re.split(r"[^A-Za-z0-9]+", name))
+
+def localize(content, res_dir, suffix=""):
+    """Point the res:// paths of the generated files at res_dir and suffix
+    the global class names, so variants side by side in one project run
+    their own scripts and do not redeclare the same class_name"""
+    content = _LOCAL_PATH.sub(res_dir, content)
+    if not suffix:
+        return content
+    lines = []
+    for line in content.split("\n"):
+        code, comment = split_comment(line)
+        lines.append(_GLOBAL_CLASSES.sub(lambda m: m.group(1) + suffix, code) + comment)
+    return "\n".join(lines)
+
+def split_comment(line):
+    """(code, comment) of a GDScript line"""
+    quote = None
+    for i, ch in enumerate(line):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch == "#":
+            return line[:i], line[i:]
+    return line, ""
+
+def install(args, out_dir):
+    """Write one variant of the cube mound system into out_dir"""
+    os.makedirs(out_dir, exist_ok=True)
+    res_dir = project_res_dir(out_dir)
+    suffix = class_suffix(out_dir) if args.variants else ""
+
+    def write(filename, content):
+        return create_file(out_dir, filename,
+                           localize(content, res_dir, suffix if filename.endswith(".gd") else ""))
     
     # cube_mound.gd - Main controller
     cube_mound_gd = '''# cube_mound.gd - Drop cubes and generate mesh from pile
@@ -26,13 +116,23 @@ extends Node3D
 @export var spawn_height: float = 10.0
 @export var spawn_radius: float = 3.0
 @export var settle_time: float = 3.0
+# Also settle once total kinetic energy drops below this (0 = off), checked every energy_check_interval s
+@export var energy_threshold: float = 0.0
+@export var energy_check_interval: float = 0.25
 @export var voxel_size: float = 0.5
 @export var generate_on_start: bool = true
+# Pile dump for cube_mound_reference.py (P key)
+@export var pile_dump_path: String = "user://cube_pile.json"
 
 var cubes: Array = []
 var state: String = "idle"  # idle, dropping, settling, generating, done
 var timer: float = 0.0
+var energy_timer: float = 0.0
+var sleeping_count: int = 0  # kept up to date by sleeping_state_changed
 var generated_mesh: MeshInstance3D = null
+# Stats of the last pile, read by cube_mound_benchmark.gd
+var settle_seconds: float = 0.0
+var generation_usec: int = 0
 
 @onready var ground = $Ground
 
@@ -48,6 +148,7 @@ func start_generation():
 	clear_generated_mesh()
 	
 	print("Dropping %d cubes..." % num_cubes)
+	sleeping_count = 0
 	drop_cubes()
 	state = "dropping"
 	timer = 0.0
@@ -91,6 +192,7 @@ func drop_cubes():
 		mesh_instance.material_override = material
 		cube.add_child(mesh_instance)
 		
+		cube.sleeping_state_changed.connect(_on_cube_sleeping_state_changed.bind(cube))
 		add_child(cube)
 		cubes.append(cube)
 	
@@ -103,73 +205,74 @@ func _process(delta):
 		if timer > 0.5:
 			state = "settling"
 			timer = 0.0
+			energy_timer = 0.0
+			if sleeping_count == cubes.size():
+				settle("all cubes asleep")
 	
 	elif state == "settling":
 		timer += delta
 		
-		# Check if all cubes are sleeping (settled)
-		var all_settled = true
-		for cube in cubes:
-			if cube is RigidBody3D and not cube.sleeping:
-				all_settled = false
-				break
-		
 		# Force generation after settle_time regardless
-		if timer > settle_time or all_settled:
-			print("Cubes settled! Generating mesh...")
-			state = "generating"
-			# Generate mesh in next frame to show message
-			await get_tree().process_frame
-			generate_mesh_from_cubes()
-			state = "done"
-			print("Mesh generation complete!")
+		if timer > settle_time:
+			settle("settle_time reached")
+		elif energy_threshold > 0.0:
+			energy_timer += delta
+			if energy_timer >= energy_check_interval:
+				energy_timer = 0.0
+				if pile_kinetic_energy() < energy_threshold:
+					settle("kinetic energy below threshold")
+
+# Sleep changes are counted as they happen, so no per-frame scan of the cubes
+func _on_cube_sleeping_state_changed(cube: RigidBody3D):
+	sleeping_count += 1 if cube.sleeping else -1
+	if state == "settling" and sleeping_count == cubes.size():
+		settle("all cubes asleep")
+
+func pile_kinetic_energy() -> float:
+	# Solid cube inertia is m * s^2 / 6 about any axis through its center
+	var inertia_factor = cube_size * cube_size / 6.0
+	var energy = 0.0
+	for cube in cubes:
+		energy += 0.5 * cube.mass * (cube.linear_velocity.length_squared()
+			+ inertia_factor * cube.angular_velocity.length_squared())
+	return energy
+
+func settle(reason: String):
+	print("Cubes settled after %.2f s (%s)! Generating mesh..." % [timer, reason])
+	settle_seconds = timer
+	state = "generating"
+	# Generate mesh in next frame to show message
+	await get_tree().process_frame
+	generate_mesh_from_cubes()
+	state = "done"
+	print("Mesh generation complete!")
 
 func generate_mesh_from_cubes():
-	# Get all cube positions
-	var positions = []
+	# Cube transforms relative to the mound (cubes are direct children)
+	var transforms = []
 	for cube in cubes:
 		if cube is RigidBody3D:
-			positions.append(cube.global_position)
+			transforms.append(cube.transform)
 	
-	if positions.is_empty():
+	if transforms.is_empty():
 		print("No cubes to generate mesh from!")
 		return
 	
-	# Find bounds
-	var min_bounds = positions[0]
-	var max_bounds = positions[0]
+	# Rasterize each cube's oriented box into a dense grid, then merge faces
+	var start_time = Time.get_ticks_usec()
+	var voxels = CubeMoundVoxels.new(voxel_size)
+	voxels.allocate(transforms, cube_size)
+	for xform in transforms:
+		voxels.rasterize_box(xform, cube_size * 0.5)
+	var surface_mesh = voxels.build_greedy_mesh()
+	generation_usec = Time.get_ticks_usec() - start_time
 	
-	for pos in positions:
-		min_bounds.x = min(min_bounds.x, pos.x)
-		min_bounds.y = min(min_bounds.y, pos.y)
-		min_bounds.z = min(min_bounds.z, pos.z)
-		max_bounds.x = max(max_bounds.x, pos.x)
-		max_bounds.y = max(max_bounds.y, pos.y)
-		max_bounds.z = max(max_bounds.z, pos.z)
-	
-	# Expand bounds by cube size
-	min_bounds -= Vector3.ONE * cube_size
-	max_bounds += Vector3.ONE * cube_size
-	
-	# Create voxel grid
-	var grid_size = ((max_bounds - min_bounds) / voxel_size).ceil()
-	var voxel_grid = {}
-	
-	# Mark voxels occupied by cubes
-	for pos in positions:
-		var voxel_pos = ((pos - min_bounds) / voxel_size).floor()
-		
-		# Mark cube volume as occupied (cube_size in voxels)
-		var half_extent = int(ceil(cube_size / voxel_size))
-		for x in range(-half_extent, half_extent + 1):
-			for y in range(-half_extent, half_extent + 1):
-				for z in range(-half_extent, half_extent + 1):
-					var check_pos = voxel_pos + Vector3(x, y, z)
-					var key = "%d,%d,%d" % [check_pos.x, check_pos.y, check_pos.z]
-					voxel_grid[key] = true
-	
-	# Generate mesh from surface voxels
-	var surface_mesh = create_mesh_from_voxels(voxel_grid, min_bounds, grid_size)
+	var triangle_count = 0
+	if surface_mesh.get_surface_count() > 0:
+		triangle_count = surface_mesh.surface_get_array_index_len(0) / 3
+	print("Voxels: %d filled of %v, %d triangles in %.1f ms" % [
+		voxels.filled_count(), voxels.size, triangle_count, generation_usec / 1000.0
+	])
 	
 	# Create mesh instance
 	generated_mesh = MeshInstance3D.new()
@@ -187,100 +290,6 @@ func generate_mesh_from_cubes():
 	for cube in cubes:
 		cube.visible = false
 
-func create_mesh_from_voxels(voxel_grid: Dictionary, min_bounds: Vector3, grid_size: Vector3) -> ArrayMesh:
-	var st = SurfaceTool.new()
-	st.begin(Mesh.PRIMITIVE_TRIANGLES)
-	
-	# For each occupied voxel, check neighbors and add faces for exposed sides
-	for key in voxel_grid.keys():
-		var parts = key.split(",")
-		var x = int(parts[0])
-		var y = int(parts[1])
-		var z = int(parts[2])
-		var pos = Vector3(x, y, z)
-		
-		# Check each face direction
-		var directions = [
-			Vector3(1, 0, 0),   # Right
-			Vector3(-1, 0, 0),  # Left
-			Vector3(0, 1, 0),   # Up
-			Vector3(0, -1, 0),  # Down
-			Vector3(0, 0, 1),   # Forward
-			Vector3(0, 0, -1)   # Back
-		]
-		
-		for dir in directions:
-			var neighbor_pos = pos + dir
-			var neighbor_key = "%d,%d,%d" % [neighbor_pos.x, neighbor_pos.y, neighbor_pos.z]
-			
-			# If neighbor is not occupied, this face is exposed
-			if not voxel_grid.has(neighbor_key):
-				add_voxel_face(st, pos, dir, min_bounds)
-	
-	st.generate_normals()
-	return st.commit()
-
-func add_voxel_face(st: SurfaceTool, voxel_pos: Vector3, normal: Vector3, min_bounds: Vector3):
-	# Convert voxel position to world position
-	var world_pos = min_bounds + voxel_pos * voxel_size
-	var half_size = voxel_size * 0.5
-	
-	# Define vertices based on face normal
-	var vertices = []
-	
-	if normal == Vector3(1, 0, 0):  # Right face (+X)
-		vertices = [
-			world_pos + Vector3(half_size, -half_size, -half_size),
-			world_pos + Vector3(half_size, -half_size, half_size),
-			world_pos + Vector3(half_size, half_size, half_size),
-			world_pos + Vector3(half_size, half_size, -half_size)
-		]
-	elif normal == Vector3(-1, 0, 0):  # Left face (-X)
-		vertices = [
-			world_pos + Vector3(-half_size, -half_size, half_size),
-			world_pos + Vector3(-half_size, -half_size, -half_size),
-			world_pos + Vector3(-half_size, half_size, -half_size),
-			world_pos + Vector3(-half_size, half_size, half_size)
-		]
-	elif normal == Vector3(0, 1, 0):  # Top face (+Y)
-		vertices = [
-			world_pos + Vector3(-half_size, half_size, -half_size),
-			world_pos + Vector3(half_size, half_size, -half_size),
-			world_pos + Vector3(half_size, half_size, half_size),
-			world_pos + Vector3(-half_size, half_size, half_size)
-		]
-	elif normal == Vector3(0, -1, 0):  # Bottom face (-Y)
-		vertices = [
-			world_pos + Vector3(-half_size, -half_size, half_size),
-			world_pos + Vector3(half_size, -half_size, half_size),
-			world_pos + Vector3(half_size, -half_size, -half_size),
-			world_pos + Vector3(-half_size, -half_size, -half_size)
-		]
-	elif normal == Vector3(0, 0, 1):  # Front face (+Z)
-		vertices = [
-			world_pos + Vector3(-half_size, -half_size, half_size),
-			world_pos + Vector3(-half_size, half_size, half_size),
-			world_pos + Vector3(half_size, half_size, half_size),
-			world_pos + Vector3(half_size, -half_size, half_size)
-		]
-	elif normal == Vector3(0, 0, -1):  # Back face (-Z)
-		vertices = [
-			world_pos + Vector3(half_size, -half_size, -half_size),
-			world_pos + Vector3(half_size, half_size, -half_size),
-			world_pos + Vector3(-half_size, half_size, -half_size),
-			world_pos + Vector3(-half_size, -half_size, -half_size)
-		]
-	
-	# Add two triangles for the quad
-	st.set_normal(normal)
-	st.add_vertex(vertices[0])
-	st.add_vertex(vertices[1])
-	st.add_vertex(vertices[2])
-	
-	st.add_vertex(vertices[0])
-	st.add_vertex(vertices[2])
-	st.add_vertex(vertices[3])
-
 func clear_cubes():
 	for cube in cubes:
 		if is_instance_valid(cube):
@@ -305,12 +314,218 @@ func _input(event):
 		elif event.keycode == KEY_R:
 			# Regenerate with different random positions
 			get_tree().reload_current_scene()
+		elif event.keycode == KEY_P:
+			save_pile()
+
+# Write cube transforms (basis columns, then origin) and the generated
+# mesh, so cube_mound_reference.py can rebuild and check it
+func save_pile():
+	var data = {"cube_size": cube_size, "voxel_size": voxel_size, "cubes": []}
+	for cube in cubes:
+		if cube is RigidBody3D:
+			var t = cube.transform
+			data["cubes"].append([
+				t.basis.x.x, t.basis.x.y, t.basis.x.z,
+				t.basis.y.x, t.basis.y.y, t.basis.y.z,
+				t.basis.z.x, t.basis.z.y, t.basis.z.z,
+				t.origin.x, t.origin.y, t.origin.z
+			])
+	
+	if generated_mesh and generated_mesh.mesh.get_surface_count() > 0:
+		var arrays = generated_mesh.mesh.surface_get_arrays(0)
+		var vertices = []
+		for v in arrays[Mesh.ARRAY_VERTEX]:
+			vertices.append_array([v.x, v.y, v.z])
+		data["mesh"] = {"vertices": vertices, "indices": Array(arrays[Mesh.ARRAY_INDEX])}
+	
+	var file = FileAccess.open(pile_dump_path, FileAccess.WRITE)
+	if file == null:
+		print("Could not write ", pile_dump_path)
+		return
+	file.store_string(JSON.stringify(data))
+	print("Pile saved to ", ProjectSettings.globalize_path(pile_dump_path))
 
 func _exit_tree():
 	clear_cubes()
 	clear_generated_mesh()
 '''
-    create_file('cube_mound.gd', cube_mound_gd)
+    write('cube_mound.gd', cube_mound_gd)
+    
+    # cube_mound_voxels.gd - Dense voxel grid and greedy mesher
+    cube_mound_voxels_gd = '''# cube_mound_voxels.gd - Dense voxel grid and greedy mesher for the cube pile
+class_name CubeMoundVoxels
+extends RefCounted
+
+# Occupancy lives in one flat PackedByteArray indexed
+# (z * size.y + y) * size.x + x, sized from the bounds of the rotated cubes.
+# Voxel (x, y, z) spans origin + [x, x + 1] * voxel_size on each axis.
+var voxel_size: float = 0.5
+var origin: Vector3 = Vector3.ZERO
+var size: Vector3i = Vector3i.ZERO
+var cells: PackedByteArray = PackedByteArray()
+
+func _init(new_voxel_size: float = 0.5):
+	voxel_size = new_voxel_size
+
+# Half size of the axis-aligned bounds of a rotated box
+static func box_extent(basis: Basis, half: float) -> Vector3:
+	return (basis.x.abs() + basis.y.abs() + basis.z.abs()) * half
+
+# Size the grid to cover every cube (transforms relative to the mound)
+func allocate(transforms: Array, cube_size: float):
+	var half = cube_size * 0.5
+	var min_bounds = Vector3.INF
+	var max_bounds = -Vector3.INF
+	for xform in transforms:
+		var extent = box_extent(xform.basis, half)
+		min_bounds = min_bounds.min(xform.origin - extent)
+		max_bounds = max_bounds.max(xform.origin + extent)
+	
+	origin = min_bounds
+	size = Vector3i(((max_bounds - min_bounds) / voxel_size).ceil()) + Vector3i.ONE
+	cells = PackedByteArray()
+	cells.resize(size.x * size.y * size.z)
+
+# Fill every voxel whose center lies inside the cube's oriented box
+func rasterize_box(xform: Transform3D, half: float):
+	var extent = box_extent(xform.basis, half)
+	var center_offset = Vector3(0.5, 0.5, 0.5)
+	var lo = Vector3i(((xform.origin - extent - origin) / voxel_size - center_offset).ceil())
+	var hi = Vector3i(((xform.origin + extent - origin) / voxel_size - center_offset).floor())
+	lo = lo.clamp(Vector3i.ZERO, size - Vector3i.ONE)
+	hi = hi.clamp(Vector3i.ZERO, size - Vector3i.ONE)
+	
+	# Walk voxel centers in the box's local space, one step per voxel
+	var inverse = xform.affine_inverse()
+	var step_x = inverse.basis.x * voxel_size
+	var step_y = inverse.basis.y * voxel_size
+	var step_z = inverse.basis.z * voxel_size
+	var start = inverse * (origin + (Vector3(lo) + center_offset) * voxel_size)
+	
+	for z in range(lo.z, hi.z + 1):
+		for y in range(lo.y, hi.y + 1):
+			var local = start + step_z * (z - lo.z) + step_y * (y - lo.y)
+			var i = (z * size.y + y) * size.x + lo.x
+			for x in range(lo.x, hi.x + 1):
+				if absf(local.x) <= half and absf(local.y) <= half and absf(local.z) <= half:
+					cells[i] = 1
+				local += step_x
+				i += 1
+
+func filled_count() -> int:
+	return cells.count(1)
+
+# Exposed faces, merged into the largest rectangles per axis slice
+func build_greedy_mesh() -> ArrayMesh:
+	return build_mesh(true)
+
+# One quad per exposed voxel face with vertices shared at lattice corners,
+# for post-processing that needs connectivity (smoothing)
+func build_face_mesh() -> ArrayMesh:
+	return build_mesh(false)
+
+func build_mesh(merge: bool) -> ArrayMesh:
+	var vertices = PackedVector3Array()
+	var normals = PackedVector3Array()
+	var indices = PackedInt32Array()
+	var corners = {}
+	var strides = Vector3i(1, size.x, size.x * size.y)
+	var mask = PackedByteArray()
+	
+	for d in range(3):
+		var u = (d + 1) % 3
+		var v = (d + 2) % 3
+		var nu = size[u]
+		var nv = size[v]
+		mask.resize(nu * nv)
+		
+		for q in range(size[d] + 1):
+			# Faces between layers q - 1 and q: 1 faces +d, 2 faces -d
+			var n = 0
+			for j in range(nv):
+				var index = q * strides[d] + j * strides[v]
+				for i in range(nu):
+					var behind = q > 0 and cells[index - strides[d]] != 0
+					var front = q < size[d] and cells[index] != 0
+					if behind and not front:
+						mask[n] = 1
+					elif front and not behind:
+						mask[n] = 2
+					else:
+						mask[n] = 0
+					index += strides[u]
+					n += 1
+			
+			n = 0
+			for j in range(nv):
+				var i = 0
+				while i < nu:
+					var kind = mask[n]
+					if kind == 0:
+						i += 1
+						n += 1
+						continue
+					var w = 1
+					var h = 1
+					if merge:
+						while i + w < nu and mask[n + w] == kind:
+							w += 1
+						while j + h < nv and row_matches(mask, n + h * nu, w, kind):
+							h += 1
+						for row in range(h):
+							for k in range(w):
+								mask[n + row * nu + k] = 0
+					
+					var a = Vector3i.ZERO
+					a[d] = q
+					a[u] = i
+					a[v] = j
+					var du = Vector3i.ZERO
+					du[u] = w
+					var dv = Vector3i.ZERO
+					dv[v] = h
+					var normal = Vector3.ZERO
+					normal[d] = 1.0 if kind == 1 else -1.0
+					var quad = [a, a + du, a + du + dv, a + dv]
+					var ids = PackedInt32Array()
+					for corner in quad:
+						if merge:
+							ids.append(vertices.size())
+							vertices.append(origin + Vector3(corner) * voxel_size)
+							normals.append(normal)
+						else:
+							if not corners.has(corner):
+								corners[corner] = vertices.size()
+								vertices.append(origin + Vector3(corner) * voxel_size)
+							ids.append(corners[corner])
+					
+					# Clockwise as seen from the side the face points to
+					if kind == 1:
+						indices.append_array(PackedInt32Array([ids[0], ids[2], ids[1], ids[0], ids[3], ids[2]]))
+					else:
+						indices.append_array(PackedInt32Array([ids[0], ids[1], ids[2], ids[0], ids[2], ids[3]]))
+					i += w
+					n += w
+	
+	var mesh = ArrayMesh.new()
+	if indices.is_empty():
+		return mesh
+	var arrays = []
+	arrays.resize(Mesh.ARRAY_MAX)
+	arrays[Mesh.ARRAY_VERTEX] = vertices
+	if merge:
+		arrays[Mesh.ARRAY_NORMAL] = normals
+	arrays[Mesh.ARRAY_INDEX] = indices
+	mesh.add_surface_from_arrays(Mesh.PRIMITIVE_TRIANGLES, arrays)
+	return mesh
+
+func row_matches(mask: PackedByteArray, start: int, width: int, kind: int) -> bool:
+	for k in range(width):
+		if mask[start + k] != kind:
+			return false
+	return true
+'''
+    write('cube_mound_voxels.gd', cube_mound_voxels_gd)
     
     # cube_mound_scene.tscn
     cube_mound_scene = '''[gd_scene load_steps=4 format=3]
@@ -328,12 +543,12 @@ albedo_color = Color(0.3, 0.3, 0.3, 1)
 
 [node name="CubeMound" type="Node3D"]
 script = ExtResource("1")
-num_cubes = 20
-cube_size = 1.0
-spawn_height = 10.0
-spawn_radius = 3.0
-settle_time = 3.0
-voxel_size = 0.5
+num_cubes = %(num_cubes)d
+cube_size = %(cube_size)s
+spawn_height = %(spawn_height)s
+spawn_radius = %(spawn_radius)s
+settle_time = %(settle_time)s
+voxel_size = %(voxel_size)s
 
 [node name="Ground" type="StaticBody3D" parent="."]
 
@@ -362,9 +577,133 @@ offset_right = 400.0
 offset_bottom = 100.0
 text = "SPACE - Drop new cubes and generate mesh
 T - Toggle cube visibility
-R - Restart scene"
+R - Restart scene
+P - Save pile for cube_mound_reference.py"
+''' % vars(args)
+    write('cube_mound_scene.tscn', cube_mound_scene)
+    
+    # Benchmark driver - one seeded pile, timed headless
+    benchmark_gd = '''# cube_mound_benchmark.gd - Seeded pile drop for headless timing
+# Run: godot --headless --path . res://cube_mound_benchmark.tscn -- --benchmark-out=user://cm.json
+# Summarize with benchmark_report.py in the project root
+extends Node3D
+
+@export var random_seed: int = 12345
+@export var max_seconds: float = 30.0
+@export var output_path: String = "user://benchmarks/cube_mound.json"
+
+@onready var mound = $CubeMound
+
+var frames: Array = []
+var elapsed: float = 0.0
+
+func _ready():
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--benchmark-out="):
+			output_path = arg.trim_prefix("--benchmark-out=")
+	# Spawn positions, rotations and colors all come from the global RNG.
+	# The physics solver is not bit-for-bit deterministic, so settle times
+	# still vary a little between runs.
+	seed(random_seed)
+	mound.start_generation()
+	print("Benchmark: %d cubes, voxel_size %.2f, seed %d" % [mound.num_cubes, mound.voxel_size, random_seed])
+
+func _process(delta):
+	elapsed += delta
+	record(delta)
+	if mound.state == "done" or elapsed > max_seconds:
+		finish()
+
+func record(delta: float):
+	var vertices = 0
+	var triangles = 0
+	if mound.generated_mesh and mound.generated_mesh.mesh.get_surface_count() > 0:
+		vertices = mound.generated_mesh.mesh.surface_get_array_len(0)
+		triangles = mound.generated_mesh.mesh.surface_get_array_index_len(0) / 3
+	
+	frames.append({
+		"frame_ms": delta * 1000.0,
+		"process_ms": Performance.get_monitor(Performance.TIME_PROCESS) * 1000.0,
+		"physics_ms": Performance.get_monitor(Performance.TIME_PHYSICS_PROCESS) * 1000.0,
+		"awake_cubes": mound.cubes.size() - mound.sleeping_count,
+		"active_bodies": Performance.get_monitor(Performance.PHYSICS_3D_ACTIVE_OBJECTS),
+		"collision_pairs": Performance.get_monitor(Performance.PHYSICS_3D_COLLISION_PAIRS),
+		"vertices": vertices,
+		"triangles": triangles,
+		"objects": Performance.get_monitor(Performance.OBJECT_COUNT),
+		"nodes": Performance.get_monitor(Performance.OBJECT_NODE_COUNT),
+		"resources": Performance.get_monitor(Performance.OBJECT_RESOURCE_COUNT),
+		"draw_calls": Performance.get_monitor(Performance.RENDER_TOTAL_DRAW_CALLS_IN_FRAME),
+		"primitives": Performance.get_monitor(Performance.RENDER_TOTAL_PRIMITIVES_IN_FRAME),
+		"static_memory_mb": Performance.get_monitor(Performance.MEMORY_STATIC) / 1048576.0
+	})
+
+func finish():
+	set_process(false)
+	if mound.state != "done":
+		push_warning("Benchmark: pile did not finish within %.0f s (state %s)" % [max_seconds, mound.state])
+	var report = {
+		"benchmark": "cube_mound",
+		"engine": Engine.get_version_info()["string"],
+		"settings": {
+			"num_cubes": mound.num_cubes,
+			"cube_size": mound.cube_size,
+			"voxel_size": mound.voxel_size,
+			"random_seed": random_seed
+		},
+		"results": {
+			"completed": 1 if mound.state == "done" else 0,
+			"settle_ms": mound.settle_seconds * 1000.0,
+			"generation_ms": mound.generation_usec / 1000.0,
+			"vertices": frames[-1]["vertices"],
+			"triangles": frames[-1]["triangles"]
+		},
+		"frames": frames
+	}
+	
+	DirAccess.make_dir_recursive_absolute(output_path.get_base_dir())
+	var file = FileAccess.open(output_path, FileAccess.WRITE)
+	if file == null:
+		push_error("Benchmark: could not write %s" % output_path)
+	else:
+		file.store_string(JSON.stringify(report))
+		file.close()
+		print("Benchmark: %d frames written to %s" % [frames.size(), ProjectSettings.globalize_path(output_path)])
+	get_tree().quit()
 '''
-    create_file('cube_mound_scene.tscn', cube_mound_scene)
+    write('cube_mound_benchmark.gd', benchmark_gd)
+    
+    benchmark_scene = '''[gd_scene load_steps=4 format=3]
+
+[ext_resource type="Script" path="res://cube_mound_benchmark.gd" id="1"]
+[ext_resource type="Script" path="res://cube_mound.gd" id="2"]
+
+[sub_resource type="BoxShape3D" id="1"]
+size = Vector3(30, 1, 30)
+
+[node name="CubeMoundBenchmark" type="Node3D"]
+script = ExtResource("1")
+
+[node name="CubeMound" type="Node3D" parent="."]
+script = ExtResource("2")
+num_cubes = %(num_cubes)d
+cube_size = %(cube_size)s
+spawn_height = %(spawn_height)s
+spawn_radius = %(spawn_radius)s
+settle_time = %(settle_time)s
+voxel_size = %(voxel_size)s
+generate_on_start = false
+
+[node name="Ground" type="StaticBody3D" parent="CubeMound"]
+
+[node name="CollisionShape3D" type="CollisionShape3D" parent="CubeMound/Ground"]
+transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, 0, -0.5, 0)
+shape = SubResource("1")
+
+[node name="Camera3D" type="Camera3D" parent="."]
+transform = Transform3D(0.866, -0.25, 0.433, 0, 0.866, 0.5, -0.5, -0.433, 0.75, 12, 8, 12)
+''' % vars(args)
+    write('cube_mound_benchmark.tscn', benchmark_scene)
     
     # advanced_cube_mound.gd - Version with smoothing options
     advanced_cube_mound_gd = '''# advanced_cube_mound.gd - Advanced version with smoothing and options
@@ -375,6 +714,9 @@ extends Node3D
 @export var spawn_height: float = 10.0
 @export var spawn_radius: float = 3.0
 @export var settle_time: float = 3.0
+# Also settle once total kinetic energy drops below this (0 = off), checked every energy_check_interval s
+@export var energy_threshold: float = 0.0
+@export var energy_check_interval: float = 0.25
 @export var voxel_size: float = 0.5
 @export var smooth_mesh: bool = true
 @export var smooth_iterations: int = 2
@@ -384,6 +726,8 @@ extends Node3D
 var cubes: Array = []
 var state: String = "idle"
 var timer: float = 0.0
+var energy_timer: float = 0.0
+var sleeping_count: int = 0  # kept up to date by sleeping_state_changed
 var generated_mesh: MeshInstance3D = null
 
 @onready var ground = $Ground
@@ -400,6 +744,7 @@ func start_generation():
 	clear_generated_mesh()
 	
 	print("Dropping %d cubes..." % num_cubes)
+	sleeping_count = 0
 	drop_cubes()
 	state = "dropping"
 	timer = 0.0
@@ -434,6 +779,7 @@ func drop_cubes():
 		mesh_instance.material_override = material
 		cube.add_child(mesh_instance)
 		
+		cube.sleeping_state_changed.connect(_on_cube_sleeping_state_changed.bind(cube))
 		add_child(cube)
 		cubes.append(cube)
 
@@ -443,39 +789,61 @@ func _process(delta):
 		if timer > 0.5:
 			state = "settling"
 			timer = 0.0
+			energy_timer = 0.0
+			if sleeping_count == cubes.size():
+				settle()
 	
 	elif state == "settling":
 		timer += delta
 		
-		var all_settled = true
-		for cube in cubes:
-			if cube is RigidBody3D and not cube.sleeping:
-				all_settled = false
-				break
-		
-		if timer > settle_time or all_settled:
-			print("Generating mesh...")
-			state = "generating"
-			await get_tree().process_frame
-			generate_mesh_from_cubes()
-			state = "done"
-			print("Done!")
+		if timer > settle_time:
+			settle()
+		elif energy_threshold > 0.0:
+			energy_timer += delta
+			if energy_timer >= energy_check_interval:
+				energy_timer = 0.0
+				if pile_kinetic_energy() < energy_threshold:
+					settle()
+
+func _on_cube_sleeping_state_changed(cube: RigidBody3D):
+	sleeping_count += 1 if cube.sleeping else -1
+	if state == "settling" and sleeping_count == cubes.size():
+		settle()
+
+func pile_kinetic_energy() -> float:
+	var inertia_factor = cube_size * cube_size / 6.0
+	var energy = 0.0
+	for cube in cubes:
+		energy += 0.5 * cube.mass * (cube.linear_velocity.length_squared()
+			+ inertia_factor * cube.angular_velocity.length_squared())
+	return energy
+
+func settle():
+	print("Generating mesh...")
+	state = "generating"
+	await get_tree().process_frame
+	generate_mesh_from_cubes()
+	state = "done"
+	print("Done!")
 
 func generate_mesh_from_cubes():
-	var positions = []
+	var transforms = []
 	for cube in cubes:
 		if cube is RigidBody3D:
-			positions.append(cube.global_position)
+			transforms.append(cube.transform)
 	
-	if positions.is_empty():
+	if transforms.is_empty():
 		return
 	
 	var surface_mesh: ArrayMesh
 	
 	if use_convex_hull:
+		var positions = []
+		for xform in transforms:
+			positions.append(xform.origin)
 		surface_mesh = create_convex_hull_mesh(positions)
 	else:
-		surface_mesh = create_voxel_mesh(positions)
+		surface_mesh = create_voxel_mesh(transforms)
 	
 	if smooth_mesh and not use_convex_hull:
 		surface_mesh = smooth_mesh_laplacian(surface_mesh, smooth_iterations)
@@ -526,109 +894,16 @@ func create_convex_hull_mesh(positions: Array) -> ArrayMesh:
 	st.generate_normals()
 	return st.commit()
 
-func create_voxel_mesh(positions: Array) -> ArrayMesh:
-	var min_bounds = positions[0]
-	var max_bounds = positions[0]
-	
-	for pos in positions:
-		min_bounds = min_bounds.min(pos)
-		max_bounds = max_bounds.max(pos)
+# Greedy-merged faces, or connected per-voxel faces when smoothing follows
+func create_voxel_mesh(transforms: Array) -> ArrayMesh:
+	var voxels = CubeMoundVoxels.new(voxel_size)
+	voxels.allocate(transforms, cube_size)
+	for xform in transforms:
+		voxels.rasterize_box(xform, cube_size * 0.5)
 	
-	min_bounds -= Vector3.ONE * cube_size
-	max_bounds += Vector3.ONE * cube_size
-	
-	var voxel_grid = {}
-	
-	for pos in positions:
-		var voxel_pos = ((pos - min_bounds) / voxel_size).floor()
-		var half_extent = int(ceil(cube_size / voxel_size))
-		
-		for x in range(-half_extent, half_extent + 1):
-			for y in range(-half_extent, half_extent + 1):
-				for z in range(-half_extent, half_extent + 1):
-					var check_pos = voxel_pos + Vector3(x, y, z)
-					var key = "%d,%d,%d" % [check_pos.x, check_pos.y, check_pos.z]
-					voxel_grid[key] = true
-	
-	var st = SurfaceTool.new()
-	st.begin(Mesh.PRIMITIVE_TRIANGLES)
-	
-	for key in voxel_grid.keys():
-		var parts = key.split(",")
-		var pos = Vector3(int(parts[0]), int(parts[1]), int(parts[2]))
-		
-		var directions = [
-			Vector3(1, 0, 0), Vector3(-1, 0, 0),
-			Vector3(0, 1, 0), Vector3(0, -1, 0),
-			Vector3(0, 0, 1), Vector3(0, 0, -1)
-		]
-		
-		for dir in directions:
-			var neighbor_pos = pos + dir
-			var neighbor_key = "%d,%d,%d" % [neighbor_pos.x, neighbor_pos.y, neighbor_pos.z]
-			
-			if not voxel_grid.has(neighbor_key):
-				add_voxel_face(st, pos, dir, min_bounds)
-	
-	st.generate_normals()
-	return st.commit()
-
-func add_voxel_face(st: SurfaceTool, voxel_pos: Vector3, normal: Vector3, min_bounds: Vector3):
-	var world_pos = min_bounds + voxel_pos * voxel_size
-	var hs = voxel_size * 0.5
-	
-	var vertices = []
-	
-	if normal.x > 0:
-		vertices = [
-			world_pos + Vector3(hs, -hs, -hs),
-			world_pos + Vector3(hs, -hs, hs),
-			world_pos + Vector3(hs, hs, hs),
-			world_pos + Vector3(hs, hs, -hs)
-		]
-	elif normal.x < 0:
-		vertices = [
-			world_pos + Vector3(-hs, -hs, hs),
-			world_pos + Vector3(-hs, -hs, -hs),
-			world_pos + Vector3(-hs, hs, -hs),
-			world_pos + Vector3(-hs, hs, hs)
-		]
-	elif normal.y > 0:
-		vertices = [
-			world_pos + Vector3(-hs, hs, -hs),
-			world_pos + Vector3(hs, hs, -hs),
-			world_pos + Vector3(hs, hs, hs),
-			world_pos + Vector3(-hs, hs, hs)
-		]
-	elif normal.y < 0:
-		vertices = [
-			world_pos + Vector3(-hs, -hs, hs),
-			world_pos + Vector3(hs, -hs, hs),
-			world_pos + Vector3(hs, -hs, -hs),
-			world_pos + Vector3(-hs, -hs, -hs)
-		]
-	elif normal.z > 0:
-		vertices = [
-			world_pos + Vector3(-hs, -hs, hs),
-			world_pos + Vector3(-hs, hs, hs),
-			world_pos + Vector3(hs, hs, hs),
-			world_pos + Vector3(hs, -hs, hs)
-		]
-	else:
-		vertices = [
-			world_pos + Vector3(hs, -hs, -hs),
-			world_pos + Vector3(hs, hs, -hs),
-			world_pos + Vector3(-hs, hs, -hs),
-			world_pos + Vector3(-hs, -hs, -hs)
-		]
-	
-	st.set_normal(normal)
-	st.add_vertex(vertices[0])
-	st.add_vertex(vertices[1])
-	st.add_vertex(vertices[2])
-	st.add_vertex(vertices[0])
-	st.add_vertex(vertices[2])
-	st.add_vertex(vertices[3])
+	if smooth_mesh:
+		return voxels.build_face_mesh()
+	return voxels.build_greedy_mesh()
 
 func smooth_mesh_laplacian(input_mesh: ArrayMesh, iterations: int) -> ArrayMesh:
 	for iter in range(iterations):
@@ -704,7 +979,7 @@ func _exit_tree():
 	clear_cubes()
 	clear_generated_mesh()
 '''
-    create_file('advanced_cube_mound.gd', advanced_cube_mound_gd)
+    write('advanced_cube_mound.gd', advanced_cube_mound_gd)
     
     # README.md
     readme = '''# Godot 4 Cube Mound Mesh Generator
@@ -735,6 +1010,7 @@ Drop physics cubes, let them pile up, then generate a mesh from their positions!
 - **SPACE** - Drop new cubes and generate mesh
 - **T** - Toggle cube visibility (show/hide original cubes)
 - **R** - Restart scene with new random positions
+- **P** - Save the pile and mesh to `pile_dump_path` (default `user://cube_pile.json`)
 
 ## How It Works
 
@@ -747,7 +1023,10 @@ Drop physics cubes, let them pile up, then generate a mesh from their positions!
 ### 2. Settle Phase
 - Physics engine simulates falling
 - Cubes collide and pile up
-- Waits for all cubes to sleep (stop moving)
+- Counts cubes as they fall asleep through `sleeping_state_changed`,
+  and generates as soon as the last one sleeps
+- Optionally also settles once total kinetic energy drops below
+  `energy_threshold` (checked every `energy_check_interval` seconds)
 - Or times out after `settle_time` seconds
 
 ### 3. Generate Phase
@@ -786,6 +1065,11 @@ Drop physics cubes, let them pile up, then generate a mesh from their positions!
   - Max wait for physics to settle
   - Increase for more cubes
 
+- **Energy Threshold** (default: 0.0 = off)
+  - Generate once the pile's kinetic energy falls below this
+  - Useful when a few cubes jitter and never sleep
+  - Checked every **Energy Check Interval** (default: 0.25 s)
+
 - **Voxel Size** (default: 0.5)
   - Resolution of generated mesh
   - Smaller = more detailed mesh
@@ -857,8 +1141,51 @@ smooth_mesh = true
 smooth_iterations = 3
 ```
 
+### Installing Several Variants
+The scene settings can be passed to the installer (`--num-cubes`,
+`--cube-size`, `--spawn-height`, `--spawn-radius`, `--settle-time`,
+`--voxel-size`), or listed in a variant spec that installs each variant
+into its own folder:
+
+```bash
+python cube_mound_installer.py --variants mounds.json --output mounds
+```
+
+```json
+{"variants": [
+  {"name": "small_detailed", "num_cubes": 30, "cube_size": 0.5, "spawn_radius": 2.0, "voxel_size": 0.3},
+  {"name": "large_rough", "num_cubes": 100, "spawn_radius": 5.0, "voxel_size": 1.0}
+]}
+```
+
+Each variant folder is self-contained: its scripts and scenes load the
+files next to them (res:// paths are written relative to the folder
+holding project.godot), and its global classes (`CubeMoundVoxels`) get
+the variant name as a suffix (`big_pile` -> `CubeMoundVoxelsBigPile`),
+so variants run side by side in one project.
+
+Files whose content is unchanged are not rewritten, so re-running the
+installer only makes Godot reimport what actually changed.
+
 ## Performance Notes
 
+### Benchmark Scene
+`cube_mound_benchmark.tscn` drops one seeded pile with the same settings
+as the demo scene and quits once the mesh is built (or after
+`max_seconds`). For each frame it records frame, process and physics
+time, awake cubes, active bodies and collision pairs, vertex and triangle
+counts, and object, node, draw call and memory monitors. It also records
+settle time and mesh generation time, and writes everything to JSON:
+
+```bash
+godot --headless --path . res://cube_mound_benchmark.tscn -- --benchmark-out=user://cm.json
+python benchmark_report.py cm.json --save-baseline baseline.json   # from the project root
+python benchmark_report.py cm.json --baseline baseline.json         # later runs
+```
+
+Physics is not bit-for-bit deterministic, so settle time varies a little
+even with the same seed; compare several runs before trusting a change.
+
 ### Voxel Resolution
 - **Small voxels** (0.2-0.4): High detail, many triangles
 - **Medium voxels** (0.5-0.8): Balanced
@@ -881,28 +1208,52 @@ smooth_iterations = 3
 
 ### Voxelization Algorithm
 ```
-For each cube position:
-  Calculate voxel grid position
-  Mark cube volume as occupied (multiple voxels)
-
-For each occupied voxel:
-  Check 6 neighbors (NESW, Up, Down)
-  If neighbor is empty:
-    Add face to mesh
+Size one flat PackedByteArray grid from the bounds of the rotated cubes
+
+For each cube transform:
+  For each voxel center inside the cube's bounding box:
+    Transform it into the cube's local space
+    Mark it if it lies inside the box (rotation respected)
 ```
 
-### Mesh Generation
-- Uses SurfaceTool for construction
-- Generates normals automatically
+`CubeMoundVoxels` (`cube_mound_voxels.gd`) holds the grid; voxel_size
+should be at most half of cube_size so every cube covers a voxel center.
+
+### Mesh Generation (Greedy Meshing)
+```
+For each axis and each slice between two voxel layers:
+  Build a mask of exposed faces (+axis or -axis)
+  Merge equal neighbors into the widest, then tallest rectangles
+  Emit one quad per rectangle
+```
+- Built straight into vertex/normal/index arrays (no SurfaceTool)
 - Clockwise winding for correct lighting
-- Each exposed voxel face becomes 2 triangles
+- Flat areas of the pile become a few large quads instead of one quad
+  per voxel face
 
 ### Smoothing (Advanced)
+- Runs on per-voxel faces that share lattice corners (not greedy quads)
 - Laplacian smoothing
 - Averages vertex positions with neighbors
 - Preserves topology
 - Multiple iterations for more smoothing
 
+## Reference Pipeline and Benchmark
+
+`cube_mound_reference.py` (needs NumPy) runs the same voxelize, face and
+greedy-merge steps as `cube_mound_voxels.gd`, in the same order:
+
+```bash
+python cube_mound_reference.py cube_pile.json --check          # compare with the Godot mesh
+python cube_mound_reference.py cube_pile.json -o golden.json   # golden mesh for regressions
+python cube_mound_reference.py --benchmark                     # 20 to 10,000 cubes
+python cube_mound_reference.py --benchmark --cubes 500 --voxel-sizes 0.3,0.4,0.5
+```
+
+The benchmark drops synthetic cone-shaped piles of randomly rotated
+cubes and reports grid size, filled voxels, exposed faces, greedy
+triangles and time per stage for each voxel_size.
+
 ## Troubleshooting
 
 **Cubes fall through ground:**
@@ -974,7 +1325,31 @@ Laplacian smoothing for organic shapes.
 
 Enjoy creating mounds! 📦🏔️
 '''
-    create_file('README.md', readme)
+    write('README.md', readme)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Install the cube mound mesh generator")
+    parser.add_argument("--num-cubes", type=int, default=20, help="cubes dropped per pile")
+    parser.add_argument("--cube-size", type=float, default=1.0, help="edge length of each cube")
+    parser.add_argument("--spawn-height", type=float, default=10.0, help="drop height")
+    parser.add_argument("--spawn-radius", type=float, default=3.0, help="radius of the drop cylinder")
+    parser.add_argument("--settle-time", type=float, default=3.0, help="max seconds to wait for the pile to sleep")
+    parser.add_argument("--voxel-size", type=float, default=0.5, help="voxel edge length of the generated mesh")
+    parser.add_argument("--variants", metavar="SPEC.json",
+                        help="install each variant of a JSON spec into its own folder under --output")
+    parser.add_argument("--output", default=".", help="output folder (default: current directory)")
+    if argv is None:
+        argv = sys.argv[1:]
+    args = parser.parse_args(argv)
+    variants = load_variants(parser, argv, args)
+
+    print("=" * 60)
+    print("Godot 4 Cube Mound Mesh Generator - Installer")
+    print("=" * 60)
+    for out_dir, options in variants:
+        print(f"\nCreating cube mound system ({options.num_cubes} cubes, "
+              f"voxel_size {options.voxel_size}) in {os.path.abspath(out_dir)}\n")
+        install(options, out_dir)
     
     print("\n" + "=" * 60)
     print("Installation Complete!")
@@ -982,7 +1357,10 @@ Enjoy creating mounds! 📦🏔️
     print("\nCreated files:")
     print("  - cube_mound.gd (Basic version)")
     print("  - advanced_cube_mound.gd (With smoothing)")
+    print("  - cube_mound_voxels.gd (Voxel grid and greedy mesher)")
+    print("  - cube_mound_reference.py is not generated; it ships next to this installer")
     print("  - cube_mound_scene.tscn (Demo scene)")
+    print("  - cube_mound_benchmark.gd/.tscn (Headless benchmark)")
     print("  - README.md (Full documentation)")
     print("\n" + "=" * 60)
     print("NEXT STEPS:")
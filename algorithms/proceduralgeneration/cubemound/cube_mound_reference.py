@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+NumPy reference of the cube mound voxel pipeline (cube_mound_voxels.gd)
+
+Runs the same steps as CubeMoundVoxels outside the editor:
+1. size the grid from the bounds of the rotated cubes
+2. rasterize each cube's oriented box (voxel centers inside the box)
+3. find exposed faces per axis slice
+4. greedy-merge them into quads, in the same order as the GDScript
+
+Input is the pile dump written by cube_mound.gd (P key):
+    {"cube_size": 1.0, "voxel_size": 0.5,
+     "cubes": [[bx.x, bx.y, bx.z, by.x, ..., bz.z, o.x, o.y, o.z], ...],
+     "mesh": {"vertices": [...], "indices": [...]}}   # optional
+Each cube is a Transform3D: basis columns x, y, z, then the origin.
+
+Usage:
+    python cube_mound_reference.py pile.json --check          # compare with the Godot mesh
+    python cube_mound_reference.py pile.json -o golden.json   # write the golden mesh
+    python cube_mound_reference.py --benchmark                # 20 .. 10000 cubes
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+BENCHMARK_CUBES = (20, 100, 500, 1000, 2500, 5000, 10000)
+BENCHMARK_VOXEL_SIZES = (0.25, 0.5, 1.0)
+BATCH = 1024
+
+
+def load_pile(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    cubes = np.asarray(data.get("cubes", []), dtype=np.float64).reshape(-1, 12)
+    return data, cubes[:, :9].reshape(-1, 3, 3).transpose(0, 2, 1), cubes[:, 9:]
+
+
+class VoxelGrid:
+    """Dense occupancy indexed [z, y, x], like CubeMoundVoxels.cells"""
+
+    def __init__(self, bases, origins, cube_size, voxel_size):
+        self.voxel_size = voxel_size
+        half = cube_size * 0.5
+        extents = np.abs(bases).sum(axis=2) * half
+        self.origin = (origins - extents).min(axis=0)
+        top = (origins + extents).max(axis=0)
+        self.size = np.ceil((top - self.origin) / voxel_size).astype(np.int64) + 1
+        self.cells = np.zeros(self.size[::-1], dtype=np.uint8)
+
+    def rasterize(self, bases, origins, half):
+        """Fill voxel centers inside each oriented box; all cubes at once, in batches"""
+        vs = self.voxel_size
+        extents = np.abs(bases).sum(axis=2) * half
+        limit = self.size - 1
+        lo = np.clip(np.ceil((origins - extents - self.origin) / vs - 0.5), 0, limit).astype(np.int64)
+        hi = np.clip(np.floor((origins + extents - self.origin) / vs - 0.5), 0, limit).astype(np.int64)
+        window = int((hi - lo).max()) + 1 if len(lo) else 0
+        offsets = np.stack(np.meshgrid(*(np.arange(window),) * 3, indexing="ij"), -1).reshape(-1, 3)
+        inverses = np.linalg.inv(bases)
+        for start in range(0, len(lo), BATCH):
+            end = start + BATCH
+            cells = lo[start:end, None, :] + offsets[None]
+            valid = (cells <= hi[start:end, None, :]).all(axis=2)
+            centers = self.origin + (cells + 0.5) * vs
+            local = np.einsum("nij,nkj->nki", inverses[start:end], centers - origins[start:end, None, :])
+            inside = valid & (np.abs(local) <= half).all(axis=2)
+            hit = cells[inside]
+            self.cells[hit[:, 2], hit[:, 1], hit[:, 0]] = 1
+
+    def face_masks(self, d):
+        """(size[d] + 1, nv, nu) masks: 1 = face toward +d, 2 = toward -d"""
+        u, v = (d + 1) % 3, (d + 2) % 3
+        by_xyz = self.cells.transpose(2, 1, 0)
+        grid = np.transpose(by_xyz, (d, v, u)).astype(bool)
+        padded = np.pad(grid, ((1, 1), (0, 0), (0, 0)))
+        behind, front = padded[:-1], padded[1:]
+        return np.where(behind & ~front, 1, np.where(front & ~behind, 2, 0)).astype(np.uint8)
+
+    def exposed_faces(self):
+        return int(sum(np.count_nonzero(self.face_masks(d)) for d in range(3)))
+
+    def build_mesh(self, merge=True):
+        """(vertices, indices) in the same order as CubeMoundVoxels.build_mesh"""
+        vertices, indices = [], []
+        corners = {}
+        for d in range(3):
+            u, v = (d + 1) % 3, (d + 2) % 3
+            masks = self.face_masks(d)
+            nv, nu = masks.shape[1:]
+            for q in range(masks.shape[0]):
+                mask = masks[q].reshape(-1).tolist()
+                for n in np.flatnonzero(masks[q]).tolist():
+                    kind = mask[n]
+                    if kind == 0:
+                        continue  # merged into an earlier quad
+                    j, i = divmod(n, nu)
+                    w = h = 1
+                    if merge:
+                        while i + w < nu and mask[n + w] == kind:
+                            w += 1
+                        while j + h < nv and all(mask[n + h * nu + k] == kind for k in range(w)):
+                            h += 1
+                        for row in range(h):
+                            mask[n + row * nu:n + row * nu + w] = [0] * w
+                    a = [0, 0, 0]
+                    a[d], a[u], a[v] = q, i, j
+                    quad = []
+                    for du, dv in ((0, 0), (w, 0), (w, h), (0, h)):
+                        corner = list(a)
+                        corner[u] += du
+                        corner[v] += dv
+                        quad.append(tuple(corner))
+                    ids = []
+                    for corner in quad:
+                        if merge:
+                            ids.append(len(vertices))
+                            vertices.append(corner)
+                        else:
+                            if corner not in corners:
+                                corners[corner] = len(vertices)
+                                vertices.append(corner)
+                            ids.append(corners[corner])
+                    if kind == 1:
+                        indices += [ids[0], ids[2], ids[1], ids[0], ids[3], ids[2]]
+                    else:
+                        indices += [ids[0], ids[1], ids[2], ids[0], ids[2], ids[3]]
+        positions = self.origin + np.asarray(vertices, dtype=np.float64).reshape(-1, 3) * self.voxel_size
+        return positions, np.asarray(indices, dtype=np.int64)
+
+
+def run_pipeline(bases, origins, cube_size, voxel_size, merge=True):
+    """Returns (grid, vertices, indices, timings in ms)"""
+    timings = {}
+    t0 = time.perf_counter()
+    grid = VoxelGrid(bases, origins, cube_size, voxel_size)
+    grid.rasterize(bases, origins, cube_size * 0.5)
+    t1 = time.perf_counter()
+    faces = grid.exposed_faces()
+    t2 = time.perf_counter()
+    vertices, indices = grid.build_mesh(merge)
+    t3 = time.perf_counter()
+    timings["voxelize"] = (t1 - t0) * 1000.0
+    timings["faces"] = (t2 - t1) * 1000.0
+    timings["greedy"] = (t3 - t2) * 1000.0
+    timings["exposed_faces"] = faces
+    return grid, vertices, indices, timings
+
+
+def compare_mesh(expected_vertices, expected_indices, mesh, tolerance=1e-3):
+    """Problems between the reference mesh and a mesh dumped by Godot"""
+    problems = []
+    vertices = np.asarray(mesh.get("vertices", []), dtype=np.float64).reshape(-1, 3)
+    indices = np.asarray(mesh.get("indices", []), dtype=np.int64)
+    if len(vertices) != len(expected_vertices):
+        problems.append(f"vertex count {len(vertices)} != reference {len(expected_vertices)}")
+    if len(indices) != len(expected_indices):
+        problems.append(f"index count {len(indices)} != reference {len(expected_indices)}")
+    if problems:
+        return problems
+    if len(vertices):
+        error = float(np.abs(vertices - expected_vertices).max())
+        if error > tolerance:
+            problems.append(f"vertex positions differ by up to {error:.5f}")
+    mismatched = int(np.count_nonzero(indices != expected_indices))
+    if mismatched:
+        problems.append(f"{mismatched} indices differ")
+    return problems
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+def random_rotations(count, rng):
+    """Uniform random rotation matrices (columns = basis x, y, z)"""
+    q = rng.normal(size=(count, 4))
+    q /= np.linalg.norm(q, axis=1, keepdims=True)
+    w, x, y, z = q.T
+    return np.stack([
+        np.stack([1 - 2 * (y * y + z * z), 2 * (x * y + w * z), 2 * (x * z - w * y)], -1),
+        np.stack([2 * (x * y - w * z), 1 - 2 * (x * x + z * z), 2 * (y * z + w * x)], -1),
+        np.stack([2 * (x * z + w * y), 2 * (y * z - w * x), 1 - 2 * (x * x + y * y)], -1),
+    ], -1)
+
+
+def synthetic_pile(count, cube_size=1.0, rng=None):
+    """A cone-shaped heap of randomly rotated cubes, roughly as dense as a settled pile"""
+    rng = rng or np.random.default_rng(1)
+    radius = max(cube_size * 2.0, cube_size * (count ** (1.0 / 3.0)) * 1.2)
+    r = radius * np.sqrt(rng.random(count))
+    angle = rng.random(count) * 2.0 * np.pi
+    height = (radius - r) * rng.random(count) + cube_size * 0.5
+    origins = np.stack([r * np.cos(angle), height, r * np.sin(angle)], -1)
+    return random_rotations(count, rng), origins
+
+
+def benchmark(cube_counts, voxel_sizes, cube_size=1.0, seed=1):
+    rng = np.random.default_rng(seed)
+    print(f"{'cubes':>6} {'voxel':>6} {'grid':>14} {'filled':>9} {'faces':>8} {'tris':>8} "
+          f"{'voxelize':>9} {'faces':>7} {'greedy':>8} {'total':>8}")
+    results = []
+    for count in cube_counts:
+        bases, origins = synthetic_pile(count, cube_size, rng)
+        for voxel_size in voxel_sizes:
+            grid, _vertices, indices, t = run_pipeline(bases, origins, cube_size, voxel_size)
+            total = t["voxelize"] + t["faces"] + t["greedy"]
+            dims = "x".join(str(int(s)) for s in grid.size)
+            print(f"{count:6d} {voxel_size:6.2f} {dims:>14} {int(grid.cells.sum()):9d} {t['exposed_faces']:8d} "
+                  f"{len(indices) // 3:8d} {t['voxelize']:8.1f}ms {t['faces']:5.1f}ms {t['greedy']:6.1f}ms "
+                  f"{total:6.1f}ms")
+            results.append({
+                "cubes": count, "voxel_size": voxel_size, "grid": [int(s) for s in grid.size],
+                "filled": int(grid.cells.sum()), "exposed_faces": t["exposed_faces"],
+                "triangles": len(indices) // 3, "ms": {k: round(t[k], 3) for k in ("voxelize", "faces", "greedy")},
+            })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reference cube mound voxel pipeline and benchmark")
+    parser.add_argument("pile", nargs="?", help="pile JSON dumped by cube_mound.gd")
+    parser.add_argument("--voxel-size", type=float, help="override the dump's voxel_size")
+    parser.add_argument("--faces", action="store_true", help="per-voxel faces (build_face_mesh) instead of greedy")
+    parser.add_argument("-o", "--output", help="write the golden mesh as JSON")
+    parser.add_argument("--check", action="store_true", help="compare with the mesh stored in the dump")
+    parser.add_argument("--benchmark", action="store_true", help="time synthetic piles")
+    parser.add_argument("--cubes", help="benchmark cube counts, comma separated")
+    parser.add_argument("--voxel-sizes", help="benchmark voxel sizes, comma separated")
+    parser.add_argument("--json", metavar="PATH", help="write benchmark results as JSON")
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    if args.benchmark:
+        counts = [int(c) for c in args.cubes.split(",")] if args.cubes else BENCHMARK_CUBES
+        sizes = [float(s) for s in args.voxel_sizes.split(",")] if args.voxel_sizes else BENCHMARK_VOXEL_SIZES
+        results = benchmark(counts, sizes)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+            print(f"\nResults written to {args.json}")
+        print("=" * 60)
+        return 0
+    if not args.pile:
+        parser.error("give a pile JSON or --benchmark")
+
+    data, bases, origins = load_pile(args.pile)
+    cube_size = float(data.get("cube_size", 1.0))
+    voxel_size = args.voxel_size or float(data.get("voxel_size", 0.5))
+    grid, vertices, indices, t = run_pipeline(bases, origins, cube_size, voxel_size, not args.faces)
+    print(f"{len(bases)} cubes, voxel_size {voxel_size}: grid {'x'.join(str(int(s)) for s in grid.size)}, "
+          f"{int(grid.cells.sum())} filled, {t['exposed_faces']} exposed faces, {len(indices) // 3} triangles")
+    print(f"voxelize {t['voxelize']:.1f} ms, faces {t['faces']:.1f} ms, greedy {t['greedy']:.1f} ms")
+
+    if args.output:
+        golden = {
+            "format": "cube_mound_golden", "version": 1,
+            "cube_size": cube_size, "voxel_size": voxel_size,
+            "origin": grid.origin.tolist(), "size": [int(s) for s in grid.size],
+            "filled": int(grid.cells.sum()),
+            "vertices": [round(v, 6) for v in vertices.reshape(-1).tolist()],
+            "indices": indices.tolist(),
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(golden, f)
+        print(f"Golden mesh written to {args.output}")
+
+    status = 0
+    if args.check:
+        if "mesh" not in data:
+            print("The dump has no mesh to check (generate the mesh before saving the pile)")
+            status = 1
+        else:
+            problems = compare_mesh(vertices, indices, data["mesh"])
+            for problem in problems:
+                print(f"MISMATCH: {problem}")
+            print("Mesh matches the reference" if not problems else f"{len(problems)} mismatches")
+            status = 1 if problems else 0
+    print("=" * 60)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
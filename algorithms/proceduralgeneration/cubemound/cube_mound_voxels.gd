@@ -0,0 +1,172 @@
+# cube_mound_voxels.gd - Dense voxel grid and greedy mesher for the cube pile
+class_name CubeMoundVoxels
+extends RefCounted
+
+# Occupancy lives in one flat PackedByteArray indexed
+# (z * size.y + y) * size.x + x, sized from the bounds of the rotated cubes.
+# Voxel (x, y, z) spans origin + [x, x + 1] * voxel_size on each axis.
+var voxel_size: float = 0.5
+var origin: Vector3 = Vector3.ZERO
+var size: Vector3i = Vector3i.ZERO
+var cells: PackedByteArray = PackedByteArray()
+
+func _init(new_voxel_size: float = 0.5):
+	voxel_size = new_voxel_size
+
+# Half size of the axis-aligned bounds of a rotated box
+static func box_extent(basis: Basis, half: float) -> Vector3:
+	return (basis.x.abs() + basis.y.abs() + basis.z.abs()) * half
+
+# Size the grid to cover every cube (transforms relative to the mound)
+func allocate(transforms: Array, cube_size: float):
+	var half = cube_size * 0.5
+	var min_bounds = Vector3.INF
+	var max_bounds = -Vector3.INF
+	for xform in transforms:
+		var extent = box_extent(xform.basis, half)
+		min_bounds = min_bounds.min(xform.origin - extent)
+		max_bounds = max_bounds.max(xform.origin + extent)
+	
+	origin = min_bounds
+	size = Vector3i(((max_bounds - min_bounds) / voxel_size).ceil()) + Vector3i.ONE
+	cells = PackedByteArray()
+	cells.resize(size.x * size.y * size.z)
+
+# Fill every voxel whose center lies inside the cube's oriented box
+func rasterize_box(xform: Transform3D, half: float):
+	var extent = box_extent(xform.basis, half)
+	var center_offset = Vector3(0.5, 0.5, 0.5)
+	var lo = Vector3i(((xform.origin - extent - origin) / voxel_size - center_offset).ceil())
+	var hi = Vector3i(((xform.origin + extent - origin) / voxel_size - center_offset).floor())
+	lo = lo.clamp(Vector3i.ZERO, size - Vector3i.ONE)
+	hi = hi.clamp(Vector3i.ZERO, size - Vector3i.ONE)
+	
+	# Walk voxel centers in the box's local space, one step per voxel
+	var inverse = xform.affine_inverse()
+	var step_x = inverse.basis.x * voxel_size
+	var step_y = inverse.basis.y * voxel_size
+	var step_z = inverse.basis.z * voxel_size
+	var start = inverse * (origin + (Vector3(lo) + center_offset) * voxel_size)
+	
+	for z in range(lo.z, hi.z + 1):
+		for y in range(lo.y, hi.y + 1):
+			var local = start + step_z * (z - lo.z) + step_y * (y - lo.y)
+			var i = (z * size.y + y) * size.x + lo.x
+			for x in range(lo.x, hi.x + 1):
+				if absf(local.x) <= half and absf(local.y) <= half and absf(local.z) <= half:
+					cells[i] = 1
+				local += step_x
+				i += 1
+
+func filled_count() -> int:
+	return cells.count(1)
+
+# Exposed faces, merged into the largest rectangles per axis slice
+func build_greedy_mesh() -> ArrayMesh:
+	return build_mesh(true)
+
+# One quad per exposed voxel face with vertices shared at lattice corners,
+# for post-processing that needs connectivity (smoothing)
+func build_face_mesh() -> ArrayMesh:
+	return build_mesh(false)
+
+func build_mesh(merge: bool) -> ArrayMesh:
+	var vertices = PackedVector3Array()
+	var normals = PackedVector3Array()
+	var indices = PackedInt32Array()
+	var corners = {}
+	var strides = Vector3i(1, size.x, size.x * size.y)
+	var mask = PackedByteArray()
+	
+	for d in range(3):
+		var u = (d + 1) % 3
+		var v = (d + 2) % 3
+		var nu = size[u]
+		var nv = size[v]
+		mask.resize(nu * nv)
+		
+		for q in range(size[d] + 1):
+			# Faces between layers q - 1 and q: 1 faces +d, 2 faces -d
+			var n = 0
+			for j in range(nv):
+				var index = q * strides[d] + j * strides[v]
+				for i in range(nu):
+					var behind = q > 0 and cells[index - strides[d]] != 0
+					var front = q < size[d] and cells[index] != 0
+					if behind and not front:
+						mask[n] = 1
+					elif front and not behind:
+						mask[n] = 2
+					else:
+						mask[n] = 0
+					index += strides[u]
+					n += 1
+			
+			n = 0
+			for j in range(nv):
+				var i = 0
+				while i < nu:
+					var kind = mask[n]
+					if kind == 0:
+						i += 1
+						n += 1
+						continue
+					var w = 1
+					var h = 1
+					if merge:
+						while i + w < nu and mask[n + w] == kind:
+							w += 1
+						while j + h < nv and row_matches(mask, n + h * nu, w, kind):
+							h += 1
+						for row in range(h):
+							for k in range(w):
+								mask[n + row * nu + k] = 0
+					
+					var a = Vector3i.ZERO
+					a[d] = q
+					a[u] = i
+					a[v] = j
+					var du = Vector3i.ZERO
+					du[u] = w
+					var dv = Vector3i.ZERO
+					dv[v] = h
+					var normal = Vector3.ZERO
+					normal[d] = 1.0 if kind == 1 else -1.0
+					var quad = [a, a + du, a + du + dv, a + dv]
+					var ids = PackedInt32Array()
+					for corner in quad:
+						if merge:
+							ids.append(vertices.size())
+							vertices.append(origin + Vector3(corner) * voxel_size)
+							normals.append(normal)
+						else:
+							if not corners.has(corner):
+								corners[corner] = vertices.size()
+								vertices.append(origin + Vector3(corner) * voxel_size)
+							ids.append(corners[corner])
+					
+					# Clockwise as seen from the side the face points to
+					if kind == 1:
+						indices.append_array(PackedInt32Array([ids[0], ids[2], ids[1], ids[0], ids[3], ids[2]]))
+					else:
+						indices.append_array(PackedInt32Array([ids[0], ids[1], ids[2], ids[0], ids[2], ids[3]]))
+					i += w
+					n += w
+	
+	var mesh = ArrayMesh.new()
+	if indices.is_empty():
+		return mesh
+	var arrays = []
+	arrays.resize(Mesh.ARRAY_MAX)
+	arrays[Mesh.ARRAY_VERTEX] = vertices
+	if merge:
+		arrays[Mesh.ARRAY_NORMAL] = normals
+	arrays[Mesh.ARRAY_INDEX] = indices
+	mesh.add_surface_from_arrays(Mesh.PRIMITIVE_TRIANGLES, arrays)
+	return mesh
+
+func row_matches(mask: PackedByteArray, start: int, width: int, kind: int) -> bool:
+	for k in range(width):
+		if mask[start + k] != kind:
+			return false
+	return true
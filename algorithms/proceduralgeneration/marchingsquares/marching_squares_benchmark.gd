@@ -0,0 +1,134 @@
+# marching_squares_benchmark.gd - Scripted stencil strokes for headless timing
+# Run: godot --headless --path . res://algorithms/proceduralgeneration/marchingsquares/marching_squares_benchmark.tscn -- --benchmark-out=user://ms.json
+# Summarize with benchmark_report.py in the project root
+extends Node3D
+
+@export var stroke_count: int = 24
+@export var points_per_stroke: int = 48
+@export var random_seed: int = 1
+@export var output_path: String = "user://benchmarks/marching_squares.json"
+
+@onready var map = $VoxelMap
+
+var strokes: Array = []
+var stroke_index: int = 0
+var point_index: int = 0
+var frames: Array = []
+var setup_triangulate_usec: int = 0
+
+func _ready():
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--benchmark-out="):
+			output_path = arg.trim_prefix("--benchmark-out=")
+	plan_strokes()
+	
+	# The map queued its first triangulation; run it now so it can be timed
+	var start = Time.get_ticks_usec()
+	triangulate_queued()
+	setup_triangulate_usec = Time.get_ticks_usec() - start
+	print("Benchmark: %d strokes of %d points on %dx%d chunks of %dx%d voxels" % [
+		stroke_count, points_per_stroke, map.chunk_resolution, map.chunk_resolution,
+		map.voxel_resolution, map.voxel_resolution
+	])
+
+# Same strokes every run: random lines across the map, mostly filling,
+# with every stencil and brush radius
+func plan_strokes():
+	var rng = RandomNumberGenerator.new()
+	rng.seed = random_seed
+	var half = map.half_size
+	for i in range(stroke_count):
+		strokes.append({
+			"from": Vector2(rng.randf_range(-half, half), rng.randf_range(-half, half)),
+			"to": Vector2(rng.randf_range(-half, half), rng.randf_range(-half, half)),
+			"fill": 0 if i % 3 != 2 else 1,
+			"stencil": i % 2,
+			"radius": rng.randi_range(0, 5)
+		})
+
+func triangulate_queued():
+	for chunk in map.chunks:
+		if chunk.retriangulate_queued:
+			chunk.retriangulate()
+
+func _process(delta):
+	if stroke_index >= strokes.size():
+		finish()
+		return
+	
+	var stroke = strokes[stroke_index]
+	map.fill_type_index = stroke["fill"]
+	map.stencil_index = stroke["stencil"]
+	map.radius_index = stroke["radius"]
+	var t = point_index / float(max(points_per_stroke - 1, 1))
+	var point = stroke["from"].lerp(stroke["to"], t)
+	
+	var start = Time.get_ticks_usec()
+	map.edit_voxels(Vector3(point.x, point.y, 0))
+	var edited = Time.get_ticks_usec()
+	# Triangulate now instead of at the end of the frame so it can be timed
+	triangulate_queued()
+	var triangulated = Time.get_ticks_usec()
+	
+	record(delta, edited - start, triangulated - edited)
+	
+	point_index += 1
+	if point_index >= points_per_stroke:
+		point_index = 0
+		stroke_index += 1
+
+func record(delta: float, edit_usec: int, triangulate_usec: int):
+	var vertices = 0
+	var triangles = 0
+	for chunk in map.chunks:
+		var surf = chunk.surface.get_child(0)
+		# Vertices the uploaded mesh actually holds, not the reserved row blocks
+		vertices += surf.used_vertex_count
+		if surf.mesh.get_surface_count() > 0:
+			triangles += surf.mesh.surface_get_array_index_len(0) / 3
+	
+	frames.append({
+		"frame_ms": delta * 1000.0,
+		"process_ms": Performance.get_monitor(Performance.TIME_PROCESS) * 1000.0,
+		"edit_ms": edit_usec / 1000.0,
+		"triangulate_ms": triangulate_usec / 1000.0,
+		"vertices": vertices,
+		"triangles": triangles,
+		"objects": Performance.get_monitor(Performance.OBJECT_COUNT),
+		"nodes": Performance.get_monitor(Performance.OBJECT_NODE_COUNT),
+		"resources": Performance.get_monitor(Performance.OBJECT_RESOURCE_COUNT),
+		"draw_calls": Performance.get_monitor(Performance.RENDER_TOTAL_DRAW_CALLS_IN_FRAME),
+		"primitives": Performance.get_monitor(Performance.RENDER_TOTAL_PRIMITIVES_IN_FRAME),
+		"static_memory_mb": Performance.get_monitor(Performance.MEMORY_STATIC) / 1048576.0
+	})
+
+func finish():
+	set_process(false)
+	var storage = "packed" if map.chunks[0].get("voxels") == null else "objects"
+	var report = {
+		"benchmark": "marching_squares",
+		"engine": Engine.get_version_info()["string"],
+		"settings": {
+			"map_size": map.map_size,
+			"voxel_resolution": map.voxel_resolution,
+			"chunk_resolution": map.chunk_resolution,
+			"storage": storage,
+			"stroke_count": stroke_count,
+			"points_per_stroke": points_per_stroke,
+			"random_seed": random_seed
+		},
+		"results": {
+			"setup_triangulate_ms": setup_triangulate_usec / 1000.0
+		},
+		"frames": frames
+	}
+	
+	DirAccess.make_dir_recursive_absolute(output_path.get_base_dir())
+	var file = FileAccess.open(output_path, FileAccess.WRITE)
+	if file == null:
+		push_error("Benchmark: could not write %s" % output_path)
+	else:
+		file.store_string(JSON.stringify(report))
+		file.close()
+		print("Benchmark: %d frames written to %s" % [frames.size(), ProjectSettings.globalize_path(output_path)])
+	get_tree().quit()
@@ -7,20 +7,114 @@ Based on Catlike Coding's Marching Squares tutorials
 - Sharp features
 - 3D walls with proper lighting
 - Stencil-based editing
+- Optional packed-array voxel storage (--storage packed)
+- Optional baked mesh from marching_squares_mesher.py (--baked-mesh)
+- Batch variants into separate folders (--variants SPEC.json)
 """
 
+import argparse
+import hashlib
+import json
 import os
-
-def create_file(filename, content):
-    with open(filename, 'w', encoding='utf-8') as f:
+import re
+import sys
+
+from marching_squares_tables import gdscript_tables
+
+# res:// paths of the files written here; a --baked-mesh or other .tres path is left alone
+_LOCAL_PATH = re.compile(r"res://(?=[a-z_]+\.(?:gd|tscn)\b)")
+_GLOBAL_CLASSES = re.compile(r"\b(Voxel|VoxelStencil|MarchingSquaresTables)\b")
+
+def create_file(out_dir, filename, content):
+    """Write a file unless it already has this content, so Godot only
+    rescans and reimports files that actually changed"""
+    path = os.path.normpath(os.path.join(out_dir, filename))
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            old_hash = hashlib.sha256(f.read().encode('utf-8')).digest()
+        if old_hash == hashlib.sha256(content.encode('utf-8')).digest():
+            print(f"Unchanged: {path}")
+            return False
+    with open(path, 'w', encoding='utf-8') as f:
         f.write(content)
-    print(f"Created: {filename}")
-
-def main():
-    print("=" * 60)
-    print("Godot 4 Marching Squares - Complete Implementation")
-    print("=" * 60)
-    print("\nCreating marching squares system...\n")
+    print(f"Created: {path}")
+    return True
+
+def load_variants(parser, argv, args):
+    """(out_dir, options) per variant in the --variants spec, or the
+    command line options alone. Spec keys are the long option names."""
+    if not args.variants:
+        return [(args.output, args)]
+    with open(args.variants, encoding='utf-8') as f:
+        spec = json.load(f)
+    if isinstance(spec, dict):
+        spec = spec.get("variants", [])
+    variants = []
+    for entry in spec:
+        entry = dict(entry)
+        name = entry.pop("name", None)
+        if not name:
+            parser.error(f"{args.variants}: every variant needs a name")
+        extra = []
+        for key, value in entry.items():
+            extra += ["--" + key.replace("_", "-"), str(value)]
+        variants.append((os.path.join(args.output, name), parser.parse_args(argv + extra)))
+    return variants
+
+def project_res_dir(out_dir):
+    """res:// folder of out_dir in the Godot project containing it; "res://"
+    when out_dir is (or is not inside) a project"""
+    path = os.path.abspath(out_dir)
+    root = path
+    while not os.path.exists(os.path.join(root, "project.godot")):
+        parent = os.path.dirname(root)
+        if parent == root:
+            return "res://"
+        root = parent
+    rel = os.path.relpath(path, root).replace(os.sep, "/")
+    return "res://" if rel == "." else "res://%s/" % rel
+
+def class_suffix(out_dir):
+    """CamelCase suffix for the global classes of a variant folder"""
+    name = os.path.basename(os.path.normpath(out_dir))
+    return "".join(part[:1].upper() + part[1:] for part in re.split(r"[^A-Za-z0-9]+", name))
+
+def localize(content, res_dir, suffix=""):
+    """Point the res:// paths of the generated files at res_dir and suffix
+    the global class names, so variants side by side in one project run
+    their own scripts and do not redeclare the same class_name"""
+    content = _LOCAL_PATH.sub(res_dir, content)
+    if not suffix:
+        return content
+    lines = []
+    for line in content.split("\n"):
+        code, comment = split_comment(line)
+        lines.append(_GLOBAL_CLASSES.sub(lambda m: m.group(1) + suffix, code) + comment)
+    return "\n".join(lines)
+
+def split_comment(line):
+    """(code, comment) of a GDScript line"""
+    quote = None
+    for i, ch in enumerate(line):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch == "#":
+            return line[:i], line[i:]
+    return line, ""
+
+def install(args, out_dir):
+    """Write one variant of the editor into out_dir"""
+    os.makedirs(out_dir, exist_ok=True)
+    res_dir = project_res_dir(out_dir)
+    suffix = class_suffix(out_dir) if args.variants else ""
+
+    def write(filename, content):
+        return create_file(out_dir, filename,
+                           localize(content, res_dir, suffix if filename.endswith(".gd") else ""))
+    packed = args.storage == "packed"
     
     # voxel.gd - Individual voxel data
     voxel_gd = '''# voxel.gd - Voxel data structure
@@ -39,37 +133,14 @@ func _init(x: int = 0, y: int = 0, size: float = 1.0):
 		x_edge_position = position + Vector2(size * 0.5, 0)
 		y_edge_position = position + Vector2(0, size * 0.5)
 
-func become_x_dummy_of(voxel: Voxel, offset: float):
-	state = voxel.state
-	position = voxel.position + Vector2(offset, 0)
-	x_edge_position = voxel.x_edge_position + Vector2(offset, 0)
-	y_edge_position = voxel.y_edge_position + Vector2(offset, 0)
-	x_normal = voxel.x_normal
-	y_normal = voxel.y_normal
-
-func become_y_dummy_of(voxel: Voxel, offset: float):
-	state = voxel.state
-	position = voxel.position + Vector2(0, offset)
-	x_edge_position = voxel.x_edge_position + Vector2(0, offset)
-	y_edge_position = voxel.y_edge_position + Vector2(0, offset)
-	x_normal = voxel.x_normal
-	y_normal = voxel.y_normal
-
-func become_xy_dummy_of(voxel: Voxel, offset: float):
-	state = voxel.state
-	position = voxel.position + Vector2(offset, offset)
-	x_edge_position = voxel.x_edge_position + Vector2(offset, offset)
-	y_edge_position = voxel.y_edge_position + Vector2(offset, offset)
-	x_normal = voxel.x_normal
-	y_normal = voxel.y_normal
-
 func get_x_edge_point() -> Vector2:
 	return x_edge_position
 
 func get_y_edge_point() -> Vector2:
 	return y_edge_position
 '''
-    create_file('voxel.gd', voxel_gd)
+    if not packed:
+        write('voxel.gd', voxel_gd)
     
     # voxel_stencil.gd - Base stencil class
     voxel_stencil_gd = '''# voxel_stencil.gd - Base stencil for editing
@@ -102,8 +173,35 @@ func get_y_start() -> int:
 
 func get_y_end() -> int:
 	return center_y + radius
+
+# Where the stencil outline cuts the edge from voxel (x, y) to (x + 1, y),
+# as an offset in voxels from (x, y); -1 if it does not cut that edge
+func x_crossing(x: int, y: int) -> float:
+	if absi(y - center_y) > radius:
+		return -1.0
+	return edge_crossing(x, center_x - radius - 0.5, center_x + radius + 0.5)
+
+func y_crossing(x: int, y: int) -> float:
+	if absi(x - center_x) > radius:
+		return -1.0
+	return edge_crossing(y, center_y - radius - 0.5, center_y + radius + 0.5)
+
+# Outline positions low/high bound the voxels the stencil covers on one
+# lattice line; a voxel exactly on either one counts as covered
+func edge_crossing(start: int, low: float, high: float) -> float:
+	if low > start and low <= start + 1:
+		return low - start
+	if high >= start and high < start + 1:
+		return high - start
+	return -1.0
+
+# Outline normal at p (voxel coordinates), pointing away from the filled side
+func normal_at(p: Vector2) -> Vector2:
+	var d = p - Vector2(center_x, center_y)
+	var normal = Vector2(signf(d.x), 0) if absf(d.x) >= absf(d.y) else Vector2(0, signf(d.y))
+	return normal if fill_type else -normal
 '''
-    create_file('voxel_stencil.gd', voxel_stencil_gd)
+    write('voxel_stencil.gd', voxel_stencil_gd)
     
     # voxel_stencil_circle.gd
     voxel_stencil_circle_gd = '''# voxel_stencil_circle.gd - Circular stencil
@@ -121,15 +219,48 @@ func apply(x: int, y: int, voxel: bool) -> bool:
 	if dx * dx + dy * dy <= sqr_radius:
 		return fill_type
 	return voxel
+
+func x_crossing(x: int, y: int) -> float:
+	var dy = y - center_y
+	if dy * dy > sqr_radius:
+		return -1.0
+	var half_width = sqrt(sqr_radius - dy * dy)
+	return edge_crossing(x, center_x - half_width, center_x + half_width)
+
+func y_crossing(x: int, y: int) -> float:
+	var dx = x - center_x
+	if dx * dx > sqr_radius:
+		return -1.0
+	var half_height = sqrt(sqr_radius - dx * dx)
+	return edge_crossing(y, center_y - half_height, center_y + half_height)
+
+func normal_at(p: Vector2) -> Vector2:
+	var normal = (p - Vector2(center_x, center_y)).normalized()
+	return normal if fill_type else -normal
 '''
-    create_file('voxel_stencil_circle.gd', voxel_stencil_circle_gd)
+    write('voxel_stencil_circle.gd', voxel_stencil_circle_gd)
     
     # voxel_grid_surface.gd - Surface mesh manager
     voxel_grid_surface_gd = '''# voxel_grid_surface.gd - Manages surface mesh
 extends MeshInstance3D
 
+# Each cell row owns a fixed block of row_capacity vertices and of
+# row_index_capacity indices, so one row can be rebuilt without touching the
+# others. apply() packs the used part of every block into the mesh buffers;
+# all of them are sized once per row count and never grown.
 var vertices: PackedVector3Array = []
-var triangles: PackedInt32Array = []
+var indices: PackedInt32Array = []
+var row_vertex_counts: PackedInt32Array = []
+var row_index_counts: PackedInt32Array = []
+var mesh_vertices: PackedVector3Array = []
+var mesh_indices: PackedInt32Array = []
+var row_capacity: int = 0
+var row_index_capacity: int = 0
+var next_vertex: int = 0
+var next_index: int = 0
+# Vertices in the uploaded mesh
+var used_vertex_count: int = 0
+var points: PackedInt32Array = []
 var corners_min: PackedInt32Array = []
 var corners_max: PackedInt32Array = []
 var x_edges_min: PackedInt32Array = []
@@ -148,40 +279,78 @@ func initialize(resolution: int):
 	corners_max.resize(resolution + 1)
 	x_edges_min.resize(resolution)
 	x_edges_max.resize(resolution)
-
-func clear():
-	vertices.clear()
-	triangles.clear()
-
+	points.resize(9)
+	
+	# Corners and x edges of two lattice rows, the y edges between them
+	# and one sharp feature vertex per cell
+	row_capacity = 5 * (resolution + 1) + resolution
+	row_index_capacity = resolution * MarchingSquaresTables.MAX_CELL_INDICES
+
+func set_row_count(rows: int):
+	var old_rows = row_index_counts.size()
+	if old_rows == rows:
+		return
+	row_vertex_counts.resize(rows)
+	row_index_counts.resize(rows)
+	for y in range(old_rows, rows):
+		row_vertex_counts[y] = 0
+		row_index_counts[y] = 0
+	vertices.resize(rows * row_capacity)
+	indices.resize(rows * row_index_capacity)
+	mesh_vertices.resize(rows * row_capacity)
+	mesh_indices.resize(rows * row_index_capacity)
+
+func begin_row(y: int, cells: int):
+	next_vertex = y * row_capacity
+	next_index = y * row_index_capacity
+
+func end_row(y: int):
+	row_vertex_counts[y] = next_vertex - y * row_capacity
+	row_index_counts[y] = next_index - y * row_index_capacity
+
+# Every vertex a row adds is referenced by its triangles, so packing the
+# used prefix of each block uploads exactly the vertices the mesh needs
 func apply():
-	if vertices.size() == 0:
+	var vertex_count = 0
+	var index_count = 0
+	for y in range(row_index_counts.size()):
+		var first_vertex = y * row_capacity
+		var shift = vertex_count - first_vertex
+		for k in range(first_vertex, first_vertex + row_vertex_counts[y]):
+			mesh_vertices[k + shift] = vertices[k]
+		var first_index = y * row_index_capacity
+		for k in range(first_index, first_index + row_index_counts[y]):
+			mesh_indices[index_count] = indices[k] + shift
+			index_count += 1
+		vertex_count += row_vertex_counts[y]
+	used_vertex_count = vertex_count
+	
+	mesh.clear_surfaces()
+	if index_count == 0:
 		return
 	
 	var arrays = []
 	arrays.resize(Mesh.ARRAY_MAX)
-	arrays[Mesh.ARRAY_VERTEX] = vertices
-	arrays[Mesh.ARRAY_INDEX] = triangles
-	
-	mesh.clear_surfaces()
+	arrays[Mesh.ARRAY_VERTEX] = mesh_vertices.slice(0, vertex_count)
+	arrays[Mesh.ARRAY_INDEX] = mesh_indices.slice(0, index_count)
 	mesh.add_surface_from_arrays(Mesh.PRIMITIVE_TRIANGLES, arrays)
 
-func cache_first_corner(voxel: Voxel):
-	corners_max[0] = vertices.size()
-	vertices.append(Vector3(voxel.position.x, voxel.position.y, 0))
+func add_vertex(p: Vector2) -> int:
+	vertices[next_vertex] = Vector3(p.x, p.y, 0)
+	next_vertex += 1
+	return next_vertex - 1
+
+func cache_first_corner(p: Vector2):
+	corners_max[0] = add_vertex(p)
 
-func cache_next_corner(i: int, voxel: Voxel):
-	corners_max[i + 1] = vertices.size()
-	vertices.append(Vector3(voxel.position.x, voxel.position.y, 0))
+func cache_next_corner(i: int, p: Vector2):
+	corners_max[i + 1] = add_vertex(p)
 
-func cache_x_edge(i: int, voxel: Voxel):
-	x_edges_max[i] = vertices.size()
-	var p = voxel.get_x_edge_point()
-	vertices.append(Vector3(p.x, p.y, 0))
+func cache_x_edge(i: int, p: Vector2):
+	x_edges_max[i] = add_vertex(p)
 
-func cache_y_edge(voxel: Voxel):
-	y_edge_max = vertices.size()
-	var p = voxel.get_y_edge_point()
-	vertices.append(Vector3(p.x, p.y, 0))
+func cache_y_edge(p: Vector2):
+	y_edge_max = add_vertex(p)
 
 func prepare_cache_for_next_cell():
 	y_edge_min = y_edge_max
@@ -194,112 +363,93 @@ func prepare_cache_for_next_row():
 	x_edges_min = x_edges_max
 	x_edges_max = swap
 
-# Triangle/Quad/Pentagon/Hexagon methods
-func add_triangle(a: int, b: int, c: int):
-	triangles.append(a)
-	triangles.append(b)
-	triangles.append(c)
-
-func add_quad(a: int, b: int, c: int, d: int):
-	triangles.append(a)
-	triangles.append(b)
-	triangles.append(c)
-	triangles.append(a)
-	triangles.append(c)
-	triangles.append(d)
-
-func add_pentagon(a: int, b: int, c: int, d: int, e: int):
-	triangles.append(a)
-	triangles.append(b)
-	triangles.append(c)
-	triangles.append(a)
-	triangles.append(c)
-	triangles.append(d)
-	triangles.append(a)
-	triangles.append(d)
-	triangles.append(e)
-
-# Case-specific methods  
-func add_triangle_a(i: int):
-	add_triangle(corners_min[i], y_edge_min, x_edges_min[i])
-
-func add_triangle_b(i: int):
-	add_triangle(x_edges_min[i], corners_max[i], y_edge_max)
-
-func add_triangle_c(i: int):
-	add_triangle(y_edge_min, corners_min[i + 1], x_edges_max[i])
-
-func add_triangle_d(i: int):
-	add_triangle(x_edges_max[i], y_edge_max, corners_max[i + 1])
-
-func add_quad_a(i: int):
-	add_quad(corners_min[i], y_edge_min, y_edge_max, corners_max[i])
-
-func add_quad_b(i: int):
-	add_quad(x_edges_min[i], corners_max[i], corners_max[i + 1], x_edges_max[i])
-
-func add_quad_c(i: int):
-	add_quad(y_edge_min, corners_min[i + 1], corners_max[i + 1], y_edge_max)
-
-func add_quad_d(i: int):
-	add_quad(x_edges_min[i], corners_min[i], corners_min[i + 1], x_edges_max[i])
-
-func add_quad_e(i: int):
-	add_quad(corners_min[i], corners_min[i + 1], corners_max[i + 1], corners_max[i])
-
-func add_pentagon_a(i: int):
-	add_pentagon(corners_min[i], corners_min[i + 1], x_edges_max[i], y_edge_max, corners_max[i])
-
-func add_pentagon_b(i: int):
-	add_pentagon(x_edges_min[i], corners_max[i], corners_max[i + 1], y_edge_max, corners_min[i])
-
-func add_pentagon_c(i: int):
-	add_pentagon(y_edge_min, corners_min[i + 1], corners_max[i + 1], x_edges_max[i], corners_min[i])
-
-func add_pentagon_d(i: int):
-	add_pentagon(corners_max[i + 1], corners_max[i], y_edge_max, x_edges_min[i], corners_min[i + 1])
+# Emit the triangles of one cell from the case tables. Point ids 0-7 map
+# to the cached corners and crossings, 8 to an optional feature vertex
+func add_cell(i: int, cell_type: int, feature: int = -1):
+	points[0] = corners_min[i]
+	points[1] = corners_min[i + 1]
+	points[2] = corners_max[i]
+	points[3] = corners_max[i + 1]
+	points[4] = x_edges_min[i]
+	points[5] = y_edge_min
+	points[6] = x_edges_max[i]
+	points[7] = y_edge_max
+	points[8] = feature
+	
+	var offsets = MarchingSquaresTables.CASE_OFFSETS
+	var table = MarchingSquaresTables.CASE_TRIANGLES
+	if feature >= 0:
+		offsets = MarchingSquaresTables.FEATURE_OFFSETS
+		table = MarchingSquaresTables.FEATURE_TRIANGLES
+	for k in range(offsets[cell_type], offsets[cell_type + 1]):
+		indices[next_index] = points[table[k]]
+		next_index += 1
 '''
-    create_file('voxel_grid_surface.gd', voxel_grid_surface_gd)
+    write('voxel_grid_surface.gd', voxel_grid_surface_gd)
     
-    # voxel_grid.gd - Main grid with triangulation (Part 1 of 2)
-    voxel_grid_part1 = '''# voxel_grid.gd - Voxel grid with marching squares
+    # marching_squares_tables.gd - Case tables from marching_squares_tables.py
+    write('marching_squares_tables.gd', gdscript_tables())
+    
+    # voxel_grid.gd - Storage part (one Voxel object per cell)
+    voxel_grid_objects = '''# voxel_grid.gd - Voxel grid with marching squares
 extends Node3D
 
 @export var resolution: int = 8
 @export var voxel_material: Material
 
 var voxels: Array = []
+'''
+
+    # voxel_grid.gd - Storage part (packed arrays)
+    voxel_grid_packed = '''# voxel_grid.gd - Voxel grid with marching squares (packed storage)
+extends Node3D
+
+@export var resolution: int = 8
+@export var voxel_material: Material
+
+# Voxel data lives in flat arrays indexed y * resolution + x.
+# Corner positions are computed from the index; edge crossings are stored
+# as offsets (in voxels) from the corner along +x / +y.
+var states: PackedByteArray = PackedByteArray()
+var x_edges: PackedFloat32Array = PackedFloat32Array()
+var y_edges: PackedFloat32Array = PackedFloat32Array()
+var x_normals: PackedVector2Array = PackedVector2Array()
+var y_normals: PackedVector2Array = PackedVector2Array()
+'''
+
+    # voxel_grid.gd - Shared chunk state, editing and dirty tracking
+    voxel_grid_common = '''
 var voxel_size: float = 1.0
 var grid_size: float = 1.0
 var surface: Node3D
-var dummy_x: Voxel = Voxel.new()
-var dummy_y: Voxel = Voxel.new()
-var dummy_t: Voxel = Voxel.new()
 
-# Chunk neighbors
+# Largest angle (degrees) between crossing normals kept as a sharp corner
+var sharp_feature_limit: float = 135.0
+
+# Chunk neighbors (read for this chunk's gap row/column) and owners
+# (the chunks that read this one, so they retriangulate when it changes)
 var x_neighbor: Node3D = null
 var y_neighbor: Node3D = null
 var xy_neighbor: Node3D = null
+var x_owner: Node3D = null
+var y_owner: Node3D = null
+var xy_owner: Node3D = null
 
 # Voxel visualization
-var voxel_objects: Array = []
+var voxel_markers: MultiMeshInstance3D
+
+# Cell rows waiting for retriangulation, flushed once per frame
+var dirty_row_min: int = 0
+var dirty_row_max: int = -1
+var retriangulate_queued: bool = false
 
 func initialize(res: int, size: float):
 	resolution = res
 	grid_size = size
 	voxel_size = size / float(resolution)
 	
-	# Create voxel array
-	voxels.clear()
-	for i in range(resolution * resolution):
-		voxels.append(null)
-	
-	# Create voxels
-	for y in range(resolution):
-		for x in range(resolution):
-			var i = y * resolution + x
-			voxels[i] = Voxel.new(x, y, voxel_size)
-			create_voxel_visual(i, x, y)
+	create_voxels()
+	create_voxel_markers()
 	
 	# Create surface
 	var surface_script = load("res://voxel_grid_surface.gd")
@@ -315,217 +465,392 @@ func initialize(res: int, size: float):
 	
 	refresh()
 
-func create_voxel_visual(i: int, x: int, y: int):
-	var quad = MeshInstance3D.new()
+# All voxel markers of the chunk are drawn by one MultiMesh with per-instance colors
+func create_voxel_markers():
 	var quad_mesh = QuadMesh.new()
 	quad_mesh.size = Vector2.ONE * voxel_size * 0.1
-	quad.mesh = quad_mesh
-	
-	quad.position = Vector3(
-		(x + 0.5) * voxel_size,
-		(y + 0.5) * voxel_size,
-		-0.01
-	)
-	
 	var mat = StandardMaterial3D.new()
 	mat.shading_mode = BaseMaterial3D.SHADING_MODE_UNSHADED
-	quad.material_override = mat
+	mat.vertex_color_use_as_albedo = true
+	quad_mesh.material = mat
+	
+	var multimesh = MultiMesh.new()
+	multimesh.transform_format = MultiMesh.TRANSFORM_3D
+	multimesh.use_colors = true
+	multimesh.mesh = quad_mesh
+	multimesh.instance_count = resolution * resolution
 	
-	add_child(quad)
-	voxel_objects.append({"mesh": quad, "material": mat})
+	for y in range(resolution):
+		for x in range(resolution):
+			var i = y * resolution + x
+			var marker_position = Vector3((x + 0.5) * voxel_size, (y + 0.5) * voxel_size, -0.01)
+			multimesh.set_instance_transform(i, Transform3D(Basis(), marker_position))
+			multimesh.set_instance_color(i, Color.WHITE)
+	
+	voxel_markers = MultiMeshInstance3D.new()
+	voxel_markers.multimesh = multimesh
+	add_child(voxel_markers)
 
-func set_voxel(x: int, y: int, state: bool):
-	voxels[y * resolution + x].state = state
-	refresh()
+func set_marker(i: int, state: bool):
+	voxel_markers.multimesh.set_instance_color(i, Color.BLACK if state else Color.WHITE)
 
-func apply(stencil: VoxelStencil):
-	var x_start = stencil.get_x_start()
-	if x_start < 0:
-		x_start = 0
-	var x_end = stencil.get_x_end()
-	if x_end >= resolution:
-		x_end = resolution - 1
-	
-	var y_start = stencil.get_y_start()
-	if y_start < 0:
-		y_start = 0
-	var y_end = stencil.get_y_end()
-	if y_end >= resolution:
-		y_end = resolution - 1
+func set_voxel(x: int, y: int, state: bool):
+	var i = y * resolution + x
+	if get_state(i) == state:
+		return
+	set_state(i, state)
+	set_marker(i, state)
+	mark_voxels_dirty(x, y, x, y)
+
+# Apply a stencil; only changed voxels are recolored and only the cell rows
+# around them are queued. Returns true if any voxel changed.
+func apply(stencil: VoxelStencil) -> bool:
+	var x_start = max(stencil.get_x_start(), 0)
+	var x_end = min(stencil.get_x_end(), resolution - 1)
+	var y_start = max(stencil.get_y_start(), 0)
+	var y_end = min(stencil.get_y_end(), resolution - 1)
 	
+	var changed_x_min = resolution
+	var changed_x_max = -1
+	var changed_y_min = resolution
+	var changed_y_max = -1
 	for y in range(y_start, y_end + 1):
 		var i = y * resolution + x_start
 		for x in range(x_start, x_end + 1):
-			voxels[i].state = stencil.apply(x, y, voxels[i].state)
+			var state = get_state(i)
+			var new_state = stencil.apply(x, y, state)
+			if new_state != state:
+				set_state(i, new_state)
+				set_marker(i, new_state)
+				changed_x_min = min(changed_x_min, x)
+				changed_x_max = max(changed_x_max, x)
+				changed_y_min = min(changed_y_min, y)
+				changed_y_max = max(changed_y_max, y)
 			i += 1
 	
-	refresh()
+	var crossings_changed = apply_crossings(stencil)
+	if changed_x_max < 0:
+		return crossings_changed
+	mark_voxels_dirty(changed_x_min, changed_y_min, changed_x_max, changed_y_max)
+	return true
+
+# Move the crossings the stencil outline cuts onto the outline and store its
+# normal there for sharp features. Edges toward the next chunk belong to
+# this chunk's last column/row and read the neighbor's state, which
+# VoxelMap has already updated since it applies stencils in reverse order.
+func apply_crossings(stencil: VoxelStencil) -> bool:
+	var edge_x_start = max(stencil.get_x_start() - 1, 0)
+	var edge_y_start = max(stencil.get_y_start() - 1, 0)
+	var x_start = max(stencil.get_x_start(), 0)
+	var y_start = max(stencil.get_y_start(), 0)
+	var x_end = min(stencil.get_x_end(), resolution - 1)
+	var y_end = min(stencil.get_y_end(), resolution - 1)
+	var edge_x_end = min(x_end, resolution - 1 if x_neighbor else resolution - 2)
+	var edge_y_end = min(y_end, resolution - 1 if y_neighbor else resolution - 2)
+	
+	var changed = false
+	for y in range(y_start, y_end + 1):
+		for x in range(edge_x_start, edge_x_end + 1):
+			var offset = stencil.x_crossing(x, y)
+			if offset >= 0.0 and state_at(x, y) != state_at(x + 1, y):
+				set_x_crossing(y * resolution + x, offset, stencil.normal_at(Vector2(x + offset, y)))
+				changed = true
+	for y in range(edge_y_start, edge_y_end + 1):
+		for x in range(x_start, x_end + 1):
+			var offset = stencil.y_crossing(x, y)
+			if offset >= 0.0 and state_at(x, y) != state_at(x, y + 1):
+				set_y_crossing(y * resolution + x, offset, stencil.normal_at(Vector2(x, y + offset)))
+				changed = true
+	
+	if changed:
+		mark_voxels_dirty(edge_x_start, edge_y_start, x_end + 1, y_end + 1)
+	return changed
 
+# Recolor every marker and retriangulate the whole chunk
 func refresh():
 	set_voxel_colors()
-	triangulate()
+	mark_rows_dirty(0, resolution - 1)
 
 func set_voxel_colors():
-	for i in range(voxels.size()):
-		var color = Color.BLACK if voxels[i].state else Color.WHITE
-		voxel_objects[i].material.albedo_color = color
+	for i in range(resolution * resolution):
+		set_marker(i, get_state(i))
+
+func mark_voxels_dirty(x_min: int, y_min: int, x_max: int, y_max: int):
+	# A voxel is a corner of the cells in the rows below and above it
+	mark_rows_dirty(y_min - 1, y_max)
+	# Voxels in the first column/row are also corners of the owners' gap cells
+	if x_min == 0 and x_owner:
+		x_owner.mark_rows_dirty(y_min - 1, y_max)
+	if y_min == 0 and y_owner:
+		y_owner.mark_rows_dirty(resolution - 1, resolution - 1)
+	if x_min == 0 and y_min == 0 and xy_owner:
+		xy_owner.mark_rows_dirty(resolution - 1, resolution - 1)
+
+func mark_rows_dirty(row_min: int, row_max: int):
+	row_min = max(row_min, 0)
+	row_max = min(row_max, resolution - 1)
+	if row_max < row_min:
+		return
+	if dirty_row_max < 0:
+		dirty_row_min = row_min
+		dirty_row_max = row_max
+	else:
+		dirty_row_min = min(dirty_row_min, row_min)
+		dirty_row_max = max(dirty_row_max, row_max)
+	if not retriangulate_queued:
+		retriangulate_queued = true
+		call_deferred("retriangulate")
+'''
 
-func triangulate():
-	var surf = surface.get_child(0)
-	surf.clear()
+    # voxel_grid.gd - Storage accessors (one Voxel object per cell)
+    voxel_grid_objects_access = '''
+func create_voxels():
+	voxels.clear()
+	for y in range(resolution):
+		for x in range(resolution):
+			voxels.append(Voxel.new(x, y, voxel_size))
+
+func get_state(i: int) -> bool:
+	return voxels[i].state
+
+func set_state(i: int, state: bool):
+	voxels[i].state = state
+
+func set_x_crossing(i: int, offset: float, normal: Vector2):
+	var voxel = voxels[i]
+	voxel.x_edge_position = voxel.position + Vector2(offset * voxel_size, 0)
+	voxel.x_normal = normal
+
+func set_y_crossing(i: int, offset: float, normal: Vector2):
+	var voxel = voxels[i]
+	voxel.y_edge_position = voxel.position + Vector2(0, offset * voxel_size)
+	voxel.y_normal = normal
+
+# Lattice access: x == resolution or y == resolution reads the first
+# column/row of the neighboring chunk
+func sample_chunk(x: int, y: int) -> Node3D:
+	if x < resolution:
+		return self if y < resolution else y_neighbor
+	return x_neighbor if y < resolution else xy_neighbor
+
+func sample_index(x: int, y: int) -> int:
+	return (y % resolution) * resolution + (x % resolution)
+
+func state_at(x: int, y: int) -> bool:
+	return sample_chunk(x, y).voxels[sample_index(x, y)].state
+
+func corner_at(x: int, y: int) -> Vector2:
+	return Vector2(x + 0.5, y + 0.5) * voxel_size
+
+func x_edge_at(x: int, y: int) -> Vector2:
+	var voxel = sample_chunk(x, y).voxels[sample_index(x, y)]
+	return corner_at(x, y) + voxel.get_x_edge_point() - voxel.position
+
+func y_edge_at(x: int, y: int) -> Vector2:
+	var voxel = sample_chunk(x, y).voxels[sample_index(x, y)]
+	return corner_at(x, y) + voxel.get_y_edge_point() - voxel.position
+
+func x_normal_at(x: int, y: int) -> Vector2:
+	return sample_chunk(x, y).voxels[sample_index(x, y)].x_normal
+
+func y_normal_at(x: int, y: int) -> Vector2:
+	return sample_chunk(x, y).voxels[sample_index(x, y)].y_normal
+'''
+
+    # voxel_grid.gd - Storage accessors (packed arrays)
+    voxel_grid_packed_access = '''
+func create_voxels():
+	var count = resolution * resolution
+	states.resize(count)
+	states.fill(0)
+	x_edges.resize(count)
+	x_edges.fill(0.5)
+	y_edges.resize(count)
+	y_edges.fill(0.5)
+	x_normals.resize(count)
+	x_normals.fill(Vector2.ZERO)
+	y_normals.resize(count)
+	y_normals.fill(Vector2.ZERO)
+
+func get_state(i: int) -> bool:
+	return states[i] != 0
+
+func set_state(i: int, state: bool):
+	states[i] = 1 if state else 0
+
+func set_x_crossing(i: int, offset: float, normal: Vector2):
+	x_edges[i] = offset
+	x_normals[i] = normal
+
+func set_y_crossing(i: int, offset: float, normal: Vector2):
+	y_edges[i] = offset
+	y_normals[i] = normal
+
+# Lattice access: x == resolution or y == resolution reads the first
+# column/row of the neighboring chunk
+func sample_chunk(x: int, y: int) -> Node3D:
+	if x < resolution:
+		return self if y < resolution else y_neighbor
+	return x_neighbor if y < resolution else xy_neighbor
+
+func sample_index(x: int, y: int) -> int:
+	return (y % resolution) * resolution + (x % resolution)
+
+func state_at(x: int, y: int) -> bool:
+	return sample_chunk(x, y).states[sample_index(x, y)] != 0
+
+func corner_at(x: int, y: int) -> Vector2:
+	return Vector2(x + 0.5, y + 0.5) * voxel_size
+
+func x_edge_at(x: int, y: int) -> Vector2:
+	var offset = sample_chunk(x, y).x_edges[sample_index(x, y)]
+	return corner_at(x, y) + Vector2(offset * voxel_size, 0)
+
+func y_edge_at(x: int, y: int) -> Vector2:
+	var offset = sample_chunk(x, y).y_edges[sample_index(x, y)]
+	return corner_at(x, y) + Vector2(0, offset * voxel_size)
+
+func x_normal_at(x: int, y: int) -> Vector2:
+	return sample_chunk(x, y).x_normals[sample_index(x, y)]
+
+func y_normal_at(x: int, y: int) -> Vector2:
+	return sample_chunk(x, y).y_normals[sample_index(x, y)]
+'''
+
+    # voxel_grid.gd - Row-wise triangulation over the voxel lattice
+    voxel_grid_triangulation = '''
+func retriangulate():
+	retriangulate_queued = false
+	if dirty_row_max < 0:
+		return
 	
+	# Gap cells toward a neighbor are triangulated by this chunk
+	var cells_x = resolution - 1
 	if x_neighbor:
-		dummy_x.become_x_dummy_of(x_neighbor.voxels[0], grid_size)
-	
-	fill_first_row_cache()
-	triangulate_cell_rows()
-	
+		cells_x += 1
+	var rows = resolution - 1
 	if y_neighbor:
-		triangulate_gap_row()
+		rows += 1
+	
+	var surf = surface.get_child(0)
+	surf.set_row_count(rows)
+	for y in range(dirty_row_min, min(dirty_row_max, rows - 1) + 1):
+		triangulate_row(y, cells_x)
+	dirty_row_min = 0
+	dirty_row_max = -1
 	
 	surf.apply()
-'''
-    
-    # voxel_grid.gd Part 2
-    voxel_grid_part2 = '''
-func fill_first_row_cache():
+
+# Cell row y lies between lattice rows y and y + 1
+func triangulate_row(y: int, cells_x: int):
 	var surf = surface.get_child(0)
-	cache_first_corner(voxels[0])
+	surf.begin_row(y, cells_x)
+	cache_lattice_row(y, cells_x)
+	surf.prepare_cache_for_next_row()
+	cache_lattice_row(y + 1, cells_x)
+	cache_next_middle_edge(0, y)
 	
-	for i in range(resolution - 1):
-		cache_next_edge_and_corner(i, voxels[i], voxels[i + 1])
+	for x in range(cells_x):
+		cache_next_middle_edge(x + 1, y)
 	
-	if x_neighbor:
-		dummy_x.become_x_dummy_of(x_neighbor.voxels[0], grid_size)
-		cache_next_edge_and_corner(resolution - 1, voxels[resolution - 1], dummy_x)
+		var cell_type = 0
+		if state_at(x, y):
+			cell_type |= 1
+		if state_at(x + 1, y):
+			cell_type |= 2
+		if state_at(x, y + 1):
+			cell_type |= 4
+		if state_at(x + 1, y + 1):
+			cell_type |= 8
+		if cell_type != 0:
+			surf.add_cell(x, cell_type, sharp_feature(x, y, cell_type))
+	
+	surf.end_row(y)
 
-func cache_first_corner(voxel: Voxel):
-	if voxel.state:
-		surface.get_child(0).cache_first_corner(voxel)
+func cache_lattice_row(y: int, cells_x: int):
+	if state_at(0, y):
+		surface.get_child(0).cache_first_corner(corner_at(0, y))
+	for x in range(cells_x):
+		cache_next_edge_and_corner(x, x, y)
 
-func cache_next_edge_and_corner(i: int, x_min: Voxel, x_max: Voxel):
+func cache_next_edge_and_corner(i: int, x: int, y: int):
 	var surf = surface.get_child(0)
-	if x_min.state != x_max.state:
-		surf.cache_x_edge(i, x_min)
-	if x_max.state:
-		surf.cache_next_corner(i, x_max)
+	var max_state = state_at(x + 1, y)
+	if state_at(x, y) != max_state:
+		surf.cache_x_edge(i, x_edge_at(x, y))
+	if max_state:
+		surf.cache_next_corner(i, corner_at(x + 1, y))
 
-func cache_next_middle_edge(y_min: Voxel, y_max: Voxel):
+func cache_next_middle_edge(x: int, y: int):
 	var surf = surface.get_child(0)
 	surf.prepare_cache_for_next_cell()
-	if y_min.state != y_max.state:
-		surf.cache_y_edge(y_min)
-
-func triangulate_cell_rows():
-	var cells = resolution - 1
-	
-	for y in range(cells):
-		var i = y * resolution
-		swap_row_caches()
-		cache_first_corner(voxels[i + resolution])
-		cache_next_middle_edge(voxels[i], voxels[i + resolution])
-		
-		for x in range(cells):
-			var a = voxels[i]
-			var b = voxels[i + 1]
-			var c = voxels[i + resolution]
-			var d = voxels[i + resolution + 1]
-			
-			cache_next_edge_and_corner(x, c, d)
-			cache_next_middle_edge(b, d)
-			triangulate_cell(x, a, b, c, d)
-			i += 1
-		
-		if x_neighbor:
-			triangulate_gap_cell(i)
-
-func triangulate_gap_cell(i: int):
-	var swap = dummy_t
-	swap.become_x_dummy_of(x_neighbor.voxels[i + 1], grid_size)
-	dummy_t = dummy_x
-	dummy_x = swap
-	triangulate_cell(resolution - 1, voxels[i], dummy_t, voxels[i + resolution], dummy_x)
-
-func triangulate_gap_row():
-	var surf = surface.get_child(0)
-	swap_row_caches()
-	
-	dummy_y.become_y_dummy_of(y_neighbor.voxels[0], grid_size)
-	var cells = resolution - 1
-	var offset = cells * resolution
-	
-	cache_first_corner(dummy_y)
-	cache_next_middle_edge(voxels[offset], dummy_y)
-	
-	for x in range(cells):
-		var swap = dummy_t
-		swap.become_y_dummy_of(y_neighbor.voxels[x + 1], grid_size)
-		dummy_t = dummy_y
-		dummy_y = swap
-		
-		cache_next_edge_and_corner(x, dummy_t, dummy_y)
-		cache_next_middle_edge(voxels[x + offset + 1], dummy_y)
-		triangulate_cell(x, voxels[x + offset], voxels[x + offset + 1], dummy_t, dummy_y)
+	if state_at(x, y) != state_at(x, y + 1):
+		surf.cache_y_edge(y_edge_at(x, y))
+
+# Sharp feature vertex where the tangents at the cell's two crossings meet.
+# Returns -1 (plain case) unless the case has a single crossing pair, both
+# crossings carry normals at a sharp angle, and the point lies inside the
+# cell on the empty side of the chord between the crossings
+func sharp_feature(x: int, y: int, cell_type: int) -> int:
+	var e1 = MarchingSquaresTables.FEATURE_EDGES[cell_type * 2]
+	if e1 < 0:
+		return -1
+	var e2 = MarchingSquaresTables.FEATURE_EDGES[cell_type * 2 + 1]
+	var n1 = edge_normal(e1, x, y)
+	var n2 = edge_normal(e2, x, y)
+	if n1 == Vector2.ZERO or n2 == Vector2.ZERO:
+		return -1
+	var dot = n1.dot(-n2)
+	if dot < cos(deg_to_rad(sharp_feature_limit)) or dot > 0.9999:
+		return -1
 	
-	if x_neighbor:
-		dummy_t.become_xy_dummy_of(xy_neighbor.voxels[0], grid_size)
-		cache_next_edge_and_corner(cells, dummy_y, dummy_t)
-		cache_next_middle_edge(dummy_x, dummy_t)
-		triangulate_cell(cells, voxels[voxels.size() - 1], dummy_x, dummy_y, dummy_t)
-
-func swap_row_caches():
-	surface.get_child(0).prepare_cache_for_next_row()
-
-func triangulate_cell(i: int, a: Voxel, b: Voxel, c: Voxel, d: Voxel):
-	var cell_type = 0
-	if a.state:
-		cell_type |= 1
-	if b.state:
-		cell_type |= 2
-	if c.state:
-		cell_type |= 4
-	if d.state:
-		cell_type |= 8
+	var t1 = n1.orthogonal()
+	var t2 = n2.orthogonal()
+	var denom = t1.cross(t2)
+	if absf(denom) < 0.0001:
+		return -1
+	var p1 = edge_point(e1, x, y)
+	var p2 = edge_point(e2, x, y)
+	var point = p1 + t1 * ((p2 - p1).cross(t2) / denom)
 	
-	var surf = surface.get_child(0)
-	match cell_type:
-		0:
-			return
-		1:
-			surf.add_triangle_a(i)
-		2:
-			surf.add_triangle_b(i)
-		3:
-			surf.add_quad_a(i)
+	var cell_min = corner_at(x, y)
+	var cell_max = corner_at(x + 1, y + 1)
+	if point.x < cell_min.x or point.y < cell_min.y or point.x > cell_max.x or point.y > cell_max.y:
+		return -1
+	var anchor_id = MarchingSquaresTables.FEATURE_ANCHORS[cell_type]
+	var anchor = corner_at(x + (anchor_id & 1), y + (anchor_id >> 1))
+	var chord = p2 - p1
+	if chord.cross(point - p1) * chord.cross(anchor - p1) >= 0.0:
+		return -1
+	return surface.get_child(0).add_vertex(point)
+
+# Crossing position and normal by table point id (4-7)
+func edge_point(edge: int, x: int, y: int) -> Vector2:
+	match edge:
+		4:
+			return x_edge_at(x, y)
+		5:
+			return y_edge_at(x, y)
+		6:
+			return x_edge_at(x, y + 1)
+	return y_edge_at(x + 1, y)
+
+func edge_normal(edge: int, x: int, y: int) -> Vector2:
+	match edge:
 		4:
-			surf.add_triangle_c(i)
+			return x_normal_at(x, y)
 		5:
-			surf.add_quad_b(i)
+			return y_normal_at(x, y)
 		6:
-			surf.add_triangle_b(i)
-			surf.add_triangle_c(i)
-		7:
-			surf.add_pentagon_a(i)
-		8:
-			surf.add_triangle_d(i)
-		9:
-			surf.add_triangle_a(i)
-			surf.add_triangle_d(i)
-		10:
-			surf.add_quad_c(i)
-		11:
-			surf.add_pentagon_b(i)
-		12:
-			surf.add_quad_d(i)
-		13:
-			surf.add_pentagon_c(i)
-		14:
-			surf.add_pentagon_d(i)
-		15:
-			surf.add_quad_e(i)
+			return x_normal_at(x, y + 1)
+	return y_normal_at(x + 1, y)
 '''
-    
-    create_file('voxel_grid.gd', voxel_grid_part1 + voxel_grid_part2)
+
+    if packed:
+        voxel_grid_gd = voxel_grid_packed + voxel_grid_common + voxel_grid_packed_access
+    else:
+        voxel_grid_gd = voxel_grid_objects + voxel_grid_common + voxel_grid_objects_access
+    write('voxel_grid.gd', voxel_grid_gd + voxel_grid_triangulation)
     
     # voxel_map.gd - Main map controller (CONTINUED NEXT MESSAGE DUE TO LENGTH)
     voxel_map_gd = '''# voxel_map.gd - Voxel map with chunks
@@ -535,6 +860,9 @@ extends Node3D
 @export var voxel_resolution: int = 8
 @export var chunk_resolution: int = 2
 @export var voxel_material: Material
+@export_range(0.0, 180.0) var sharp_feature_limit: float = 135.0
+# Mesh baked by marching_squares_mesher.py; shown until the first edit
+@export var baked_mesh: ArrayMesh
 
 var chunks: Array = []
 var chunk_size: float
@@ -547,6 +875,11 @@ var fill_type_index: int = 0
 var radius_index: int = 0
 var stencil_index: int = 0
 
+# Last stroke position and brush; holding the mouse on one cell is a no-op
+var last_edit: Array = []
+
+var baked_instance: MeshInstance3D = null
+
 func _ready():
 	half_size = map_size * 0.5
 	chunk_size = map_size / float(chunk_resolution)
@@ -558,14 +891,10 @@ func _ready():
 		load("res://voxel_stencil_circle.gd").new()
 	]
 	
-	# Create chunks
-	var grid_script = load("res://voxel_grid.gd")
-	chunks.resize(chunk_resolution * chunk_resolution)
-	
-	for y in range(chunk_resolution):
-		for x in range(chunk_resolution):
-			var i = y * chunk_resolution + x
-			create_chunk(i, x, y, grid_script)
+	if baked_mesh:
+		show_baked_mesh()
+	else:
+		create_chunks()
 	
 	# Add collider
 	var box = CollisionShape3D.new()
@@ -578,10 +907,47 @@ func _ready():
 	static_body.add_child(box)
 	add_child(static_body)
 
+func create_chunks():
+	var grid_script = load("res://voxel_grid.gd")
+	chunks.resize(chunk_resolution * chunk_resolution)
+	
+	for y in range(chunk_resolution):
+		for x in range(chunk_resolution):
+			var i = y * chunk_resolution + x
+			create_chunk(i, x, y, grid_script)
+
+# A baked set piece is one static mesh; chunks are built on the first edit
+func show_baked_mesh():
+	baked_instance = MeshInstance3D.new()
+	baked_instance.mesh = baked_mesh
+	if voxel_material:
+		baked_instance.material_override = voxel_material
+	add_child(baked_instance)
+
+# Switch from the baked mesh to runtime meshing, seeded with the baked
+# voxel states (stored as mesh metadata by the mesher)
+func unbake():
+	create_chunks()
+	var states: PackedByteArray = baked_mesh.get_meta("voxel_states", PackedByteArray())
+	var width: int = baked_mesh.get_meta("voxel_width", 0)
+	var height: int = baked_mesh.get_meta("voxel_height", 0)
+	var total = chunk_resolution * voxel_resolution
+	if width != total or height != total:
+		print("VoxelMap: baked grid is %dx%d, map has %dx%d voxels" % [width, height, total, total])
+	for y in range(min(height, total)):
+		for x in range(min(width, total)):
+			if states[y * width + x] != 0:
+				var chunk = chunks[(y / voxel_resolution) * chunk_resolution + x / voxel_resolution]
+				chunk.set_voxel(x % voxel_resolution, y % voxel_resolution, true)
+	
+	baked_instance.queue_free()
+	baked_instance = null
+
 func create_chunk(i: int, x: int, y: int, grid_script):
 	var chunk = Node3D.new()
 	chunk.set_script(grid_script)
 	chunk.voxel_material = voxel_material
+	chunk.sharp_feature_limit = sharp_feature_limit
 	chunk.position = Vector3(
 		x * chunk_size - half_size,
 		y * chunk_size - half_size,
@@ -591,13 +957,16 @@ func create_chunk(i: int, x: int, y: int, grid_script):
 	chunk.initialize(voxel_resolution, chunk_size)
 	chunks[i] = chunk
 	
-	# Set up neighbors
+	# Set up neighbors and the owners that read them
 	if x > 0:
 		chunks[i - 1].x_neighbor = chunk
+		chunk.x_owner = chunks[i - 1]
 	if y > 0:
 		chunks[i - chunk_resolution].y_neighbor = chunk
+		chunk.y_owner = chunks[i - chunk_resolution]
 		if x > 0:
 			chunks[i - chunk_resolution - 1].xy_neighbor = chunk
+			chunk.xy_owner = chunks[i - chunk_resolution - 1]
 
 func _process(_delta):
 	if Input.is_mouse_button_pressed(MOUSE_BUTTON_LEFT):
@@ -612,11 +981,21 @@ func _process(_delta):
 			
 			if result and result.collider.get_parent() == self:
 				edit_voxels(to_local(result.position))
+	else:
+		last_edit = []
 
 func edit_voxels(point: Vector3):
+	if baked_instance:
+		unbake()
+	
 	var center_x = int((point.x + half_size) / voxel_size)
 	var center_y = int((point.y + half_size) / voxel_size)
 	
+	var edit = [center_x, center_y, fill_type_index, radius_index, stencil_index]
+	if edit == last_edit:
+		return
+	last_edit = edit
+	
 	var x_start = (center_x - radius_index - 1) / voxel_resolution
 	x_start = max(0, x_start)
 	var x_end = (center_x + radius_index) / voxel_resolution
@@ -659,7 +1038,7 @@ func _input(event):
 		elif event.keycode == KEY_C:
 			stencil_index = 1
 '''
-    create_file('voxel_map.gd', voxel_map_gd)
+    write('voxel_map.gd', voxel_map_gd)
     
     # Scene file
     scene_file = '''[gd_scene load_steps=3 format=3]
@@ -674,9 +1053,9 @@ albedo_color = Color(0.4, 0.7, 0.9, 1)
 
 [node name="VoxelMap" type="Node3D" parent="."]
 script = ExtResource("1")
-map_size = 4.0
-voxel_resolution = 16
-chunk_resolution = 2
+map_size = %(map_size)s
+voxel_resolution = %(voxel_resolution)d
+chunk_resolution = %(chunk_resolution)d
 voxel_material = SubResource("1")
 
 [node name="Camera3D" type="Camera3D" parent="."]
@@ -703,8 +1082,181 @@ S - Square stencil
 C - Circle stencil
 1-6 - Brush radius
 Left Mouse - Paint"
+''' % vars(args)
+    if args.baked_mesh:
+        scene_file = scene_file.replace('load_steps=3', 'load_steps=4', 1)
+        scene_file = scene_file.replace(
+            '[ext_resource type="Script" path="res://voxel_map.gd" id="1"]\n',
+            '[ext_resource type="Script" path="res://voxel_map.gd" id="1"]\n'
+            '[ext_resource type="ArrayMesh" path="%s" id="2"]\n' % args.baked_mesh, 1)
+        scene_file = scene_file.replace(
+            'voxel_material = SubResource("1")\n',
+            'voxel_material = SubResource("1")\nbaked_mesh = ExtResource("2")\n', 1)
+    write('marching_squares_scene.tscn', scene_file)
+    
+    # Benchmark driver - scripted stencil strokes, timed headless
+    benchmark_gd = '''# marching_squares_benchmark.gd - Scripted stencil strokes for headless timing
+# Run: godot --headless --path . res://marching_squares_benchmark.tscn -- --benchmark-out=user://ms.json
+# Summarize with benchmark_report.py in the project root
+extends Node3D
+
+@export var stroke_count: int = 24
+@export var points_per_stroke: int = 48
+@export var random_seed: int = 1
+@export var output_path: String = "user://benchmarks/marching_squares.json"
+
+@onready var map = $VoxelMap
+
+var strokes: Array = []
+var stroke_index: int = 0
+var point_index: int = 0
+var frames: Array = []
+var setup_triangulate_usec: int = 0
+
+func _ready():
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--benchmark-out="):
+			output_path = arg.trim_prefix("--benchmark-out=")
+	plan_strokes()
+	
+	# The map queued its first triangulation; run it now so it can be timed
+	var start = Time.get_ticks_usec()
+	triangulate_queued()
+	setup_triangulate_usec = Time.get_ticks_usec() - start
+	print("Benchmark: %d strokes of %d points on %dx%d chunks of %dx%d voxels" % [
+		stroke_count, points_per_stroke, map.chunk_resolution, map.chunk_resolution,
+		map.voxel_resolution, map.voxel_resolution
+	])
+
+# Same strokes every run: random lines across the map, mostly filling,
+# with every stencil and brush radius
+func plan_strokes():
+	var rng = RandomNumberGenerator.new()
+	rng.seed = random_seed
+	var half = map.half_size
+	for i in range(stroke_count):
+		strokes.append({
+			"from": Vector2(rng.randf_range(-half, half), rng.randf_range(-half, half)),
+			"to": Vector2(rng.randf_range(-half, half), rng.randf_range(-half, half)),
+			"fill": 0 if i % 3 != 2 else 1,
+			"stencil": i % 2,
+			"radius": rng.randi_range(0, 5)
+		})
+
+func triangulate_queued():
+	for chunk in map.chunks:
+		if chunk.retriangulate_queued:
+			chunk.retriangulate()
+
+func _process(delta):
+	if stroke_index >= strokes.size():
+		finish()
+		return
+	
+	var stroke = strokes[stroke_index]
+	map.fill_type_index = stroke["fill"]
+	map.stencil_index = stroke["stencil"]
+	map.radius_index = stroke["radius"]
+	var t = point_index / float(max(points_per_stroke - 1, 1))
+	var point = stroke["from"].lerp(stroke["to"], t)
+	
+	var start = Time.get_ticks_usec()
+	map.edit_voxels(Vector3(point.x, point.y, 0))
+	var edited = Time.get_ticks_usec()
+	# Triangulate now instead of at the end of the frame so it can be timed
+	triangulate_queued()
+	var triangulated = Time.get_ticks_usec()
+	
+	record(delta, edited - start, triangulated - edited)
+	
+	point_index += 1
+	if point_index >= points_per_stroke:
+		point_index = 0
+		stroke_index += 1
+
+func record(delta: float, edit_usec: int, triangulate_usec: int):
+	var vertices = 0
+	var triangles = 0
+	for chunk in map.chunks:
+		var surf = chunk.surface.get_child(0)
+		# Vertices the uploaded mesh actually holds, not the reserved row blocks
+		vertices += surf.used_vertex_count
+		if surf.mesh.get_surface_count() > 0:
+			triangles += surf.mesh.surface_get_array_index_len(0) / 3
+	
+	frames.append({
+		"frame_ms": delta * 1000.0,
+		"process_ms": Performance.get_monitor(Performance.TIME_PROCESS) * 1000.0,
+		"edit_ms": edit_usec / 1000.0,
+		"triangulate_ms": triangulate_usec / 1000.0,
+		"vertices": vertices,
+		"triangles": triangles,
+		"objects": Performance.get_monitor(Performance.OBJECT_COUNT),
+		"nodes": Performance.get_monitor(Performance.OBJECT_NODE_COUNT),
+		"resources": Performance.get_monitor(Performance.OBJECT_RESOURCE_COUNT),
+		"draw_calls": Performance.get_monitor(Performance.RENDER_TOTAL_DRAW_CALLS_IN_FRAME),
+		"primitives": Performance.get_monitor(Performance.RENDER_TOTAL_PRIMITIVES_IN_FRAME),
+		"static_memory_mb": Performance.get_monitor(Performance.MEMORY_STATIC) / 1048576.0
+	})
+
+func finish():
+	set_process(false)
+	var storage = "packed" if map.chunks[0].get("voxels") == null else "objects"
+	var report = {
+		"benchmark": "marching_squares",
+		"engine": Engine.get_version_info()["string"],
+		"settings": {
+			"map_size": map.map_size,
+			"voxel_resolution": map.voxel_resolution,
+			"chunk_resolution": map.chunk_resolution,
+			"storage": storage,
+			"stroke_count": stroke_count,
+			"points_per_stroke": points_per_stroke,
+			"random_seed": random_seed
+		},
+		"results": {
+			"setup_triangulate_ms": setup_triangulate_usec / 1000.0
+		},
+		"frames": frames
+	}
+	
+	DirAccess.make_dir_recursive_absolute(output_path.get_base_dir())
+	var file = FileAccess.open(output_path, FileAccess.WRITE)
+	if file == null:
+		push_error("Benchmark: could not write %s" % output_path)
+	else:
+		file.store_string(JSON.stringify(report))
+		file.close()
+		print("Benchmark: %d frames written to %s" % [frames.size(), ProjectSettings.globalize_path(output_path)])
+	get_tree().quit()
 '''
-    create_file('marching_squares_scene.tscn', scene_file)
+    write('marching_squares_benchmark.gd', benchmark_gd)
+    
+    benchmark_scene = '''[gd_scene load_steps=4 format=3]
+
+[ext_resource type="Script" path="res://marching_squares_benchmark.gd" id="1"]
+[ext_resource type="Script" path="res://voxel_map.gd" id="2"]
+
+[sub_resource type="StandardMaterial3D" id="1"]
+shading_mode = 0
+albedo_color = Color(0.4, 0.7, 0.9, 1)
+
+[node name="MarchingSquaresBenchmark" type="Node3D"]
+script = ExtResource("1")
+
+[node name="VoxelMap" type="Node3D" parent="."]
+script = ExtResource("2")
+map_size = %(map_size)s
+voxel_resolution = %(voxel_resolution)d
+chunk_resolution = %(chunk_resolution)d
+voxel_material = SubResource("1")
+
+[node name="Camera3D" type="Camera3D" parent="."]
+transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 5)
+projection = 1
+size = %(map_size)s
+''' % vars(args)
+    write('marching_squares_benchmark.tscn', benchmark_scene)
     
     # README
     readme = '''# Godot 4 Marching Squares Complete
@@ -768,6 +1320,10 @@ python install_marching_squares.py
 15: Full
 ```
 
+The triangles for every case come from `marching_squares_tables.gd`,
+generated by `marching_squares_tables.py` (run it with `--verify` to
+check winding, coverage and area of every case).
+
 ### Chunking System
 - Map divided into NxN chunks
 - Each chunk has NxN voxels
@@ -783,12 +1339,68 @@ voxel_resolution = 16       # Voxels per chunk
 chunk_resolution = 2        # Chunks per side (2x2 = 4 chunks)
 ```
 
+### Storage Modes
+```bash
+python marching_squares_installer.py                   # one Voxel object per cell
+python marching_squares_installer.py --storage packed  # flat packed arrays
+```
+
+With `--storage packed`, `voxel_grid.gd` keeps state in a `PackedByteArray`,
+edge crossings in `PackedFloat32Array` and edge normals in
+`PackedVector2Array`; corner positions are computed from the cell index.
+`voxel.gd` is not needed. That is about 25 bytes per voxel instead of a
+`Voxel` object with five fields, which keeps large `voxel_resolution` maps
+editable without allocation churn.
+
+### Batch Variants
+```bash
+python marching_squares_installer.py --voxel-resolution 32 --chunk-resolution 4
+python marching_squares_installer.py --variants variants.json --output builds
+```
+
+A variant spec lists one folder per variant; keys are the long option
+names (`storage`, `voxel_resolution`, `chunk_resolution`, `map_size`,
+`baked_mesh`) and override the command line:
+
+```json
+{"variants": [
+  {"name": "small", "voxel_resolution": 8},
+  {"name": "large_packed", "storage": "packed", "voxel_resolution": 32, "chunk_resolution": 4}
+]}
+```
+
+Each variant folder is self-contained: its scripts and scenes load the
+files next to them (res:// paths are written relative to the folder
+holding project.godot), and its global classes (`Voxel`, `VoxelStencil`
+and `MarchingSquaresTables`) get the variant name as a suffix
+(`large_packed` -> `VoxelLargePacked`), so variants run side by side in
+one project.
+
+Files whose content is unchanged are not rewritten, so re-running the
+installer only makes Godot reimport what actually changed.
+
 ### Performance Guidelines
 - **8x8 voxels, 2x2 chunks**: Very fast, good for testing
 - **16x16 voxels, 2x2 chunks**: Balanced, recommended
 - **32x32 voxels, 4x4 chunks**: Detailed, slower
 - **64x64 voxels, 4x4 chunks**: Very detailed, heavy
 
+### Benchmark Scene
+`marching_squares_benchmark.tscn` paints the same seeded stencil strokes
+every run (one stroke point per frame, every brush and radius) and then
+quits. For each frame it records frame time, stencil and triangulation
+time, vertex and triangle counts, and object, node, draw call and memory
+monitors, and writes them to JSON:
+
+```bash
+godot --headless --path . res://marching_squares_benchmark.tscn -- --benchmark-out=user://ms.json
+python benchmark_report.py ms.json --save-baseline baseline.json   # from the project root
+python benchmark_report.py ms.json --baseline baseline.json         # later runs
+```
+
+The benchmark scene gets the same map settings as the demo scene, so
+`--variants` installs one benchmark per variant.
+
 ## Code Structure
 
 ### Core Classes
@@ -797,7 +1409,6 @@ chunk_resolution = 2        # Chunks per side (2x2 = 4 chunks)
 - Stores state (filled/empty)
 - Stores position
 - Stores edge positions
-- Dummy voxel support for chunk boundaries
 
 **VoxelStencil** (`voxel_stencil.gd`)
 - Base class for editing tools
@@ -812,13 +1423,22 @@ chunk_resolution = 2        # Chunks per side (2x2 = 4 chunks)
 - Manages mesh generation
 - Vertex/triangle arrays
 - Caching system for efficiency
-- Case-specific triangulation methods
+- Table-driven triangulation (`add_cell`) into per-row blocks of one
+  index buffer sized for the worst case
+- `apply()` packs the used vertices and indices of every row into mesh
+  buffers allocated once and trimmed once per upload
 
 **VoxelGrid** (`voxel_grid.gd`)
 - Individual chunk management
 - Voxel storage
 - Triangulation orchestration
 - Neighbor connections
+- Dirty-row tracking: edits queue only the cell rows around changed
+  voxels (and the neighbors' gap rows/columns), rebuilt once per frame
+
+**MarchingSquaresTables** (`marching_squares_tables.gd`)
+- Generated case tables: triangles per case, with and without a sharp
+  feature vertex
 
 **VoxelMap** (`voxel_map.gd`)
 - Overall map controller
@@ -838,11 +1458,33 @@ The system is ready for 3D walls:
 
 ### Add Sharp Features (Tutorials 2-3)
 
-Detect sharp angles:
-1. Store normals at edges
-2. Calculate angle between edges
-3. Add extra vertices for sharp corners
-4. Smooth vs sharp transitions
+Cells with a single pair of crossings use the feature variant of their
+case when both crossings carry normals (`x_normal`/`y_normal`) meeting at
+an angle within `sharp_feature_limit`. The feature vertex is placed where
+the two tangents intersect, provided it lies inside the cell. When a
+stencil is applied, every edge its outline cuts between voxels of different
+state gets its crossing moved onto the outline and the outline normal
+(`x_crossing`/`y_crossing`/`normal_at` on the stencil), so square brushes
+keep their corners and overlapping circles meet in sharp points.
+
+### Baked Set Pieces
+
+Static layouts can be meshed offline instead of in `_ready`
+(`marching_squares_mesher.py` needs NumPy):
+
+```bash
+python marching_squares_mesher.py layout.png -o baked_map.tres --size 4 --walls 0.2
+python marching_squares_mesher.py layout.npy -o baked_map.tres
+python marching_squares_mesher.py --map Base -o baked_map.tres
+python marching_squares_installer.py --baked-mesh res://baked_map.tres
+```
+
+The mesher uses the same case tables as the runtime, shares one vertex
+per lattice corner and edge crossing, and adds the walls as a second
+surface. `VoxelMap.baked_mesh` is shown as a single mesh; the chunks are
+created from the voxel states saved in the mesh metadata on the first
+edit, so runtime meshing only happens once the piece is edited. The grid
+should be `chunk_resolution * voxel_resolution` voxels wide.
 
 ### Custom Stencils
 
@@ -881,7 +1523,7 @@ func apply(x: int, y: int, voxel: bool) -> bool:
 
 **Seams between chunks:**
 - Check neighbor assignments
-- Verify dummy voxel setup
+- Verify owner assignments (x_owner, y_owner, xy_owner)
 - Ensure triangulation order (right-to-left, top-to-bottom)
 
 **Slow performance:**
@@ -918,11 +1560,16 @@ Sync voxel edits across network
 
 ## Performance Optimization
 
-1. **Object Pooling**: Reuse voxel visuals
-2. **Dirty Flags**: Only re-triangulate changed chunks
+1. **Batched Markers**: Voxel dots are one MultiMesh per chunk; only
+   instances whose state changed are recolored
+2. **Dirty Rows**: Stencil edits that change nothing are skipped, and
+   only the cell rows around changed voxels are re-triangulated
 3. **LOD**: Reduce resolution at distance
-4. **Caching**: Store commonly used configurations
-5. **Threading**: Generate meshes off main thread
+4. **Case Tables**: Triangulation is a table lookup per cell, with no
+   per-case branches and no growing arrays
+5. **Baking**: Static maps load a mesh baked offline by
+   `marching_squares_mesher.py`
+6. **Threading**: Generate meshes off main thread
 
 ## Credits
 
@@ -936,19 +1583,48 @@ Ported to Godot 4 with GDScript.
 
 Enjoy creating! 🎨
 '''
-    create_file('README.md', readme)
+    write('README.md', readme)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Install the marching squares voxel editor")
+    parser.add_argument("--storage", choices=("objects", "packed"), default="objects",
+                        help="voxel storage: one Voxel object per cell, or flat packed arrays")
+    parser.add_argument("--baked-mesh", metavar="RES_PATH",
+                        help="ArrayMesh from marching_squares_mesher.py shown by the scene until edited")
+    parser.add_argument("--map-size", type=float, default=4.0, help="map size in world units")
+    parser.add_argument("--voxel-resolution", type=int, default=16, help="voxels per chunk side")
+    parser.add_argument("--chunk-resolution", type=int, default=2, help="chunks per map side")
+    parser.add_argument("--variants", metavar="SPEC.json",
+                        help="install each variant of a JSON spec into its own folder under --output")
+    parser.add_argument("--output", default=".", help="output folder (default: current directory)")
+    if argv is None:
+        argv = sys.argv[1:]
+    args = parser.parse_args(argv)
+    variants = load_variants(parser, argv, args)
+
+    print("=" * 60)
+    print("Godot 4 Marching Squares - Complete Implementation")
+    print("=" * 60)
+    for out_dir, options in variants:
+        print(f"\nCreating marching squares system ({options.storage} storage, "
+              f"{options.chunk_resolution}x{options.chunk_resolution} chunks of "
+              f"{options.voxel_resolution}x{options.voxel_resolution}) in {os.path.abspath(out_dir)}\n")
+        install(options, out_dir)
     
     print("\n" + "=" * 60)
     print("Installation Complete!")
     print("=" * 60)
     print("\nCreated files:")
-    print("  - voxel.gd (Voxel data structure)")
+    if any(options.storage == "objects" for _, options in variants):
+        print("  - voxel.gd (Voxel data structure, objects storage only)")
     print("  - voxel_stencil.gd (Base editing tool)")
     print("  - voxel_stencil_circle.gd (Circular brush)")
     print("  - voxel_grid_surface.gd (Mesh generation)")
+    print("  - marching_squares_tables.gd (Case tables)")
     print("  - voxel_grid.gd (Chunk management)")
     print("  - voxel_map.gd (Map controller)")
     print("  - marching_squares_scene.tscn (Demo scene)")
+    print("  - marching_squares_benchmark.gd/.tscn (Headless benchmark)")
     print("  - README.md (Complete documentation)")
     print("\n" + "=" * 60)
     print("QUICK START:")
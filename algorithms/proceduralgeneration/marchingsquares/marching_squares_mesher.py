@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Offline marching squares mesher: bakes a voxel occupancy grid into a Godot
+ArrayMesh .tres, so a static set piece does not have to be re-meshed from
+voxels in VoxelMap._ready.
+
+Input (row 0 is the top row, as in an image):
+- a NumPy .npy array (non-zero = filled)
+- a PNG mask (alpha, or luminance for opaque images, >= --threshold = filled)
+- a grid map layer: --map NAME [--layer structure] (tokens other than "0")
+
+Case indices for the whole grid come from one vectorized pass, and the
+triangles from the case tables in marching_squares_tables.py, so the
+topology matches the runtime surface. Each lattice corner and edge
+crossing becomes one vertex shared by every cell that touches it. With
+--walls DEPTH a second surface extrudes the outline backwards along -z.
+
+The voxel states are stored as mesh metadata; VoxelMap shows the baked
+mesh and only builds its chunks (runtime meshing) once the map is edited.
+
+Usage:
+    python marching_squares_mesher.py mask.png -o baked_map.tres --size 4
+    python marching_squares_mesher.py grid.npy -o baked_map.tres --walls 0.2
+    python marching_squares_mesher.py --map Base -o base_map.tres
+"""
+
+import argparse
+import base64
+import os
+import struct
+import sys
+import zlib
+
+import numpy as np
+
+from marching_squares_tables import build_tables, case_segments
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", ".."))
+
+# Mesh.ARRAY_FLAG_FORMAT_VERSION_2 | ARRAY_FORMAT_VERTEX | NORMAL | TANGENT | INDEX
+SURFACE_FORMAT = (1 << 35) | 1 | 2 | 4 | 4096
+PRIMITIVE_TRIANGLES = 3
+EMPTY_TOKENS = ("", "0")
+
+
+# ---------------------------------------------------------------------------
+# Input
+# ---------------------------------------------------------------------------
+
+def load_npy(path):
+    return np.asarray(np.load(path)) != 0
+
+
+def _unfilter(raw, height, stride, bpp):
+    """Undo PNG scanline filters; returns rows as a (height, stride) uint8 array"""
+    out = np.zeros((height, stride), dtype=np.uint8)
+    prev = bytearray(stride)
+    pos = 0
+    for y in range(height):
+        kind = raw[pos]
+        line = bytearray(raw[pos + 1:pos + 1 + stride])
+        pos += stride + 1
+        if kind == 1:
+            for i in range(bpp, stride):
+                line[i] = (line[i] + line[i - bpp]) & 0xFF
+        elif kind == 2:
+            line = bytearray((np.frombuffer(bytes(line), np.uint8) + np.frombuffer(bytes(prev), np.uint8)).tobytes())
+        elif kind == 3:
+            for i in range(stride):
+                left = line[i - bpp] if i >= bpp else 0
+                line[i] = (line[i] + ((left + prev[i]) >> 1)) & 0xFF
+        elif kind == 4:
+            for i in range(stride):
+                a = line[i - bpp] if i >= bpp else 0
+                b = prev[i]
+                c = prev[i - bpp] if i >= bpp else 0
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                line[i] = (line[i] + (a if pa <= pb and pa <= pc else b if pb <= pc else c)) & 0xFF
+        elif kind != 0:
+            raise ValueError(f"unknown PNG filter {kind}")
+        out[y] = np.frombuffer(bytes(line), np.uint8)
+        prev = line
+    return out
+
+
+def load_png(path, threshold=128):
+    """Non-interlaced 8/16-bit PNG to a boolean mask"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:8] != b"\x89PNG\r\n\x1a\n":
+        raise ValueError(f"{path} is not a PNG file")
+    pos = 8
+    chunks = {}
+    idat = []
+    while pos < len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if kind == b"IDAT":
+            idat.append(body)
+        else:
+            chunks.setdefault(kind, body)
+    width, height, depth, color, _comp, _filt, interlace = struct.unpack(">IIBBBBB", chunks[b"IHDR"])
+    if depth not in (8, 16) or interlace:
+        raise ValueError(f"{path}: only non-interlaced 8/16-bit PNGs are supported")
+    channels = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}[color]
+    bpp = channels * depth // 8
+    rows = _unfilter(zlib.decompress(b"".join(idat)), height, width * bpp, bpp)
+    if depth == 16:
+        pixels = rows.view(">u2").astype(np.float32) / 257.0
+    else:
+        pixels = rows.astype(np.float32)
+    pixels = pixels.reshape(height, width, channels)
+
+    if color == 3:
+        palette = np.frombuffer(chunks[b"PLTE"], np.uint8).reshape(-1, 3).astype(np.float32)
+        alpha = np.full(len(palette), 255.0, np.float32)
+        if b"tRNS" in chunks:
+            trns = np.frombuffer(chunks[b"tRNS"], np.uint8)
+            alpha[:len(trns)] = trns
+        index = pixels[..., 0].astype(np.int64)
+        pixels = np.concatenate([palette[index], alpha[index][..., None]], axis=-1)
+        channels = 4
+
+    if channels in (2, 4) and (pixels[..., -1] < 255).any():
+        value = pixels[..., -1]
+    elif channels >= 3:
+        value = pixels[..., 0] * 0.299 + pixels[..., 1] * 0.587 + pixels[..., 2] * 0.114
+    else:
+        value = pixels[..., 0]
+    return value >= threshold
+
+
+def load_map_layer(map_name, layer="structure"):
+    """Filled cells of a grid map layer (see commons/maps)"""
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+    from godot_maps import iter_layer_cells, load_map
+
+    map_data = load_map(map_name, PROJECT_ROOT)
+    if map_data is None:
+        raise SystemExit(f"Map not found: {map_name}")
+    cells = [(x, z) for x, z, token in iter_layer_cells(map_data, layer) if token not in EMPTY_TOKENS]
+    rows = map_data.get("layers", {}).get(layer, []) or []
+    width = max((len(row) for row in rows if isinstance(row, list)), default=0)
+    grid = np.zeros((len(rows), width), dtype=bool)
+    for x, z in cells:
+        grid[z, x] = True
+    return grid
+
+
+# ---------------------------------------------------------------------------
+# Meshing
+# ---------------------------------------------------------------------------
+
+def case_indices(states):
+    """Marching squares case of every cell; states is indexed [y, x] with y up"""
+    s = states.astype(np.uint8)
+    return s[:-1, :-1] | (s[:-1, 1:] << 1) | (s[1:, :-1] << 2) | (s[1:, 1:] << 3)
+
+
+class Lattice:
+    """Global point ids and positions: corners, then x edges, then y edges"""
+
+    def __init__(self, height, width, voxel_size, origin):
+        self.height = height
+        self.width = width
+        self.corner_count = height * width
+        self.x_edge_count = height * (width - 1)
+        y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+        corners = np.stack([(x + 0.5), (y + 0.5)], -1).reshape(-1, 2)
+        x_edges = np.stack([(x[:, :-1] + 1.0), (y[:, :-1] + 0.5)], -1).reshape(-1, 2)
+        y_edges = np.stack([(x[:-1] + 0.5), (y[:-1] + 1.0)], -1).reshape(-1, 2)
+        points = np.concatenate([corners, x_edges, y_edges]) * voxel_size + np.asarray(origin, np.float32)
+        self.points = np.concatenate([points, np.zeros((len(points), 1), np.float32)], -1)
+
+    def cell_slots(self, cy, cx):
+        """(n, 8) point ids of table slots a b c d x_min y_min x_max y_max"""
+        w = self.width
+        a = cy * w + cx
+        x_min = self.corner_count + cy * (w - 1) + cx
+        y_min = self.corner_count + self.x_edge_count + cy * w + cx
+        return np.stack([a, a + 1, a + w, a + w + 1, x_min, y_min, x_min + (w - 1), y_min + 1], -1)
+
+
+def build_surface(states, lattice):
+    """(positions, indices) of the top surface with shared vertices"""
+    cases = case_indices(states)
+    tables = build_tables()
+    offsets, triangles = tables["CASE_OFFSETS"], tables["CASE_TRIANGLES"]
+    parts = []
+    for case in range(1, 16):
+        local = np.asarray(triangles[offsets[case]:offsets[case + 1]], dtype=np.int64)
+        cy, cx = np.nonzero(cases == case)
+        if len(cy) and len(local):
+            parts.append(lattice.cell_slots(cy, cx)[:, local].reshape(-1))
+    if not parts:
+        return np.zeros((0, 3), np.float32), np.zeros(0, np.uint32)
+    indices = np.concatenate(parts)
+    used = np.zeros(len(lattice.points), dtype=bool)
+    used[indices] = True
+    remap = np.cumsum(used) - 1
+    return lattice.points[used], remap[indices].astype(np.uint32)
+
+
+def build_walls(states, lattice, depth):
+    """(positions, normals, tangents, indices) of the outline extruded to z = -depth"""
+    cases = case_indices(states)
+    starts, ends = [], []
+    for case in range(1, 15):
+        segments = case_segments(case)
+        cy, cx = np.nonzero(cases == case)
+        if not segments or not len(cy):
+            continue
+        slots = lattice.cell_slots(cy, cx)
+        for e_out, e_in in segments:
+            starts.append(slots[:, e_out])
+            ends.append(slots[:, e_in])
+    if not starts:
+        empty = np.zeros((0, 3), np.float32)
+        return empty, empty, empty, np.zeros(0, np.uint32)
+    p = lattice.points[np.concatenate(starts)]
+    q = lattice.points[np.concatenate(ends)]
+    along = q - p
+    along /= np.linalg.norm(along, axis=1, keepdims=True)
+    # The filled region is to the right of p -> q, so outward is the left normal
+    outward = np.stack([-along[:, 1], along[:, 0], np.zeros(len(along), np.float32)], -1)
+    down = np.asarray([0, 0, -depth], np.float32)
+
+    n = len(p)
+    positions = np.stack([p, q, p + down, q + down], 1).reshape(-1, 3)
+    normals = np.repeat(outward, 4, axis=0)
+    tangents = np.repeat(along, 4, axis=0)
+    base = (np.arange(n, dtype=np.uint32) * 4)[:, None]
+    indices = (base + np.asarray([0, 2, 1, 1, 2, 3], np.uint32)).reshape(-1)
+    return positions, normals, tangents, indices
+
+
+# ---------------------------------------------------------------------------
+# .tres output
+# ---------------------------------------------------------------------------
+
+def octahedron_encode(vectors):
+    """Vector3.octahedron_encode for an (n, 3) array; returns (n, 2) in 0..1"""
+    v = vectors / np.abs(vectors).sum(axis=1, keepdims=True)
+    x, y = v[:, 0].copy(), v[:, 1].copy()
+    back = v[:, 2] < 0
+    x[back] = (1.0 - np.abs(v[back, 1])) * np.where(v[back, 0] >= 0, 1.0, -1.0)
+    y[back] = (1.0 - np.abs(v[back, 0])) * np.where(v[back, 1] >= 0, 1.0, -1.0)
+    return np.stack([x * 0.5 + 0.5, y * 0.5 + 0.5], -1)
+
+
+def _unorm16(values):
+    return np.clip(values * 65535, 0, 65535).astype("<u2")
+
+
+def _packed_bytes(data):
+    return 'PackedByteArray("%s")' % base64.b64encode(data).decode("ascii")
+
+
+def _float(value):
+    return "%g" % float(value)
+
+
+def surface_dict(name, positions, normals, tangents, indices):
+    """One entry of ArrayMesh._surfaces in Godot 4.2+ (format version 2) layout"""
+    vertex_count = len(positions)
+    normal_oct = _unorm16(octahedron_encode(normals))
+    tangent_oct = octahedron_encode(tangents)
+    tangent_oct[:, 1] = np.maximum(tangent_oct[:, 1], 1.0 / 32767) * 0.5 + 0.5  # sign +1
+    stream = np.concatenate([normal_oct, _unorm16(tangent_oct)], axis=1)
+    vertex_data = positions.astype("<f4").tobytes() + stream.tobytes()
+    index_type = "<u2" if vertex_count <= 65536 else "<u4"
+    low = positions.min(axis=0)
+    size = positions.max(axis=0) - low
+    aabb = "AABB(%s)" % ", ".join(_float(v) for v in list(low) + list(size))
+    return "\n".join([
+        "{",
+        '"aabb": %s,' % aabb,
+        '"format": %d,' % SURFACE_FORMAT,
+        '"index_count": %d,' % len(indices),
+        '"index_data": %s,' % _packed_bytes(indices.astype(index_type).tobytes()),
+        '"name": "%s",' % name,
+        '"primitive": %d,' % PRIMITIVE_TRIANGLES,
+        '"vertex_count": %d,' % vertex_count,
+        '"vertex_data": %s' % _packed_bytes(vertex_data),
+        "}",
+    ])
+
+
+def bake(states, size=4.0, walls=0.0):
+    """ArrayMesh .tres text for a [y, x] (y up) occupancy grid"""
+    height, width = states.shape
+    voxel_size = size / float(width)
+    half = size * 0.5
+    lattice = Lattice(height, width, voxel_size, (-half, -half))
+
+    surfaces = []
+    positions, indices = build_surface(states, lattice)
+    if len(indices):
+        normals = np.tile(np.asarray([[0, 0, 1]], np.float32), (len(positions), 1))
+        tangents = np.tile(np.asarray([[1, 0, 0]], np.float32), (len(positions), 1))
+        surfaces.append(surface_dict("surface", positions, normals, tangents, indices))
+    if walls > 0:
+        wall_data = build_walls(states, lattice, walls)
+        if len(wall_data[3]):
+            surfaces.append(surface_dict("walls", *wall_data))
+
+    lines = [
+        '[gd_resource type="ArrayMesh" format=3]',
+        "",
+        "[resource]",
+        "_surfaces = [%s]" % ", ".join(surfaces),
+        "blend_shape_mode = 0",
+        "metadata/voxel_width = %d" % width,
+        "metadata/voxel_height = %d" % height,
+        "metadata/voxel_states = %s" % _packed_bytes(states.astype(np.uint8).tobytes()),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def load_states(args):
+    if args.map:
+        grid = load_map_layer(args.map, args.layer)
+    elif args.input.lower().endswith(".npy"):
+        grid = load_npy(args.input)
+    elif args.input.lower().endswith(".png"):
+        grid = load_png(args.input, args.threshold)
+    else:
+        raise SystemExit(f"Unsupported input: {args.input} (expected .npy or .png)")
+    if grid.ndim != 2 or min(grid.shape) < 2:
+        raise SystemExit(f"Occupancy grid must be 2D and at least 2x2, got {grid.shape}")
+    # Row 0 is the top row; the mesh has y up
+    return np.ascontiguousarray(grid[::-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bake a voxel occupancy grid to a marching squares ArrayMesh")
+    parser.add_argument("input", nargs="?", help=".npy array or .png mask")
+    parser.add_argument("--map", help="grid map name (commons/maps) instead of a file")
+    parser.add_argument("--layer", default="structure", help="map layer (default: structure)")
+    parser.add_argument("-o", "--output", required=True, help="output .tres path")
+    parser.add_argument("--size", type=float, default=4.0, help="map width in meters (VoxelMap.map_size)")
+    parser.add_argument("--walls", type=float, default=0.0, metavar="DEPTH", help="extrude walls this deep")
+    parser.add_argument("--threshold", type=float, default=128, help="PNG fill threshold 0-255")
+    args = parser.parse_args(argv)
+    if not args.input and not args.map:
+        parser.error("give an input file or --map")
+
+    states = load_states(args)
+    text = bake(states, args.size, args.walls)
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(text)
+    height, width = states.shape
+    print(f"Baked {width}x{height} voxels ({int(states.sum())} filled) to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+# marching_squares_tables.gd - Generated by marching_squares_tables.py, do not edit
+class_name MarchingSquaresTables
+
+# Point ids: 0-3 corners a b c d, 4-7 crossings x_min y_min x_max y_max,
+# 8 sharp feature vertex. Triangles of case k are TRIANGLES[OFFSETS[k]:OFFSETS[k + 1]]
+const CASE_OFFSETS = [0, 0, 3, 6, 12, 15, 21, 27, 36, 39, 45, 51, 60, 66, 75, 84, 90]
+const CASE_TRIANGLES = [0, 5, 4, 1, 4, 7, 0, 5, 7, 0, 7, 1, 2, 6, 5, 0, 2, 6, 0, 6, 4, 2, 6, 5, 1, 4, 7, 0, 2, 6, 0, 6, 7, 0, 7, 1, 3, 7, 6, 0, 5, 4, 3, 7, 6, 1, 4, 6, 1, 6, 3, 1, 0, 5, 1, 5, 6, 1, 6, 3, 2, 3, 7, 2, 7, 5, 2, 3, 7, 2, 7, 4, 2, 4, 0, 3, 1, 4, 3, 4, 5, 3, 5, 2, 0, 2, 3, 0, 3, 1]
+const FEATURE_OFFSETS = [0, 0, 6, 12, 21, 27, 36, 36, 48, 54, 54, 63, 75, 84, 96, 108, 108]
+const FEATURE_TRIANGLES = [0, 5, 8, 0, 8, 4, 1, 4, 8, 1, 8, 7, 0, 5, 8, 0, 8, 7, 0, 7, 1, 2, 6, 8, 2, 8, 5, 0, 2, 6, 0, 6, 8, 0, 8, 4, 0, 2, 6, 0, 6, 8, 0, 8, 7, 0, 7, 1, 3, 7, 8, 3, 8, 6, 1, 4, 8, 1, 8, 6, 1, 6, 3, 1, 0, 5, 1, 5, 8, 1, 8, 6, 1, 6, 3, 2, 3, 7, 2, 7, 8, 2, 8, 5, 2, 3, 7, 2, 7, 8, 2, 8, 4, 2, 4, 0, 3, 1, 4, 3, 4, 8, 3, 8, 5, 3, 5, 2]
+
+# Crossings a sharp feature joins (2 per case) and the fan's anchor corner, -1 if none
+const FEATURE_EDGES = [-1, -1, 5, 4, 4, 7, 5, 7, 6, 5, 6, 4, -1, -1, 6, 7, 7, 6, -1, -1, 4, 6, 5, 6, 7, 5, 7, 4, 4, 5, -1, -1]
+const FEATURE_ANCHORS = [-1, 0, 1, 0, 2, 0, -1, 0, 3, -1, 1, 1, 2, 2, 3, -1]
+
+# Worst-case index count of one cell, used to preallocate row buffers
+const MAX_CELL_INDICES = 12
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Marching squares case tables for marching_squares_installer.py
+
+Each of the 16 cell cases is turned into polygons by walking the cell
+boundary clockwise (Godot's front-face winding, seen from +z with y up)
+and collecting the filled corners and edge crossings. Polygons are fanned
+into triangles from the filled corner farthest from the crossing chord.
+
+Point ids used in the tables:
+    0-3  corners a (x, y), b (x + 1, y), c (x, y + 1), d (x + 1, y + 1)
+    4-7  edge crossings x_min (a-b), y_min (a-c), x_max (c-d), y_max (b-d)
+    8    sharp feature vertex between the two crossings
+
+Cases with a single filled region also get a feature variant: the same
+polygon with point 8 inserted between its two crossings. The runtime only
+uses it when the feature lies inside the cell on the empty side of the
+crossing chord; --verify checks the fan stays valid for every such point.
+
+Usage:
+    python marching_squares_tables.py           # print the GDScript tables
+    python marching_squares_tables.py --verify  # self-check the tables
+    python -m pytest tests/test_marching_squares_tables.py   # from the project root
+"""
+
+import argparse
+import random
+import sys
+
+A, B, C, D = 0, 1, 2, 3
+X_MIN, Y_MIN, X_MAX, Y_MAX = 4, 5, 6, 7
+FEATURE = 8
+
+# Unit-cell positions for verification
+POINTS = {
+    A: (0.0, 0.0), B: (1.0, 0.0), C: (0.0, 1.0), D: (1.0, 1.0),
+    X_MIN: (0.5, 0.0), Y_MIN: (0.0, 0.5), X_MAX: (0.5, 1.0), Y_MAX: (1.0, 0.5),
+}
+
+# Clockwise boundary walk: (corner, edge leading to the next corner)
+_BOUNDARY = [(A, Y_MIN), (C, X_MAX), (D, Y_MAX), (B, X_MIN)]
+_CORNER_BITS = {A: 1, B: 2, C: 4, D: 8}
+
+
+def filled_corners(case):
+    return {corner for corner, bit in _CORNER_BITS.items() if case & bit}
+
+
+def case_polygons(case):
+    """Filled regions of a case as clockwise point-id lists"""
+    filled = filled_corners(case)
+    if not filled:
+        return []
+    if len(filled) == 4:
+        return [[A, C, D, B]]
+    # Start walking just after a crossing into the filled region
+    walk = []
+    for corner, edge in _BOUNDARY:
+        walk.append(corner)
+        walk.append(edge)
+    n = len(walk)
+    start = next(k for k in range(0, n, 2)
+                 if walk[k] in filled and walk[k - 2] not in filled) - 1
+    polygons = []
+    current = []
+    for step in range(n):
+        point = walk[(start + step) % n]
+        if point < 4:
+            if point in filled:
+                current.append(point)
+            continue
+        before = walk[(start + step - 1) % n]
+        after = walk[(start + step + 1) % n]
+        if (before in filled) == (after in filled):
+            continue
+        current.append(point)
+        if before in filled:  # leaving the region closes the polygon
+            polygons.append(current)
+            current = []
+    return polygons
+
+
+def _crossings(polygon):
+    return [p for p in polygon if 4 <= p < FEATURE]
+
+
+def _chord_midpoint(polygon):
+    e1, e2 = _crossings(polygon)
+    (x1, y1), (x2, y2) = POINTS[e1], POINTS[e2]
+    return (x1 + x2) / 2.0, (y1 + y2) / 2.0
+
+
+def _anchor_first(polygon):
+    """Rotate so the fan starts at the filled corner farthest from the chord"""
+    corners = [p for p in polygon if p < 4]
+    if len(_crossings(polygon)) != 2:
+        return polygon
+    mx, my = _chord_midpoint(polygon)
+    anchor = max(corners, key=lambda c: ((POINTS[c][0] - mx) ** 2 + (POINTS[c][1] - my) ** 2, -c))
+    k = polygon.index(anchor)
+    return polygon[k:] + polygon[:k]
+
+
+def with_feature(polygon):
+    """Insert the feature point between the polygon's two crossings"""
+    e_out = next(p for p in polygon if 4 <= p < FEATURE and
+                 polygon[(polygon.index(p) + 1) % len(polygon)] >= 4)
+    k = polygon.index(e_out) + 1
+    return polygon[:k] + [FEATURE] + polygon[k:]
+
+
+def case_segments(case):
+    """Outline segments (e_out, e_in) of a case, in clockwise polygon order.
+    The filled region lies to the right of each segment."""
+    segments = []
+    for polygon in case_polygons(case):
+        n = len(polygon)
+        for k in range(n):
+            p, q = polygon[k], polygon[(k + 1) % n]
+            if p >= 4 and q >= 4:
+                segments.append((p, q))
+    return segments
+
+
+def fan(polygon):
+    return [(polygon[0], polygon[k], polygon[k + 1]) for k in range(1, len(polygon) - 1)]
+
+
+def build_tables():
+    """Return dict of flat tables keyed like the GDScript constants"""
+    case_offsets, case_triangles = [0], []
+    feature_offsets, feature_triangles = [0], []
+    feature_edges, feature_anchors = [], []
+    for case in range(16):
+        polygons = [_anchor_first(p) for p in case_polygons(case)]
+        for polygon in polygons:
+            for tri in fan(polygon):
+                case_triangles.extend(tri)
+        case_offsets.append(len(case_triangles))
+
+        if len(polygons) == 1 and len(_crossings(polygons[0])) == 2:
+            polygon = polygons[0]
+            for tri in fan(with_feature(polygon)):
+                feature_triangles.extend(tri)
+            e_out = with_feature(polygon)[with_feature(polygon).index(FEATURE) - 1]
+            e_in = with_feature(polygon)[with_feature(polygon).index(FEATURE) + 1]
+            feature_edges.extend([e_out, e_in])
+            feature_anchors.append(polygon[0])
+        else:
+            feature_edges.extend([-1, -1])
+            feature_anchors.append(-1)
+        feature_offsets.append(len(feature_triangles))
+
+    max_indices = max(
+        max(case_offsets[k + 1] - case_offsets[k] for k in range(16)),
+        max(feature_offsets[k + 1] - feature_offsets[k] for k in range(16)),
+    )
+    return {
+        "CASE_OFFSETS": case_offsets,
+        "CASE_TRIANGLES": case_triangles,
+        "FEATURE_OFFSETS": feature_offsets,
+        "FEATURE_TRIANGLES": feature_triangles,
+        "FEATURE_EDGES": feature_edges,
+        "FEATURE_ANCHORS": feature_anchors,
+        "MAX_CELL_INDICES": max_indices,
+    }
+
+
+def gdscript_tables():
+    """marching_squares_tables.gd source"""
+    tables = build_tables()
+    lines = [
+        "# marching_squares_tables.gd - Generated by marching_squares_tables.py, do not edit",
+        "class_name MarchingSquaresTables",
+        "",
+        "# Point ids: 0-3 corners a b c d, 4-7 crossings x_min y_min x_max y_max,",
+        "# 8 sharp feature vertex. Triangles of case k are TRIANGLES[OFFSETS[k]:OFFSETS[k + 1]]",
+    ]
+    for name in ("CASE_OFFSETS", "CASE_TRIANGLES", "FEATURE_OFFSETS", "FEATURE_TRIANGLES"):
+        lines.append("const %s = [%s]" % (name, ", ".join(str(v) for v in tables[name])))
+    lines.append("")
+    lines.append("# Crossings a sharp feature joins (2 per case) and the fan's anchor corner, -1 if none")
+    lines.append("const FEATURE_EDGES = [%s]" % ", ".join(str(v) for v in tables["FEATURE_EDGES"]))
+    lines.append("const FEATURE_ANCHORS = [%s]" % ", ".join(str(v) for v in tables["FEATURE_ANCHORS"]))
+    lines.append("")
+    lines.append("# Worst-case index count of one cell, used to preallocate row buffers")
+    lines.append("const MAX_CELL_INDICES = %d" % tables["MAX_CELL_INDICES"])
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# Verification
+# ---------------------------------------------------------------------------
+
+def _signed_area(a, b, c):
+    return ((b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])) / 2.0
+
+
+def _polygon_area(points):
+    area = 0.0
+    for k in range(len(points)):
+        x1, y1 = points[k]
+        x2, y2 = points[(k + 1) % len(points)]
+        area += x1 * y2 - x2 * y1
+    return area / 2.0
+
+
+def _expected_area(case):
+    """Filled area of a case with crossings at edge midpoints"""
+    filled = filled_corners(case)
+    if len(filled) == 4:
+        return 1.0
+    if len(filled) == 3:
+        return 7.0 / 8.0
+    if len(filled) == 2:
+        return 0.25 if case in (6, 9) else 0.5
+    return len(filled) / 8.0
+
+
+def _check_triangles(case, triangles, points, errors, label):
+    total = 0.0
+    for tri in triangles:
+        area = _signed_area(*(points[p] for p in tri))
+        if area >= -1e-9:
+            errors.append(f"{label} case {case}: triangle {tri} is not clockwise ({area:.4f})")
+        total += -area
+    return total
+
+
+def verify(samples=2000, seed=1):
+    """Return a list of problems; empty when the tables are sound"""
+    errors = []
+    tables = build_tables()
+    rng = random.Random(seed)
+    for case in range(16):
+        filled = filled_corners(case)
+        tris = tables["CASE_TRIANGLES"][tables["CASE_OFFSETS"][case]:tables["CASE_OFFSETS"][case + 1]]
+        tris = [tuple(tris[k:k + 3]) for k in range(0, len(tris), 3)]
+        used = {p for tri in tris for p in tri}
+        for corner in range(4):
+            if (corner in filled) != (corner in used) and case != 0:
+                errors.append(f"case {case}: corner {corner} used={corner in used} filled={corner in filled}")
+        for edge, (c1, c2) in ((X_MIN, (A, B)), (Y_MIN, (A, C)), (X_MAX, (C, D)), (Y_MAX, (B, D))):
+            crossing = (c1 in filled) != (c2 in filled)
+            if crossing != (edge in used):
+                errors.append(f"case {case}: edge {edge} used={edge in used} crossing={crossing}")
+        area = _check_triangles(case, tris, POINTS, errors, "base")
+        if abs(area - _expected_area(case)) > 1e-9:
+            errors.append(f"case {case}: area {area} != {_expected_area(case)}")
+
+        start, end = tables["FEATURE_OFFSETS"][case], tables["FEATURE_OFFSETS"][case + 1]
+        if start == end:
+            continue
+        ftris = tables["FEATURE_TRIANGLES"][start:end]
+        ftris = [tuple(ftris[k:k + 3]) for k in range(0, len(ftris), 3)]
+        e1, e2 = tables["FEATURE_EDGES"][2 * case:2 * case + 2]
+        anchor = POINTS[tables["FEATURE_ANCHORS"][case]]
+        p1, p2 = POINTS[e1], POINTS[e2]
+        polygon = with_feature(_anchor_first(case_polygons(case)[0]))
+        # Any feature the runtime accepts: inside the cell, on the empty side of the chord
+        accepted = 0
+        while accepted < samples // 16:
+            f = (rng.random(), rng.random())
+            if (_signed_area(p1, p2, f) > 0) == (_signed_area(p1, p2, anchor) > 0) or abs(_signed_area(p1, p2, f)) < 1e-6:
+                continue
+            accepted += 1
+            points = dict(POINTS)
+            points[FEATURE] = f
+            area = _check_triangles(case, ftris, points, errors, "feature")
+            outline = -_polygon_area([points[p] for p in polygon])
+            if abs(area - outline) > 1e-9:
+                errors.append(f"feature case {case}: fan area {area} != outline {outline} at {f}")
+                break
+    return errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate and check marching squares case tables")
+    parser.add_argument("--verify", action="store_true", help="self-check the tables")
+    args = parser.parse_args(argv)
+    if args.verify:
+        errors = verify()
+        for error in errors:
+            print(error)
+        print("Tables OK" if not errors else f"{len(errors)} problems")
+        return 1 if errors else 0
+    sys.stdout.write(gdscript_tables())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
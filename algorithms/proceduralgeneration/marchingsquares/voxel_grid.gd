@@ -5,40 +5,41 @@ extends Node3D
 @export var voxel_material: Material
 
 var voxels: Array = []
+
 var voxel_size: float = 1.0
 var grid_size: float = 1.0
 var surface: Node3D
-var dummy_x: Voxel = Voxel.new()
-var dummy_y: Voxel = Voxel.new()
-var dummy_t: Voxel = Voxel.new()
 
-# Chunk neighbors
+# Largest angle (degrees) between crossing normals kept as a sharp corner
+var sharp_feature_limit: float = 135.0
+
+# Chunk neighbors (read for this chunk's gap row/column) and owners
+# (the chunks that read this one, so they retriangulate when it changes)
 var x_neighbor: Node3D = null
 var y_neighbor: Node3D = null
 var xy_neighbor: Node3D = null
+var x_owner: Node3D = null
+var y_owner: Node3D = null
+var xy_owner: Node3D = null
 
 # Voxel visualization
-var voxel_objects: Array = []
+var voxel_markers: MultiMeshInstance3D
+
+# Cell rows waiting for retriangulation, flushed once per frame
+var dirty_row_min: int = 0
+var dirty_row_max: int = -1
+var retriangulate_queued: bool = false
 
 func initialize(res: int, size: float):
 	resolution = res
 	grid_size = size
 	voxel_size = size / float(resolution)
 	
-	# Create voxel array
-	voxels.clear()
-	for i in range(resolution * resolution):
-		voxels.append(null)
-	
-	# Create voxels
-	for y in range(resolution):
-		for x in range(resolution):
-			var i = y * resolution + x
-			voxels[i] = Voxel.new(x, y, voxel_size)
-			create_voxel_visual(i, x, y)
+	create_voxels()
+	create_voxel_markers()
 	
 	# Create surface
-	var surface_script = load("res://voxel_grid_surface.gd")
+	var surface_script = load("res://algorithms/proceduralgeneration/marchingsquares/voxel_grid_surface.gd")
 	surface = Node3D.new()
 	var mesh_inst = MeshInstance3D.new()
 	mesh_inst.set_script(surface_script)
@@ -51,208 +52,316 @@ func initialize(res: int, size: float):
 	
 	refresh()
 
-func create_voxel_visual(i: int, x: int, y: int):
-	var quad = MeshInstance3D.new()
+# All voxel markers of the chunk are drawn by one MultiMesh with per-instance colors
+func create_voxel_markers():
 	var quad_mesh = QuadMesh.new()
 	quad_mesh.size = Vector2.ONE * voxel_size * 0.1
-	quad.mesh = quad_mesh
-	
-	quad.position = Vector3(
-		(x + 0.5) * voxel_size,
-		(y + 0.5) * voxel_size,
-		-0.01
-	)
-	
 	var mat = StandardMaterial3D.new()
 	mat.shading_mode = BaseMaterial3D.SHADING_MODE_UNSHADED
-	quad.material_override = mat
+	mat.vertex_color_use_as_albedo = true
+	quad_mesh.material = mat
+	
+	var multimesh = MultiMesh.new()
+	multimesh.transform_format = MultiMesh.TRANSFORM_3D
+	multimesh.use_colors = true
+	multimesh.mesh = quad_mesh
+	multimesh.instance_count = resolution * resolution
+	
+	for y in range(resolution):
+		for x in range(resolution):
+			var i = y * resolution + x
+			var marker_position = Vector3((x + 0.5) * voxel_size, (y + 0.5) * voxel_size, -0.01)
+			multimesh.set_instance_transform(i, Transform3D(Basis(), marker_position))
+			multimesh.set_instance_color(i, Color.WHITE)
 	
-	add_child(quad)
-	voxel_objects.append({"mesh": quad, "material": mat})
+	voxel_markers = MultiMeshInstance3D.new()
+	voxel_markers.multimesh = multimesh
+	add_child(voxel_markers)
+
+func set_marker(i: int, state: bool):
+	voxel_markers.multimesh.set_instance_color(i, Color.BLACK if state else Color.WHITE)
 
 func set_voxel(x: int, y: int, state: bool):
-	voxels[y * resolution + x].state = state
-	refresh()
+	var i = y * resolution + x
+	if get_state(i) == state:
+		return
+	set_state(i, state)
+	set_marker(i, state)
+	mark_voxels_dirty(x, y, x, y)
 
-func apply(stencil: VoxelStencil):
-	var x_start = stencil.get_x_start()
-	if x_start < 0:
-		x_start = 0
-	var x_end = stencil.get_x_end()
-	if x_end >= resolution:
-		x_end = resolution - 1
-	
-	var y_start = stencil.get_y_start()
-	if y_start < 0:
-		y_start = 0
-	var y_end = stencil.get_y_end()
-	if y_end >= resolution:
-		y_end = resolution - 1
+# Apply a stencil; only changed voxels are recolored and only the cell rows
+# around them are queued. Returns true if any voxel changed.
+func apply(stencil: VoxelStencil) -> bool:
+	var x_start = max(stencil.get_x_start(), 0)
+	var x_end = min(stencil.get_x_end(), resolution - 1)
+	var y_start = max(stencil.get_y_start(), 0)
+	var y_end = min(stencil.get_y_end(), resolution - 1)
 	
+	var changed_x_min = resolution
+	var changed_x_max = -1
+	var changed_y_min = resolution
+	var changed_y_max = -1
 	for y in range(y_start, y_end + 1):
 		var i = y * resolution + x_start
 		for x in range(x_start, x_end + 1):
-			voxels[i].state = stencil.apply(x, y, voxels[i].state)
+			var state = get_state(i)
+			var new_state = stencil.apply(x, y, state)
+			if new_state != state:
+				set_state(i, new_state)
+				set_marker(i, new_state)
+				changed_x_min = min(changed_x_min, x)
+				changed_x_max = max(changed_x_max, x)
+				changed_y_min = min(changed_y_min, y)
+				changed_y_max = max(changed_y_max, y)
 			i += 1
 	
-	refresh()
+	var crossings_changed = apply_crossings(stencil)
+	if changed_x_max < 0:
+		return crossings_changed
+	mark_voxels_dirty(changed_x_min, changed_y_min, changed_x_max, changed_y_max)
+	return true
+
+# Move the crossings the stencil outline cuts onto the outline and store its
+# normal there for sharp features. Edges toward the next chunk belong to
+# this chunk's last column/row and read the neighbor's state, which
+# VoxelMap has already updated since it applies stencils in reverse order.
+func apply_crossings(stencil: VoxelStencil) -> bool:
+	var edge_x_start = max(stencil.get_x_start() - 1, 0)
+	var edge_y_start = max(stencil.get_y_start() - 1, 0)
+	var x_start = max(stencil.get_x_start(), 0)
+	var y_start = max(stencil.get_y_start(), 0)
+	var x_end = min(stencil.get_x_end(), resolution - 1)
+	var y_end = min(stencil.get_y_end(), resolution - 1)
+	var edge_x_end = min(x_end, resolution - 1 if x_neighbor else resolution - 2)
+	var edge_y_end = min(y_end, resolution - 1 if y_neighbor else resolution - 2)
+	
+	var changed = false
+	for y in range(y_start, y_end + 1):
+		for x in range(edge_x_start, edge_x_end + 1):
+			var offset = stencil.x_crossing(x, y)
+			if offset >= 0.0 and state_at(x, y) != state_at(x + 1, y):
+				set_x_crossing(y * resolution + x, offset, stencil.normal_at(Vector2(x + offset, y)))
+				changed = true
+	for y in range(edge_y_start, edge_y_end + 1):
+		for x in range(x_start, x_end + 1):
+			var offset = stencil.y_crossing(x, y)
+			if offset >= 0.0 and state_at(x, y) != state_at(x, y + 1):
+				set_y_crossing(y * resolution + x, offset, stencil.normal_at(Vector2(x, y + offset)))
+				changed = true
+	
+	if changed:
+		mark_voxels_dirty(edge_x_start, edge_y_start, x_end + 1, y_end + 1)
+	return changed
 
+# Recolor every marker and retriangulate the whole chunk
 func refresh():
 	set_voxel_colors()
-	triangulate()
+	mark_rows_dirty(0, resolution - 1)
 
 func set_voxel_colors():
-	for i in range(voxels.size()):
-		var color = Color.BLACK if voxels[i].state else Color.WHITE
-		voxel_objects[i].material.albedo_color = color
+	for i in range(resolution * resolution):
+		set_marker(i, get_state(i))
 
-func triangulate():
-	var surf = surface.get_child(0)
-	surf.clear()
+func mark_voxels_dirty(x_min: int, y_min: int, x_max: int, y_max: int):
+	# A voxel is a corner of the cells in the rows below and above it
+	mark_rows_dirty(y_min - 1, y_max)
+	# Voxels in the first column/row are also corners of the owners' gap cells
+	if x_min == 0 and x_owner:
+		x_owner.mark_rows_dirty(y_min - 1, y_max)
+	if y_min == 0 and y_owner:
+		y_owner.mark_rows_dirty(resolution - 1, resolution - 1)
+	if x_min == 0 and y_min == 0 and xy_owner:
+		xy_owner.mark_rows_dirty(resolution - 1, resolution - 1)
+
+func mark_rows_dirty(row_min: int, row_max: int):
+	row_min = max(row_min, 0)
+	row_max = min(row_max, resolution - 1)
+	if row_max < row_min:
+		return
+	if dirty_row_max < 0:
+		dirty_row_min = row_min
+		dirty_row_max = row_max
+	else:
+		dirty_row_min = min(dirty_row_min, row_min)
+		dirty_row_max = max(dirty_row_max, row_max)
+	if not retriangulate_queued:
+		retriangulate_queued = true
+		call_deferred("retriangulate")
+
+func create_voxels():
+	voxels.clear()
+	for y in range(resolution):
+		for x in range(resolution):
+			voxels.append(Voxel.new(x, y, voxel_size))
+
+func get_state(i: int) -> bool:
+	return voxels[i].state
+
+func set_state(i: int, state: bool):
+	voxels[i].state = state
+
+func set_x_crossing(i: int, offset: float, normal: Vector2):
+	var voxel = voxels[i]
+	voxel.x_edge_position = voxel.position + Vector2(offset * voxel_size, 0)
+	voxel.x_normal = normal
+
+func set_y_crossing(i: int, offset: float, normal: Vector2):
+	var voxel = voxels[i]
+	voxel.y_edge_position = voxel.position + Vector2(0, offset * voxel_size)
+	voxel.y_normal = normal
+
+# Lattice access: x == resolution or y == resolution reads the first
+# column/row of the neighboring chunk
+func sample_chunk(x: int, y: int) -> Node3D:
+	if x < resolution:
+		return self if y < resolution else y_neighbor
+	return x_neighbor if y < resolution else xy_neighbor
+
+func sample_index(x: int, y: int) -> int:
+	return (y % resolution) * resolution + (x % resolution)
+
+func state_at(x: int, y: int) -> bool:
+	return sample_chunk(x, y).voxels[sample_index(x, y)].state
+
+func corner_at(x: int, y: int) -> Vector2:
+	return Vector2(x + 0.5, y + 0.5) * voxel_size
+
+func x_edge_at(x: int, y: int) -> Vector2:
+	var voxel = sample_chunk(x, y).voxels[sample_index(x, y)]
+	return corner_at(x, y) + voxel.get_x_edge_point() - voxel.position
+
+func y_edge_at(x: int, y: int) -> Vector2:
+	var voxel = sample_chunk(x, y).voxels[sample_index(x, y)]
+	return corner_at(x, y) + voxel.get_y_edge_point() - voxel.position
+
+func x_normal_at(x: int, y: int) -> Vector2:
+	return sample_chunk(x, y).voxels[sample_index(x, y)].x_normal
+
+func y_normal_at(x: int, y: int) -> Vector2:
+	return sample_chunk(x, y).voxels[sample_index(x, y)].y_normal
+
+func retriangulate():
+	retriangulate_queued = false
+	if dirty_row_max < 0:
+		return
 	
+	# Gap cells toward a neighbor are triangulated by this chunk
+	var cells_x = resolution - 1
 	if x_neighbor:
-		dummy_x.become_x_dummy_of(x_neighbor.voxels[0], grid_size)
-	
-	fill_first_row_cache()
-	triangulate_cell_rows()
-	
+		cells_x += 1
+	var rows = resolution - 1
 	if y_neighbor:
-		triangulate_gap_row()
+		rows += 1
+	
+	var surf = surface.get_child(0)
+	surf.set_row_count(rows)
+	for y in range(dirty_row_min, min(dirty_row_max, rows - 1) + 1):
+		triangulate_row(y, cells_x)
+	dirty_row_min = 0
+	dirty_row_max = -1
 	
 	surf.apply()
 
-func fill_first_row_cache():
+# Cell row y lies between lattice rows y and y + 1
+func triangulate_row(y: int, cells_x: int):
 	var surf = surface.get_child(0)
-	cache_first_corner(voxels[0])
+	surf.begin_row(y, cells_x)
+	cache_lattice_row(y, cells_x)
+	surf.prepare_cache_for_next_row()
+	cache_lattice_row(y + 1, cells_x)
+	cache_next_middle_edge(0, y)
 	
-	for i in range(resolution - 1):
-		cache_next_edge_and_corner(i, voxels[i], voxels[i + 1])
+	for x in range(cells_x):
+		cache_next_middle_edge(x + 1, y)
 	
-	if x_neighbor:
-		dummy_x.become_x_dummy_of(x_neighbor.voxels[0], grid_size)
-		cache_next_edge_and_corner(resolution - 1, voxels[resolution - 1], dummy_x)
+		var cell_type = 0
+		if state_at(x, y):
+			cell_type |= 1
+		if state_at(x + 1, y):
+			cell_type |= 2
+		if state_at(x, y + 1):
+			cell_type |= 4
+		if state_at(x + 1, y + 1):
+			cell_type |= 8
+		if cell_type != 0:
+			surf.add_cell(x, cell_type, sharp_feature(x, y, cell_type))
+	
+	surf.end_row(y)
 
-func cache_first_corner(voxel: Voxel):
-	if voxel.state:
-		surface.get_child(0).cache_first_corner(voxel)
+func cache_lattice_row(y: int, cells_x: int):
+	if state_at(0, y):
+		surface.get_child(0).cache_first_corner(corner_at(0, y))
+	for x in range(cells_x):
+		cache_next_edge_and_corner(x, x, y)
 
-func cache_next_edge_and_corner(i: int, x_min: Voxel, x_max: Voxel):
+func cache_next_edge_and_corner(i: int, x: int, y: int):
 	var surf = surface.get_child(0)
-	if x_min.state != x_max.state:
-		surf.cache_x_edge(i, x_min)
-	if x_max.state:
-		surf.cache_next_corner(i, x_max)
+	var max_state = state_at(x + 1, y)
+	if state_at(x, y) != max_state:
+		surf.cache_x_edge(i, x_edge_at(x, y))
+	if max_state:
+		surf.cache_next_corner(i, corner_at(x + 1, y))
 
-func cache_next_middle_edge(y_min: Voxel, y_max: Voxel):
+func cache_next_middle_edge(x: int, y: int):
 	var surf = surface.get_child(0)
 	surf.prepare_cache_for_next_cell()
-	if y_min.state != y_max.state:
-		surf.cache_y_edge(y_min)
+	if state_at(x, y) != state_at(x, y + 1):
+		surf.cache_y_edge(y_edge_at(x, y))
 
-func triangulate_cell_rows():
-	var cells = resolution - 1
-	
-	for y in range(cells):
-		var i = y * resolution
-		swap_row_caches()
-		cache_first_corner(voxels[i + resolution])
-		cache_next_middle_edge(voxels[i], voxels[i + resolution])
-		
-		for x in range(cells):
-			var a = voxels[i]
-			var b = voxels[i + 1]
-			var c = voxels[i + resolution]
-			var d = voxels[i + resolution + 1]
-			
-			cache_next_edge_and_corner(x, c, d)
-			cache_next_middle_edge(b, d)
-			triangulate_cell(x, a, b, c, d)
-			i += 1
-		
-		if x_neighbor:
-			triangulate_gap_cell(i)
-
-func triangulate_gap_cell(i: int):
-	var swap = dummy_t
-	swap.become_x_dummy_of(x_neighbor.voxels[i + 1], grid_size)
-	dummy_t = dummy_x
-	dummy_x = swap
-	triangulate_cell(resolution - 1, voxels[i], dummy_t, voxels[i + resolution], dummy_x)
-
-func triangulate_gap_row():
-	var surf = surface.get_child(0)
-	swap_row_caches()
-	
-	dummy_y.become_y_dummy_of(y_neighbor.voxels[0], grid_size)
-	var cells = resolution - 1
-	var offset = cells * resolution
-	
-	cache_first_corner(dummy_y)
-	cache_next_middle_edge(voxels[offset], dummy_y)
+# Sharp feature vertex where the tangents at the cell's two crossings meet.
+# Returns -1 (plain case) unless the case has a single crossing pair, both
+# crossings carry normals at a sharp angle, and the point lies inside the
+# cell on the empty side of the chord between the crossings
+func sharp_feature(x: int, y: int, cell_type: int) -> int:
+	var e1 = MarchingSquaresTables.FEATURE_EDGES[cell_type * 2]
+	if e1 < 0:
+		return -1
+	var e2 = MarchingSquaresTables.FEATURE_EDGES[cell_type * 2 + 1]
+	var n1 = edge_normal(e1, x, y)
+	var n2 = edge_normal(e2, x, y)
+	if n1 == Vector2.ZERO or n2 == Vector2.ZERO:
+		return -1
+	var dot = n1.dot(-n2)
+	if dot < cos(deg_to_rad(sharp_feature_limit)) or dot > 0.9999:
+		return -1
 	
-	for x in range(cells):
-		var swap = dummy_t
-		swap.become_y_dummy_of(y_neighbor.voxels[x + 1], grid_size)
-		dummy_t = dummy_y
-		dummy_y = swap
-		
-		cache_next_edge_and_corner(x, dummy_t, dummy_y)
-		cache_next_middle_edge(voxels[x + offset + 1], dummy_y)
-		triangulate_cell(x, voxels[x + offset], voxels[x + offset + 1], dummy_t, dummy_y)
+	var t1 = n1.orthogonal()
+	var t2 = n2.orthogonal()
+	var denom = t1.cross(t2)
+	if absf(denom) < 0.0001:
+		return -1
+	var p1 = edge_point(e1, x, y)
+	var p2 = edge_point(e2, x, y)
+	var point = p1 + t1 * ((p2 - p1).cross(t2) / denom)
 	
-	if x_neighbor:
-		dummy_t.become_xy_dummy_of(xy_neighbor.voxels[0], grid_size)
-		cache_next_edge_and_corner(cells, dummy_y, dummy_t)
-		cache_next_middle_edge(dummy_x, dummy_t)
-		triangulate_cell(cells, voxels[voxels.size() - 1], dummy_x, dummy_y, dummy_t)
-
-func swap_row_caches():
-	surface.get_child(0).prepare_cache_for_next_row()
-
-func triangulate_cell(i: int, a: Voxel, b: Voxel, c: Voxel, d: Voxel):
-	var cell_type = 0
-	if a.state:
-		cell_type |= 1
-	if b.state:
-		cell_type |= 2
-	if c.state:
-		cell_type |= 4
-	if d.state:
-		cell_type |= 8
-	
-	var surf = surface.get_child(0)
-	match cell_type:
-		0:
-			return
-		1:
-			surf.add_triangle_a(i)
-		2:
-			surf.add_triangle_b(i)
-		3:
-			surf.add_quad_a(i)
+	var cell_min = corner_at(x, y)
+	var cell_max = corner_at(x + 1, y + 1)
+	if point.x < cell_min.x or point.y < cell_min.y or point.x > cell_max.x or point.y > cell_max.y:
+		return -1
+	var anchor_id = MarchingSquaresTables.FEATURE_ANCHORS[cell_type]
+	var anchor = corner_at(x + (anchor_id & 1), y + (anchor_id >> 1))
+	var chord = p2 - p1
+	if chord.cross(point - p1) * chord.cross(anchor - p1) >= 0.0:
+		return -1
+	return surface.get_child(0).add_vertex(point)
+
+# Crossing position and normal by table point id (4-7)
+func edge_point(edge: int, x: int, y: int) -> Vector2:
+	match edge:
+		4:
+			return x_edge_at(x, y)
+		5:
+			return y_edge_at(x, y)
+		6:
+			return x_edge_at(x, y + 1)
+	return y_edge_at(x + 1, y)
+
+func edge_normal(edge: int, x: int, y: int) -> Vector2:
+	match edge:
 		4:
-			surf.add_triangle_c(i)
+			return x_normal_at(x, y)
 		5:
-			surf.add_quad_b(i)
+			return y_normal_at(x, y)
 		6:
-			surf.add_triangle_b(i)
-			surf.add_triangle_c(i)
-		7:
-			surf.add_pentagon_a(i)
-		8:
-			surf.add_triangle_d(i)
-		9:
-			surf.add_triangle_a(i)
-			surf.add_triangle_d(i)
-		10:
-			surf.add_quad_c(i)
-		11:
-			surf.add_pentagon_b(i)
-		12:
-			surf.add_quad_d(i)
-		13:
-			surf.add_pentagon_c(i)
-		14:
-			surf.add_pentagon_d(i)
-		15:
-			surf.add_quad_e(i)
+			return x_normal_at(x, y + 1)
+	return y_normal_at(x + 1, y)
@@ -1,8 +1,23 @@
 # voxel_grid_surface.gd - Manages surface mesh
 extends MeshInstance3D
 
+# Each cell row owns a fixed block of row_capacity vertices and of
+# row_index_capacity indices, so one row can be rebuilt without touching the
+# others. apply() packs the used part of every block into the mesh buffers;
+# all of them are sized once per row count and never grown.
 var vertices: PackedVector3Array = []
-var triangles: PackedInt32Array = []
+var indices: PackedInt32Array = []
+var row_vertex_counts: PackedInt32Array = []
+var row_index_counts: PackedInt32Array = []
+var mesh_vertices: PackedVector3Array = []
+var mesh_indices: PackedInt32Array = []
+var row_capacity: int = 0
+var row_index_capacity: int = 0
+var next_vertex: int = 0
+var next_index: int = 0
+# Vertices in the uploaded mesh
+var used_vertex_count: int = 0
+var points: PackedInt32Array = []
 var corners_min: PackedInt32Array = []
 var corners_max: PackedInt32Array = []
 var x_edges_min: PackedInt32Array = []
@@ -21,40 +36,78 @@ func initialize(resolution: int):
 	corners_max.resize(resolution + 1)
 	x_edges_min.resize(resolution)
 	x_edges_max.resize(resolution)
-
-func clear():
-	vertices.clear()
-	triangles.clear()
-
+	points.resize(9)
+	
+	# Corners and x edges of two lattice rows, the y edges between them
+	# and one sharp feature vertex per cell
+	row_capacity = 5 * (resolution + 1) + resolution
+	row_index_capacity = resolution * MarchingSquaresTables.MAX_CELL_INDICES
+
+func set_row_count(rows: int):
+	var old_rows = row_index_counts.size()
+	if old_rows == rows:
+		return
+	row_vertex_counts.resize(rows)
+	row_index_counts.resize(rows)
+	for y in range(old_rows, rows):
+		row_vertex_counts[y] = 0
+		row_index_counts[y] = 0
+	vertices.resize(rows * row_capacity)
+	indices.resize(rows * row_index_capacity)
+	mesh_vertices.resize(rows * row_capacity)
+	mesh_indices.resize(rows * row_index_capacity)
+
+func begin_row(y: int, cells: int):
+	next_vertex = y * row_capacity
+	next_index = y * row_index_capacity
+
+func end_row(y: int):
+	row_vertex_counts[y] = next_vertex - y * row_capacity
+	row_index_counts[y] = next_index - y * row_index_capacity
+
+# Every vertex a row adds is referenced by its triangles, so packing the
+# used prefix of each block uploads exactly the vertices the mesh needs
 func apply():
-	if vertices.size() == 0:
+	var vertex_count = 0
+	var index_count = 0
+	for y in range(row_index_counts.size()):
+		var first_vertex = y * row_capacity
+		var shift = vertex_count - first_vertex
+		for k in range(first_vertex, first_vertex + row_vertex_counts[y]):
+			mesh_vertices[k + shift] = vertices[k]
+		var first_index = y * row_index_capacity
+		for k in range(first_index, first_index + row_index_counts[y]):
+			mesh_indices[index_count] = indices[k] + shift
+			index_count += 1
+		vertex_count += row_vertex_counts[y]
+	used_vertex_count = vertex_count
+	
+	mesh.clear_surfaces()
+	if index_count == 0:
 		return
 	
 	var arrays = []
 	arrays.resize(Mesh.ARRAY_MAX)
-	arrays[Mesh.ARRAY_VERTEX] = vertices
-	arrays[Mesh.ARRAY_INDEX] = triangles
-	
-	mesh.clear_surfaces()
+	arrays[Mesh.ARRAY_VERTEX] = mesh_vertices.slice(0, vertex_count)
+	arrays[Mesh.ARRAY_INDEX] = mesh_indices.slice(0, index_count)
 	mesh.add_surface_from_arrays(Mesh.PRIMITIVE_TRIANGLES, arrays)
 
-func cache_first_corner(voxel: Voxel):
-	corners_max[0] = vertices.size()
-	vertices.append(Vector3(voxel.position.x, voxel.position.y, 0))
+func add_vertex(p: Vector2) -> int:
+	vertices[next_vertex] = Vector3(p.x, p.y, 0)
+	next_vertex += 1
+	return next_vertex - 1
+
+func cache_first_corner(p: Vector2):
+	corners_max[0] = add_vertex(p)
 
-func cache_next_corner(i: int, voxel: Voxel):
-	corners_max[i + 1] = vertices.size()
-	vertices.append(Vector3(voxel.position.x, voxel.position.y, 0))
+func cache_next_corner(i: int, p: Vector2):
+	corners_max[i + 1] = add_vertex(p)
 
-func cache_x_edge(i: int, voxel: Voxel):
-	x_edges_max[i] = vertices.size()
-	var p = voxel.get_x_edge_point()
-	vertices.append(Vector3(p.x, p.y, 0))
+func cache_x_edge(i: int, p: Vector2):
+	x_edges_max[i] = add_vertex(p)
 
-func cache_y_edge(voxel: Voxel):
-	y_edge_max = vertices.size()
-	var p = voxel.get_y_edge_point()
-	vertices.append(Vector3(p.x, p.y, 0))
+func cache_y_edge(p: Vector2):
+	y_edge_max = add_vertex(p)
 
 func prepare_cache_for_next_cell():
 	y_edge_min = y_edge_max
@@ -67,67 +120,24 @@ func prepare_cache_for_next_row():
 	x_edges_min = x_edges_max
 	x_edges_max = swap
 
-# Triangle/Quad/Pentagon/Hexagon methods
-func add_triangle(a: int, b: int, c: int):
-	triangles.append(a)
-	triangles.append(b)
-	triangles.append(c)
-
-func add_quad(a: int, b: int, c: int, d: int):
-	triangles.append(a)
-	triangles.append(b)
-	triangles.append(c)
-	triangles.append(a)
-	triangles.append(c)
-	triangles.append(d)
-
-func add_pentagon(a: int, b: int, c: int, d: int, e: int):
-	triangles.append(a)
-	triangles.append(b)
-	triangles.append(c)
-	triangles.append(a)
-	triangles.append(c)
-	triangles.append(d)
-	triangles.append(a)
-	triangles.append(d)
-	triangles.append(e)
-
-# Case-specific methods  
-func add_triangle_a(i: int):
-	add_triangle(corners_min[i], y_edge_min, x_edges_min[i])
-
-func add_triangle_b(i: int):
-	add_triangle(x_edges_min[i], corners_max[i], y_edge_max)
-
-func add_triangle_c(i: int):
-	add_triangle(y_edge_min, corners_min[i + 1], x_edges_max[i])
-
-func add_triangle_d(i: int):
-	add_triangle(x_edges_max[i], y_edge_max, corners_max[i + 1])
-
-func add_quad_a(i: int):
-	add_quad(corners_min[i], y_edge_min, y_edge_max, corners_max[i])
-
-func add_quad_b(i: int):
-	add_quad(x_edges_min[i], corners_max[i], corners_max[i + 1], x_edges_max[i])
-
-func add_quad_c(i: int):
-	add_quad(y_edge_min, corners_min[i + 1], corners_max[i + 1], y_edge_max)
-
-func add_quad_d(i: int):
-	add_quad(x_edges_min[i], corners_min[i], corners_min[i + 1], x_edges_max[i])
-
-func add_quad_e(i: int):
-	add_quad(corners_min[i], corners_min[i + 1], corners_max[i + 1], corners_max[i])
-
-func add_pentagon_a(i: int):
-	add_pentagon(corners_min[i], corners_min[i + 1], x_edges_max[i], y_edge_max, corners_max[i])
-
-func add_pentagon_b(i: int):
-	add_pentagon(x_edges_min[i], corners_max[i], corners_max[i + 1], y_edge_max, corners_min[i])
-
-func add_pentagon_c(i: int):
-	add_pentagon(y_edge_min, corners_min[i + 1], corners_max[i + 1], x_edges_max[i], corners_min[i])
-
-func add_pentagon_d(i: int):
-	add_pentagon(corners_max[i + 1], corners_max[i], y_edge_max, x_edges_min[i], corners_min[i + 1])
+# Emit the triangles of one cell from the case tables. Point ids 0-7 map
+# to the cached corners and crossings, 8 to an optional feature vertex
+func add_cell(i: int, cell_type: int, feature: int = -1):
+	points[0] = corners_min[i]
+	points[1] = corners_min[i + 1]
+	points[2] = corners_max[i]
+	points[3] = corners_max[i + 1]
+	points[4] = x_edges_min[i]
+	points[5] = y_edge_min
+	points[6] = x_edges_max[i]
+	points[7] = y_edge_max
+	points[8] = feature
+	
+	var offsets = MarchingSquaresTables.CASE_OFFSETS
+	var table = MarchingSquaresTables.CASE_TRIANGLES
+	if feature >= 0:
+		offsets = MarchingSquaresTables.FEATURE_OFFSETS
+		table = MarchingSquaresTables.FEATURE_TRIANGLES
+	for k in range(offsets[cell_type], offsets[cell_type + 1]):
+		indices[next_index] = points[table[k]]
+		next_index += 1
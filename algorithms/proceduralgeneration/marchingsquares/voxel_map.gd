@@ -5,6 +5,9 @@ extends Node3D
 @export var voxel_resolution: int = 8
 @export var chunk_resolution: int = 2
 @export var voxel_material: Material
+@export_range(0.0, 180.0) var sharp_feature_limit: float = 135.0
+# Mesh baked by marching_squares_mesher.py; shown until the first edit
+@export var baked_mesh: ArrayMesh
 
 var chunks: Array = []
 var chunk_size: float
@@ -17,6 +20,11 @@ var fill_type_index: int = 0
 var radius_index: int = 0
 var stencil_index: int = 0
 
+# Last stroke position and brush; holding the mouse on one cell is a no-op
+var last_edit: Array = []
+
+var baked_instance: MeshInstance3D = null
+
 func _ready():
 	half_size = map_size * 0.5
 	chunk_size = map_size / float(chunk_resolution)
@@ -25,17 +33,13 @@ func _ready():
 	# Initialize stencils
 	stencils = [
 		VoxelStencil.new(),
-		load("res://voxel_stencil_circle.gd").new()
+		load("res://algorithms/proceduralgeneration/marchingsquares/voxel_stencil_circle.gd").new()
 	]
 	
-	# Create chunks
-	var grid_script = load("res://voxel_grid.gd")
-	chunks.resize(chunk_resolution * chunk_resolution)
-	
-	for y in range(chunk_resolution):
-		for x in range(chunk_resolution):
-			var i = y * chunk_resolution + x
-			create_chunk(i, x, y, grid_script)
+	if baked_mesh:
+		show_baked_mesh()
+	else:
+		create_chunks()
 	
 	# Add collider
 	var box = CollisionShape3D.new()
@@ -48,10 +52,47 @@ func _ready():
 	static_body.add_child(box)
 	add_child(static_body)
 
+func create_chunks():
+	var grid_script = load("res://algorithms/proceduralgeneration/marchingsquares/voxel_grid.gd")
+	chunks.resize(chunk_resolution * chunk_resolution)
+	
+	for y in range(chunk_resolution):
+		for x in range(chunk_resolution):
+			var i = y * chunk_resolution + x
+			create_chunk(i, x, y, grid_script)
+
+# A baked set piece is one static mesh; chunks are built on the first edit
+func show_baked_mesh():
+	baked_instance = MeshInstance3D.new()
+	baked_instance.mesh = baked_mesh
+	if voxel_material:
+		baked_instance.material_override = voxel_material
+	add_child(baked_instance)
+
+# Switch from the baked mesh to runtime meshing, seeded with the baked
+# voxel states (stored as mesh metadata by the mesher)
+func unbake():
+	create_chunks()
+	var states: PackedByteArray = baked_mesh.get_meta("voxel_states", PackedByteArray())
+	var width: int = baked_mesh.get_meta("voxel_width", 0)
+	var height: int = baked_mesh.get_meta("voxel_height", 0)
+	var total = chunk_resolution * voxel_resolution
+	if width != total or height != total:
+		print("VoxelMap: baked grid is %dx%d, map has %dx%d voxels" % [width, height, total, total])
+	for y in range(min(height, total)):
+		for x in range(min(width, total)):
+			if states[y * width + x] != 0:
+				var chunk = chunks[(y / voxel_resolution) * chunk_resolution + x / voxel_resolution]
+				chunk.set_voxel(x % voxel_resolution, y % voxel_resolution, true)
+	
+	baked_instance.queue_free()
+	baked_instance = null
+
 func create_chunk(i: int, x: int, y: int, grid_script):
 	var chunk = Node3D.new()
 	chunk.set_script(grid_script)
 	chunk.voxel_material = voxel_material
+	chunk.sharp_feature_limit = sharp_feature_limit
 	chunk.position = Vector3(
 		x * chunk_size - half_size,
 		y * chunk_size - half_size,
@@ -61,13 +102,16 @@ func create_chunk(i: int, x: int, y: int, grid_script):
 	chunk.initialize(voxel_resolution, chunk_size)
 	chunks[i] = chunk
 	
-	# Set up neighbors
+	# Set up neighbors and the owners that read them
 	if x > 0:
 		chunks[i - 1].x_neighbor = chunk
+		chunk.x_owner = chunks[i - 1]
 	if y > 0:
 		chunks[i - chunk_resolution].y_neighbor = chunk
+		chunk.y_owner = chunks[i - chunk_resolution]
 		if x > 0:
 			chunks[i - chunk_resolution - 1].xy_neighbor = chunk
+			chunk.xy_owner = chunks[i - chunk_resolution - 1]
 
 func _process(_delta):
 	if Input.is_mouse_button_pressed(MOUSE_BUTTON_LEFT):
@@ -82,11 +126,21 @@ func _process(_delta):
 			
 			if result and result.collider.get_parent() == self:
 				edit_voxels(to_local(result.position))
+	else:
+		last_edit = []
 
 func edit_voxels(point: Vector3):
+	if baked_instance:
+		unbake()
+	
 	var center_x = int((point.x + half_size) / voxel_size)
 	var center_y = int((point.y + half_size) / voxel_size)
 	
+	var edit = [center_x, center_y, fill_type_index, radius_index, stencil_index]
+	if edit == last_edit:
+		return
+	last_edit = edit
+	
 	var x_start = (center_x - radius_index - 1) / voxel_resolution
 	x_start = max(0, x_start)
 	var x_end = (center_x + radius_index) / voxel_resolution
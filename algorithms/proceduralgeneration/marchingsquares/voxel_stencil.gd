@@ -28,3 +28,30 @@ func get_y_start() -> int:
 
 func get_y_end() -> int:
 	return center_y + radius
+
+# Where the stencil outline cuts the edge from voxel (x, y) to (x + 1, y),
+# as an offset in voxels from (x, y); -1 if it does not cut that edge
+func x_crossing(x: int, y: int) -> float:
+	if absi(y - center_y) > radius:
+		return -1.0
+	return edge_crossing(x, center_x - radius - 0.5, center_x + radius + 0.5)
+
+func y_crossing(x: int, y: int) -> float:
+	if absi(x - center_x) > radius:
+		return -1.0
+	return edge_crossing(y, center_y - radius - 0.5, center_y + radius + 0.5)
+
+# Outline positions low/high bound the voxels the stencil covers on one
+# lattice line; a voxel exactly on either one counts as covered
+func edge_crossing(start: int, low: float, high: float) -> float:
+	if low > start and low <= start + 1:
+		return low - start
+	if high >= start and high < start + 1:
+		return high - start
+	return -1.0
+
+# Outline normal at p (voxel coordinates), pointing away from the filled side
+func normal_at(p: Vector2) -> Vector2:
+	var d = p - Vector2(center_x, center_y)
+	var normal = Vector2(signf(d.x), 0) if absf(d.x) >= absf(d.y) else Vector2(0, signf(d.y))
+	return normal if fill_type else -normal
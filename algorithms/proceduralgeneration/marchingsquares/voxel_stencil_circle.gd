@@ -13,3 +13,21 @@ func apply(x: int, y: int, voxel: bool) -> bool:
 	if dx * dx + dy * dy <= sqr_radius:
 		return fill_type
 	return voxel
+
+func x_crossing(x: int, y: int) -> float:
+	var dy = y - center_y
+	if dy * dy > sqr_radius:
+		return -1.0
+	var half_width = sqrt(sqr_radius - dy * dy)
+	return edge_crossing(x, center_x - half_width, center_x + half_width)
+
+func y_crossing(x: int, y: int) -> float:
+	var dx = x - center_x
+	if dx * dx > sqr_radius:
+		return -1.0
+	var half_height = sqrt(sqr_radius - dx * dx)
+	return edge_crossing(y, center_y - half_height, center_y + half_height)
+
+func normal_at(p: Vector2) -> Vector2:
+	var normal = (p - Vector2(center_x, center_y)).normalized()
+	return normal if fill_type else -normal
@@ -15,6 +15,14 @@ var sequence_elements: Array = []
 var transition_matrix: Array = []
 var step_timer: float = 0.0
 var step_interval: float = 0.8
+@onready var engine_core_node: CSGBox3D = $GenerationEngine/EngineCore
+@onready var text_generation_core: CSGSphere3D = $GenerationEngine/ChainMethods/TextGenerationCore
+@onready var music_generation_core: CSGSphere3D = $GenerationEngine/ChainMethods/MusicGenerationCore
+@onready var pattern_generation_core: CSGSphere3D = $GenerationEngine/ChainMethods/PatternGenerationCore
+@onready var matrix_core_node: CSGBox3D = $ProbabilityMatrix/MatrixCore
+@onready var sequence_core_node: CSGBox3D = $GeneratedSequence/SequenceCore
+@onready var entropy_indicator_node: CSGSphere3D = $MarkovMetrics/EntropyMeter/EntropyIndicator
+@onready var convergence_indicator_node: CSGSphere3D = $MarkovMetrics/ConvergenceMeter/ConvergenceIndicator
 
 func _ready():
 	# Initialize Markov Chains visualization
@@ -335,7 +343,7 @@ func animate_transitions(delta):
 
 func animate_generation_engine(delta):
 	# Animate generation engine core
-	var engine_core = $GenerationEngine/EngineCore
+	var engine_core = engine_core_node
 	if engine_core:
 		# Rotate engine
 		engine_core.rotation.y += delta * 0.5
@@ -350,7 +358,7 @@ func animate_generation_engine(delta):
 			engine_core.material_override.emission = Color(0.2, 0.8, 0.2, 1) * intensity
 	
 	# Animate chain method cores
-	var text_core = $GenerationEngine/ChainMethods/TextGenerationCore
+	var text_core = text_generation_core
 	if text_core:
 		text_core.rotation.y += delta * 0.8
 		var text_activation = sin(time * 1.5) * 0.5 + 0.5
@@ -363,7 +371,7 @@ func animate_generation_engine(delta):
 			var intensity = 0.3 + text_activation * 0.7
 			text_core.material_override.emission = Color(0.8, 0.2, 0.2, 1) * intensity
 	
-	var music_core = $GenerationEngine/ChainMethods/MusicGenerationCore
+	var music_core = music_generation_core
 	if music_core:
 		music_core.rotation.y += delta * 1.0
 		var music_activation = cos(time * 1.8) * 0.5 + 0.5
@@ -376,7 +384,7 @@ func animate_generation_engine(delta):
 			var intensity = 0.3 + music_activation * 0.7
 			music_core.material_override.emission = Color(0.8, 0.2, 0.2, 1) * intensity
 	
-	var pattern_core = $GenerationEngine/ChainMethods/PatternGenerationCore
+	var pattern_core = pattern_generation_core
 	if pattern_core:
 		pattern_core.rotation.y += delta * 1.2
 		var pattern_activation = sin(time * 2.0) * 0.5 + 0.5
@@ -391,7 +399,7 @@ func animate_generation_engine(delta):
 
 func animate_probability_matrix(delta):
 	# Animate probability matrix core
-	var matrix_core = $ProbabilityMatrix/MatrixCore
+	var matrix_core = matrix_core_node
 	if matrix_core:
 		# Rotate matrix
 		matrix_core.rotation.y += delta * 0.3
@@ -425,7 +433,7 @@ func animate_probability_matrix(delta):
 
 func animate_generated_sequence(delta):
 	# Animate generated sequence core
-	var sequence_core = $GeneratedSequence/SequenceCore
+	var sequence_core = sequence_core_node
 	if sequence_core:
 		# Rotate sequence
 		sequence_core.rotation.y += delta * 0.2
@@ -465,7 +473,7 @@ func animate_generated_sequence(delta):
 
 func update_markov_metrics(delta):
 	# Update entropy meter
-	var entropy_indicator = $MarkovMetrics/EntropyMeter/EntropyIndicator
+	var entropy_indicator = entropy_indicator_node
 	if entropy_indicator:
 		var target_x = lerp(-2, 2, entropy_level)
 		entropy_indicator.position.x = lerp(entropy_indicator.position.x, target_x, delta * 2.0)
@@ -476,7 +484,7 @@ func update_markov_metrics(delta):
 		entropy_indicator.material_override.albedo_color = Color(red_component, green_component, 0.2, 1)
 	
 	# Update convergence meter
-	var convergence_indicator = $MarkovMetrics/ConvergenceMeter/ConvergenceIndicator
+	var convergence_indicator = convergence_indicator_node
 	if convergence_indicator:
 		var target_x = lerp(-2, 2, convergence_rate)
 		convergence_indicator.position.x = lerp(convergence_indicator.position.x, target_x, delta * 2.0)
@@ -12,6 +12,14 @@ var voronoi_cells: Array = []
 var boundaries: Array = []
 var distance_indicators: Array = []
 var sweep_line_position: float = -5.0
+@onready var engine_core_node: CSGBox3D = $GenerationEngine/EngineCore
+@onready var fortune_core_node: CSGSphere3D = $GenerationEngine/GenerationMethods/FortuneCore
+@onready var delaunay_core_node: CSGSphere3D = $GenerationEngine/GenerationMethods/DelaunayCore
+@onready var lloyd_core_node: CSGSphere3D = $GenerationEngine/GenerationMethods/LloydCore
+@onready var field_core_node: CSGBox3D = $DistanceFields/FieldCore
+@onready var sweep_core_node: CSGBox3D = $SweepLine/SweepCore
+@onready var uniformity_indicator_node: CSGSphere3D = $VoronoiMetrics/UniformityMeter/UniformityIndicator
+@onready var coverage_indicator_node: CSGSphere3D = $VoronoiMetrics/CoverageMeter/CoverageIndicator
 
 func _ready():
 	# Initialize Voronoi Diagrams visualization
@@ -250,7 +258,7 @@ func calculate_average_neighbor_distance(seed_index: int) -> float:
 
 func animate_generation_engine(delta):
 	# Animate generation engine core
-	var engine_core = $GenerationEngine/EngineCore
+	var engine_core = engine_core_node
 	if engine_core:
 		# Rotate engine
 		engine_core.rotation.y += delta * 0.5
@@ -265,7 +273,7 @@ func animate_generation_engine(delta):
 			engine_core.material_override.emission = Color(0.2, 0.8, 0.2, 1) * intensity
 	
 	# Animate generation method cores
-	var fortune_core = $GenerationEngine/GenerationMethods/FortuneCore
+	var fortune_core = fortune_core_node
 	if fortune_core:
 		fortune_core.rotation.y += delta * 0.8
 		var fortune_activation = sin(time * 1.5) * 0.5 + 0.5
@@ -278,7 +286,7 @@ func animate_generation_engine(delta):
 			var intensity = 0.3 + fortune_activation * 0.7
 			fortune_core.material_override.emission = Color(0.8, 0.2, 0.2, 1) * intensity
 	
-	var delaunay_core = $GenerationEngine/GenerationMethods/DelaunayCore
+	var delaunay_core = delaunay_core_node
 	if delaunay_core:
 		delaunay_core.rotation.y += delta * 1.0
 		var delaunay_activation = cos(time * 1.8) * 0.5 + 0.5
@@ -291,7 +299,7 @@ func animate_generation_engine(delta):
 			var intensity = 0.3 + delaunay_activation * 0.7
 			delaunay_core.material_override.emission = Color(0.8, 0.2, 0.2, 1) * intensity
 	
-	var lloyd_core = $GenerationEngine/GenerationMethods/LloydCore
+	var lloyd_core = lloyd_core_node
 	if lloyd_core:
 		lloyd_core.rotation.y += delta * 1.2
 		var lloyd_activation = sin(time * 2.0) * 0.5 + 0.5
@@ -306,7 +314,7 @@ func animate_generation_engine(delta):
 
 func animate_distance_fields(delta):
 	# Animate distance field core
-	var field_core = $DistanceFields/FieldCore
+	var field_core = field_core_node
 	if field_core:
 		# Rotate field
 		field_core.rotation.y += delta * 0.3
@@ -353,7 +361,7 @@ func animate_distance_fields(delta):
 
 func animate_sweep_line(delta):
 	# Animate Fortune's algorithm sweep line
-	var sweep_core = $SweepLine/SweepCore
+	var sweep_core = sweep_core_node
 	if sweep_core:
 		# Move sweep line across space
 		sweep_line_position += delta * 2.0
@@ -402,7 +410,7 @@ func animate_sweep_line(delta):
 
 func update_voronoi_metrics(delta):
 	# Update uniformity meter
-	var uniformity_indicator = $VoronoiMetrics/UniformityMeter/UniformityIndicator
+	var uniformity_indicator = uniformity_indicator_node
 	if uniformity_indicator:
 		var target_x = lerp(-2, 2, uniformity_score)
 		uniformity_indicator.position.x = lerp(uniformity_indicator.position.x, target_x, delta * 2.0)
@@ -413,7 +421,7 @@ func update_voronoi_metrics(delta):
 		uniformity_indicator.material_override.albedo_color = Color(red_component, green_component, 0.2, 1)
 	
 	# Update coverage meter
-	var coverage_indicator = $VoronoiMetrics/CoverageMeter/CoverageIndicator
+	var coverage_indicator = coverage_indicator_node
 	if coverage_indicator:
 		var target_x = lerp(-2, 2, coverage_score)
 		coverage_indicator.position.x = lerp(coverage_indicator.position.x, target_x, delta * 2.0)
@@ -8,6 +8,8 @@ var adjacency_rules = {}
 var collapsed_cells = 0
 var generation_timer = 0.0
 var generation_interval = 0.2
+@onready var entropy_indicator: CSGCylinder3D = $EntropyIndicator
+@onready var collapse_progress: CSGBox3D = $CollapseProgress
 
 class WFCCell:
 	var possible_states: Array
@@ -243,7 +245,7 @@ func animate_indicators():
 	
 	var avg_entropy = total_entropy / max(uncollapsed_count, 1)
 	var entropy_height = (avg_entropy / tile_types.size()) * 2.0 + 0.5
-	var entropyindicator = get_node_or_null("EntropyIndicator")
+	var entropyindicator = entropy_indicator
 	if entropyindicator and entropyindicator is CSGCylinder3D:
 		entropyindicator.height = entropy_height
 		entropyindicator.position.y = -3 + entropy_height/2
@@ -251,13 +253,13 @@ func animate_indicators():
 	# Collapse progress indicator
 	var progress = float(collapsed_cells) / (grid_size * grid_size)
 	var progress_height = progress * 2.0 + 0.5
-	$CollapseProgress.size.y = progress_height
-	$CollapseProgress.position.y = -3 + progress_height/2
+	collapse_progress.size.y = progress_height
+	collapse_progress.position.y = -3 + progress_height/2
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 4.0) * 0.1
-	$EntropyIndicator.scale.x = pulse
-	$CollapseProgress.scale.x = pulse
+	entropy_indicator.scale.x = pulse
+	collapse_progress.scale.x = pulse
 
 func get_wfc_info() -> Dictionary:
 	var total_entropy = 0
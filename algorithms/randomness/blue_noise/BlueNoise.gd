@@ -12,6 +12,10 @@ var generation_timer = 0.0
 var generation_interval = 0.1
 var current_iteration = 0
 var max_iterations = 100
+@onready var voronoi_cells_node: Node3D = $VoronoiCells
+@onready var noise_points_node: Node3D = $NoisePoints
+@onready var min_distance_node: CSGCylinder3D = $MinDistance
+@onready var iteration_count = $IterationCount
 
 func _ready():
 	create_distance_field()
@@ -81,7 +85,7 @@ func start_poisson_disk_sampling():
 	current_iteration = 0
 	
 	# Clear existing visual points
-	for child in $NoisePoints.get_children():
+	for child in noise_points_node.get_children():
 		child.queue_free()
 	
 	# Start with initial point
@@ -155,7 +159,7 @@ func add_sample_point(point: Vector2):
 	point_material.emission = point_material.albedo_color * 0.5
 	visual_point.material_override = point_material
 	
-	$NoisePoints.add_child(visual_point)
+	noise_points_node.add_child(visual_point)
 	
 	# Update distance field
 	update_distance_field()
@@ -202,7 +206,7 @@ func update_voronoi_diagram():
 	voronoi_cells.clear()
 	
 	# Create simplified Voronoi diagram
-	var cell_parent = $VoronoiCells
+	var cell_parent = voronoi_cells_node
 	
 	for i in range(noise_points.size()):
 		var center = noise_points[i]
@@ -263,7 +267,7 @@ func create_voronoi_edge(start: Vector2, end: Vector2):
 	edge_material.emission = Color(0.3, 0.3, 0.05, 1.0)
 	edge.material_override = edge_material
 	
-	$VoronoiCells.add_child(edge)
+	voronoi_cells_node.add_child(edge)
 	voronoi_cells.append(edge)
 
 func reset_generation():
@@ -272,8 +276,8 @@ func reset_generation():
 
 func animate_blue_noise():
 	# Animate noise points
-	for i in range($NoisePoints.get_child_count()):
-		var point = $NoisePoints.get_child(i)
+	for i in range(noise_points_node.get_child_count()):
+		var point = noise_points_node.get_child(i)
 		var pulse = 1.0 + sin(time * 4.0 + i * 0.3) * 0.2
 		point.scale = Vector3.ONE * pulse
 	
@@ -291,19 +295,19 @@ func animate_blue_noise():
 func animate_indicators():
 	# Min distance indicator
 	var min_dist_height = min_distance * 1.5 + 0.5
-	$MinDistance.height = min_dist_height
-	$MinDistance.position.y = -3 + min_dist_height/2
+	min_distance_node.height = min_dist_height
+	min_distance_node.position.y = -3 + min_dist_height/2
 	
 	# Iteration count indicator
 	var iter_progress = current_iteration / float(max_iterations)
 	var iter_height = iter_progress * 2.0 + 0.5
-	$IterationCount.height = iter_height
-	$IterationCount.position.y = -3 + iter_height/2
+	iteration_count.height = iter_height
+	iteration_count.position.y = -3 + iter_height/2
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 4.0) * 0.1
-	$MinDistance.scale.x = pulse
-	$IterationCount.scale.x = pulse
+	min_distance_node.scale.x = pulse
+	iteration_count.scale.x = pulse
 	
 	# Update min distance over time
 	min_distance = 0.8 + sin(time * 0.2) * 0.4
@@ -16,6 +16,10 @@ var error_propagation_speed := 2.0
 var data_grid := []
 var corrupted_elements := []
 var error_cascade := []
+@onready var glitch_aesthetics: Node3D = $GlitchAesthetics
+@onready var data_corruption: Node3D = $DataCorruption
+@onready var digital_artifacts: Node3D = $DigitalArtifacts
+@onready var error_propagation: Node3D = $ErrorPropagation
 
 func _ready():
 	initialize_digital_structures()
@@ -46,7 +50,7 @@ func update_glitch_parameters():
 	error_propagation_speed = 1.5 + sin(time * 0.8) * 1.0
 
 func create_glitch_aesthetics():
-	var container = $GlitchAesthetics
+	var container = glitch_aesthetics
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -214,7 +218,7 @@ func create_compression_artifact_effect(container: Node3D, base_pos: Vector3):
 			container.add_child(compression_block)
 
 func simulate_data_corruption():
-	var container = $DataCorruption
+	var container = data_corruption
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -277,7 +281,7 @@ func propagate_corruption():
 				cell.corruption_age += 0.1
 
 func generate_digital_artifacts():
-	var container = $DigitalArtifacts
+	var container = digital_artifacts
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -387,7 +391,7 @@ func create_buffer_overflow_artifacts(container: Node3D):
 		container.add_child(overflow_bar)
 
 func show_error_propagation():
-	var container = $ErrorPropagation
+	var container = error_propagation
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -21,6 +21,11 @@ enum DistributionType {
 var current_distribution = DistributionType.UNIFORM
 var param1 = 0.0  # Mean, Lambda, etc.
 var param2 = 1.0  # Std dev, etc.
+@onready var distribution_points_node: Node3D = $DistributionPoints
+@onready var distribution_type: CSGBox3D = $DistributionType
+@onready var sample_count_node: CSGCylinder3D = $SampleCount
+@onready var parameter1: CSGCylinder3D = $Parameter1
+@onready var parameter2: CSGCylinder3D = $Parameter2
 
 func _ready():
 	create_histogram_bars()
@@ -213,7 +218,7 @@ func beta_sample(alpha: float, beta: float) -> float:
 	return randf()  # Fallback
 
 func create_sample_points(samples: Array):
-	var points_parent = $DistributionPoints
+	var points_parent = distribution_points_node
 	
 	# Normalize samples to display range
 	var min_val = samples.min()
@@ -353,10 +358,10 @@ func animate_distribution():
 func animate_indicators():
 	# Distribution type indicator
 	var type_scale = 1.0 + sin(time * 3.0) * 0.1
-	$DistributionType.scale = Vector3.ONE * type_scale
+	distribution_type.scale = Vector3.ONE * type_scale
 	
 	# Update distribution type color
-	var type_material = $DistributionType.material_override as StandardMaterial3D
+	var type_material = distribution_type.material_override as StandardMaterial3D
 	if type_material:
 		match current_distribution:
 			DistributionType.UNIFORM:
@@ -374,19 +379,19 @@ func animate_indicators():
 	
 	# Sample count indicator
 	var count_height = (sample_count / 1000.0) * 2.0 + 0.5
-	$SampleCount.height = count_height
-	$SampleCount.position.y = 4 + count_height/2
+	sample_count_node.height = count_height
+	sample_count_node.position.y = 4 + count_height/2
 	
 	# Parameter indicators
 	var param1_height = abs(param1) * 0.5 + 0.5
-	$Parameter1.height = param1_height
-	$Parameter1.position.y = -3 + param1_height/2
+	parameter1.height = param1_height
+	parameter1.position.y = -3 + param1_height/2
 	
 	var param2_height = abs(param2) * 0.5 + 0.5
-	$Parameter2.height = param2_height
-	$Parameter2.position.y = -3 + param2_height/2
+	parameter2.height = param2_height
+	parameter2.position.y = -3 + param2_height/2
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 4.0) * 0.1
-	$Parameter1.scale.x = pulse
-	$Parameter2.scale.x = pulse
+	parameter1.scale.x = pulse
+	parameter2.scale.x = pulse
@@ -25,6 +25,7 @@ var target_sit_position: Vector3
 
 # Generated random sitting points (positions)
 var random_sitting_points: Array[Vector3] = []
+@onready var animation_player: AnimationPlayer = $AnimationPlayer
 
 func _ready():
 	# Get the reference to the center node
@@ -63,7 +64,7 @@ func _process(delta: float):
 			# Finished sitting, resume flying
 			is_sitting = false
 			change_direction()
-			$AnimationPlayer.play("fly")
+			animation_player.play("fly")
 	else:
 		# Move the butterfly in local space relative to the center
 		var previous_position = position 
@@ -152,4 +153,4 @@ func _physics_process(delta: float):
 			# Arrived at the sitting point: stop moving and stop the animation
 			is_sitting = true
 			sitting_timer = sitting_duration
-			$AnimationPlayer.stop()
+			animation_player.stop()
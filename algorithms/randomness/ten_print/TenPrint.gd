@@ -11,6 +11,9 @@ var current_col = 0
 var maze_lines = []
 var grid_nodes = []
 var generation_speed = 1.0
+@onready var maze_lines_node: Node3D = $MazeLines
+@onready var probability_control: CSGCylinder3D = $ProbabilityControl
+@onready var generation_speed_node: CSGBox3D = $GenerationSpeed
 
 func _ready():
 	create_grid()
@@ -147,7 +150,7 @@ func create_maze_line(x: int, y: int, forward_slash: bool):
 	line_material.emission = line_material.albedo_color * 0.4
 	line.material_override = line_material
 	
-	$MazeLines.add_child(line)
+	maze_lines_node.add_child(line)
 	maze_lines.append(line)
 
 func highlight_current_position():
@@ -193,21 +196,21 @@ func animate_ten_print():
 func animate_indicators():
 	# Probability control
 	var prob_height = probability * 2.0 + 0.5
-	$ProbabilityControl.height = prob_height
-	$ProbabilityControl.position.y = -4 + prob_height/2
+	probability_control.height = prob_height
+	probability_control.position.y = -4 + prob_height/2
 	
 	# Generation speed indicator
 	var speed_height = (generation_speed / 3.0) * 1.5 + 0.5
-	$GenerationSpeed.size.y = speed_height
-	$GenerationSpeed.position.y = -4 + speed_height/2
+	generation_speed_node.size.y = speed_height
+	generation_speed_node.position.y = -4 + speed_height/2
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 4.0) * 0.1
-	$ProbabilityControl.scale.x = pulse
-	$GenerationSpeed.scale.x = pulse
+	probability_control.scale.x = pulse
+	generation_speed_node.scale.x = pulse
 	
 	# Color changes based on probability
-	var prob_material = $ProbabilityControl.material_override as StandardMaterial3D
+	var prob_material = probability_control.material_override as StandardMaterial3D
 	if prob_material:
 		prob_material.albedo_color = Color(
 			1.0,
@@ -16,6 +16,10 @@ var prng_buffer := []
 var trng_samples := []
 var prng_samples := []
 var entropy_history := []
+@onready var true_random_generator: Node3D = $TrueRandomGenerator
+@onready var pseudo_random_generator: Node3D = $PseudoRandomGenerator
+@onready var statistical_comparison: Node3D = $StatisticalComparison
+@onready var entropy_visualization: Node3D = $EntropyVisualization
 
 func _ready():
 	initialize_generators()
@@ -97,7 +101,7 @@ func generate_pseudo_random() -> float:
 	return float(prng_state) / float(2**32)
 
 func visualize_true_random():
-	var container = $TrueRandomGenerator
+	var container = true_random_generator
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -163,7 +167,7 @@ func visualize_true_random():
 	show_random_output(container, trng_buffer, Vector3(0, -3, 0), Color.GREEN)
 
 func visualize_pseudo_random():
-	var container = $PseudoRandomGenerator
+	var container = pseudo_random_generator
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -238,7 +242,7 @@ func show_random_output(container: Node3D, buffer: Array, base_pos: Vector3, col
 		container.add_child(output_cube)
 
 func show_statistical_comparison():
-	var container = $StatisticalComparison
+	var container = statistical_comparison
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -339,7 +343,7 @@ func calculate_statistics(samples: Array) -> Dictionary:
 	return stats
 
 func demonstrate_entropy_visualization():
-	var container = $EntropyVisualization
+	var container = entropy_visualization
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -72,6 +72,7 @@ var edge_table: PackedInt32Array = [
 
 # Simplified triangle table (first few entries - full table would be very long)
 var triangle_table: Array = []
+@onready var cave_mesh_node: MeshInstance3D = $CaveMesh
 
 func _ready():
 	setup_noise_generators()
@@ -385,7 +386,7 @@ func create_collision():
 		collision_shape.shape = shape
 
 func animate_cave_colors(delta):
-	var mesh_instance = $CaveMesh
+	var mesh_instance = cave_mesh_node
 	if mesh_instance.material_override:
 		var material = mesh_instance.material_override as StandardMaterial3D
 		if material:
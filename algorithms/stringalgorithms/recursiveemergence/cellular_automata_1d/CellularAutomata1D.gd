@@ -18,6 +18,9 @@ var grid_cells = []
 # Famous rules to cycle through
 var famous_rules = [30, 110, 90, 150, 184, 226]
 var current_rule_index = 0
+@onready var rule_table: Node3D = $RuleTable
+@onready var generation_indicator: CSGCylinder3D = $GenerationIndicator
+@onready var rule_number_node: CSGBox3D = $RuleNumber
 
 func _ready():
 	create_automaton_grid()
@@ -190,7 +193,7 @@ func update_grid_display():
 
 func update_rule_table():
 	# Update rule table display
-	var rule_parent = $RuleTable
+	var rule_parent = rule_table
 	
 	for i in range(8):
 		var rule_group = rule_parent.get_child(i)
@@ -246,7 +249,7 @@ func animate_automaton():
 			cell.scale = Vector3.ONE * pulse
 	
 	# Animate rule table
-	var rule_parent = $RuleTable
+	var rule_parent = rule_table
 	for i in range(rule_parent.get_child_count()):
 		var rule_group = rule_parent.get_child(i)
 		var wave = sin(time * 4.0 + i * 0.5) * 0.1
@@ -255,18 +258,18 @@ func animate_automaton():
 func animate_indicators():
 	# Generation indicator
 	var gen_height = (current_generation / float(grid_height)) * 2.0 + 0.5
-	var generationindicator = get_node_or_null("GenerationIndicator")
+	var generationindicator = generation_indicator
 	if generationindicator and generationindicator is CSGCylinder3D:
 		generationindicator.height = gen_height
 		generationindicator.position.y = -3 + gen_height/2
 	
 	# Rule number indicator
 	var rule_height = (rule_number / 255.0) * 2.0 + 0.5
-	$RuleNumber.size.y = rule_height
-	$RuleNumber.position.y = -3 + rule_height/2
+	rule_number_node.size.y = rule_height
+	rule_number_node.position.y = -3 + rule_height/2
 	
 	# Update rule number color based on rule
-	var rule_material = $RuleNumber.material_override as StandardMaterial3D
+	var rule_material = rule_number_node.material_override as StandardMaterial3D
 	if rule_material:
 		match rule_number:
 			30:
@@ -288,8 +291,8 @@ func animate_indicators():
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 4.0) * 0.1
-	$GenerationIndicator.scale.x = pulse
-	$RuleNumber.scale.x = pulse
+	generation_indicator.scale.x = pulse
+	rule_number_node.scale.x = pulse
 
 func get_rule_name() -> String:
 	match rule_number:
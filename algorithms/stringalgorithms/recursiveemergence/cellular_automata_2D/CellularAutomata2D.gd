@@ -15,6 +15,15 @@ var dead_cells: Array = []
 var gliders: Array = []
 var oscillators: Array = []
 var still_lifes: Array = []
+@onready var live_cells_node: Node3D = $CellGrid/LiveCells
+@onready var dead_cells_node: Node3D = $CellGrid/DeadCells
+@onready var engine_core_node: CSGBox3D = $RuleEngine/EngineCore
+@onready var conway_core_node: CSGSphere3D = $RuleEngine/AutomataRules/ConwayCore
+@onready var rule30core: CSGSphere3D = $RuleEngine/AutomataRules/Rule30Core
+@onready var rule110core: CSGSphere3D = $RuleEngine/AutomataRules/Rule110Core
+@onready var evolution_core_node: CSGBox3D = $PatternEvolution/EvolutionCore
+@onready var density_indicator_node: CSGSphere3D = $AutomataMetrics/DensityMeter/DensityIndicator
+@onready var stability_indicator_node: CSGSphere3D = $AutomataMetrics/StabilityMeter/StabilityIndicator
 
 func _ready():
 	# Initialize Cellular Automata visualization
@@ -61,9 +70,9 @@ func initialize_grid():
 
 func create_cell_visuals():
 	# Clear existing cells
-	for child in $CellGrid/LiveCells.get_children():
+	for child in live_cells_node.get_children():
 		child.queue_free()
-	for child in $CellGrid/DeadCells.get_children():
+	for child in dead_cells_node.get_children():
 		child.queue_free()
 	
 	live_cells.clear()
@@ -86,13 +95,13 @@ func create_cell_visuals():
 				cell.material_override.albedo_color = Color(0.2, 0.8, 0.2, 1)
 				cell.material_override.emission_enabled = true
 				cell.material_override.emission = Color(0.2, 0.8, 0.2, 1) * 0.4
-				$CellGrid/LiveCells.add_child(cell)
+				live_cells_node.add_child(cell)
 				live_cells.append({"cell": cell, "x": x, "y": y, "age": 0})
 			else:
 				# Dead cell
 				cell.material_override.albedo_color = Color(0.2, 0.2, 0.2, 0.3)
 				cell.material_override.transparency = BaseMaterial3D.TRANSPARENCY_ALPHA
-				$CellGrid/DeadCells.add_child(cell)
+				dead_cells_node.add_child(cell)
 				dead_cells.append({"cell": cell, "x": x, "y": y})
 
 func add_glider_pattern(start_x: int, start_y: int):
@@ -299,7 +308,7 @@ func animate_cells(delta):
 
 func animate_rule_engine(delta):
 	# Animate rule engine core
-	var engine_core = $RuleEngine/EngineCore
+	var engine_core = engine_core_node
 	if engine_core:
 		# Rotate engine
 		engine_core.rotation.y += delta * 0.5
@@ -314,7 +323,7 @@ func animate_rule_engine(delta):
 			engine_core.material_override.emission = Color(0.2, 0.8, 0.2, 1) * intensity
 	
 	# Animate rule cores
-	var conway_core = $RuleEngine/AutomataRules/ConwayCore
+	var conway_core = conway_core_node
 	if conway_core:
 		conway_core.rotation.y += delta * 0.8
 		var conway_activation = sin(time * 1.5) * 0.5 + 0.5
@@ -326,7 +335,7 @@ func animate_rule_engine(delta):
 			var intensity = 0.3 + conway_activation * 0.7
 			conway_core.material_override.emission = Color(0.8, 0.2, 0.2, 1) * intensity
 	
-	var rule30_core = $RuleEngine/AutomataRules/Rule30Core
+	var rule30_core = rule30core
 	if rule30_core:
 		rule30_core.rotation.y += delta * 1.0
 		var rule30_activation = cos(time * 1.8) * 0.5 + 0.5
@@ -338,7 +347,7 @@ func animate_rule_engine(delta):
 			var intensity = 0.3 + rule30_activation * 0.7
 			rule30_core.material_override.emission = Color(0.8, 0.2, 0.2, 1) * intensity
 	
-	var rule110_core = $RuleEngine/AutomataRules/Rule110Core
+	var rule110_core = rule110core
 	if rule110_core:
 		rule110_core.rotation.y += delta * 1.2
 		var rule110_activation = sin(time * 2.0) * 0.5 + 0.5
@@ -352,7 +361,7 @@ func animate_rule_engine(delta):
 
 func animate_pattern_evolution(delta):
 	# Animate evolution core
-	var evolution_core = $PatternEvolution/EvolutionCore
+	var evolution_core = evolution_core_node
 	if evolution_core:
 		# Rotate evolution engine
 		evolution_core.rotation.y += delta * 0.3
@@ -411,7 +420,7 @@ func animate_pattern_evolution(delta):
 
 func update_automata_metrics(delta):
 	# Update density meter
-	var density_indicator = $AutomataMetrics/DensityMeter/DensityIndicator
+	var density_indicator = density_indicator_node
 	if density_indicator:
 		var target_x = lerp(-2, 2, density)
 		density_indicator.position.x = lerp(density_indicator.position.x, target_x, delta * 2.0)
@@ -422,7 +431,7 @@ func update_automata_metrics(delta):
 		density_indicator.material_override.albedo_color = Color(red_component, green_component, 0.2, 1)
 	
 	# Update stability meter
-	var stability_indicator = $AutomataMetrics/StabilityMeter/StabilityIndicator
+	var stability_indicator = stability_indicator_node
 	if stability_indicator:
 		var target_x = lerp(-2, 2, stability)
 		stability_indicator.position.x = lerp(stability_indicator.position.x, target_x, delta * 2.0)
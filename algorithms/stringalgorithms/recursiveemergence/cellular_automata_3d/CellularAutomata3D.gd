@@ -20,6 +20,8 @@ enum Rule3D {
 
 var current_rule = Rule3D.LIFE_3D
 var alive_count = 0
+@onready var generation_control: CSGCylinder3D = $GenerationControl
+@onready var density_indicator: CSGBox3D = $DensityIndicator
 
 func _ready():
 	create_3d_grid()
@@ -251,20 +253,20 @@ func animate_3d_automaton():
 func animate_indicators():
 	# Generation control
 	var gen_height = (current_generation % 20) * 0.15 + 0.5
-	$GenerationControl.height = gen_height
-	$GenerationControl.position.y = -4 + gen_height/2
+	generation_control.height = gen_height
+	generation_control.position.y = -4 + gen_height/2
 	
 	# Density indicator
 	var density = float(alive_count) / (grid_size * grid_size * grid_size)
 	var density_height = density * 3.0 + 0.5
-	var densityindicator = get_node_or_null("DensityIndicator")
+	var densityindicator = density_indicator
 	if densityindicator and densityindicator is CSGCylinder3D:
 		densityindicator.height = density_height
 		densityindicator.position.y = -4 + density_height/2
 	
 	# Update rule-based colors
-	var gen_material = $GenerationControl.material_override as StandardMaterial3D
-	var density_material = $DensityIndicator.material_override as StandardMaterial3D
+	var gen_material = generation_control.material_override as StandardMaterial3D
+	var density_material = density_indicator.material_override as StandardMaterial3D
 	
 	if gen_material and density_material:
 		match current_rule:
@@ -286,8 +288,8 @@ func animate_indicators():
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 4.0) * 0.1
-	$GenerationControl.scale.x = pulse
-	$DensityIndicator.scale.x = pulse
+	generation_control.scale.x = pulse
+	density_indicator.scale.x = pulse
 
 func get_rule_name() -> String:
 	match current_rule:
@@ -8,6 +8,10 @@ var sequence_timer := 0.0
 var current_index := 0
 var fibonacci_numbers := [1, 1]
 var golden_ratio := (1 + sqrt(5)) / 2
+@onready var number_sequence: Node3D = $NumberSequence
+@onready var golden_spiral: Node3D = $GoldenSpiral
+@onready var natural_patterns: Node3D = $NaturalPatterns
+@onready var recursion_visualization: Node3D = $RecursionVisualization
 
 func _ready():
 	generate_fibonacci_sequence(20)
@@ -33,7 +37,7 @@ func generate_fibonacci_sequence(count: int):
 		fibonacci_numbers.append(next_fib)
 
 func visualize_number_sequence():
-	var container = $NumberSequence
+	var container = number_sequence
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -91,7 +95,7 @@ func create_addition_visualization(container: Node3D, index: int):
 	container.add_child(connection2)
 
 func create_golden_spiral():
-	var container = $GoldenSpiral
+	var container = golden_spiral
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -146,7 +150,7 @@ func create_golden_spiral():
 		container.add_child(connection)
 
 func show_natural_patterns():
-	var container = $NaturalPatterns
+	var container = natural_patterns
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -234,7 +238,7 @@ func create_nautilus_pattern(container: Node3D, center: Vector3):
 		container.add_child(chamber_sphere)
 
 func demonstrate_recursion():
-	var container = $RecursionVisualization
+	var container = recursion_visualization
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -10,6 +10,10 @@ var max_iterations := 50
 var escape_radius := 2.0
 var zoom_level := 1.0
 var grid_resolution := 40
+@onready var julia_visualization: Node3D = $JuliaVisualization
+@onready var parameter_space: Node3D = $ParameterSpace
+@onready var iteration_display: Node3D = $IterationDisplay
+@onready var escape_analysis: Node3D = $EscapeAnalysis
 
 func _ready():
 	pass
@@ -29,7 +33,7 @@ func _process(delta):
 	analyze_escape_behavior()
 
 func visualize_julia_set():
-	var container = $JuliaVisualization
+	var container = julia_visualization
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -86,7 +90,7 @@ func julia_iterations(x: float, y: float, c_r: float, c_i: float) -> int:
 	return iteration
 
 func show_parameter_space():
-	var container = $ParameterSpace
+	var container = parameter_space
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -139,7 +143,7 @@ func show_parameter_space():
 	container.add_child(boundary_ring)
 
 func display_iteration_count():
-	var container = $IterationDisplay
+	var container = iteration_display
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -176,7 +180,7 @@ func display_iteration_count():
 		container.add_child(iter_tower)
 
 func analyze_escape_behavior():
-	var container = $EscapeAnalysis
+	var container = escape_analysis
 	
 	# Clear previous visualization
 	for child in container.get_children():
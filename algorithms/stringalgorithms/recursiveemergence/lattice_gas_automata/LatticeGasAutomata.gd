@@ -13,6 +13,10 @@ var velocity_directions := [
 	Vector2(1, 0), Vector2(-1, 0), Vector2(0, 1), Vector2(0, -1),
 	Vector2(1, 1), Vector2(-1, -1), Vector2(1, -1), Vector2(-1, 1)
 ]
+@onready var lattice_grid_node: Node3D = $LatticeGrid
+@onready var particle_flow: Node3D = $ParticleFlow
+@onready var collision_dynamics: Node3D = $CollisionDynamics
+@onready var macroscopic_properties: Node3D = $MacroscopicProperties
 
 # Particle data structure
 class LatticeCell:
@@ -179,7 +183,7 @@ func calculate_macroscopic_properties():
 			cell.pressure = cell.density * cell.density
 
 func visualize_lattice_grid():
-	var container = $LatticeGrid
+	var container = lattice_grid_node
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -229,7 +233,7 @@ func visualize_lattice_grid():
 					container.add_child(particle)
 
 func show_particle_flow():
-	var container = $ParticleFlow
+	var container = particle_flow
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -269,7 +273,7 @@ func show_particle_flow():
 				container.add_child(flow_arrow)
 
 func demonstrate_collision_dynamics():
-	var container = $CollisionDynamics
+	var container = collision_dynamics
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -306,7 +310,7 @@ func demonstrate_collision_dynamics():
 				container.add_child(collision_indicator)
 
 func display_macroscopic_properties():
-	var container = $MacroscopicProperties
+	var container = macroscopic_properties
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -6,13 +6,16 @@ var max_iterations = 50
 var zoom = 1.0
 var center = Vector2(-0.5, 0.0)
 var fractal_points = []
+@onready var fractal_points_node: Node3D = $FractalPoints
+@onready var iteration_control: CSGCylinder3D = $IterationControl
+@onready var zoom_level: CSGBox3D = $ZoomLevel
 
 func _ready():
 	generate_mandelbrot()
 	setup_materials()
 
 func generate_mandelbrot():
-	var points_parent = $FractalPoints
+	var points_parent = fractal_points_node
 	
 	# Clear existing points
 	for child in points_parent.get_children():
@@ -94,11 +97,11 @@ func animate_fractal():
 func animate_indicators():
 	# Iteration control
 	var iter_height = (max_iterations / 100.0) * 2.0 + 0.5
-	$IterationControl.height = iter_height
-	$IterationControl.position.y = -3 + iter_height/2
+	iteration_control.height = iter_height
+	iteration_control.position.y = -3 + iter_height/2
 	
 	# Zoom level
 	var zoom_height = (zoom / 2.0) * 2.0 + 0.5
-	$ZoomLevel.size.y = zoom_height
-	$ZoomLevel.position.y = -3 + zoom_height/2
+	zoom_level.size.y = zoom_height
+	zoom_level.position.y = -3 + zoom_height/2
 
@@ -17,6 +17,10 @@ var rule_30_grid := []
 var rule_110_grid := []
 var rule_30_seed := []
 var rule_110_seed := []
+@onready var rule30visualization: Node3D = $Rule30Visualization
+@onready var rule110visualization: Node3D = $Rule110Visualization
+@onready var rule_comparison: Node3D = $RuleComparison
+@onready var emergent_patterns: Node3D = $EmergentPatterns
 
 func _ready():
 	initialize_rules()
@@ -121,7 +125,7 @@ func apply_rule_110(current_row: Array) -> Array:
 	return new_row
 
 func visualize_rule_30():
-	var container = $Rule30Visualization
+	var container = rule30visualization
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -163,7 +167,7 @@ func visualize_rule_30():
 	container.add_child(label)
 
 func visualize_rule_110():
-	var container = $Rule110Visualization
+	var container = rule110visualization
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -205,7 +209,7 @@ func visualize_rule_110():
 	container.add_child(label)
 
 func show_rule_comparison():
-	var container = $RuleComparison
+	var container = rule_comparison
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -260,7 +264,7 @@ func show_rule_comparison():
 		container.add_child(rule_110_output)
 
 func demonstrate_emergent_patterns():
-	var container = $EmergentPatterns
+	var container = emergent_patterns
 	
 	# Clear previous visualization
 	for child in container.get_children():
@@ -18,6 +18,13 @@ var flow_particles: Array = []
 var fundamental_freq: float = 1.0
 var harmonics: Array = [1.0, 0.5, 0.3, 0.2, 0.1]  # Harmonic amplitudes
 var noise_level: float = 0.1
+@onready var engine_core_node: CSGBox3D = $TransformEngine/EngineCore
+@onready var fft_core_node: CSGSphere3D = $TransformEngine/TransformMethods/FFTCore
+@onready var dft_core_node: CSGSphere3D = $TransformEngine/TransformMethods/DFTCore
+@onready var ifft_core_node: CSGSphere3D = $TransformEngine/TransformMethods/IFFTCore
+@onready var components_core_node: CSGBox3D = $WaveComponents/ComponentsCore
+@onready var resolution_indicator_node: CSGSphere3D = $FourierMetrics/ResolutionMeter/ResolutionIndicator
+@onready var phase_indicator_node: CSGSphere3D = $FourierMetrics/PhaseCoherenceMeter/PhaseIndicator
 
 func _ready():
 	# Initialize Fourier Transform visualization
@@ -275,7 +282,7 @@ func update_frequency_spectrum(delta):
 
 func animate_transform_engine(delta):
 	# Animate transform engine core
-	var engine_core = $TransformEngine/EngineCore
+	var engine_core = engine_core_node
 	if engine_core:
 		# Rotate engine
 		engine_core.rotation.y += delta * 0.5
@@ -290,7 +297,7 @@ func animate_transform_engine(delta):
 			engine_core.material_override.emission = Color(0.2, 0.8, 0.2, 1) * intensity
 	
 	# Animate transform method cores
-	var fft_core = $TransformEngine/TransformMethods/FFTCore
+	var fft_core = fft_core_node
 	if fft_core:
 		fft_core.rotation.y += delta * 0.8
 		var fft_activation = sin(time * 1.5) * 0.5 + 0.5
@@ -303,7 +310,7 @@ func animate_transform_engine(delta):
 			var intensity = 0.3 + fft_activation * 0.7
 			fft_core.material_override.emission = Color(0.8, 0.2, 0.2, 1) * intensity
 	
-	var dft_core = $TransformEngine/TransformMethods/DFTCore
+	var dft_core = dft_core_node
 	if dft_core:
 		dft_core.rotation.y += delta * 1.0
 		var dft_activation = cos(time * 1.8) * 0.5 + 0.5
@@ -316,7 +323,7 @@ func animate_transform_engine(delta):
 			var intensity = 0.3 + dft_activation * 0.7
 			dft_core.material_override.emission = Color(0.8, 0.2, 0.2, 1) * intensity
 	
-	var ifft_core = $TransformEngine/TransformMethods/IFFTCore
+	var ifft_core = ifft_core_node
 	if ifft_core:
 		ifft_core.rotation.y += delta * 1.2
 		var ifft_activation = sin(time * 2.0) * 0.5 + 0.5
@@ -331,7 +338,7 @@ func animate_transform_engine(delta):
 
 func animate_wave_components(delta):
 	# Animate wave components core
-	var components_core = $WaveComponents/ComponentsCore
+	var components_core = components_core_node
 	if components_core:
 		# Rotate components
 		components_core.rotation.y += delta * 0.3
@@ -439,7 +446,7 @@ func animate_data_flow(delta):
 
 func update_fourier_metrics(delta):
 	# Update frequency resolution meter
-	var resolution_indicator = $FourierMetrics/ResolutionMeter/ResolutionIndicator
+	var resolution_indicator = resolution_indicator_node
 	if resolution_indicator:
 		var target_x = lerp(-2, 2, frequency_resolution)
 		resolution_indicator.position.x = lerp(resolution_indicator.position.x, target_x, delta * 2.0)
@@ -450,7 +457,7 @@ func update_fourier_metrics(delta):
 		resolution_indicator.material_override.albedo_color = Color(red_component, green_component, 0.2, 1)
 	
 	# Update phase coherence meter
-	var phase_indicator = $FourierMetrics/PhaseCoherenceMeter/PhaseIndicator
+	var phase_indicator = phase_indicator_node
 	if phase_indicator:
 		var target_x = lerp(-2, 2, phase_coherence)
 		phase_indicator.position.x = lerp(phase_indicator.position.x, target_x, delta * 2.0)
@@ -18,6 +18,10 @@ enum ShapeType {
 var current_shape = ShapeType.CIRCLE
 var shape_points = []
 var parameter_lines = []
+@onready var shape_points_node: Node3D = $ShapePoints
+@onready var shape_indicator: CSGBox3D = $ShapeIndicator
+@onready var parameter_u: CSGCylinder3D = $ParameterU
+@onready var parameter_v: CSGCylinder3D = $ParameterV
 
 func _ready():
 	setup_materials()
@@ -171,7 +175,7 @@ func create_shape_point(position: Vector3, u_param: float, v_param: float):
 	point.set_meta("u_param", u_param)
 	point.set_meta("v_param", v_param)
 	
-	$ShapePoints.add_child(point)
+	shape_points_node.add_child(point)
 	shape_points.append(point)
 
 func animate_parametric_shapes():
@@ -272,10 +276,10 @@ func animate_torus_variations():
 func animate_indicators():
 	# Shape indicator
 	var shape_scale = 1.0 + sin(time * 3.0) * 0.1
-	$ShapeIndicator.scale = Vector3.ONE * shape_scale
+	shape_indicator.scale = Vector3.ONE * shape_scale
 	
 	# Update shape indicator color based on current shape
-	var shape_material = $ShapeIndicator.material_override as StandardMaterial3D
+	var shape_material = shape_indicator.material_override as StandardMaterial3D
 	if shape_material:
 		match current_shape:
 			ShapeType.CIRCLE:
@@ -291,18 +295,18 @@ func animate_indicators():
 	
 	# Parameter U indicator
 	var u_height = (current_u / (2.0 * PI)) * 2.0 + 0.5
-	$ParameterU.height = u_height
-	$ParameterU.position.y = -4 + u_height/2
+	parameter_u.height = u_height
+	parameter_u.position.y = -4 + u_height/2
 	
 	# Parameter V indicator
 	var v_height = (current_v / (2.0 * PI)) * 2.0 + 0.5
-	$ParameterV.height = v_height
-	$ParameterV.position.y = -4 + v_height/2
+	parameter_v.height = v_height
+	parameter_v.position.y = -4 + v_height/2
 	
 	# Pulsing parameter indicators
 	var param_pulse = 1.0 + sin(time * 4.0) * 0.1
-	$ParameterU.scale.x = param_pulse
-	$ParameterV.scale.x = param_pulse
+	parameter_u.scale.x = param_pulse
+	parameter_v.scale.x = param_pulse
 
 func get_shape_name() -> String:
 	match current_shape:
@@ -19,6 +19,10 @@ enum TopologyMode {
 }
 
 var current_topology = TopologyMode.FLAT_SINE
+@onready var frequency_control: CSGCylinder3D = $FrequencyControl
+@onready var amplitude_control: CSGCylinder3D = $AmplitudeControl
+@onready var phase_control: CSGCylinder3D = $PhaseControl
+@onready var topology_mode: CSGBox3D = $TopologyMode
 
 func _ready():
 	create_sine_surface()
@@ -217,27 +221,27 @@ func update_node_color(node: CSGSphere3D, height_value: float):
 func animate_controls():
 	# Frequency control
 	var freq_height = frequency * 0.8 + 0.5
-	$FrequencyControl.height = freq_height
-	$FrequencyControl.position.y = -3 + freq_height/2
+	frequency_control.height = freq_height
+	frequency_control.position.y = -3 + freq_height/2
 	
 	# Amplitude control
 	var amp_height = amplitude * 0.6 + 0.5
-	$AmplitudeControl.height = amp_height
-	$AmplitudeControl.position.y = -3 + amp_height/2
+	amplitude_control.height = amp_height
+	amplitude_control.position.y = -3 + amp_height/2
 	
 	# Phase control (rotating)
 	var phase_height = 1.0 + sin(phase) * 0.3
-	$PhaseControl.height = phase_height
-	$PhaseControl.position.y = -3 + phase_height/2
-	$PhaseControl.rotation_degrees.y = phase * 180.0 / PI
+	phase_control.height = phase_height
+	phase_control.position.y = -3 + phase_height/2
+	phase_control.rotation_degrees.y = phase * 180.0 / PI
 	
 	# Topology mode indicator
 	var topology_height = (current_topology + 1) * 0.3 + 0.5
-	$TopologyMode.size.y = topology_height
-	$TopologyMode.position.y = -3 + topology_height/2
+	topology_mode.size.y = topology_height
+	topology_mode.position.y = -3 + topology_height/2
 	
 	# Update topology indicator color
-	var topology_material = $TopologyMode.material_override as StandardMaterial3D
+	var topology_material = topology_mode.material_override as StandardMaterial3D
 	if topology_material:
 		match current_topology:
 			TopologyMode.FLAT_SINE:
@@ -255,10 +259,10 @@ func animate_controls():
 	
 	# Pulsing effects
 	var pulse = 1.0 + sin(time * 4.0) * 0.1
-	$FrequencyControl.scale.x = pulse
-	$AmplitudeControl.scale.x = pulse
-	$PhaseControl.scale.x = pulse
-	$TopologyMode.scale.x = pulse
+	frequency_control.scale.x = pulse
+	amplitude_control.scale.x = pulse
+	phase_control.scale.x = pulse
+	topology_mode.scale.x = pulse
 
 func get_topology_name() -> String:
 	match current_topology:
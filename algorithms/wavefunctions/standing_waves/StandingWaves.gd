@@ -6,6 +6,8 @@ var node_count = 21
 var frequency = 2.0
 var amplitude = 2.0
 var string_length = 10.0
+@onready var frequency_indicator: CSGBox3D = $FrequencyIndicator
+@onready var amplitude_indicator: CSGBox3D = $AmplitudeIndicator
 
 func _ready():
 	create_wave_nodes()
@@ -96,14 +98,14 @@ func animate_standing_wave():
 func animate_indicators():
 	# Frequency indicator - height represents frequency
 	var freq_height = frequency * 0.5
-	var frequencyindicator = get_node_or_null("FrequencyIndicator")
+	var frequencyindicator = frequency_indicator
 	if frequencyindicator and frequencyindicator is CSGCylinder3D:
 		frequencyindicator.height = freq_height
 		frequencyindicator.position.y = -3 + freq_height/2
 	
 	# Amplitude indicator - height represents amplitude
 	var amp_height = amplitude * 0.3
-	var amplitudeindicator = get_node_or_null("AmplitudeIndicator")
+	var amplitudeindicator = amplitude_indicator
 	if amplitudeindicator and amplitudeindicator is CSGCylinder3D:
 		amplitudeindicator.height = amp_height
 		amplitudeindicator.position.y = -3 + amp_height/2
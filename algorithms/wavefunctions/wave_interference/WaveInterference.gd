@@ -9,6 +9,9 @@ var amplitude: float = 1.0
 var field_points: Array = []
 var wave_rings1: Array = []
 var wave_rings2: Array = []
+@onready var source_core: CSGSphere3D = $WaveSource1/SourceCore
+@onready var source_core_node: CSGSphere3D = $WaveSource2/SourceCore
+@onready var pattern_core_node: CSGBox3D = $InterferencePattern/PatternCore
 
 func _ready():
 	# Initialize Wave Interference visualization
@@ -105,8 +108,8 @@ func setup_grid():
 
 func animate_wave_sources(delta):
 	# Animate wave source cores
-	var source1_core = $WaveSource1/SourceCore
-	var source2_core = $WaveSource2/SourceCore
+	var source1_core = source_core
+	var source2_core = source_core_node
 	
 	if source1_core:
 		# Pulse source 1
@@ -196,7 +199,7 @@ func animate_interference_field(delta):
 
 func animate_interference_pattern(delta):
 	# Animate the interference pattern visualization
-	var pattern_core = $InterferencePattern/PatternCore
+	var pattern_core = pattern_core_node
 	if pattern_core:
 		# Rotate pattern
 		pattern_core.rotation.y += delta * 0.5
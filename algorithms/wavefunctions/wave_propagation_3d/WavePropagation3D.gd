@@ -19,6 +19,9 @@ var tile_collision_bodies: Array[StaticBody3D] = []
 
 var base_tile_color := Color(0.22, 0.55, 0.85, 1.0)
 var peak_tile_color := Color(0.95, 0.85, 0.4, 1.0)
+@onready var frequency_control: CSGBox3D = $FrequencyControl
+@onready var amplitude_control: CSGBox3D = $AmplitudeControl
+@onready var wave_source: CSGSphere3D = $WaveSource
 
 func _ready():
 	create_wave_surface()
@@ -154,19 +157,19 @@ func animate_wave_rings():
 
 func animate_controls():
 	var freq_height = frequency * 0.8
-	var freq_size = $FrequencyControl.size
+	var freq_size = frequency_control.size
 	freq_size.y = max(0.2, freq_height)
-	$FrequencyControl.size = freq_size
-	$FrequencyControl.position.y = -3.0 + freq_size.y * 0.5
+	frequency_control.size = freq_size
+	frequency_control.position.y = -3.0 + freq_size.y * 0.5
 	var amp_height = amplitude * 1.6
-	var amp_size = $AmplitudeControl.size
+	var amp_size = amplitude_control.size
 	amp_size.y = max(0.2, amp_height)
-	$AmplitudeControl.size = amp_size
-	$AmplitudeControl.position.y = -3.0 + amp_size.y * 0.5
+	amplitude_control.size = amp_size
+	amplitude_control.position.y = -3.0 + amp_size.y * 0.5
 	frequency = 0.55 + sin(time * 0.12) * 0.25
 	amplitude = 0.22 + cos(time * 0.1) * 0.12
 	wave_speed = 0.5 + sin(time * 0.09) * 0.18
-	$WaveSource.radius = 0.28 + sin(time * frequency * 2.4) * 0.05
+	wave_source.radius = 0.28 + sin(time * frequency * 2.4) * 0.05
 
 func _create_tile_collision_bodies(surface_parent: Node3D):
 	"""Create collision bodies for each tile"""
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Summarize benchmark runs written by the generated benchmark scenes and
+compare them against a stored baseline.
+
+The marching squares and cube mound installers emit a benchmark scene
+(marching_squares_benchmark.tscn, cube_mound_benchmark.tscn) that drives
+a scripted workload headless and writes a JSON report:
+
+    {"benchmark": "marching_squares", "engine": "4.4.1-stable",
+     "settings": {"voxel_resolution": 16, ...},
+     "results": {"setup_triangulate_ms": 3.2, ...},
+     "frames": [{"frame_ms": 4.1, "triangulate_ms": 0.3, "triangles": 812, ...}, ...]}
+
+Runs with the same benchmark name and settings are grouped. Per-frame
+fields are summarized as mean/p50/p95/max over every frame of the group;
+"results" values are averaged over runs. Fields ending in _ms are timings
+(lower is better) and are checked against the baseline with a relative
+tolerance; anything else (vertex, triangle and object counts) is reported
+when it differs, since a changed count means the workload changed.
+
+Usage:
+    godot --headless --path . res://marching_squares_benchmark.tscn -- --benchmark-out=user://ms.json
+    python benchmark_report.py runs/                          # summarize every .json in runs/
+    python benchmark_report.py runs/ --save-baseline baseline.json
+    python benchmark_report.py runs/ --baseline baseline.json --tolerance 0.1
+
+Exits with 1 when a timing regressed beyond the tolerance.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+FRAME_STATS = ("mean", "p50", "p95", "max")
+# Timing statistics that are compared; max is too noisy to gate on
+GATED_STATS = ("p50", "p95")
+
+
+def find_reports(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(".json"):
+                    files.append(os.path.join(path, name))
+        else:
+            files.append(path)
+    return files
+
+
+def run_key(report):
+    """Benchmark name plus its settings, so only like runs are compared"""
+    settings = report.get("settings", {})
+    if not settings:
+        return report.get("benchmark", "unknown")
+    return "%s[%s]" % (report.get("benchmark", "unknown"),
+                       ",".join("%s=%s" % (k, settings[k]) for k in sorted(settings)))
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    k = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[k]
+
+
+def summarize(reports):
+    """{metric: value} for one group of runs of the same benchmark"""
+    columns = {}
+    for report in reports:
+        for frame in report.get("frames", []):
+            for name, value in frame.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    columns.setdefault(name, []).append(value)
+    summary = {"runs": len(reports), "frames": sum(len(r.get("frames", [])) for r in reports)}
+    for name, values in sorted(columns.items()):
+        summary[name + ".mean"] = sum(values) / len(values)
+        summary[name + ".p50"] = percentile(values, 0.5)
+        summary[name + ".p95"] = percentile(values, 0.95)
+        summary[name + ".max"] = max(values)
+
+    results = {}
+    for report in reports:
+        for name, value in report.get("results", {}).items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                results.setdefault(name, []).append(value)
+    for name, values in sorted(results.items()):
+        summary[name] = sum(values) / len(values)
+    return summary
+
+
+def is_timing(metric):
+    return metric.split(".")[0].endswith("_ms")
+
+
+def is_gated(metric):
+    if not is_timing(metric):
+        return False
+    parts = metric.split(".")
+    return len(parts) == 1 or parts[1] in GATED_STATS
+
+
+def compare(summary, baseline, tolerance, noise_ms):
+    """(regressions, improvements, count_changes) as lists of (metric, old, new)"""
+    regressions, improvements, count_changes = [], [], []
+    for metric, old in sorted(baseline.items()):
+        if metric in ("runs", "frames") or metric not in summary:
+            continue
+        new = summary[metric]
+        if is_gated(metric):
+            if new > old * (1.0 + tolerance) and new - old > noise_ms:
+                regressions.append((metric, old, new))
+            elif new < old * (1.0 - tolerance) and old - new > noise_ms:
+                improvements.append((metric, old, new))
+        elif not is_timing(metric) and metric.endswith((".mean", ".max")) and abs(new - old) > 1e-9:
+            count_changes.append((metric, old, new))
+        elif not is_timing(metric) and "." not in metric and abs(new - old) > 1e-9:
+            count_changes.append((metric, old, new))
+    return regressions, improvements, count_changes
+
+
+def print_summary(key, summary):
+    print(f"\n{key}")
+    print(f"  {summary['runs']} run(s), {summary['frames']} frames")
+    metrics = sorted({m.split(".")[0] for m in summary if m not in ("runs", "frames")})
+    for metric in metrics:
+        if metric in summary:
+            print(f"  {metric:<28} {summary[metric]:>12.3f}")
+        else:
+            stats = "  ".join(f"{stat} {summary[metric + '.' + stat]:>10.3f}" for stat in FRAME_STATS)
+            print(f"  {metric:<28} {stats}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize benchmark scene runs and compare to a baseline")
+    parser.add_argument("paths", nargs="+", help="benchmark JSON files or folders of them")
+    parser.add_argument("--baseline", metavar="JSON", help="baseline written by --save-baseline")
+    parser.add_argument("--save-baseline", metavar="JSON", help="store these summaries as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="allowed relative slowdown of p50/p95 timings (default 0.15)")
+    parser.add_argument("--noise-ms", type=float, default=0.05,
+                        help="ignore timing differences smaller than this (default 0.05 ms)")
+    args = parser.parse_args(argv)
+
+    groups = {}
+    for path in find_reports(args.paths):
+        with open(path, encoding="utf-8") as f:
+            report = json.load(f)
+        groups.setdefault(run_key(report), []).append(report)
+    if not groups:
+        print("No benchmark reports found")
+        return 1
+
+    summaries = {key: summarize(reports) for key, reports in sorted(groups.items())}
+    for key, summary in summaries.items():
+        print_summary(key, summary)
+
+    failed = False
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print("\n" + "=" * 60)
+        print(f"Comparison with {args.baseline} (tolerance {args.tolerance:.0%})")
+        print("=" * 60)
+        for key, summary in summaries.items():
+            if key not in baseline:
+                print(f"\n{key}: no baseline")
+                continue
+            regressions, improvements, count_changes = compare(
+                summary, baseline[key], args.tolerance, args.noise_ms)
+            print(f"\n{key}: {len(regressions)} regressions, {len(improvements)} improvements")
+            for label, rows in (("SLOWER", regressions), ("faster", improvements), ("changed", count_changes)):
+                for metric, old, new in rows:
+                    ratio = f"{new / old:6.2f}x" if old else "   new"
+                    print(f"  {label:<8} {metric:<32} {old:>12.3f} -> {new:>12.3f}  {ratio}")
+            failed = failed or bool(regressions)
+
+    if args.save_baseline:
+        stored = {}
+        if os.path.exists(args.save_baseline):
+            with open(args.save_baseline, encoding="utf-8") as f:
+                stored = json.load(f)
+        stored.update(summaries)
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+        print(f"\nBaseline saved to {args.save_baseline} ({len(summaries)} benchmark(s))")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
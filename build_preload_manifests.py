@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Build preload manifests from the resource dependency graph.
+
+For every map (commons/maps) and every scene listed in algorithms.json the
+full resource closure is resolved: ext_resources, uid:// references,
+preload()/load() literals and class_name uses in scripts, shader includes,
+map utility tokens and artifact registry entries. Lists are ordered
+dependencies-first, ready to hand to ResourceLoader.load_threaded_request().
+
+A map's resources include its shader warm-up scene (generate_shader_warmup.py)
+when one was generated, so the warm-up is prefetched with the map instead
+of loaded while the map is being built.
+
+For each map that belongs to a sequence (map_sequences.json) the manifest
+also records the next map and the delta: resources the next map needs that
+the current one has not already loaded.
+
+Output is res://preload_manifest.json, read at runtime by
+commons/managers/PreloadManifest.gd.
+
+Usage:
+    python build_preload_manifests.py            # write preload_manifest.json
+    python build_preload_manifests.py --dry-run  # summary only
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from godot_maps import (list_maps, load_lenient_json, load_map_sequences, load_utility_types,
+                        map_scene_references)
+from generate_shader_warmup import warmup_scene_path
+from godot_resources import PROJECT_ROOT, ResourceGraph, to_res
+
+MANIFEST_FILE = "preload_manifest.json"
+ALGORITHMS_JSON = "algorithms.json"
+GRID_SCENE_PATH = "res://commons/scenes/grid.tscn"
+
+
+def algorithm_scenes(root=PROJECT_ROOT):
+    """Scene paths from algorithms.json, in category order, without duplicates"""
+    data = load_lenient_json(os.path.join(root, ALGORITHMS_JSON))
+    scenes = []
+    for paths in (data.get("categories", {}) or {}).values():
+        for path in paths or []:
+            if path not in scenes:
+                scenes.append(path)
+    return scenes
+
+
+def next_map_index(sequences):
+    """map name -> following map, using the first sequence that contains it.
+
+    Mirrors AdaSceneManager._find_sequence_containing_map, which walks the
+    sequences in file order.
+    """
+    following = {}
+    for maps in sequences.values():
+        for i, name in enumerate(maps[:-1]):
+            following.setdefault(name, maps[i + 1])
+    return following
+
+
+def build_manifest(graph, root=PROJECT_ROOT):
+    utility_types = load_utility_types(root)
+    base = set(graph.closure([GRID_SCENE_PATH]))
+
+    maps = {}
+    for name in list_maps(root):
+        scenes, unresolved = map_scene_references(name, root, utility_types)
+        warmup = to_res(os.path.relpath(warmup_scene_path(name, root), root).replace(os.sep, "/"))
+        if graph.exists(warmup):
+            scenes = scenes + [warmup]
+        closure = [p for p in graph.closure(scenes) if p not in base and graph.exists(p)]
+        entry = {"resources": closure}
+        if unresolved:
+            entry["unresolved"] = unresolved
+        maps[name] = entry
+
+    for name, next_name in sorted(next_map_index(load_map_sequences(root)).items()):
+        if name not in maps or next_name not in maps:
+            continue
+        loaded = set(maps[name]["resources"])
+        maps[name]["next"] = {
+            "map": next_name,
+            "delta": [p for p in maps[next_name]["resources"] if p not in loaded],
+        }
+
+    scenes = {}
+    for scene in algorithm_scenes(root):
+        if graph.exists(scene):
+            scenes[scene] = graph.closure([scene])
+
+    return {
+        "format": "preload_manifest",
+        "version": 1,
+        "grid": graph.closure([GRID_SCENE_PATH]),
+        "maps": maps,
+        "scenes": scenes,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build preload manifests from the dependency graph")
+    parser.add_argument("--dry-run", action="store_true", help="print the summary without writing")
+    parser.add_argument("--output", default=None, help=f"output path (default <root>/{MANIFEST_FILE})")
+    parser.add_argument("--root", default=PROJECT_ROOT, help="project root")
+    args = parser.parse_args(argv)
+
+    print("Resolving resource dependencies...")
+    print("=" * 60)
+    graph = ResourceGraph(args.root)
+    manifest = build_manifest(graph, args.root)
+
+    maps = manifest["maps"]
+    with_next = [m for m in maps.values() if "next" in m]
+    print(f"Grid base: {len(manifest['grid'])} resources")
+    print(f"Maps: {len(maps)} ({len(with_next)} with a next map in a sequence)")
+    print(f"Algorithm scenes: {len(manifest['scenes'])}")
+    if with_next:
+        deltas = [len(m["next"]["delta"]) for m in with_next]
+        print(f"Next-map delta: avg {sum(deltas) / len(deltas):.1f}, max {max(deltas)} resources")
+    unresolved = sum(len(m.get("unresolved", [])) for m in maps.values())
+    if unresolved:
+        print(f"Unresolved map tokens: {unresolved}")
+    if graph.missing:
+        print(f"Files with missing references: {len(graph.missing)}")
+        for source, targets in sorted(graph.missing.items())[:20]:
+            print(f"    {source} -> {', '.join(targets)}")
+
+    output = args.output or os.path.join(args.root, MANIFEST_FILE)
+    print("=" * 60)
+    if args.dry_run:
+        print(f"Dry run, {output} not written")
+        return 0
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+        f.write("\n")
+    print(f"Manifest written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
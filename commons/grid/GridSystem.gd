@@ -179,6 +179,9 @@ func _on_data_loaded(loaded_map_name: String, format: String):
 		if not sequence_name.is_empty():
 			audio_component.set_sequence_id(sequence_name)
 	
+	# Compile this map's shaders off-screen while the grid is being built
+	_start_shader_warmup(loaded_map_name)
+
 	# Start grid generation
 	_generate_grid()
 	
@@ -200,6 +203,18 @@ func _on_data_load_failed(failed_map_name: String, error: String):
 	# Emit failure signal for external systems to handle
 	emit_signal("map_generation_complete")  # With error state
 
+# Instance the map's shader warm-up scene if one was generated
+func _start_shader_warmup(warmup_map_name: String):
+	var warmup_path = ShaderWarmup.scene_path_for_map(warmup_map_name)
+	if not ResourceLoader.exists(warmup_path):
+		return
+
+	# Prefetched with the rest of the map by PreloadManifest.prefetch_next_map
+	var warmup_scene = PreloadManifest.take(warmup_path)
+	if warmup_scene:
+		add_child(warmup_scene.instantiate())
+		print("GridSystem: Warming up shaders from %s" % warmup_path)
+
 # Generate the complete grid using components
 func _generate_grid():
 	if generation_in_progress:
@@ -274,6 +289,9 @@ func _on_spawn_complete(spawn_position: Vector3):
 	# Start ambient audio after everything is set up
 	call_deferred("_handle_audio_start")
 
+	# Stream in what the next map in the sequence needs while this one is played
+	PreloadManifest.prefetch_next_map(map_name)
+
 	generation_in_progress = false
 	print("GridSystem: ✅ Grid generation completed successfully")
 	emit_signal("map_generation_complete")
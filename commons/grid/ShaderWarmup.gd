@@ -0,0 +1,49 @@
+# ShaderWarmup.gd
+# Root script of the per-map warm-up scenes written by generate_shader_warmup.py
+# Draws every material of a map once inside an off-screen SubViewport so the
+# shaders compile while the map is being built, then frees itself.
+# The SubViewport takes the main viewport's MSAA sample count; it stays a
+# non-XR viewport so nothing of the warm-up reaches the headset.
+
+extends Node3D
+class_name ShaderWarmup
+
+const MAPS_PATH = "res://commons/maps/"
+
+# Frames to keep drawing before freeing (first frame compiles, second confirms)
+@export var warmup_frames: int = 2
+
+var _frames_left: int = 0
+
+signal warmup_finished(material_count: int)
+
+func _ready():
+	_frames_left = max(warmup_frames, 1)
+	var viewport = get_node_or_null("SubViewport")
+	if viewport:
+		match_main_viewport(viewport)
+
+func match_main_viewport(viewport: SubViewport):
+	"""Render with the MSAA of the viewport the map is drawn in"""
+	viewport.msaa_3d = get_viewport().msaa_3d
+
+func _process(_delta):
+	_frames_left -= 1
+	if _frames_left > 0:
+		return
+
+	set_process(false)
+	var material_count = 0
+	var viewport = get_node_or_null("SubViewport")
+	if viewport:
+		material_count = viewport.get_child_count() - 2  # Camera3D + DirectionalLight3D
+	warmup_finished.emit(material_count)
+	queue_free()
+
+# Warm-up scene path for a map (mirrors GridDataComponent's map_name -> JSON rules)
+static func scene_path_for_map(map_name: String) -> String:
+	if map_name.begins_with("Lab/"):
+		return MAPS_PATH + "Lab/" + map_name.substr(4) + "_warmup.tscn"
+	elif map_name == "Lab":
+		return MAPS_PATH + "Lab/map_data_one_warmup.tscn"
+	return MAPS_PATH + map_name + "/map_data_warmup.tscn"
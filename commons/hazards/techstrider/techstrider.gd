@@ -11,6 +11,7 @@ var legs: Array = []
 var current_direction: Vector3 = Vector3.ZERO
 var direction_timer: float = 0.0
 var spawn_position: Vector3
+@onready var body: MeshInstance3D = $Body
 
 func _ready():
 	# Get references to the three legs
@@ -64,7 +65,7 @@ func _process(delta):
 		joint2.rotation.z = knee_bend
 	
 	# Add slight body bobbing for realism
-	$Body.position.y = 0.5 + sin(time * 2.0) * 0.05
+	body.position.y = 0.5 + sin(time * 2.0) * 0.05
 
 func _choose_new_direction():
 	# Pick a random direction on the XZ plane
@@ -0,0 +1,96 @@
+# PreloadManifest.gd
+# Runtime side of build_preload_manifests.py
+# Reads res://preload_manifest.json and hands resource lists to
+# ResourceLoader.load_threaded_request so the next scene or map streams in
+# in the background instead of loading synchronously
+
+extends RefCounted
+class_name PreloadManifest
+
+const MANIFEST_PATH = "res://preload_manifest.json"
+
+static var _manifest: Dictionary = {}
+static var _loaded: bool = false
+static var _requested: Dictionary = {}
+
+static func _get_manifest() -> Dictionary:
+	if _loaded:
+		return _manifest
+	_loaded = true
+	if not FileAccess.file_exists(MANIFEST_PATH):
+		return _manifest
+	var file = FileAccess.open(MANIFEST_PATH, FileAccess.READ)
+	if file:
+		var json = JSON.new()
+		if json.parse(file.get_as_text()) == OK and json.data is Dictionary:
+			_manifest = json.data
+		else:
+			print("PreloadManifest: Failed to parse ", MANIFEST_PATH)
+	return _manifest
+
+# Resources an algorithms.json scene pulls in (dependencies first)
+static func scene_resources(scene_path: String) -> Array:
+	return _get_manifest().get("scenes", {}).get(scene_path, [scene_path])
+
+# Resources a map pulls in on top of the grid scene
+static func map_resources(map_name: String) -> Array:
+	return _get_manifest().get("maps", {}).get(map_name, {}).get("resources", [])
+
+# Next map in the map's sequence and the resources it adds, or {}
+static func next_map(map_name: String) -> Dictionary:
+	return _get_manifest().get("maps", {}).get(map_name, {}).get("next", {})
+
+# Start background loads for every path not already cached or in flight
+static func request(paths: Array) -> int:
+	var started = 0
+	for path in paths:
+		if _requested.has(path) or ResourceLoader.has_cached(path):
+			continue
+		if ResourceLoader.load_threaded_request(path, "", true) == OK:
+			_requested[path] = true
+			started += 1
+	return started
+
+# Finish the background loads nobody took: a threaded load keeps its
+# resource alive until load_threaded_get() is called for it, so a
+# prefetched scene the player never opened would stay in memory for the
+# whole session. Loads still in progress are left for the next call;
+# what is in use (the scene or map that was opened) stays referenced by
+# it, the rest is freed.
+static func collect() -> int:
+	var collected = 0
+	for path in _requested.keys():
+		if ResourceLoader.load_threaded_get_status(path) == ResourceLoader.THREAD_LOAD_IN_PROGRESS:
+			continue
+		_requested.erase(path)
+		ResourceLoader.load_threaded_get(path)
+		collected += 1
+	return collected
+
+static func prefetch_scene(scene_path: String) -> int:
+	return request(scene_resources(scene_path))
+
+# Called once a map is up: the previous prefetch was for this map and is
+# collected before the next map's delta is requested
+static func prefetch_next_map(map_name: String) -> int:
+	collect()
+	var next = next_map(map_name)
+	if next.is_empty():
+		return 0
+	var started = request(next.get("delta", []))
+	if started > 0:
+		print("PreloadManifest: Prefetching %d resources for %s" % [started, next.get("map", "")])
+	return started
+
+# Load a resource, reusing a background request when one was made, and
+# collect the other requests, which the loaded resource now holds or
+# which were prefetched for nothing
+static func take(path: String) -> Resource:
+	var resource: Resource = null
+	if _requested.has(path):
+		_requested.erase(path)
+		resource = ResourceLoader.load_threaded_get(path)
+	if not resource:
+		resource = load(path)
+	collect()
+	return resource
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Compile algorithms.json into the runtime scene catalog.
+
+algorithms.json is edited by hand (pretty printed, BOM, the odd literal
+"\\t") and MainSceneLoader used to parse it on device and check every
+entry with ResourceLoader.exists. This script verifies the catalog once,
+against a single walk of the project (godot_resources.StatTable), and
+writes what the loader reads instead:
+
+- algorithms.min.json: {"categories": {name: [res paths]}, "metadata": {...},
+  "source_sha256": ...} minified, broken entries left out, each scene
+  listed once; MainSceneLoader falls back to algorithms.json when its
+  SHA-256 no longer matches source_sha256
+- algorithms.index.json: per-category counts and offsets into the flat
+  scene order, plus the folder each category lives in
+
+Checks, per entry of ./algorithms.json and algorithms/algorithms.json:
+- the path exists with exactly this case (res:// is case-sensitive on
+  Linux and Android even when the editor's filesystem is not); a path
+  that only matches another case, or a file of the same name elsewhere,
+  is reported with the likely fix
+- it is a .tscn with a gd_scene header and a root node
+- its ext_resource paths exist (warning: the uid may still resolve)
+- it is listed once; duplicates across categories and across the two
+  copies are merged, algorithms/algorithms.json only adding metadata
+  (name, description, ...) and scenes the main copy lacks
+
+Scene headers are cached in .godot/catalog_stat_cache.json by size and
+mtime, so a rebuild only re-reads scenes that changed. --derive adds the
+scenes under algorithms/ that no category lists, in the category their
+folder's other scenes are in.
+
+Usage:
+    python compile_catalog.py            # verify and write the runtime catalog
+    python compile_catalog.py --check    # fail if the written catalog is stale (CI)
+    python compile_catalog.py --check --strict   # ... or if an entry is broken
+    python compile_catalog.py --derive --dry-run
+
+Broken entries are left out of the written catalog, so --check only fails
+when the files on disk differ from what would be written; --strict makes
+broken entries fail it too. Without --check, exits with 1 when an entry
+is broken.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from godot_maps import load_lenient_json
+from godot_resources import PROJECT_ROOT, StatTable, from_res, parse_resource_file, to_res
+
+SOURCE_JSON = "algorithms.json"
+SECONDARY_JSON = "algorithms/algorithms.json"
+CATALOG_JSON = "algorithms.min.json"
+INDEX_JSON = "algorithms.index.json"
+CACHE_FILE = ".godot/catalog_stat_cache.json"
+METADATA_FIELDS = ("id", "name", "description", "complexity", "inventor", "year_invented", "tags")
+
+
+def load_cache(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def scene_facts(rel, stats, cache, root):
+    """Header facts of a scene, re-read only when its size or mtime changed"""
+    stat = list(stats.stat(rel))
+    cached = cache.get(rel)
+    if cached and cached.get("stat") == stat:
+        return cached
+    doc = parse_resource_file(os.path.join(root, rel))
+    doc.path = to_res(rel)
+    facts = {
+        "stat": stat,
+        "kind": doc.kind,
+        "has_root": doc.root_node() is not None,
+        "ext_paths": sorted({section.attr("path") for section in doc.ext_resources.values()
+                             if section.attr("path")}),
+    }
+    cache[rel] = facts
+    return facts
+
+
+class Catalog:
+    """Merged, verified catalog entries in source order"""
+
+    def __init__(self, stats, cache, root):
+        self.stats = stats
+        self.cache = cache
+        self.root = root
+        self.categories = {}
+        self.metadata = {}
+        self.listed = {}
+        self.rejected = set()
+        self.errors = []
+        self.warnings = []
+
+    def check(self, path, source):
+        """Problem with a catalog path, or None"""
+        if not isinstance(path, str) or not path.startswith("res://"):
+            return f"{source}: not a res:// path: {path!r}"
+        rel = from_res(path)
+        if not self.stats.exists(rel):
+            variants = self.stats.case_variants(rel)
+            if variants:
+                return f"{source}: {path} differs in case from {to_res(variants[0])}"
+            moved = [p for p in self.stats.same_name(rel) if p.endswith(".tscn")]
+            hint = f" (same name: {to_res(moved[0])})" if moved else ""
+            return f"{source}: {path} does not exist{hint}"
+        if not rel.endswith(".tscn"):
+            return f"{source}: {path} is not a scene"
+        facts = scene_facts(rel, self.stats, self.cache, self.root)
+        if facts["kind"] != "gd_scene" or not facts["has_root"]:
+            return f"{source}: {path} has no gd_scene header or root node"
+        for dep in facts["ext_paths"]:
+            if dep.startswith("res://") and not self.stats.exists(dep):
+                variants = self.stats.case_variants(dep)
+                fix = f", differs in case from {to_res(variants[0])}" if variants else ""
+                self.warnings.append(f"{path}: dependency {dep} does not exist{fix}")
+        return None
+
+    def add(self, category, path, source):
+        if path in self.listed:
+            if self.listed[path] != category:
+                self.warnings.append(f"{source}: {path} already listed under {self.listed[path]}, "
+                                     f"not repeated under {category}")
+            return False
+        if path in self.rejected:
+            return False
+        problem = self.check(path, source)
+        if problem:
+            self.rejected.add(path)
+            self.errors.append(problem)
+            return False
+        self.listed[path] = category
+        self.categories.setdefault(category, []).append(path)
+        return True
+
+
+def category_folders(catalog):
+    """category -> algorithms/<folder> most of its scenes live in"""
+    folders = {}
+    for category, paths in catalog.categories.items():
+        counts = {}
+        for path in paths:
+            parts = from_res(path).split("/")
+            if len(parts) > 2 and parts[0] == "algorithms":
+                counts[parts[1]] = counts.get(parts[1], 0) + 1
+        if counts:
+            folders[category] = max(sorted(counts), key=counts.get)
+    return folders
+
+
+def derive_uncatalogued(catalog):
+    """Add the scenes under algorithms/ that no category lists"""
+    by_folder = {}
+    for category, folder in category_folders(catalog).items():
+        by_folder.setdefault(folder, category)
+    added = 0
+    for rel in sorted(catalog.stats.iter_files(".tscn", "algorithms")):
+        path = to_res(rel)
+        if path in catalog.listed:
+            continue
+        folder = rel.split("/")[1] if rel.count("/") > 1 else "algorithms"
+        category = by_folder.get(folder, folder.replace("_", " ").title())
+        added += catalog.add(category, path, "filesystem")
+    return added
+
+
+def source_hash(path):
+    """SHA-256 of the file as FileAccess.get_sha256 reports it"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def build_outputs(catalog, source_sha256):
+    categories = catalog.categories
+    runtime = {"categories": categories}
+    metadata = {path: meta for path, meta in catalog.metadata.items() if path in catalog.listed}
+    if metadata:
+        runtime["metadata"] = metadata
+    runtime["source_sha256"] = source_sha256
+    folders = category_folders(catalog)
+    index = {"total": len(catalog.listed), "categories": []}
+    offset = 0
+    for name, paths in categories.items():
+        entry = {"name": name, "count": len(paths), "offset": offset}
+        if name in folders:
+            entry["folder"] = folders[name]
+        index["categories"].append(entry)
+        offset += len(paths)
+    return runtime, index
+
+
+def minified(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify algorithms.json and write the runtime catalog")
+    parser.add_argument("--derive", action="store_true", help="add uncatalogued scenes under algorithms/")
+    parser.add_argument("--check", action="store_true", help="fail if the written catalog is out of date")
+    parser.add_argument("--strict", action="store_true", help="with --check, also fail on broken entries")
+    parser.add_argument("--dry-run", action="store_true", help="verify only, write nothing")
+    parser.add_argument("--root", default=PROJECT_ROOT, help="project root")
+    args = parser.parse_args(argv)
+
+    stats = StatTable(args.root)
+    cache_path = os.path.join(args.root, CACHE_FILE)
+    cache = load_cache(cache_path)
+    catalog = Catalog(stats, cache, args.root)
+
+    source_path = os.path.join(args.root, SOURCE_JSON)
+    source = load_lenient_json(source_path)
+    for category, paths in (source.get("categories") or {}).items():
+        for path in paths or []:
+            catalog.add(category, path, SOURCE_JSON)
+
+    secondary_path = os.path.join(args.root, SECONDARY_JSON)
+    if os.path.exists(secondary_path):
+        for entry in load_lenient_json(secondary_path).get("algorithms", []):
+            path = entry.get("scene_path", "")
+            if path in catalog.listed or catalog.add(entry.get("category", "Uncategorized"), path, SECONDARY_JSON):
+                meta = {k: entry[k] for k in METADATA_FIELDS if k in entry}
+                catalog.metadata.setdefault(path, meta)
+
+    derived = derive_uncatalogued(catalog) if args.derive else 0
+    uncatalogued = [rel for rel in stats.iter_files(".tscn", "algorithms") if to_res(rel) not in catalog.listed]
+
+    print("=" * 60)
+    print(f"{len(catalog.listed)} scenes in {len(catalog.categories)} categories "
+          f"({len(stats.files)} project files walked)")
+    if derived:
+        print(f"Derived {derived} uncatalogued scenes from algorithms/")
+    elif uncatalogued:
+        print(f"{len(uncatalogued)} scenes under algorithms/ are in no category (--derive adds them)")
+    print(f"Errors: {len(catalog.errors)}, warnings: {len(catalog.warnings)}")
+    for message in catalog.errors:
+        print(f"  ERROR {message}")
+    for message in catalog.warnings[:20]:
+        print(f"  warn  {message}")
+    if len(catalog.warnings) > 20:
+        print(f"  ... and {len(catalog.warnings) - 20} more warnings")
+    print("=" * 60)
+
+    runtime, index = build_outputs(catalog, source_hash(source_path))
+    outputs = {CATALOG_JSON: minified(runtime), INDEX_JSON: minified(index)}
+    failed = bool(catalog.errors)
+    if args.check:
+        # Broken entries are already left out of the output; they only fail --strict
+        failed = bool(catalog.errors) and args.strict
+        for name, content in outputs.items():
+            path = os.path.join(args.root, name)
+            current = open(path, encoding="utf-8").read() if os.path.exists(path) else None
+            if current != content:
+                print(f"{name} is out of date; run compile_catalog.py")
+                failed = True
+        if not failed:
+            print(f"{CATALOG_JSON} and {INDEX_JSON} are up to date"
+                  + (f" ({len(catalog.errors)} broken entries left out)" if catalog.errors else ""))
+    elif not args.dry_run:
+        for name, content in outputs.items():
+            with open(os.path.join(args.root, name), "w", encoding="utf-8") as f:
+                f.write(content)
+            print(f"Wrote {name} ({len(content.encode('utf-8'))} bytes)")
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, separators=(",", ":"))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
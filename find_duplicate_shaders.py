@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Find exact and near-duplicate .gdshader files and optionally point every
+.tscn/.tres reference at one canonical copy.
+
+Shader source is normalized before hashing: comments and whitespace are
+dropped, numeric literals are written in one canonical form, and top-level
+uniform declarations and render_mode flags are sorted. Files with the same
+normalized hash are exact duplicates (safe to merge); files whose token
+shingles overlap above --threshold are reported as near duplicates.
+
+The report lists, per map, how many distinct shader files the map pulls in
+today and how many would remain after merging the exact duplicates.
+
+Usage:
+    python find_duplicate_shaders.py                 # report only
+    python find_duplicate_shaders.py --apply         # rewrite references
+    python find_duplicate_shaders.py --json out.json # machine-readable report
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+from godot_maps import list_maps, load_utility_types, map_scene_references
+from godot_resources import (PROJECT_ROOT, ResourceGraph, iter_project_files, read_text,
+                             to_res)
+
+CANONICAL_DIR = "commons/resourses/shaders/"
+
+_TOKEN = re.compile(r"""
+    (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<number>(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?[fFuU]?)
+  | (?P<ident>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<string>"(?:\\.|[^"\\])*")
+  | (?P<op><<=|>>=|[-+*/%&|^<>=!]=|&&|\|\||\+\+|--|<<|>>|\S)
+""", re.S | re.X)
+
+
+def tokenize_shader(source):
+    """Shader source -> list of tokens without comments or whitespace"""
+    tokens = []
+    for m in _TOKEN.finditer(source):
+        kind = m.lastgroup
+        if kind == "comment":
+            continue
+        text = m.group(kind)
+        if kind == "number":
+            text = _canonical_number(text)
+        tokens.append(text)
+    return tokens
+
+
+def _canonical_number(text):
+    suffix = ""
+    if text[-1] in "fFuU":
+        suffix = "u" if text[-1] in "uU" else ""
+        text = text[:-1]
+    if "." in text or "e" in text or "E" in text:
+        return repr(float(text))
+    return str(int(text)) + suffix
+
+
+def _split_statements(tokens):
+    """Split a token list into top-level statements (';' or a closed {} block)"""
+    statements = []
+    current = []
+    depth = 0
+    for tok in tokens:
+        current.append(tok)
+        if tok in "({[":
+            depth += 1
+        elif tok in ")}]":
+            depth -= 1
+            if tok == "}" and depth == 0:
+                statements.append(current)
+                current = []
+        elif tok == ";" and depth == 0:
+            statements.append(current)
+            current = []
+    if current:
+        statements.append(current)
+    return statements
+
+
+def normalize_shader(source):
+    """Canonical token string: uniforms and render_mode flags are order-independent"""
+    statements = _split_statements(tokenize_shader(source))
+    head = []
+    uniforms = []
+    body = []
+    for stmt in statements:
+        first = stmt[0] if stmt else ""
+        if first in ("shader_type",):
+            head.append(stmt)
+        elif first == "render_mode":
+            flags = sorted(t for t in stmt[1:-1] if t != ",")
+            head.append(["render_mode"] + flags + [";"])
+        elif first == "uniform" or (len(stmt) > 1 and first in ("global", "instance") and stmt[1] == "uniform"):
+            uniforms.append(stmt)
+        else:
+            body.append(stmt)
+    uniforms.sort(key=lambda s: " ".join(s))
+    return " ".join(" ".join(s) for s in head + uniforms + body)
+
+
+def shader_fingerprint(source):
+    return hashlib.sha1(normalize_shader(source).encode("utf-8")).hexdigest()
+
+
+def _shingles(normalized, size=4):
+    toks = normalized.split(" ")
+    if len(toks) <= size:
+        return {tuple(toks)}
+    return {tuple(toks[i:i + size]) for i in range(len(toks) - size + 1)}
+
+
+class _UnionFind:
+    def __init__(self, items):
+        self.parent = {i: i for i in items}
+
+    def find(self, x):
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def collect_shaders(root=PROJECT_ROOT):
+    """res:// path -> normalized source for every .gdshader in the tree"""
+    shaders = {}
+    for rel in iter_project_files(".gdshader", root):
+        shaders[to_res(rel)] = normalize_shader(read_text(os.path.join(root, rel)))
+    return shaders
+
+
+def count_references(graph, root=PROJECT_ROOT):
+    """res:// shader path -> number of .tscn/.tres files referencing it"""
+    counts = {}
+    for rel in iter_project_files((".tscn", ".tres"), root):
+        for target in graph.references(to_res(rel)):
+            if target.endswith(".gdshader"):
+                counts[target] = counts.get(target, 0) + 1
+    return counts
+
+
+def choose_canonical(paths, ref_counts):
+    """Prefer the shared shader library, then the most referenced, then the shortest path"""
+    return min(paths, key=lambda p: (
+        not p.startswith("res://" + CANONICAL_DIR),
+        -ref_counts.get(p, 0),
+        len(p),
+        p,
+    ))
+
+
+def find_clusters(shaders, threshold):
+    """Return (exact_groups, near_groups) as lists of sorted path lists"""
+    by_hash = {}
+    for path, normalized in shaders.items():
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+        by_hash.setdefault(digest, []).append(path)
+    exact = [sorted(group) for group in by_hash.values() if len(group) > 1]
+
+    # Near duplicates are compared one representative per exact group
+    reps = sorted(group[0] for group in by_hash.values())
+    shingles = {p: _shingles(shaders[p]) for p in reps}
+    uf = _UnionFind(reps)
+    for i, a in enumerate(reps):
+        sa = shingles[a]
+        for b in reps[i + 1:]:
+            sb = shingles[b]
+            smaller, larger = sorted((len(sa), len(sb)))
+            if not larger or smaller / larger < threshold:
+                continue
+            if len(sa & sb) / len(sa | sb) >= threshold:
+                uf.union(a, b)
+    clusters = {}
+    for p in reps:
+        clusters.setdefault(uf.find(p), []).append(p)
+    near = []
+    for members in clusters.values():
+        if len(members) > 1:
+            expanded = []
+            for rep in members:
+                expanded.extend(next(g for g in by_hash.values() if rep in g))
+            near.append(sorted(expanded))
+    return sorted(exact), sorted(near)
+
+
+def build_canonical_map(exact_groups, ref_counts):
+    """duplicate res:// path -> canonical res:// path"""
+    mapping = {}
+    for group in exact_groups:
+        canonical = choose_canonical(group, ref_counts)
+        for path in group:
+            if path != canonical:
+                mapping[path] = canonical
+    return mapping
+
+
+def per_map_savings(graph, mapping, root=PROJECT_ROOT):
+    """map name -> (shader files compiled now, after merging exact duplicates)"""
+    utility_types = load_utility_types(root)
+    results = {}
+    for name in list_maps(root):
+        scenes, _unresolved = map_scene_references(name, root, utility_types)
+        used = [p for p in graph.closure(scenes) if p.endswith(".gdshader")]
+        if not used:
+            continue
+        results[name] = (len(set(used)), len({mapping.get(p, p) for p in used}))
+    return results
+
+
+_HEADER_ATTR = r'(\b%s=")([^"]*)(")'
+
+
+def rewrite_references(graph, mapping, root=PROJECT_ROOT, dry_run=False):
+    """Point Shader ext_resources at the canonical copy; returns {file: count}"""
+    reverse_uid = {path: uid for uid, path in graph.uid_index.items()}
+    changed = {}
+    for rel in iter_project_files((".tscn", ".tres"), root):
+        res_path = to_res(rel)
+        doc = graph.document(res_path)
+        if doc is None:
+            continue
+        edits = []
+        for section in doc.ext_resources.values():
+            target = graph.resolve(section.attr("uid") or "") or section.attr("path")
+            if not graph.exists(target or ""):
+                target = section.attr("path")
+            canonical = mapping.get(target)
+            if not canonical:
+                continue
+            start, end = section.header_span
+            header = doc.text[start:end]
+            new_header = re.sub(_HEADER_ATTR % "path", lambda m: m.group(1) + canonical + m.group(3), header)
+            canonical_uid = reverse_uid.get(canonical)
+            if canonical_uid:
+                new_header = re.sub(_HEADER_ATTR % "uid", lambda m: m.group(1) + canonical_uid + m.group(3), new_header)
+            else:
+                new_header = re.sub(r'\s\buid="[^"]*"', "", new_header)
+            if new_header != header:
+                edits.append((start, end, new_header))
+        if not edits:
+            continue
+        text = doc.text
+        for start, end, new_header in sorted(edits, reverse=True):
+            text = text[:start] + new_header + text[end:]
+        changed[rel] = len(edits)
+        if not dry_run:
+            with open(os.path.join(root, rel), "w", encoding="utf-8", newline="") as f:
+                f.write(text)
+    return changed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Detect and consolidate duplicate shaders")
+    parser.add_argument("--threshold", type=float, default=0.9,
+                        help="shingle similarity for near duplicates (default 0.9)")
+    parser.add_argument("--apply", action="store_true",
+                        help="rewrite .tscn/.tres references to the canonical copy")
+    parser.add_argument("--json", metavar="PATH", help="write the report as JSON")
+    parser.add_argument("--root", default=PROJECT_ROOT, help="project root")
+    args = parser.parse_args(argv)
+
+    print("Scanning shaders...")
+    print("=" * 60)
+    graph = ResourceGraph(args.root)
+    shaders = collect_shaders(args.root)
+    ref_counts = count_references(graph, args.root)
+    exact, near = find_clusters(shaders, args.threshold)
+    mapping = build_canonical_map(exact, ref_counts)
+
+    print(f"{len(shaders)} shaders, {len(exact)} exact duplicate groups, {len(near)} near-duplicate clusters")
+    for group in exact:
+        canonical = choose_canonical(group, ref_counts)
+        print(f"\nEXACT -> {canonical}")
+        for path in group:
+            if path != canonical:
+                print(f"    {path} ({ref_counts.get(path, 0)} refs)")
+    for group in near:
+        print("\nNEAR")
+        for path in group:
+            print(f"    {path} ({ref_counts.get(path, 0)} refs)")
+
+    savings = per_map_savings(graph, mapping, args.root)
+    saved_maps = {name: v for name, v in savings.items() if v[0] != v[1]}
+    print("\n" + "=" * 60)
+    print(f"Maps using shaders: {len(savings)}, maps that save compiles: {len(saved_maps)}")
+    for name, (before, after) in sorted(saved_maps.items(), key=lambda kv: kv[1][1] - kv[1][0]):
+        print(f"  {name}: {before} -> {after} shader compiles (-{before - after})")
+
+    changed = rewrite_references(graph, mapping, args.root, dry_run=not args.apply)
+    verb = "Rewrote" if args.apply else "Would rewrite"
+    print("=" * 60)
+    print(f"{verb} {sum(changed.values())} references in {len(changed)} files")
+
+    if args.json:
+        report = {
+            "shader_count": len(shaders),
+            "exact_groups": [{"canonical": choose_canonical(g, ref_counts), "members": g} for g in exact],
+            "near_groups": near,
+            "references": ref_counts,
+            "per_map": {name: {"before": b, "after": a, "saved": b - a} for name, (b, a) in savings.items()},
+            "rewrites": changed,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"Report written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Find dead assets: files nothing in the running game can reach.
+
+The reference graph is rooted at everything the game loads by name:
+- project.godot (main scene uid, autoloads, icon, plugins)
+- every scene listed in algorithms.json, and the compiled catalog
+  (algorithms.min.json, algorithms.index.json) MainSceneLoader prefers
+- every map (commons/maps), the scenes its tokens instantiate, the
+  artifact registries and map_sequences.json
+- generated warm-up scenes and the preload manifest, when present
+Directories named in reachable scripts (e.g. MAP_OBJECTS_PATH) are kept
+whole, since their contents are looked up by name at runtime, as is
+everything under --keep (addons/ by default).
+
+Every unreachable asset is listed with its size, along with stale .uid /
+.import sidecars whose source file no longer exists. The result can be
+written as an export_presets.cfg exclude_filter, with fully dead folders
+collapsed to "res://folder/*".
+
+Paths built from string pieces at runtime are invisible to the graph, so
+check the list before deleting anything. A project.godot reference that
+resolves to no file (a stale main scene uid, say) hides everything only
+it reaches, so --filter and --preset refuse to write while there is one
+unless --force is given.
+
+Usage:
+    python find_orphan_assets.py                   # report
+    python find_orphan_assets.py --filter out.txt  # write the exclude filter
+    python find_orphan_assets.py --preset 0        # set it on export preset 0
+    python find_orphan_assets.py --preset 0 --force  # even with unresolved project.godot roots
+"""
+
+import argparse
+import os
+import re
+import sys
+
+from compile_catalog import CATALOG_JSON, INDEX_JSON
+from godot_maps import (MAP_OBJECTS_PATH, MAP_SEQUENCES_JSON, UTILITY_REGISTRY_GD, list_maps,
+                        load_lenient_json, load_utility_types, map_file_res_path, map_scene_references,
+                        registry_files)
+from godot_resources import (PROJECT_ROOT, ResourceGraph, iter_project_files, read_text, res_to_file,
+                             script_references, to_res)
+
+ASSET_EXTENSIONS = (
+    ".tscn", ".scn", ".tres", ".res", ".gd", ".gdshader", ".gdshaderinc",
+    ".png", ".jpg", ".jpeg", ".webp", ".svg", ".exr", ".hdr",
+    ".wav", ".ogg", ".mp3", ".glb", ".gltf", ".bin", ".obj", ".json",
+)
+SIDECAR_EXTENSIONS = (".uid", ".import")
+ALGORITHMS_JSON = "algorithms.json"
+EXPORT_PRESETS = "export_presets.cfg"
+DEFAULT_KEEP = ("addons/",)
+# Loaded by the engine through project setting defaults, not written to project.godot
+ENGINE_DEFAULT_ROOTS = ("res://openxr_action_map.tres",)
+
+_PROJECT_REF = re.compile(r'"\*?((?:res|uid)://[^"]*)"')
+_GLTF_URI = re.compile(r'"uri"\s*:\s*"([^":]+)"')
+
+
+def project_roots(root=PROJECT_ROOT):
+    """res:// / uid:// references in project.godot (autoloads carry a '*' prefix)"""
+    return _PROJECT_REF.findall(read_text(os.path.join(root, "project.godot")))
+
+
+def game_roots(graph, root=PROJECT_ROOT, keep=DEFAULT_KEEP):
+    """(files the game loads by name, project.godot references that resolve to nothing)"""
+    roots = list(ENGINE_DEFAULT_ROOTS)
+    unresolved = []
+    for ref in project_roots(root):
+        target = graph.resolve(ref)
+        if target and graph.exists(target):
+            roots.append(target)
+        elif not (target or "").startswith(tuple(to_res(k) for k in keep)):
+            unresolved.append(ref)
+
+    if os.path.isfile(os.path.join(root, INDEX_JSON)):
+        roots.append(to_res(INDEX_JSON))
+    for name in (ALGORITHMS_JSON, CATALOG_JSON):
+        if not os.path.isfile(os.path.join(root, name)):
+            continue
+        roots.append(to_res(name))
+        catalog = load_lenient_json(os.path.join(root, name))
+        for paths in (catalog.get("categories", {}) or {}).values():
+            roots.extend(paths or [])
+
+    roots += [to_res(MAP_SEQUENCES_JSON), to_res(UTILITY_REGISTRY_GD)]
+    roots += registry_files(root)
+    utility_types = load_utility_types(root)
+    for name in list_maps(root):
+        roots.append(map_file_res_path(name, root))
+        scenes, _unresolved = map_scene_references(name, root, utility_types)
+        roots.extend(scenes)
+
+    # Generated by generate_shader_warmup.py / build_preload_manifests.py
+    roots += [to_res(p) for p in iter_project_files("_warmup.tscn", root, "commons/maps")]
+    if os.path.isfile(os.path.join(root, "preload_manifest.json")):
+        roots.append("res://preload_manifest.json")
+    return [r for r in roots if r and graph.exists(r)], unresolved
+
+
+def gltf_references(res_path, root=PROJECT_ROOT):
+    """Buffers and images a .gltf points at by relative uri"""
+    base = res_path.rsplit("/", 1)[0]
+    return [base + "/" + uri for uri in _GLTF_URI.findall(read_text(res_to_file(res_path, root)))]
+
+
+def reachable_files(graph, roots, root=PROJECT_ROOT):
+    """(reachable res:// paths, directories kept whole because scripts name them)"""
+    reachable = set()
+    kept_dirs = set()
+    pending = list(roots)
+    while pending:
+        for path in graph.closure(pending):
+            reachable.add(path)
+        pending = []
+        for path in list(reachable):
+            if path.endswith(".gltf"):
+                pending += [p for p in gltf_references(path, root) if p not in reachable and graph.exists(p)]
+        reachable.update(pending)
+        pending = []
+    for path in reachable:
+        if not path.endswith(".gd"):
+            continue
+        for ref in script_references(read_text(res_to_file(path, root)), path):
+            name = ref.rsplit("/", 1)[-1]
+            # Ignore top-level prefixes such as "res://commons/"
+            folder = ref.rstrip("/") + "/"
+            if (ref.startswith("res://") and "." not in name and folder.count("/") >= 4
+                    and folder != MAP_OBJECTS_PATH  # resolved through UtilityRegistry
+                    and os.path.isdir(res_to_file(folder, root))):
+                kept_dirs.add(folder)
+    return reachable, kept_dirs
+
+
+def find_orphans(root=PROJECT_ROOT, keep=DEFAULT_KEEP):
+    """Returns (orphans, stale_sidecars, kept_dirs, unresolved_roots)"""
+    graph = ResourceGraph(root)
+    roots, unresolved = game_roots(graph, root, keep)
+    reachable, kept_dirs = reachable_files(graph, roots, root)
+    keep_prefixes = tuple(keep) + tuple(d[len("res://"):] for d in kept_dirs)
+
+    orphans = []
+    for rel in iter_project_files(ASSET_EXTENSIONS, root):
+        if rel.startswith(keep_prefixes):
+            continue
+        if to_res(rel) not in reachable:
+            orphans.append(rel)
+
+    stale = []
+    for rel in iter_project_files(SIDECAR_EXTENSIONS, root):
+        source = rel.rsplit(".", 1)[0]
+        if not os.path.isfile(os.path.join(root, *source.split("/"))):
+            stale.append(rel)
+    return orphans, stale, sorted(kept_dirs), unresolved
+
+
+def exclude_filter(paths, root=PROJECT_ROOT):
+    """Export filter entries; folders whose assets are all dead become 'res://dir/*'"""
+    dead = set(paths)
+    folders = {}
+    for rel in iter_project_files(ASSET_EXTENSIONS + SIDECAR_EXTENSIONS, root):
+        parts = rel.split("/")
+        for depth in range(1, len(parts)):
+            folder = "/".join(parts[:depth])
+            folders[folder] = folders.get(folder, 0) + (rel not in dead)
+    dead_folders = sorted(f for f, live in folders.items() if live == 0)
+
+    entries = []
+    collapsed = []
+    for folder in dead_folders:
+        if not any(folder.startswith(c + "/") for c in collapsed):
+            collapsed.append(folder)
+            entries.append(to_res(folder) + "/*")
+    for rel in sorted(dead):
+        if not any(rel.startswith(c + "/") for c in collapsed) and "," not in rel:
+            entries.append(to_res(rel))
+    return entries
+
+
+def set_preset_exclude_filter(preset_index, entries, root=PROJECT_ROOT):
+    """Write entries into [preset.N] exclude_filter of export_presets.cfg"""
+    path = os.path.join(root, EXPORT_PRESETS)
+    text = read_text(path)
+    section = re.search(r'^\[preset\.%d\]\n(.*?)(?=^\[)' % preset_index, text, re.M | re.S)
+    if not section:
+        raise SystemExit(f"preset.{preset_index} not found in {EXPORT_PRESETS}")
+    value = 'exclude_filter="%s"' % ", ".join(entries)
+    body = re.sub(r'^exclude_filter=".*"$', lambda m: value, section.group(1), count=1, flags=re.M)
+    text = text[:section.start(1)] + body + text[section.end(1):]
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+
+
+def _size(rel, root):
+    return os.path.getsize(os.path.join(root, *rel.split("/")))
+
+
+def _format_size(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024 or unit == "MB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find assets no game entry point can reach")
+    parser.add_argument("--keep", action="append", default=None,
+                        help="project-relative prefix to always keep (default: addons/)")
+    parser.add_argument("--filter", metavar="PATH", help="write the export exclude filter to a file")
+    parser.add_argument("--preset", type=int, metavar="N", help="set exclude_filter on export preset N")
+    parser.add_argument("--force", action="store_true",
+                        help="write --filter / --preset even when a project.godot root is unresolved")
+    parser.add_argument("--root", default=PROJECT_ROOT, help="project root")
+    args = parser.parse_args(argv)
+    keep = tuple(args.keep) if args.keep else DEFAULT_KEEP
+
+    print("Building reference graph...")
+    print("=" * 60)
+    orphans, stale, kept_dirs, unresolved = find_orphans(args.root, keep)
+    for ref in unresolved:
+        print(f"WARNING: project.godot references {ref}, which resolves to no file")
+
+    by_folder = {}
+    for rel in orphans:
+        folder = "/".join(rel.split("/")[:2]) if rel.count("/") >= 2 else rel.rsplit("/", 1)[0] if "/" in rel else "."
+        count, size = by_folder.get(folder, (0, 0))
+        by_folder[folder] = (count + 1, size + _size(rel, args.root))
+    total = sum(size for _count, size in by_folder.values())
+
+    print(f"Unreachable assets: {len(orphans)} ({_format_size(total)})")
+    for folder, (count, size) in sorted(by_folder.items(), key=lambda kv: -kv[1][1]):
+        print(f"  {_format_size(size):>9}  {count:4d}  {folder}/")
+    print()
+    for rel in orphans:
+        print(f"  {_format_size(_size(rel, args.root)):>9}  {rel}")
+
+    print("\n" + "=" * 60)
+    print(f"Stale sidecars (source file missing): {len(stale)}")
+    for rel in stale:
+        print(f"    {rel}")
+    if kept_dirs:
+        print(f"Kept whole (named by scripts): {', '.join(kept_dirs)}")
+
+    entries = exclude_filter(orphans + stale, args.root)
+    print("=" * 60)
+    print(f"Exclude filter: {len(entries)} entries")
+    if (args.filter or args.preset is not None) and unresolved and not args.force:
+        print(f"Not writing the filter: {len(unresolved)} project.godot reference(s) resolve to no file, "
+              "so what they load is listed as dead. Fix them or pass --force.")
+        return 1
+    if args.filter:
+        with open(args.filter, "w", encoding="utf-8") as f:
+            f.write(", ".join(entries) + "\n")
+        print(f"Filter written to {args.filter}")
+    if args.preset is not None:
+        set_preset_exclude_filter(args.preset, entries, args.root)
+        print(f"exclude_filter set on preset.{args.preset} in {EXPORT_PRESETS}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
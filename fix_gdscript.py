@@ -0,0 +1,672 @@
+#!/usr/bin/env python3
+"""
+Token-based GDScript fixes for the Godot 4 port.
+
+Replaces the regex fixers (fix_progress_modulo, fix_csg_godot4 and the
+cylinder radius/size scripts) with rules that match the token stream of
+gdscript_tokens, so comments, strings and unrelated identifiers are never
+touched. Every script is tokenized once (token streams are cached by
+content hash) and all selected rules run in a single traversal of it.
+
+Rules:
+- float-modulo: `x % 1.0` and `x %= 1.0` -> fmod(); % is int-only in Godot 4
+  and any left operand is handled, not just `var progress = (...)`
+- csg-cone: CSGCone3D (never an engine class) -> CSGCylinder3D with cone = true
+- csg-cylinder-radius: radius_top/radius_bottom/top_radius/bottom_radius on
+  a CSGCylinder3D -> radius (a zero top radius becomes cone = true)
+- cylinder-mesh-radius: radius_top/radius_bottom/radius on a CylinderMesh
+  -> top_radius/bottom_radius, the properties CylinderMesh actually has
+- csg-cylinder-size: size.y on a CSGCylinder3D -> height
+- onready-node-cache: $Path, %Name and get_node("path") in _process,
+  _physics_process and the functions they call (lint_hotpath's call
+  graph) -> one `@onready var name: Type = $Path` per node, typed from
+  the scenes the script is attached to; an existing @onready member for
+  the path is reused
+
+The cylinder rules only rewrite a property when the receiver is known to
+be of that class: a variable declared or assigned as `T.new()`, `: T` or
+`as T` in the script, or a $Path / %Name / get_node("...") whose node has
+that type in every scene the script is attached to. CSGBox3D.size and
+CylinderMesh.top_radius are left alone.
+
+onready-node-cache only caches a node that exists, with one type, in
+every scene the script is attached to, and that the script never frees
+or moves. Code reachable from _init, _enter_tree, _notification or a
+property setter is skipped, since @onready members are still null there.
+
+Usage:
+    python fix_gdscript.py                          # list the fixes for every script
+    python fix_gdscript.py algorithms/color --diff  # show them as a diff
+    python fix_gdscript.py --rules float-modulo --write
+    python fix_gdscript.py --rules onready-node-cache --write
+    python fix_gdscript.py --check                  # exit 1 if any fix applies (CI)
+    python fix_gdscript.py --list-rules
+"""
+
+import argparse
+import difflib
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+
+from gdscript_tokens import (ANNOTATION, DEDENT, EOF, INDENT, KEYWORD, NAME, NEWLINE, NODE_PATH, OPERATOR, STRING,
+                             LexError, ScriptWalker, TokenCache, is_float_literal, matching_close, node_path_text,
+                             postfix_start, statement_end, statement_start)
+from godot_resources import PROJECT_ROOT, iter_project_files, join_node_path, read_text, res_to_file, to_res
+from lint_hotpath import FRAME_CALLBACKS, ScriptLint
+from scene_inventory import SceneResolver
+
+LEGACY_TYPES = {"CSGCone3D": "CSGCylinder3D"}
+_ZERO = re.compile(r"0*\.?0*$")
+_WORD_BREAK = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+_PLAIN_PATH = re.compile(r"%?(?:[A-Za-z0-9_]+|\.\.)(?:/(?:[A-Za-z0-9_]+|\.\.))*$")
+# Calls that free or move a node, after which a cached reference is stale
+NODE_MUTATORS = ("queue_free", "free", "remove_child", "reparent", "replace_by")
+# Properties scripts set on these classes that they do not have; a typed
+# member would turn the runtime error into a parse error for the script
+MISSING_PROPERTIES = {
+    "CSGBox3D": ("height", "radius"),
+    "CSGSphere3D": ("height", "size"),
+    "CSGCylinder3D": ("size", "radius_top", "radius_bottom", "top_radius", "bottom_radius"),
+}
+
+Edit = namedtuple("Edit", "start end text rule line")
+
+
+class SceneTypes:
+    """Types of the nodes a script reaches through $Path, %Name and
+    get_node(), looked up in every scene the script is attached to"""
+
+    def __init__(self, root):
+        self.root = root
+        self.resolver = SceneResolver(root)
+        self._scenes = None
+        self._attached = {}
+
+    def attached(self, script_res):
+        """(scene, node path) of every node running the script"""
+        if self._scenes is None:
+            self._scenes = {to_res(rel): read_text(os.path.join(self.root, rel))
+                            for rel in iter_project_files(".tscn", self.root)}
+        if script_res not in self._attached:
+            # Only scenes naming the script by path or uid can attach it
+            keys = [script_res]
+            uid_file = res_to_file(script_res, self.root) + ".uid"
+            if os.path.exists(uid_file):
+                keys.append(read_text(uid_file).strip())
+            found = []
+            for scene, text in self._scenes.items():
+                if not any(key in text for key in keys):
+                    continue
+                doc = self.resolver.document(scene)
+                for node in doc.nodes if doc is not None else ():
+                    raw = node.properties.get("script")
+                    if raw and self.resolver.ext_target(doc, raw) == script_res:
+                        found.append((scene, doc.node_path(node)))
+            self._attached[script_res] = found
+        return self._attached[script_res]
+
+    def nodes(self, script_res, path):
+        """(scene, document, node section or None) the path reaches in every
+        scene the script is attached to"""
+        for scene, base in self.attached(script_res):
+            doc = self.resolver.document(scene)
+            if path.startswith("%"):
+                node = next((n for n in doc.nodes if n.attr("name") == path[1:]
+                             and n.properties.get("unique_name_in_owner") == "true"), None)
+            else:
+                node_path = join_node_path(base, path)
+                node = next((n for n in doc.nodes if doc.node_path(n) == node_path), None) if node_path else None
+            yield scene, doc, node
+
+    def node_type(self, script_res, path):
+        """Node type, or None when it is unknown or the scenes disagree"""
+        types = {self.resolver.node_type(doc, node, (scene,)) if node is not None else None
+                 for scene, doc, node in self.nodes(script_res, path)}
+        return types.pop() if len(types) == 1 else None
+
+    def node_script(self, doc, node):
+        """res:// path of the script on a node or on the scene it instances"""
+        raw = node.properties.get("script")
+        if raw:
+            return self.resolver.ext_target(doc, raw)
+        instance = node.attrs.get("instance")
+        if instance:
+            sub = self.resolver.document(self.resolver.ext_target(doc, instance))
+            root = sub.root_node() if sub is not None else None
+            return self.node_script(sub, root) if root is not None else None
+        return None
+
+    def node_class(self, script_res, path):
+        """What a script can declare the node as: the class_name of the
+        script on it, else its type; "" for a script without class_name
+        (the engine type would hide the script's methods), None when the
+        node is unknown or the scenes disagree"""
+        classes = set()
+        for scene, doc, node in self.nodes(script_res, path):
+            if node is None or not (node.attr("type") or node.attrs.get("instance")):
+                return None
+            script = self.node_script(doc, node)
+            if script:
+                classes.add(self.resolver.script(script)[0] or "")
+            else:
+                classes.add(self.resolver.node_type(doc, node, (scene,)))
+        return classes.pop() if len(classes) == 1 else None
+
+
+class ScriptContext(ScriptWalker):
+    """One script during the traversal: the walker state plus edits"""
+
+    def __init__(self, rel, text, tokens, scene_types):
+        super().__init__(text, tokens)
+        self.rel = rel
+        self.scene_types = scene_types
+        self.pending = {}
+        self.cones = set()
+        self.edits = []
+        self.notes = []
+
+    def edit(self, rule, first, last, text):
+        token = self.tokens[first]
+        self.edits.append(Edit(token.start, self.tokens[last].end, text, rule, token.line))
+
+    def insert_after_statement(self, rule, i, text):
+        """Add a line with the indentation of the statement containing i"""
+        first = self.tokens[statement_start(self.tokens, i)]
+        end = self.tokens[statement_end(self.tokens, i)]
+        indent = self.text[self.text.rfind("\n", 0, first.start) + 1:first.start]
+        self.edits.append(Edit(end.start, end.start, "\n" + indent + text, rule, first.line))
+
+    def remove_statement(self, rule, i):
+        tokens = self.tokens
+        first = statement_start(tokens, i)
+        last = statement_end(tokens, i)
+        if tokens[first - 1].kind == INDENT and tokens[last + 1].kind in (DEDENT, EOF):
+            # The only statement of its block
+            self.edit(rule, first, last - 1, "pass")
+            return
+        start = self.text.rfind("\n", 0, tokens[first].start) + 1
+        self.edits.append(Edit(start, tokens[last].end, "", rule, tokens[first].line))
+
+    def note(self, rule, i, message):
+        self.notes.append((self.tokens[i].line, rule, message))
+
+    def resolve(self, fact):
+        if isinstance(fact, tuple):
+            fact = self.scene_types.node_type(to_res(self.rel), fact[1])
+        return LEGACY_TYPES.get(fact, fact)
+
+    def receiver_type(self, first, last, scope):
+        types = {self.resolve(fact) for fact in self.receiver_facts(first, last, scope)}
+        return types.pop() if len(types) == 1 else None
+
+
+class Rule:
+    name = ""
+    summary = ""
+    triggers = ()
+
+    def visit(self, ctx, i):
+        pass
+
+    def finish(self, ctx):
+        pass
+
+
+def _unary(tokens, i):
+    """Whether the +, -, ! or ~ at i is a prefix operator"""
+    before = tokens[i - 1] if i > 0 else None
+    return (before is None or before.kind in (NEWLINE, INDENT, DEDENT, KEYWORD)
+            or before.kind == OPERATOR and before.value not in (")", "]", "}"))
+
+
+def left_operand(tokens, i):
+    """First index of the multiplicative operand ending at i"""
+    first = postfix_start(tokens, i)
+    while first > 0:
+        while first > 0 and tokens[first - 1].value in ("-", "+", "!", "~") and _unary(tokens, first - 1):
+            first -= 1
+        before = tokens[first - 1]
+        if before.kind != OPERATOR or before.value not in ("*", "/", "%", "**"):
+            break
+        previous = postfix_start(tokens, first - 2)
+        if previous < 0:
+            break
+        first = previous
+    return first
+
+
+class FloatModulo(Rule):
+    name = "float-modulo"
+    summary = "x % 1.0 -> fmod(x, 1.0)"
+    triggers = ("%", "%=")
+
+    def visit(self, ctx, i):
+        tokens = ctx.tokens
+        if tokens[i].kind != OPERATOR:
+            return
+        right = i + 1
+        if tokens[right].value == "-" and tokens[right].kind == OPERATOR:
+            right += 1
+        if not is_float_literal(tokens[right]) or tokens[right + 1].value in (".", "(", "[", "**"):
+            return
+        divisor = ctx.source(i + 1, right)
+        if tokens[i].value == "%=":
+            first = statement_start(tokens, i)
+            if postfix_start(tokens, i - 1) != first:
+                return
+            target = ctx.source(first, i - 1)
+            ctx.edit(self.name, first, right, "%s = fmod(%s, %s)" % (target, target, divisor))
+            return
+        first = left_operand(tokens, i - 1)
+        if first < 0 or tokens[first].kind == STRING:
+            return
+        if tokens[first].value == "(" and matching_close(tokens, first) == i - 1:
+            dividend = ctx.source(first + 1, i - 2)
+        else:
+            dividend = ctx.source(first, i - 1)
+        ctx.edit(self.name, first, right, "fmod(%s, %s)" % (dividend, divisor))
+
+
+class CsgCone(Rule):
+    name = "csg-cone"
+    summary = "CSGCone3D -> CSGCylinder3D with cone = true"
+    triggers = ("CSGCone3D",)
+
+    def visit(self, ctx, i):
+        tokens = ctx.tokens
+        if tokens[i].kind != NAME:
+            return
+        ctx.edit(self.name, i, i, "CSGCylinder3D")
+        if [t.value for t in tokens[i + 1:i + 5]] != [".", "new", "(", ")"]:
+            return
+        first = statement_start(tokens, i)
+        target = first + 1 if tokens[first].value == "var" else first
+        if tokens[target].kind == NAME and tokens[target + 1].value in ("=", ":=", ":"):
+            ctx.cones.add((ctx.function if tokens[first].value == "var" or (ctx.function, tokens[target].value)
+                           in ctx.declared else None, tokens[target].value))
+            ctx.insert_after_statement(self.name, i, tokens[target].value + ".cone = true")
+
+
+def property_site(ctx, i):
+    """(receiver first, receiver last, value first, value last) of `recv.prop`
+    at i; the value range is None unless the statement is `recv.prop = value`"""
+    tokens = ctx.tokens
+    if i < 2 or tokens[i - 1].value != "." or tokens[i - 1].kind != OPERATOR:
+        return None
+    first = postfix_start(tokens, i - 2)
+    if first < 0:
+        return None
+    if tokens[i + 1].value == "=" and statement_start(tokens, i) == first:
+        return first, i - 2, i + 2, statement_end(tokens, i) - 1
+    return first, i - 2, None, None
+
+
+class CsgCylinderRadius(Rule):
+    name = "csg-cylinder-radius"
+    summary = "radius_top/radius_bottom on CSGCylinder3D -> radius, cone"
+    triggers = ("radius_top", "radius_bottom", "top_radius", "bottom_radius")
+
+    def visit(self, ctx, i):
+        site = property_site(ctx, i)
+        if site:
+            ctx.pending.setdefault(self.name, []).append((i, site, ctx.scope()))
+
+    def finish(self, ctx):
+        groups = {}
+        for i, (first, last, value_first, value_last), scope in ctx.pending.get(self.name, []):
+            if ctx.receiver_type(first, last, scope) != "CSGCylinder3D":
+                continue
+            if value_first is None:
+                ctx.edit(self.name, i, i, "radius")
+                continue
+            receiver = ctx.source(first, last)
+            side = "top" if "top" in ctx.tokens[i].value else "bottom"
+            groups.setdefault((scope[0], receiver), {"top": [], "bottom": []})[side].append((i, value_first, value_last))
+        for (function, receiver), sides in groups.items():
+            cone_known = (function, receiver) in ctx.cones or (None, receiver) in ctx.cones
+            tops, bottoms = sides["top"], sides["bottom"]
+            for n in range(max(len(tops), len(bottoms))):
+                top = tops[n] if n < len(tops) else None
+                bottom = bottoms[n] if n < len(bottoms) else None
+                self.rewrite(ctx, top, bottom, cone_known)
+
+    def rewrite(self, ctx, top, bottom, cone_known):
+        top_value = ctx.source(top[1], top[2]) if top else None
+        if top and _ZERO.match(top_value):
+            # A cone: the bottom radius is the base, the tip is the cone flag
+            if cone_known:
+                ctx.remove_statement(self.name, top[0])
+            else:
+                ctx.edit(self.name, top[0], top[2], "cone = true")
+            if bottom:
+                ctx.edit(self.name, bottom[0], bottom[0], "radius")
+            return
+        if top:
+            ctx.edit(self.name, top[0], top[0], "radius")
+        if bottom and top:
+            bottom_value = ctx.source(bottom[1], bottom[2])
+            if bottom_value != top_value:
+                ctx.note(self.name, bottom[0], "bottom radius %s dropped, CSGCylinder3D has one radius" % bottom_value)
+            ctx.remove_statement(self.name, bottom[0])
+        elif bottom:
+            ctx.edit(self.name, bottom[0], bottom[0], "radius")
+
+
+class CylinderMeshRadius(Rule):
+    name = "cylinder-mesh-radius"
+    summary = "radius_top/radius_bottom/radius on CylinderMesh -> top_radius/bottom_radius"
+    triggers = ("radius_top", "radius_bottom", "radius")
+
+    def visit(self, ctx, i):
+        site = property_site(ctx, i)
+        if site:
+            ctx.pending.setdefault(self.name, []).append((i, site, ctx.scope()))
+
+    def finish(self, ctx):
+        for i, (first, last, value_first, _value_last), scope in ctx.pending.get(self.name, []):
+            if ctx.receiver_type(first, last, scope) != "CylinderMesh":
+                continue
+            prop = ctx.tokens[i].value
+            if prop != "radius":
+                ctx.edit(self.name, i, i, "top_radius" if prop == "radius_top" else "bottom_radius")
+            elif value_first is not None:
+                ctx.edit(self.name, i, i, "top_radius")
+                ctx.insert_after_statement(self.name, i, "%s.bottom_radius = %s.top_radius"
+                                           % ((ctx.source(first, last),) * 2))
+            else:
+                ctx.edit(self.name, i, i, "top_radius")
+
+
+class CsgCylinderSize(Rule):
+    name = "csg-cylinder-size"
+    summary = "size.y on CSGCylinder3D -> height"
+    triggers = ("size",)
+
+    def visit(self, ctx, i):
+        site = property_site(ctx, i)
+        if site:
+            ctx.pending.setdefault(self.name, []).append((i, site, ctx.scope()))
+
+    def finish(self, ctx):
+        tokens = ctx.tokens
+        for i, (first, last, _value_first, _value_last), scope in ctx.pending.get(self.name, []):
+            if ctx.receiver_type(first, last, scope) != "CSGCylinder3D":
+                continue
+            if tokens[i + 1].value == "." and tokens[i + 2].value == "y":
+                ctx.edit(self.name, i, i + 2, "height")
+            else:
+                ctx.note(self.name, i, "CSGCylinder3D has no size; use radius and height")
+
+
+def lookup_sites(tokens, first, last):
+    """(first, last, path) of every $Path, %Name and get_node("path") /
+    get_node_or_null("path") on self in first..last"""
+    for i in range(first, last + 1):
+        token = tokens[i]
+        if token.kind == NODE_PATH:
+            yield i, i, node_path_text(token)
+        elif (token.value in ("get_node", "get_node_or_null") and token.kind == NAME
+              and tokens[i + 1].value == "(" and tokens[i + 2].kind == STRING
+              and tokens[i + 2].value[0] in "\"'" and tokens[i + 3].value == ")"):
+            if tokens[i - 1].value != ".":
+                yield i, i + 3, tokens[i + 2].value[1:-1]
+            elif tokens[i - 2].value == "self" and tokens[i - 3].value != ".":
+                yield i - 2, i + 3, tokens[i + 2].value[1:-1]
+
+
+def member_name(path):
+    """snake_case member name for the node a path ends at"""
+    leaf = path.rstrip("/").rsplit("/", 1)[-1].lstrip("%")
+    if not leaf or leaf in (".", ".."):
+        return None
+    name = _WORD_BREAK.sub("_", leaf).lower()
+    name = re.sub(r"\W+", "_", name).strip("_")
+    if not name:
+        return None
+    return "_" + name if name[0].isdigit() else name
+
+
+class OnreadyNodeCache(Rule):
+    name = "onready-node-cache"
+    summary = "$Path / get_node(\"path\") in per-frame code -> @onready var"
+
+    def finish(self, ctx):
+        if not any(callback in ctx.text for callback in FRAME_CALLBACKS):
+            return
+        tokens = ctx.tokens
+        lint = ScriptLint(ctx.rel, ctx.text, tokens)
+        hot = [key for key in lint.rates() if not key[0] and tokens[lint.functions[key][0] - 1].value != "static"]
+        if not hot:
+            return
+        # @onready vars are still null in _init, _enter_tree and setters
+        # run while the scene loads; leave code reachable from those alone
+        early = [key for key in lint.functions if not key[0] and key[1] in ("_init", "_enter_tree", "_notification")]
+        early += [("", tokens[i + 2].value) for i in range(len(tokens) - 2)
+                  if tokens[i].value in ("set", "get") and tokens[i + 1].value == "=" and tokens[i + 2].kind == NAME]
+        early = reachable(lint, early)
+
+        unsafe = set()
+        for first, last in lint.functions.values():
+            for site_first, _site_last, path in lookup_sites(tokens, first, last):
+                statement = tokens[statement_start(tokens, site_first):statement_end(tokens, site_first)]
+                if any(t.value in NODE_MUTATORS for t in statement):
+                    unsafe.add(path)
+        sites = {}
+        for key in hot:
+            if key in early:
+                continue
+            first, last = lint.functions[key]
+            body = statement_end(tokens, first)
+            for site in lookup_sites(tokens, body, last):
+                if site[2] not in unsafe:
+                    sites.setdefault(site[2], []).append(site)
+        if not sites:
+            return
+
+        cached = self.cached_members(ctx)
+        used = {t.value for t in tokens if t.kind == NAME}
+        script_res = to_res(ctx.rel)
+        declarations = []
+        hoisted = []
+        for path in sorted(sites, key=lambda p: sites[p][0][0]):
+            name = cached.get(path)
+            if name is None:
+                cls = ctx.scene_types.node_class(script_res, path)
+                name = member_name(path)
+                if cls is None or name is None:
+                    continue
+                if name in used:
+                    name += "_node"
+                if name in used:
+                    ctx.note(self.name, sites[path][0][0], "no free member name to cache %s" % path)
+                    continue
+                used.add(name)
+                cls = LEGACY_TYPES.get(cls, cls)
+                missing = sorted({tokens[last + 2].value for _first, last, _path in sites[path]
+                                  if tokens[last + 1].value == "."} & set(MISSING_PROPERTIES.get(cls, ())))
+                if missing:
+                    ctx.note(self.name, sites[path][0][0], "%s has no %s; %s left untyped"
+                             % (cls, ", ".join(missing), name))
+                    cls = ""
+                hint = ": " + cls if cls else ""
+                declarations.append("@onready var %s%s = %s" % (name, hint, node_path_literal(path)))
+            for first, last, _path in sites[path]:
+                ctx.edit(self.name, first, last, name)
+            hoisted.append(path)
+        anchor = member_anchor(tokens)
+        if declarations and anchor is None:
+            ctx.edits = [edit for edit in ctx.edits if edit.rule != self.name]
+            ctx.note(self.name, 0, "no place for @onready vars before the first func")
+            return
+        if declarations:
+            newline = "\r\n" if "\r\n" in ctx.text else "\n"
+            end = tokens[anchor]
+            ctx.edits.append(Edit(end.start, end.start, "".join(newline + d for d in declarations),
+                                  self.name, end.line))
+        if hoisted:
+            lookups = sum(len(sites[path]) for path in hoisted)
+            ctx.note(self.name, sites[hoisted[0]][0][0], "%d lookups of %d nodes cached (%d new @onready vars)"
+                     % (lookups, len(hoisted), len(declarations)))
+
+    def cached_members(self, ctx):
+        """path -> name of the `@onready var name = $Path` members never reassigned"""
+        tokens = ctx.tokens
+        cached = {}
+        for i, token in enumerate(tokens):
+            if token.value != "@onready" or token.col != 1 or tokens[i + 1].value != "var":
+                continue
+            name = tokens[i + 2].value
+            end = statement_end(tokens, i)
+            j = next((j for j in range(i + 3, end) if tokens[j].value in ("=", ":=")), None)
+            fact = ctx.node_fact(j + 1, end - 1) if j else None
+            if fact and len(ctx.declared.get((None, name), ())) == 1:
+                cached.setdefault(fact[1], name)
+        return cached
+
+
+def reachable(lint, keys):
+    """Functions of the script called, transitively, from keys"""
+    seen = set(keys)
+    pending = [key for key in keys if key in lint.functions]
+    while pending:
+        for callee, _i in lint.calls(pending.pop()):
+            if callee not in seen:
+                seen.add(callee)
+                pending.append(callee)
+    return seen
+
+
+def member_anchor(tokens):
+    """Index of the NEWLINE after the last top-level member statement
+    (extends, class_name, var, const, signal, enum) before the first func"""
+    anchor = None
+    for i, token in enumerate(tokens):
+        if token.col != 1 or (i and tokens[i - 1].kind not in (NEWLINE, DEDENT)):
+            continue
+        if token.value in ("func", "static", "class") or token.kind == EOF:
+            break
+        if token.value in ("extends", "class_name", "var", "const", "signal", "enum") or token.kind == ANNOTATION:
+            end = statement_end(tokens, i)
+            if tokens[end].kind == NEWLINE and tokens[end + 1].kind != INDENT:
+                anchor = end
+    return anchor
+
+
+def node_path_literal(path):
+    if _PLAIN_PATH.match(path):
+        return path if path.startswith("%") else "$" + path
+    return '$"%s"' % path
+
+
+RULES = [FloatModulo(), CsgCone(), CsgCylinderRadius(), CylinderMeshRadius(), CsgCylinderSize(), OnreadyNodeCache()]
+
+
+def fix_script(ctx, rules):
+    """Run the rules over one script in a single pass; returns the edits
+    that apply, overlapping ones after the first left for the next run"""
+    dispatch = {}
+    for rule in rules:
+        for trigger in rule.triggers:
+            dispatch.setdefault(trigger, []).append(rule.visit)
+    ctx.walk(dispatch)
+    for rule in rules:
+        rule.finish(ctx)
+
+    applied = []
+    end = -1
+    for edit in sorted(ctx.edits, key=lambda e: (e.start, e.end)):
+        if edit.start < end:
+            ctx.notes.append((edit.line, edit.rule, "overlaps another fix, run again"))
+            continue
+        applied.append(edit)
+        end = max(end, edit.end)
+    return applied
+
+
+def apply_edits(text, edits):
+    for edit in sorted(edits, key=lambda e: e.start, reverse=True):
+        text = text[:edit.start] + edit.text + text[edit.end:]
+    return text
+
+
+def shorten(text, width=70):
+    text = " ".join(text.split()) if text.strip() else repr(text)
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply token-based Godot 4 fixes to GDScript files")
+    parser.add_argument("paths", nargs="*", help="project-relative folders or scripts (default: all)")
+    parser.add_argument("--rules", help="comma-separated rules to run (default: all)")
+    parser.add_argument("--write", action="store_true", help="rewrite the scripts")
+    parser.add_argument("--diff", action="store_true", help="print a unified diff instead of the fix list")
+    parser.add_argument("--check", action="store_true", help="exit with 1 if any fix applies")
+    parser.add_argument("--list-rules", action="store_true", help="list the rules and exit")
+    parser.add_argument("--root", default=PROJECT_ROOT, help="project root")
+    args = parser.parse_args(argv)
+
+    if args.list_rules:
+        for rule in RULES:
+            print(f"{rule.name:<22} {rule.summary}")
+        return 0
+    rules = RULES
+    if args.rules:
+        names = [name.strip() for name in args.rules.split(",")]
+        unknown = [name for name in names if name not in {rule.name for rule in RULES}]
+        if unknown:
+            parser.error("unknown rule(s): %s" % ", ".join(unknown))
+        rules = [rule for rule in RULES if rule.name in names]
+
+    start = time.monotonic()
+    scope = [p.strip("/") for p in args.paths]
+    scripts = [rel for rel in iter_project_files(".gd", args.root)
+               if not scope or any(rel == p or rel.startswith(p + "/") for p in scope)]
+    cache = TokenCache(args.root)
+    scene_types = SceneTypes(args.root)
+    counts = {rule.name: 0 for rule in rules}
+    changed = 0
+    failed = []
+    for rel in scripts:
+        try:
+            text, tokens = cache.tokens(rel)
+        except LexError as exc:
+            failed.append((rel, str(exc)))
+            continue
+        ctx = ScriptContext(rel, text, tokens, scene_types)
+        edits = fix_script(ctx, rules)
+        for line, rule, message in sorted(ctx.notes):
+            print(f"{rel}:{line} [{rule}] note: {message}")
+        if not edits:
+            continue
+        changed += 1
+        fixed = apply_edits(text, edits)
+        for edit in edits:
+            counts[edit.rule] += 1
+        if args.diff:
+            sys.stdout.writelines(difflib.unified_diff(text.splitlines(True), fixed.splitlines(True),
+                                                       "a/" + rel, "b/" + rel))
+        else:
+            for edit in edits:
+                print(f"{rel}:{edit.line} [{edit.rule}] {shorten(text[edit.start:edit.end])} -> {shorten(edit.text)}")
+        if args.write:
+            with open(os.path.join(args.root, rel), "w", encoding="utf-8", newline="") as f:
+                f.write(fixed)
+    cache.save()
+
+    print("=" * 60)
+    print(f"{len(scripts)} scripts, {changed} with fixes "
+          f"({cache.hits} token streams cached, {cache.misses} tokenized)")
+    for name, count in counts.items():
+        print(f"  {name:<22} {count}")
+    for rel, message in failed:
+        print(f"  could not tokenize {rel}: {message}")
+    print(f"{'Wrote' if args.write else 'Dry run, nothing written;'} done in {time.monotonic() - start:.1f}s")
+    print("=" * 60)
+    return 1 if args.check and changed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,650 @@
+#!/usr/bin/env python3
+"""
+Incremental symbol index of the project's GDScript, in SQLite.
+
+Every script is read through the shared tokenizer (gdscript_tokens) and
+recorded with:
+- class_name, extends (class name or script path) and @tool
+- symbols: func signatures (params, return type, static, line range),
+  signals, member var/const with their annotations (@export..., @onready),
+  declared or inferred type and initializer, enums and inner classes, and
+  @export_group/@export_subgroup/@export_category as "section" symbols
+  (they start an inspector section, they do not annotate the next member)
+- node_refs: every literal $Path, %Name and get_node("...") path
+- member_uses: `recv.prop` reads and writes where recv is known to be a
+  node path or of a class (`var x: T`, `T.new()`, `as T`, `if x is T:`,
+  `@onready var x = $Path`)
+
+Scenes come from scene_inventory (resolved node types and attached
+scripts), and node_targets joins the two: for each literal path in a
+script, the node and type it reaches in every scene the script is
+attached to.
+
+A script is re-indexed when its sha256 changes; a scene when its sha256
+or that of a file its types were resolved through changes. The database
+defaults to .godot/gdscript_index.sqlite next to the token cache.
+
+Usage:
+    python gdscript_index.py update                          # incremental; --force rebuilds
+    python gdscript_index.py touches size --type CSGCylinder3D
+    python gdscript_index.py show algorithms/chaos/lorenz/lorenz.gd
+    python gdscript_index.py find _on_body_entered --kind func
+    python gdscript_index.py extends Node3D                  # scripts deriving from a class
+    python gdscript_index.py sql "SELECT name, COUNT(*) FROM symbols GROUP BY name ORDER BY 2 DESC LIMIT 10"
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import sqlite3
+import sys
+import time
+
+import scene_inventory
+from gdscript_tokens import (ANNOTATION, DEDENT, EOF, INDENT, KEYWORD, NAME, NEWLINE, NODE_GETTERS, NODE_PATH,
+                             OPERATOR, STRING, LexError, ScriptWalker, TokenCache, matching_close, matching_open,
+                             node_path_text, postfix_start, statement_end, statement_start)
+from godot_resources import (PROJECT_ROOT, build_uid_index, from_res, iter_project_files, join_node_path,
+                             resolve_relative, to_res)
+
+DEFAULT_DB = ".godot/gdscript_index.sqlite"
+SCRIPT_ANNOTATIONS = ("@tool", "@icon", "@static_unload")
+SECTION_ANNOTATIONS = ("@export_group", "@export_subgroup", "@export_category")
+ASSIGNMENTS = ("=", "+=", "-=", "*=", "/=", "%=", "**=", "&=", "|=", "^=", "<<=", ">>=")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scripts (
+    path TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    class_name TEXT,
+    extends TEXT,
+    tool INTEGER NOT NULL DEFAULT 0,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    script TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    end_line INTEGER,
+    signature TEXT,
+    type TEXT,
+    annotations TEXT,
+    value TEXT,
+    static INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS node_refs (
+    script TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    function TEXT,
+    path TEXT NOT NULL,
+    via TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS member_uses (
+    script TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    function TEXT,
+    receiver TEXT NOT NULL,
+    node_path TEXT,
+    class TEXT,
+    certain INTEGER NOT NULL,
+    property TEXT NOT NULL,
+    write INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scenes (
+    path TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    dependencies TEXT NOT NULL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS scene_nodes (
+    scene TEXT NOT NULL,
+    node TEXT NOT NULL,
+    type TEXT,
+    script TEXT,
+    unique_name INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS node_targets (
+    script TEXT NOT NULL,
+    path TEXT NOT NULL,
+    scene TEXT NOT NULL,
+    node TEXT,
+    type TEXT
+);
+CREATE INDEX IF NOT EXISTS scripts_extends ON scripts (extends);
+CREATE INDEX IF NOT EXISTS scripts_class_name ON scripts (class_name);
+CREATE INDEX IF NOT EXISTS symbols_script ON symbols (script);
+CREATE INDEX IF NOT EXISTS symbols_name ON symbols (name, kind);
+CREATE INDEX IF NOT EXISTS node_refs_script ON node_refs (script, path);
+CREATE INDEX IF NOT EXISTS member_uses_property ON member_uses (property, class);
+CREATE INDEX IF NOT EXISTS member_uses_script ON member_uses (script, node_path);
+CREATE INDEX IF NOT EXISTS scene_nodes_scene ON scene_nodes (scene, node);
+CREATE INDEX IF NOT EXISTS scene_nodes_script ON scene_nodes (script);
+CREATE INDEX IF NOT EXISTS node_targets_lookup ON node_targets (script, path);
+CREATE INDEX IF NOT EXISTS node_targets_type ON node_targets (type);
+"""
+
+
+def open_db(path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    return db
+
+
+def block_end(tokens, i):
+    """Index of the last token of the statement at i and the block it opens"""
+    end = statement_end(tokens, i)
+    if tokens[end + 1].kind != INDENT:
+        return end - 1
+    depth = 0
+    j = end + 1
+    while tokens[j].kind != EOF:
+        if tokens[j].kind == INDENT:
+            depth += 1
+        elif tokens[j].kind == DEDENT:
+            depth -= 1
+            if depth == 0:
+                break
+        j += 1
+    while tokens[j - 1].kind in (NEWLINE, DEDENT, INDENT):
+        j -= 1
+    return j - 1
+
+
+def annotations_before(walker, i):
+    """@annotations (with arguments) that apply to the statement at i; a
+    section annotation ends them, it stands on its own"""
+    tokens = walker.tokens
+    found = []
+    j = i - 1
+    while j >= 0:
+        token = tokens[j]
+        if token.kind == NEWLINE:
+            j -= 1
+            continue
+        if token.kind == OPERATOR and token.value == ")":
+            opening = matching_open(tokens, j)
+            if opening > 0 and tokens[opening - 1].kind == ANNOTATION:
+                if tokens[opening - 1].value in SECTION_ANNOTATIONS:
+                    break
+                found.append(walker.source(opening - 1, j))
+                j = opening - 2
+                continue
+            break
+        if token.kind != ANNOTATION or token.value in SECTION_ANNOTATIONS:
+            break
+        found.append(token.value)
+        j -= 1
+    return " ".join(a for a in reversed(found) if not a.startswith(SCRIPT_ANNOTATIONS))
+
+
+def type_name(walker, i):
+    """Dotted type name starting at i (Array[int] keeps its subscript)"""
+    tokens = walker.tokens
+    if tokens[i].kind not in (NAME, KEYWORD):
+        return None, i
+    j = i
+    while tokens[j + 1].value == "." and tokens[j + 2].kind == NAME:
+        j += 2
+    if tokens[j + 1].value == "[":
+        j = matching_close(tokens, j + 1)
+    return walker.source(i, j), j
+
+
+class ScriptIndexer:
+    """Symbol rows of one script, collected in a single walk"""
+
+    def __init__(self, res_path, text, tokens):
+        self.res_path = res_path
+        self.walker = ScriptWalker(text, tokens)
+        self.class_name = None
+        self.extends = None
+        self.tool = False
+        self.symbols = []
+        self.node_refs = []
+        self.member_uses = []
+
+    def run(self):
+        by_value = {
+            "class_name": [self.visit_class_name],
+            "extends": [self.visit_extends],
+            "func": [self.visit_func],
+            "signal": [self.visit_signal],
+            "var": [self.visit_var],
+            "const": [self.visit_var],
+            "enum": [self.visit_enum],
+            "class": [self.visit_class],
+            "@tool": [self.visit_tool],
+            ".": [self.visit_member],
+        }
+        for section in SECTION_ANNOTATIONS:
+            by_value[section] = [self.visit_section]
+        for getter in NODE_GETTERS:
+            by_value[getter] = [self.visit_get_node]
+        self.walker.walk(by_value, {NODE_PATH: [self.visit_node_path]})
+        return self
+
+    def symbol(self, kind, name, i, end=None, signature=None, type_=None, annotations=None, value=None,
+               static=False, owner=None):
+        tokens = self.walker.tokens
+        owner = self.walker.owner if owner is None else owner
+        self.symbols.append((self.res_path, owner, kind, name, tokens[i].line,
+                             tokens[end].line if end is not None else tokens[i].line,
+                             signature, type_, annotations or None, value, int(static)))
+
+    @staticmethod
+    def at_statement_start(tokens, i):
+        return i == 0 or tokens[i - 1].kind in (NEWLINE, INDENT, DEDENT) or tokens[i - 1].kind == ANNOTATION
+
+    def visit_tool(self, walker, i):
+        if walker.tokens[i].kind == ANNOTATION:
+            self.tool = True
+
+    def visit_class_name(self, walker, i):
+        tokens = walker.tokens
+        if tokens[i].kind == KEYWORD and tokens[i + 1].kind == NAME and self.class_name is None:
+            self.class_name = tokens[i + 1].value
+
+    def visit_extends(self, walker, i):
+        tokens = walker.tokens
+        if tokens[i].kind != KEYWORD or walker.classes or self.extends is not None:
+            return
+        if tokens[i + 1].kind == STRING:
+            self.extends = resolve_relative(tokens[i + 1].value[1:-1], self.res_path)
+        else:
+            self.extends = type_name(walker, i + 1)[0]
+
+    def visit_func(self, walker, i):
+        tokens = walker.tokens
+        if tokens[i].kind != KEYWORD or tokens[i + 1].kind != NAME or tokens[i + 2].value != "(":
+            return
+        close = matching_close(tokens, i + 2)
+        returns = None
+        if tokens[close + 1].value == "->":
+            returns = type_name(walker, close + 2)[0]
+        static = i > 0 and tokens[i - 1].value == "static"
+        signature = walker.source(i + 2, close)
+        self.symbol("func", tokens[i + 1].value, i, block_end(tokens, i), signature, returns,
+                    annotations_before(walker, i - static), static=static)
+
+    def visit_signal(self, walker, i):
+        tokens = walker.tokens
+        if tokens[i].kind != KEYWORD or tokens[i + 1].kind != NAME:
+            return
+        signature = None
+        if tokens[i + 2].value == "(":
+            signature = walker.source(i + 2, matching_close(tokens, i + 2))
+        self.symbol("signal", tokens[i + 1].value, i, signature=signature)
+
+    def visit_var(self, walker, i):
+        tokens = walker.tokens
+        if walker.function is not None or tokens[i + 1].kind != NAME:
+            return
+        j = i + 2
+        declared = None
+        if tokens[j].value == ":" and tokens[j + 1].kind in (NAME, KEYWORD):
+            declared, j = type_name(walker, j + 1)
+            j += 1
+        value = None
+        if tokens[j].value in ("=", ":="):
+            end = statement_end(tokens, j)
+            # Properties with setget blocks end at the ":" of `set`/`get`
+            last = end - 1
+            if tokens[last].value == ":":
+                last -= 1
+            if last > j:
+                value = walker.source(j + 1, last)
+                fact = walker.expression_type(j + 1, last)
+                if declared is None and isinstance(fact, str):
+                    declared = fact
+        static = i > 0 and tokens[i - 1].value == "static"
+        self.symbol(tokens[i].value, tokens[i + 1].value, i, signature=None, type_=declared,
+                    annotations=annotations_before(walker, i - static),
+                    value=value[:200] if value else None, static=static)
+
+    def visit_section(self, walker, i):
+        tokens = walker.tokens
+        if tokens[i].kind != ANNOTATION or tokens[i + 1].value != "(":
+            return
+        close = matching_close(tokens, i + 1)
+        label = tokens[i + 2].value[1:-1] if tokens[i + 2].kind == STRING else ""
+        self.symbol("section", label, i, close, annotations=tokens[i].value,
+                    value=walker.source(i + 2, close - 1) if close > i + 2 else None)
+
+    def visit_enum(self, walker, i):
+        tokens = walker.tokens
+        name = tokens[i + 1].value if tokens[i + 1].kind == NAME else ""
+        brace = i + 2 if name else i + 1
+        end = matching_close(tokens, brace) if tokens[brace].value == "{" else brace
+        self.symbol("enum", name, i, end, value=walker.source(brace, end) if end > brace else None)
+
+    def visit_class(self, walker, i):
+        tokens = walker.tokens
+        if tokens[i].kind != KEYWORD or tokens[i + 1].kind != NAME:
+            return
+        base = type_name(walker, i + 3)[0] if tokens[i + 2].value == "extends" else None
+        # The walker has already entered the class; record it under its parent
+        owner = walker.classes[-2][1] if len(walker.classes) > 1 else ""
+        self.symbol("class", tokens[i + 1].value, i, block_end(tokens, i), type_=base, owner=owner)
+
+    def visit_node_path(self, walker, i):
+        token = walker.tokens[i]
+        via = "%" if token.value.startswith("%") else "$"
+        self.node_refs.append((self.res_path, token.line, walker.function, node_path_text(token), via))
+
+    def visit_get_node(self, walker, i):
+        tokens = walker.tokens
+        if (tokens[i + 1].value == "(" and tokens[i + 2].kind == STRING and tokens[i + 2].value[0] in "\"'"
+                and tokens[i + 3].value == ")" and (i == 0 or tokens[i - 1].value != "func")):
+            self.node_refs.append((self.res_path, tokens[i].line, walker.function, tokens[i + 2].value[1:-1],
+                                   tokens[i].value))
+
+    def visit_member(self, walker, i):
+        tokens = walker.tokens
+        if tokens[i].kind != OPERATOR or tokens[i + 1].kind != NAME or i == 0:
+            return
+        first = postfix_start(tokens, i - 1)
+        if first < 0:
+            return
+        facts = walker.receiver_facts(first, i - 1, walker.scope())
+        known = [fact for fact in facts if fact is not None]
+        if not known:
+            return
+        write = tokens[i + 2].value in ASSIGNMENTS and statement_start(tokens, i) == first
+        receiver = walker.source(first, i - 1)
+        certain = int(len(facts) == 1)
+        for fact in known:
+            node_path, class_ = (fact[1], None) if isinstance(fact, tuple) else (None, fact)
+            self.member_uses.append((self.res_path, tokens[i].line, walker.function, receiver, node_path,
+                                     class_, certain, tokens[i + 1].value, int(write)))
+
+
+def index_scripts(db, root, force=False, cache=None):
+    """Re-index the scripts whose hash changed; returns (indexed, removed, errors)"""
+    stored = dict(db.execute("SELECT path, sha256 FROM scripts"))
+    current = {}
+    for rel in iter_project_files(".gd", root):
+        current[to_res(rel)] = scene_inventory.file_hash(os.path.join(root, rel))
+    stale = [res for res, digest in current.items() if force or stored.get(res) != digest]
+    removed = [res for res in stored if res not in current]
+    cache = cache or TokenCache(root)
+    errors = 0
+    for res in stale + removed:
+        for table, column in (("scripts", "path"), ("symbols", "script"), ("node_refs", "script"),
+                              ("member_uses", "script")):
+            db.execute(f"DELETE FROM {table} WHERE {column} = ?", (res,))
+    for res in stale:
+        try:
+            text, tokens = cache.tokens(from_res(res))
+        except LexError as exc:
+            db.execute("INSERT INTO scripts (path, sha256, error) VALUES (?, ?, ?)", (res, current[res], str(exc)))
+            errors += 1
+            continue
+        indexer = ScriptIndexer(res, text, tokens).run()
+        db.execute("INSERT INTO scripts VALUES (?, ?, ?, ?, ?, NULL)",
+                   (res, current[res], indexer.class_name, indexer.extends, int(indexer.tool)))
+        db.executemany("INSERT INTO symbols VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", indexer.symbols)
+        db.executemany("INSERT INTO node_refs VALUES (?, ?, ?, ?, ?)", indexer.node_refs)
+        db.executemany("INSERT INTO member_uses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", indexer.member_uses)
+    cache.save()
+    return len(stale), len(removed), errors
+
+
+def scene_rows(record):
+    """scene_nodes rows of a scene_inventory record"""
+    scene = to_res(record["scene"])
+    root_node = record.get("root_node")
+    if root_node is None:
+        return []
+    rows = [(scene, ".", root_node.get("type"), root_node.get("script"), int(bool(root_node.get("unique_name"))))]
+    for child in record.get("children", []):
+        parent = child.get("parent", ".")
+        node = child["name"] if parent == "." else parent + "/" + child["name"]
+        rows.append((scene, node, child.get("type"), child.get("script"), int(bool(child.get("unique_name")))))
+    return rows
+
+
+def index_scenes(db, root, jobs, force=False):
+    """Re-inventory the scenes whose own or dependency hashes changed"""
+    stored = {path: {"sha256": digest, "dependencies": json.loads(deps)}
+              for path, digest, deps in db.execute("SELECT path, sha256, dependencies FROM scenes")}
+    hashes = {}
+    current = []
+    stale = []
+    for rel in iter_project_files(".tscn", root):
+        res = to_res(rel)
+        digest = scene_inventory.file_hash(os.path.join(root, rel))
+        hashes[res] = digest
+        current.append(res)
+        if force or res not in stored or not scene_inventory.is_fresh(stored[res], digest, hashes, root):
+            stale.append(rel)
+    removed = [res for res in stored if res not in hashes]
+
+    records = []
+    if stale:
+        uid_index = build_uid_index(root)
+        if jobs > 1 and len(stale) > 1:
+            with concurrent.futures.ProcessPoolExecutor(jobs, initializer=scene_inventory._init_worker,
+                                                        initargs=(uid_index,)) as pool:
+                chunk = max(1, len(stale) // (jobs * 4))
+                records = list(pool.map(scene_inventory.inventory_scene, stale, [root] * len(stale),
+                                        chunksize=chunk))
+        else:
+            scene_inventory._init_worker(uid_index)
+            records = [scene_inventory.inventory_scene(rel, root) for rel in stale]
+    for res in removed + [to_res(r["scene"]) for r in records]:
+        db.execute("DELETE FROM scenes WHERE path = ?", (res,))
+        db.execute("DELETE FROM scene_nodes WHERE scene = ?", (res,))
+    for record in records:
+        db.execute("INSERT INTO scenes VALUES (?, ?, ?, ?)",
+                   (to_res(record["scene"]), record["sha256"], json.dumps(record["dependencies"]), record.get("error")))
+        db.executemany("INSERT INTO scene_nodes VALUES (?, ?, ?, ?, ?)", scene_rows(record))
+    return len(stale), len(removed)
+
+
+def link_node_targets(db):
+    """Rebuild node_targets: what each literal path of a script reaches"""
+    db.execute("DELETE FROM node_targets")
+    attached = {}
+    for scene, node, script in db.execute("SELECT scene, node, script FROM scene_nodes WHERE script IS NOT NULL"):
+        attached.setdefault(script, []).append((scene, node))
+    types = {(scene, node): type_ for scene, node, type_ in db.execute("SELECT scene, node, type FROM scene_nodes")}
+    uniques = {}
+    for scene, node in db.execute("SELECT scene, node FROM scene_nodes WHERE unique_name = 1"):
+        uniques[(scene, node.rsplit("/", 1)[-1])] = node
+    paths = db.execute("SELECT script, path FROM node_refs UNION "
+                       "SELECT script, node_path FROM member_uses WHERE node_path IS NOT NULL").fetchall()
+    rows = []
+    for script, path in paths:
+        for scene, base in attached.get(script, ()):
+            node = uniques.get((scene, path[1:])) if path.startswith("%") else join_node_path(base, path)
+            rows.append((script, path, scene, node, types.get((scene, node))))
+    db.executemany("INSERT INTO node_targets VALUES (?, ?, ?, ?, ?)", rows)
+    return len(rows)
+
+
+def update(db, root, jobs=1, force=False, cache=None):
+    scripts = index_scripts(db, root, force, cache)
+    scenes = index_scenes(db, root, jobs, force)
+    if scripts[0] or scripts[1] or scenes[0] or scenes[1]:
+        link_node_targets(db)
+    db.commit()
+    return scripts, scenes
+
+
+def script_arg(value):
+    return value if value.startswith("res://") else to_res(value.strip("/"))
+
+
+def timed(db, sql, params=()):
+    start = time.perf_counter()
+    rows = db.execute(sql, params).fetchall()
+    return rows, (time.perf_counter() - start) * 1000
+
+
+def cmd_update(args, db):
+    start = time.monotonic()
+    (indexed, removed, errors), (scenes, scenes_removed) = update(db, args.root, args.jobs, args.force)
+    counts = {table: db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+              for table in ("scripts", "symbols", "node_refs", "member_uses", "scene_nodes", "node_targets")}
+    print("=" * 60)
+    print(f"Scripts: indexed {indexed}, removed {removed}" + (f", {errors} could not be tokenized" if errors else ""))
+    print(f"Scenes:  indexed {scenes}, removed {scenes_removed}")
+    print("  " + ", ".join(f"{table} {count}" for table, count in counts.items()))
+    print(f"{args.db} updated in {time.monotonic() - start:.1f}s")
+    print("=" * 60)
+    return 0
+
+
+def cmd_touches(args, db):
+    certain = "" if args.possible else " AND u.certain = 1"
+    sql = ("SELECT u.script, u.line, u.receiver, u.write, u.certain, t.scene, t.node FROM member_uses u "
+           "JOIN node_targets t ON t.script = u.script AND t.path = u.node_path "
+           "WHERE u.property = ? AND t.type = ?" + certain + " "
+           "UNION ALL "
+           "SELECT u.script, u.line, u.receiver, u.write, u.certain, NULL, NULL FROM member_uses u "
+           "WHERE u.property = ? AND u.class = ?" + certain + " ORDER BY 1, 2")
+    rows, ms = timed(db, sql, (args.property, args.type) * 2)
+    for script, line, receiver, write, sure, scene, node in rows:
+        via = f" ({node} in {scene})" if scene else ""
+        maybe = "" if sure else " (possibly)"
+        print(f"{from_res(script)}:{line} {'writes' if write else 'reads'} {receiver}.{args.property}{via}{maybe}")
+    print(f"{len({r[0] for r in rows})} scripts, {len(rows)} uses of .{args.property} on {args.type} ({ms:.1f} ms)")
+    return 0
+
+
+def extends_chain(db, script):
+    """[script, base script, ..., native class] following extends"""
+    chain = [script]
+    seen = {script}
+    while True:
+        row = db.execute("SELECT extends FROM scripts WHERE path = ?", (chain[-1],)).fetchone()
+        base = row[0] if row else None
+        if not base:
+            return chain
+        if not base.startswith("res://"):
+            named = db.execute("SELECT path FROM scripts WHERE class_name = ?", (base,)).fetchone()
+            if named is None:
+                return chain + [base]
+            base = named[0]
+        if base in seen:
+            return chain + [base + " (cycle)"]
+        seen.add(base)
+        chain.append(base)
+
+
+def cmd_show(args, db):
+    script = script_arg(args.script)
+    row = db.execute("SELECT class_name, tool, error FROM scripts WHERE path = ?", (script,)).fetchone()
+    if row is None:
+        print(f"{script} is not indexed (run update)")
+        return 1
+    class_name, tool, error = row
+    print(script + (f"  class_name {class_name}" if class_name else "") + ("  @tool" if tool else ""))
+    if error:
+        print(f"  could not be tokenized: {error}")
+    print("  extends " + " -> ".join(extends_chain(db, script)[1:]))
+    for owner, kind, name, line, signature, type_, annotations, static in db.execute(
+            "SELECT owner, kind, name, line, signature, type, annotations, static FROM symbols "
+            "WHERE script = ? ORDER BY line", (script,)):
+        text = f"{'static ' if static else ''}{kind} {owner + '.' if owner else ''}{name}{signature or ''}"
+        if type_:
+            text += f" -> {type_}" if kind == "func" else f": {type_}"
+        print(f"  {line:>5}  {annotations + ' ' if annotations else ''}{text}")
+    targets = db.execute("SELECT DISTINCT r.path, t.type, COUNT(DISTINCT t.scene) FROM node_refs r "
+                         "LEFT JOIN node_targets t ON t.script = r.script AND t.path = r.path "
+                         "WHERE r.script = ? GROUP BY r.path, t.type ORDER BY r.path", (script,)).fetchall()
+    if targets:
+        print("  node paths:")
+        for path, type_, scenes in targets:
+            print(f"    {path:<40} {type_ or '?'}" + (f" ({scenes} scenes)" if scenes > 1 else ""))
+    return 0
+
+
+def cmd_find(args, db):
+    sql = "SELECT script, line, kind, owner, name, signature, type FROM symbols WHERE name = ?"
+    params = [args.name]
+    if args.kind:
+        sql += " AND kind = ?"
+        params.append(args.kind)
+    rows, ms = timed(db, sql + " ORDER BY script, line", params)
+    for script, line, kind, owner, name, signature, type_ in rows:
+        print(f"{from_res(script)}:{line} {kind} {owner + '.' if owner else ''}{name}{signature or ''}"
+              + (f" -> {type_}" if type_ else ""))
+    print(f"{len(rows)} definitions ({ms:.1f} ms)")
+    return 0 if rows else 1
+
+
+def cmd_extends(args, db):
+    # Scripts naming the class directly, by class_name or by path, and everything below them
+    sql = ("WITH RECURSIVE derived(path, class_name, depth) AS ("
+           "  SELECT path, class_name, 1 FROM scripts WHERE extends = ?"
+           "  UNION SELECT s.path, s.class_name, d.depth + 1 FROM derived d"
+           "  JOIN scripts s ON s.extends IN (d.path, d.class_name) WHERE d.depth < 32"
+           ") SELECT path, MIN(depth) FROM derived GROUP BY path ORDER BY 2, 1")
+    rows, ms = timed(db, sql, (args.base,))
+    for path, depth in rows:
+        print(f"{'  ' * (depth - 1)}{from_res(path)}")
+    print(f"{len(rows)} scripts extend {args.base} ({ms:.1f} ms)")
+    return 0
+
+
+def cmd_sql(args, db):
+    rows, ms = timed(db, args.query)
+    for row in rows:
+        print("\t".join("" if v is None else str(v) for v in row))
+    print(f"{len(rows)} rows ({ms:.1f} ms)", file=sys.stderr)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Incremental GDScript symbol index")
+    parser.add_argument("--db", help="SQLite index (default <root>/%s)" % DEFAULT_DB)
+    parser.add_argument("--root", default=PROJECT_ROOT, help="project root")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    upd = commands.add_parser("update", help="index changed scripts and scenes")
+    upd.add_argument("--force", action="store_true", help="re-index everything")
+    upd.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                     help="scene parser processes (default: CPU count)")
+
+    touches = commands.add_parser("touches", help="uses of a property on nodes or objects of a class")
+    touches.add_argument("property", help="property name, e.g. size")
+    touches.add_argument("--type", required=True, help="class, e.g. CSGCylinder3D")
+    touches.add_argument("--possible", action="store_true",
+                         help="include receivers that are of the class on only some paths")
+
+    show = commands.add_parser("show", help="symbols and node paths of one script")
+    show.add_argument("script", help="project-relative or res:// script path")
+
+    find = commands.add_parser("find", help="where a symbol is defined")
+    find.add_argument("name")
+    find.add_argument("--kind", choices=("func", "signal", "var", "const", "enum", "class", "section"))
+
+    ext = commands.add_parser("extends", help="scripts deriving from a class or script")
+    ext.add_argument("base", help="native class, class_name or res:// script path")
+
+    sql = commands.add_parser("sql", help="run a query against the index")
+    sql.add_argument("query")
+
+    args = parser.parse_args(argv)
+    args.db = args.db or os.path.join(args.root, DEFAULT_DB)
+    if args.command != "update" and not os.path.exists(args.db):
+        print(f"{args.db} does not exist; run: python gdscript_index.py update")
+        return 1
+    db = open_db(args.db)
+    handlers = {"update": cmd_update, "touches": cmd_touches, "show": cmd_show, "find": cmd_find,
+                "extends": cmd_extends, "sql": cmd_sql}
+    try:
+        return handlers[args.command](args, db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,534 @@
+#!/usr/bin/env python3
+"""
+GDScript lexer shared by the code rules (fix_gdscript.py and friends):
+- tokenize(): token stream with INDENT/DEDENT/NEWLINE like Godot's own
+  tokenizer, strings (quoted, triple-quoted, &"StringName", ^"NodePath",
+  r"raw"), numbers (hex, binary, underscores, exponents), operators,
+  $NodePath / %UniqueName, @annotations and keywords; comments are
+  dropped unless asked for
+- TokenCache: token streams keyed by file content hash, kept for the run
+  and in .godot/gdscript_token_cache.bin between runs
+- ScriptWalker: one traversal of a script tracking functions, blocks,
+  `is` checks and the declared types of its variables
+- small helpers rules use to walk statements and expressions
+
+Tokens carry character offsets into the source, so rules can rewrite
+exact spans and leave everything else (comments, spacing) untouched.
+
+Brackets suppress NEWLINE/INDENT like in Python, so a multi-line lambda
+passed as an argument is one logical line.
+"""
+
+import gc
+import hashlib
+import marshal
+import os
+import re
+import sys
+from collections import namedtuple
+
+from godot_resources import PROJECT_ROOT
+
+NAME = "NAME"
+KEYWORD = "KEYWORD"
+NUMBER = "NUMBER"
+STRING = "STRING"
+NODE_PATH = "NODE_PATH"
+ANNOTATION = "ANNOTATION"
+OPERATOR = "OP"
+NEWLINE = "NEWLINE"
+INDENT = "INDENT"
+DEDENT = "DEDENT"
+COMMENT = "COMMENT"
+EOF = "EOF"
+
+KEYWORDS = frozenset("""
+    and as assert await break breakpoint class class_name const continue elif else enum extends
+    false for func if in is match not null or pass preload return self signal static super true
+    var void when while yield
+""".split())
+
+Token = namedtuple("Token", "kind value start end line col")
+
+# Longest first so "**=" wins over "**" and "*"
+_OPERATORS = sorted("""
+    **= <<= >>= ** << >> == != <= >= && || += -= *= /= %= &= |= ^= -> := ..
+    + - * / % & | ^ ~ ! < > = . , : ; ( ) [ ] { } ?
+""".split(), key=len, reverse=True)
+
+# Plain strings may span lines too (Godot 4 accepts a raw newline in "...")
+_STRING = "".join([
+    r'[&^r]?(?:',
+    r'"""(?:[^"\\]|\\.|"(?!""))*"""',
+    r"|'''(?:[^'\\]|\\.|'(?!''))*'''",
+    r'|"(?:[^"\\]|\\.)*"',
+    r"|'(?:[^'\\]|\\.)*'",
+    r')',
+])
+_TOKEN = re.compile(r"""
+    (?P<ws>[ \t]+)
+  | (?P<comment>\#[^\n]*)
+  | (?P<cont>\\\r?\n)
+  | (?P<newline>\r?\n)
+  | (?P<string>%s)
+  | (?P<number>0[xX][0-9a-fA-F_]+|0[bB][01_]+|(?:\d[\d_]*(?:\.(?![A-Za-z_.])[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d[\d_]*)?)
+  | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<annotation>@[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<nodepath>\$(?:"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|(?:[A-Za-z0-9_]+|\.\.)(?:/(?:[A-Za-z0-9_]+|\.\.))*))
+  | (?P<op>%s)
+""" % (_STRING, "|".join(re.escape(op) for op in _OPERATORS)), re.X)
+_LEADING_WS = re.compile(r"[ \t]*")
+_UNIQUE_NAME = re.compile(r'%(?:"(?:[^"\\\n]|\\.)*"|[A-Za-z_][A-Za-z0-9_]*(?:/[A-Za-z0-9_]+)*)')
+
+_OPENING = {"(": ")", "[": "]", "{": "}"}
+_CLOSING = {")", "]", "}"}
+# After these, "%" and "." start an operand (unique name, .5) rather than an operator
+_OPERAND_FOLLOWS = frozenset({NAME, NUMBER, STRING, NODE_PATH})
+
+
+class LexError(ValueError):
+    def __init__(self, message, line, col):
+        super().__init__("%s at line %d, column %d" % (message, line, col))
+        self.line = line
+        self.col = col
+
+
+def tokenize(text, comments=False):
+    """Token list of a GDScript source; raises LexError on a stray character"""
+    tokens = []
+    indents = [0]
+    depth = 0
+    line = 1
+    line_start = 0
+    at_line_start = True
+    pos = 0
+    n = len(text)
+    if text.startswith("﻿"):
+        pos = 1
+
+    def emit(kind, value, start, end):
+        tokens.append(Token(kind, value, start, end, line, start - line_start + 1))
+
+    while pos < n:
+        if at_line_start and depth == 0:
+            # Measure indentation of the next logical line, skipping blank and comment lines
+            m = _LEADING_WS.match(text, pos)
+            width = len(m.group(0))
+            after = m.end()
+            if after >= n or text[after] in "\r\n#":
+                if after < n and text[after] == "#":
+                    end = text.find("\n", after)
+                    end = n if end == -1 else end
+                    if comments:
+                        emit(COMMENT, text[after:end].rstrip("\r"), after, end)
+                    after = end
+                if after < n:
+                    after += 1
+                    line += 1
+                    line_start = after
+                pos = after
+                continue
+            at_line_start = False
+            if width > indents[-1]:
+                indents.append(width)
+                emit(INDENT, "", pos, after)
+            else:
+                while width < indents[-1]:
+                    indents.pop()
+                    emit(DEDENT, "", after, after)
+                if width != indents[-1]:
+                    raise LexError("inconsistent dedent", line, width + 1)
+            pos = after
+            continue
+
+        c = text[pos]
+        if c == "%" and (not tokens or tokens[-1].kind not in _OPERAND_FOLLOWS
+                         and tokens[-1].value not in _CLOSING):
+            m = _UNIQUE_NAME.match(text, pos)
+            if m:
+                emit(NODE_PATH, m.group(0), pos, m.end())
+                pos = m.end()
+                continue
+        if c == "." and tokens and (tokens[-1].kind in _OPERAND_FOLLOWS or tokens[-1].value in _CLOSING):
+            emit(OPERATOR, ".", pos, pos + 1)
+            pos += 1
+            continue
+        m = _TOKEN.match(text, pos)
+        if m is None:
+            raise LexError("unexpected character %r" % c, line, pos - line_start + 1)
+        kind = m.lastgroup
+        value = m.group(0)
+        end = m.end()
+        if kind == "ws":
+            pass
+        elif kind == "comment":
+            if comments:
+                emit(COMMENT, value, pos, end)
+        elif kind == "cont":
+            line += 1
+            line_start = end
+        elif kind == "newline":
+            if depth == 0:
+                emit(NEWLINE, "\n", pos, end)
+                at_line_start = True
+            line += 1
+            line_start = end
+        elif kind == "string":
+            emit(STRING, value, pos, end)
+            newlines = value.count("\n")
+            if newlines:
+                line += newlines
+                line_start = pos + value.rfind("\n") + 1
+        elif kind == "name":
+            emit(KEYWORD if value in KEYWORDS else NAME, value, pos, end)
+        elif kind == "number":
+            emit(NUMBER, value, pos, end)
+        elif kind == "annotation":
+            emit(ANNOTATION, value, pos, end)
+        elif kind == "nodepath":
+            emit(NODE_PATH, value, pos, end)
+        else:
+            if value in _OPENING:
+                depth += 1
+            elif value in _CLOSING:
+                depth = max(0, depth - 1)
+            emit(OPERATOR, value, pos, end)
+        pos = end
+
+    if tokens and tokens[-1].kind not in (NEWLINE, DEDENT, INDENT):
+        emit(NEWLINE, "", n, n)
+    while len(indents) > 1:
+        indents.pop()
+        emit(DEDENT, "", n, n)
+    emit(EOF, "", n, n)
+    return tokens
+
+
+def is_float_literal(token):
+    if token.kind != NUMBER or token.value[:2].lower() in ("0x", "0b"):
+        return False
+    return "." in token.value or "e" in token.value.lower()
+
+
+def node_path_text(token):
+    """'$A/B', '$"A/B"' or '%A' -> 'A/B' / '%A' as get_node() would take it"""
+    value = token.value
+    if value.startswith("$"):
+        value = value[1:]
+    if len(value) >= 2 and value[0] in "\"'" and value[-1] == value[0]:
+        value = value[1:-1]
+    return value
+
+
+def statement_end(tokens, i):
+    """Index of the NEWLINE (or EOF) that ends the logical line containing i"""
+    while tokens[i].kind not in (NEWLINE, EOF):
+        i += 1
+    return i
+
+
+def statement_start(tokens, i):
+    """Index of the first token of the logical line containing i"""
+    while i > 0 and tokens[i - 1].kind not in (NEWLINE, INDENT, DEDENT):
+        i -= 1
+    return i
+
+
+def matching_open(tokens, i):
+    """Index of the bracket that opens the closing bracket at i"""
+    closing = tokens[i].value
+    opening = {")": "(", "]": "[", "}": "{"}[closing]
+    depth = 0
+    while i >= 0:
+        value = tokens[i].value
+        if tokens[i].kind == OPERATOR:
+            if value == closing:
+                depth += 1
+            elif value == opening:
+                depth -= 1
+                if depth == 0:
+                    return i
+        i -= 1
+    return -1
+
+
+def matching_close(tokens, i):
+    """Index of the bracket that closes the opening bracket at i"""
+    opening = tokens[i].value
+    closing = _OPENING[opening]
+    depth = 0
+    while i < len(tokens):
+        value = tokens[i].value
+        if tokens[i].kind == OPERATOR:
+            if value == opening:
+                depth += 1
+            elif value == closing:
+                depth -= 1
+                if depth == 0:
+                    return i
+        elif tokens[i].kind == EOF:
+            break
+        i += 1
+    return -1
+
+
+def postfix_start(tokens, i):
+    """First index of the primary-plus-postfix expression ending at i
+    (a.b(c)[d], $Path.x, (expr), "str"); -1 when i is not an operand end"""
+    while True:
+        token = tokens[i]
+        if token.kind == OPERATOR and token.value in _CLOSING:
+            i = matching_open(tokens, i)
+            if i <= 0:
+                return i
+            before = tokens[i - 1]
+            # A call or subscript continues the chain to the left
+            if token.value in ")]" and (before.kind in _OPERAND_FOLLOWS or before.value in _CLOSING):
+                i -= 1
+                continue
+        elif token.kind not in _OPERAND_FOLLOWS and token.value not in ("self", "super", "true", "false", "null"):
+            return -1
+        if i >= 2 and tokens[i - 1].value == "." and tokens[i - 1].kind == OPERATOR:
+            i -= 2
+            continue
+        return i
+
+
+NODE_GETTERS = ("get_node", "get_node_or_null", "has_node")
+
+
+class ScriptWalker:
+    """One pass over a script's tokens that keeps track of where it is
+    (function, inner class, block depth, enclosing `if x is T:` checks)
+    and of the type facts the script states about its variables.
+
+    A fact is a class name (`var x: T`, `T.new()`, `as T`), ("node", path)
+    for `$Path`, `%Name` and get_node("path"), or None when the initializer
+    says nothing. Facts are keyed by (function, name), members by
+    (None, name); every declaration and plain assignment adds one, so a
+    name with several different facts has no single type."""
+
+    def __init__(self, text, tokens):
+        self.text = text
+        self.tokens = tokens
+        self.function = None
+        self.function_depth = 0
+        self.classes = []
+        self.depth = 0
+        self.declared = {}
+        self.narrowed = []
+
+    def source(self, first, last):
+        return self.text[self.tokens[first].start:self.tokens[last].end]
+
+    @property
+    def owner(self):
+        """Name of the inner class being walked, "" at script level"""
+        return self.classes[-1][1] if self.classes else ""
+
+    def scope(self):
+        """Where a site is: its function and the `is` checks around it"""
+        return self.function, {name: type_name for _depth, _end, name, type_name in self.narrowed}
+
+    def facts(self, name, function):
+        """Type facts of a local of function, else of the member"""
+        facts = self.declared.get((function, name))
+        if facts is None:
+            facts = self.declared.get((None, name), {None})
+        return facts
+
+    def receiver_facts(self, first, last, scope):
+        """Type facts of the receiver expression first..last of `recv.prop`"""
+        tokens = self.tokens
+        function, narrowed = scope
+        if first == last and tokens[first].kind == NAME:
+            name = tokens[first].value
+            return {narrowed[name]} if name in narrowed else self.facts(name, function)
+        if last - first == 2 and tokens[first].value == "self" and tokens[last].kind == NAME:
+            return self.facts(tokens[last].value, None)
+        if tokens[first].value == "(" and matching_close(tokens, first) == last and last - first > 3:
+            if tokens[last - 2].value == "as" and tokens[last - 1].kind == NAME:
+                return {tokens[last - 1].value}
+        return {self.node_fact(first, last)}
+
+    def declare(self, name, fact, local):
+        key = (self.function if local else None, name)
+        self.declared.setdefault(key, set()).add(fact)
+
+    def expression_type(self, first, last):
+        """Type fact of an initializer"""
+        tokens = self.tokens
+        values = [t.value for t in tokens[first:last + 1]]
+        if len(values) >= 3 and values[-2] == "as" and tokens[last].kind == NAME:
+            return values[-1]
+        if len(values) == 5 and tokens[first].kind == NAME and values[1:] == [".", "new", "(", ")"]:
+            return values[0]
+        return self.node_fact(first, last)
+
+    def node_fact(self, first, last):
+        """("node", path) when first..last is $Path, %Name or get_node("path")"""
+        tokens = self.tokens
+        if first == last and tokens[first].kind == NODE_PATH:
+            return ("node", node_path_text(tokens[first]))
+        if tokens[first].value == "self" and first + 1 < last and tokens[first + 1].value == ".":
+            first += 2
+        if (last - first == 3 and tokens[first].value in NODE_GETTERS and tokens[first + 1].value == "("
+                and tokens[first + 2].kind == STRING and tokens[first + 2].value[0] in "\"'"):
+            return ("node", tokens[first + 2].value[1:-1])
+        return None
+
+    def declaration(self, i):
+        tokens = self.tokens
+        keyword = tokens[i].value
+        if tokens[i + 1].kind != NAME:
+            return
+        name = tokens[i + 1].value
+        if keyword == "class":
+            self.classes.append((self.depth, name))
+            return
+        if keyword == "func":
+            self.function = name
+            self.function_depth = self.depth
+            open_paren = i + 2
+            if tokens[open_paren].value != "(":
+                return
+            close = matching_close(tokens, open_paren)
+            j = open_paren + 1
+            while 0 < j < close:
+                if tokens[j].kind == NAME and tokens[j - 1].value in ("(", ","):
+                    typed = tokens[j + 1].value == ":" and tokens[j + 2].kind == NAME
+                    self.declare(tokens[j].value, tokens[j + 2].value if typed else None, True)
+                j += 1
+            return
+        local = self.function is not None
+        j = i + 2
+        fact = None
+        if tokens[j].value == ":" and tokens[j + 1].kind == NAME:
+            fact = tokens[j + 1].value
+            j += 2
+        if tokens[j].value in ("=", ":="):
+            end = statement_end(tokens, j)
+            fact = fact or self.expression_type(j + 1, end - 1)
+        self.declare(name, fact, local)
+
+    def narrow(self, i):
+        """`if x is T:` makes x a T for the block that follows"""
+        tokens = self.tokens
+        first = statement_start(tokens, i)
+        if tokens[first].value not in ("if", "elif", "while") or tokens[i - 1].kind != NAME:
+            return
+        if tokens[i + 1].kind != NAME or tokens[i - 2].value == "not":
+            return
+        end = statement_end(tokens, i)
+        if any(t.value in ("or", "||") for t in tokens[first:end]):
+            return
+        self.narrowed.append((self.depth, end, tokens[i - 1].value, tokens[i + 1].value))
+
+    def assignment(self, i):
+        """`name = T.new()` adds a type fact to where name is declared"""
+        tokens = self.tokens
+        end = statement_end(tokens, i)
+        name = tokens[i].value
+        if tokens[i + 2].value == "null" and i + 3 == end:
+            return
+        local = (self.function, name) in self.declared
+        self.declare(name, self.expression_type(i + 2, end - 1), local)
+
+    def walk(self, by_value, by_kind=None):
+        """Call visitor(self, i) for every token whose value (or kind) has
+        visitors, with the position and facts up to date at that token"""
+        tokens = self.tokens
+        by_kind = by_kind or {}
+        for i, token in enumerate(tokens):
+            kind = token.kind
+            if kind == INDENT:
+                self.depth += 1
+            elif kind == DEDENT:
+                self.depth -= 1
+                while self.narrowed and self.narrowed[-1][0] >= self.depth:
+                    self.narrowed.pop()
+                if self.function is not None and self.depth <= self.function_depth:
+                    self.function = None
+                while self.classes and self.classes[-1][0] >= self.depth:
+                    self.classes.pop()
+            elif kind == NEWLINE and tokens[i + 1].kind != INDENT:
+                # `if x is T: ...` on one line narrows nothing after it
+                while self.narrowed and self.narrowed[-1][1] == i:
+                    self.narrowed.pop()
+            elif kind == KEYWORD and token.value in ("var", "const", "func", "class"):
+                self.declaration(i)
+            elif kind == KEYWORD and token.value == "is":
+                self.narrow(i)
+            elif (kind == NAME and tokens[i + 1].value == "=" and
+                  (i == 0 or tokens[i - 1].kind in (NEWLINE, INDENT, DEDENT))):
+                self.assignment(i)
+            for visitor in by_value.get(token.value, ()):
+                visitor(self, i)
+            for visitor in by_kind.get(kind, ()):
+                visitor(self, i)
+
+
+class TokenCache:
+    """Token streams by content hash, shared by every rule of a run.
+
+    On disk each script's tokens are one marshal blob of plain tuples,
+    unpacked only when that script is asked for: rebuilding ~2M Token
+    tuples from a pickle took as long as tokenizing from scratch."""
+
+    FORMAT = 1
+
+    def __init__(self, root=PROJECT_ROOT, path=None):
+        self.root = root
+        self.path = path if path is not None else os.path.join(root, ".godot", "gdscript_token_cache.bin")
+        self._blobs = {}
+        self._tokens = {}
+        self._dirty = False
+        self.hits = self.misses = 0
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, "rb") as f:
+                    data = marshal.load(f)
+                if data.get("format") == [self.FORMAT, list(sys.version_info[:2])]:
+                    self._blobs = data["files"]
+            except (OSError, ValueError, EOFError, TypeError, AttributeError):
+                self._blobs = {}
+
+    def source(self, rel_path):
+        with open(os.path.join(self.root, rel_path), "rb") as f:
+            return f.read().decode("utf-8", errors="replace")
+
+    def tokens(self, rel_path, text=None):
+        """(text, tokens) of a project-relative script"""
+        text = self.source(rel_path) if text is None else text
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        cached = self._tokens.get(rel_path)
+        if cached is not None and cached[0] == digest:
+            self.hits += 1
+            return text, cached[1]
+        # Tokens are acyclic; keep the collector from rescanning millions of them
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            blob = self._blobs.get(rel_path)
+            if blob is not None and blob[0] == digest:
+                self.hits += 1
+                tokens = list(map(Token._make, marshal.loads(blob[1])))
+            else:
+                self.misses += 1
+                tokens = tokenize(text)
+                self._blobs[rel_path] = (digest, marshal.dumps([tuple(t) for t in tokens]))
+                self._dirty = True
+        finally:
+            if enabled:
+                gc.enable()
+        self._tokens[rel_path] = (digest, tokens)
+        return text, tokens
+
+    def save(self):
+        if not self._dirty or not self.path:
+            return
+        files = {rel: blob for rel, blob in self._blobs.items() if os.path.exists(os.path.join(self.root, rel))}
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "wb") as f:
+            marshal.dump({"format": [self.FORMAT, list(sys.version_info[:2])], "files": files}, f)
+        self._dirty = False
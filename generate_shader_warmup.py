@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Generate a shader/material warm-up scene for every grid map.
+
+For each map the utilities (UtilityRegistry.gd codes) and interactables
+(artifact registry lookup names) are resolved to scenes, and the transitive
+set of .tscn/.tres/.gd/.gdshader files they pull in is walked. Every
+material found on the way is copied into a small scene that draws it once
+inside an off-screen SubViewport (see commons/grid/ShaderWarmup.gd), so
+GridSystem can compile the map's shaders while the map is being built
+instead of stalling the first VR frames. At runtime ShaderWarmup gives
+the SubViewport the main viewport's msaa_3d; it stays a non-XR viewport.
+build_preload_manifests.py lists the warm-up scene with its map, so it is
+prefetched with the rest of the next map.
+
+Spatial materials are drawn on quads, ParticleProcessMaterials through a
+one-particle GPUParticles3D, and bare spatial .gdshader files referenced
+from scripts get a default ShaderMaterial. Materials that compile to the
+same shader variant are drawn once.
+
+Output: <map json without .json>_warmup.tscn next to the map's JSON, e.g.
+commons/maps/CA_1/map_data_warmup.tscn or commons/maps/Lab/map_data_post_color_warmup.tscn
+
+Usage:
+    python generate_shader_warmup.py              # all maps
+    python generate_shader_warmup.py CA_1 Lab/map_data_one
+    python generate_shader_warmup.py --dry-run
+"""
+
+import argparse
+import math
+import os
+import re
+import sys
+
+from godot_maps import list_maps, load_utility_types, map_json_path, map_scene_references
+from godot_resources import (PROJECT_ROOT, ResourceGraph, ext_resource_target, read_text,
+                             parse_value, res_to_file, rewrite_value_refs, value_refs)
+
+WARMUP_SCRIPT = "res://commons/grid/ShaderWarmup.gd"
+SPATIAL_MATERIALS = ("StandardMaterial3D", "ORMMaterial3D", "ShaderMaterial")
+PARTICLE_MATERIALS = ("ParticleProcessMaterial",)
+QUAD_SIZE = 0.05
+QUAD_SPACING = 0.06
+
+VARIANT_BY_FLAGS = ("StandardMaterial3D", "ORMMaterial3D", "ParticleProcessMaterial")
+
+_SHADER_TYPE = re.compile(r"^\s*shader_type\s+(\w+)\s*;", re.M)
+
+
+def warmup_scene_path(map_name, root=PROJECT_ROOT):
+    """Filesystem path of a map's warm-up scene (ShaderWarmup.scene_path_for_map)"""
+    json_path = map_json_path(map_name, root)
+    return json_path[:-len(".json")] + "_warmup.tscn"
+
+
+class _Material:
+    """A material to be drawn: sub_resources to copy plus the external files they need"""
+
+    def __init__(self, kind, signature, source):
+        self.kind = kind
+        self.signature = signature
+        self.source = source
+        self.subs = []      # (doc, sub_id) in dependency order, the material last
+        self.exts = []      # (res_path, type)
+
+
+class WarmupCollector:
+    """Collects the distinct materials reachable from a set of scenes"""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self._shader_types = {}
+        self._doc_materials = {}
+
+    def shader_type(self, res_path):
+        if res_path not in self._shader_types:
+            m = _SHADER_TYPE.search(read_text(res_to_file(res_path, self.graph.root)))
+            self._shader_types[res_path] = m.group(1) if m else ""
+        return self._shader_types[res_path]
+
+    def _signature(self, doc, sub_id, seen=None):
+        """Shader-variant key of a sub_resource, references resolved recursively.
+
+        Only what selects a different compiled shader is kept: ShaderMaterials
+        are keyed by shader (and next_pass), base materials by their flags,
+        enums and which texture slots are filled, not by colours or floats.
+        """
+        seen = seen or set()
+        section = doc.sub_resources.get(sub_id)
+        if section is None or sub_id in seen:
+            return "?"
+        seen = seen | {sub_id}
+        kind = section.attr("type", "")
+        parts = [kind]
+        for key in sorted(section.properties):
+            raw = section.properties[key]
+            if kind == "ShaderMaterial" and key not in ("shader", "next_pass"):
+                continue
+            if kind in VARIANT_BY_FLAGS and not _selects_variant(raw):
+                continue
+            for ref_kind, ref_id in value_refs(raw):
+                if ref_kind == "ExtResource":
+                    ext = doc.ext_resource(ref_id)
+                    target = ext_resource_target(ext, self.graph.uid_index, doc.path) if ext else "?"
+                    if not target.endswith(".gdshader"):
+                        target = ext.attr("type", "Resource") if ext else "?"
+                    raw = raw.replace('ExtResource("%s")' % ref_id, "<%s>" % target)
+                elif kind in VARIANT_BY_FLAGS:
+                    raw = raw.replace('SubResource("%s")' % ref_id, "<texture>")
+                else:
+                    raw = raw.replace('SubResource("%s")' % ref_id,
+                                      "{%s}" % self._signature(doc, ref_id, seen))
+            parts.append("%s=%s" % (key, raw))
+        return "|".join(parts)
+
+    def _sub_closure(self, doc, sub_id, out, exts):
+        section = doc.sub_resources.get(sub_id)
+        if section is None or (doc, sub_id) in out:
+            return
+        for raw in section.properties.values():
+            for kind, ref_id in value_refs(raw):
+                if kind == "SubResource":
+                    self._sub_closure(doc, ref_id, out, exts)
+                else:
+                    ext = doc.ext_resource(ref_id)
+                    if ext is not None:
+                        target = ext_resource_target(ext, self.graph.uid_index, doc.path)
+                        if target and self.graph.exists(target):
+                            exts.append((target, ext.attr("type", "Resource")))
+        out.append((doc, sub_id))
+
+    def document_materials(self, res_path):
+        """Materials defined in, or referenced as files by, one .tscn/.tres"""
+        if res_path in self._doc_materials:
+            return self._doc_materials[res_path]
+        found = []
+        doc = self.graph.document(res_path)
+        if doc is not None:
+            for sub_id, section in doc.sub_resources.items():
+                kind = section.attr("type", "")
+                if kind not in SPATIAL_MATERIALS + PARTICLE_MATERIALS:
+                    continue
+                if kind == "ShaderMaterial" and not self._spatial_shader_material(doc, section):
+                    continue
+                mat = _Material(kind, self._signature(doc, sub_id), res_path)
+                self._sub_closure(doc, sub_id, mat.subs, mat.exts)
+                found.append(mat)
+            for section in doc.ext_resources.values():
+                if section.attr("type") == "Material":
+                    target = ext_resource_target(section, self.graph.uid_index, doc.path)
+                    if target and self.graph.exists(target):
+                        mat = _Material("Material", "<%s>" % target, res_path)
+                        mat.exts.append((target, "Material"))
+                        found.append(mat)
+        self._doc_materials[res_path] = found
+        return found
+
+    def _spatial_shader_material(self, doc, section):
+        for kind, ref_id in value_refs(section.properties.get("shader", "")):
+            if kind == "ExtResource":
+                ext = doc.ext_resource(ref_id)
+                target = ext_resource_target(ext, self.graph.uid_index, doc.path) if ext else None
+                return bool(target) and self.graph.exists(target) and self.shader_type(target) == "spatial"
+        return False
+
+    def collect(self, scenes):
+        """Distinct materials (by signature) for the closure of scenes"""
+        materials = {}
+        covered_shaders = set()
+        closure = self.graph.closure(scenes)
+        for res_path in closure:
+            for mat in self.document_materials(res_path):
+                materials.setdefault(mat.signature, mat)
+                covered_shaders.update(p for p, _t in mat.exts if p.endswith(".gdshader"))
+        for res_path in closure:
+            if res_path.endswith(".gdshader") and res_path not in covered_shaders \
+                    and self.shader_type(res_path) == "spatial":
+                mat = _Material("Shader", "<shader:%s>" % res_path, res_path)
+                mat.exts.append((res_path, "Shader"))
+                materials.setdefault(mat.signature, mat)
+        return list(materials.values())
+
+
+def _selects_variant(raw):
+    """Flags, enums and resource slots select shader variants; plain values do not"""
+    value = parse_value(raw)
+    if isinstance(value, bool) or isinstance(value, int):
+        return True
+    return "Resource(" in raw
+
+
+def render_warmup_scene(materials, uid_index=None):
+    """Text of a warm-up .tscn drawing every material once"""
+    ext_lines = ['[ext_resource type="Script" path="%s" id="1_warmup"]' % WARMUP_SCRIPT]
+    ext_ids = {}
+    sub_blocks = ['[sub_resource type="QuadMesh" id="QuadMesh_warmup"]\nsize = Vector2(%s, %s)'
+                  % (QUAD_SIZE, QUAD_SIZE)]
+    node_blocks = []
+
+    def ext_id(path, kind):
+        if path not in ext_ids:
+            ext_ids[path] = "%d_warmup" % (len(ext_ids) + 2)
+            ext_lines.append('[ext_resource type="%s" path="%s" id="%s"]' % (kind, path, ext_ids[path]))
+        return ext_ids[path]
+
+    cols = max(1, int(math.ceil(math.sqrt(len(materials)))))
+    distance = max(1.0, cols * QUAD_SPACING / 1.2)
+    for index, mat in enumerate(materials):
+        sub_map = {}
+        material_ref = None
+        for path, kind in mat.exts:
+            ext_id(path, kind)
+        for doc, sub_id in mat.subs:
+            new_id = "%s_w%d" % (doc.sub_resources[sub_id].attr("type", "Resource"), len(sub_blocks))
+            sub_map[sub_id] = new_id
+            ext_map = {}
+            for eid, section in doc.ext_resources.items():
+                target = ext_resource_target(section, uid_index, doc.path)
+                if target in ext_ids:
+                    ext_map[eid] = ext_ids[target]
+            section = doc.sub_resources[sub_id]
+            lines = ['[sub_resource type="%s" id="%s"]' % (section.attr("type"), new_id)]
+            for key, raw in section.properties.items():
+                lines.append("%s = %s" % (_format_key(key), rewrite_value_refs(raw, ext_map, sub_map)))
+            sub_blocks.append("\n".join(lines))
+            material_ref = 'SubResource("%s")' % new_id
+        if mat.kind == "Material":
+            material_ref = 'ExtResource("%s")' % ext_ids[mat.exts[0][0]]
+        elif mat.kind == "Shader":
+            new_id = "ShaderMaterial_w%d" % len(sub_blocks)
+            sub_blocks.append('[sub_resource type="ShaderMaterial" id="%s"]\nshader = ExtResource("%s")'
+                              % (new_id, ext_ids[mat.exts[0][0]]))
+            material_ref = 'SubResource("%s")' % new_id
+
+        x = (index % cols - (cols - 1) / 2.0) * QUAD_SPACING
+        y = ((cols - 1) / 2.0 - index // cols) * QUAD_SPACING
+        transform = "Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, %s, %s, %s)" % (round(x, 4), round(y, 4), -distance)
+        if mat.kind in PARTICLE_MATERIALS:
+            node_blocks.append(
+                '[node name="Particles%d" type="GPUParticles3D" parent="SubViewport"]\n'
+                'transform = %s\namount = 1\nlifetime = 0.1\nprocess_material = %s\n'
+                'draw_pass_1 = SubResource("QuadMesh_warmup")' % (index, transform, material_ref))
+        else:
+            node_blocks.append(
+                '[node name="Material%d" type="MeshInstance3D" parent="SubViewport"]\n'
+                'transform = %s\nmesh = SubResource("QuadMesh_warmup")\n'
+                'surface_material_override/0 = %s' % (index, transform, material_ref))
+
+    header = "[gd_scene load_steps=%d format=3]" % (len(ext_lines) + len(sub_blocks) + 1)
+    nodes = [
+        '[node name="ShaderWarmup" type="Node3D"]\nscript = ExtResource("1_warmup")',
+        '[node name="SubViewport" type="SubViewport" parent="."]\nown_world_3d = true\n'
+        'size = Vector2i(64, 64)\nrender_target_update_mode = 4',
+        '[node name="Camera3D" type="Camera3D" parent="SubViewport"]',
+        '[node name="DirectionalLight3D" type="DirectionalLight3D" parent="SubViewport"]\n'
+        'transform = Transform3D(1, 0, 0, 0, 0.707, 0.707, 0, -0.707, 0.707, 0, 0, 0)\nshadow_enabled = true',
+    ] + node_blocks
+    return "\n\n".join([header, "\n".join(ext_lines)] + sub_blocks + nodes) + "\n"
+
+
+def _format_key(key):
+    return key if re.match(r"^[A-Za-z0-9_/:.]+$", key) else '"%s"' % key
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate per-map shader warm-up scenes")
+    parser.add_argument("maps", nargs="*", help="map names (default: every map)")
+    parser.add_argument("--dry-run", action="store_true", help="report without writing files")
+    parser.add_argument("--root", default=PROJECT_ROOT, help="project root")
+    args = parser.parse_args(argv)
+
+    graph = ResourceGraph(args.root)
+    collector = WarmupCollector(graph)
+    utility_types = load_utility_types(args.root)
+    names = args.maps or list_maps(args.root)
+
+    print("Generating shader warm-up scenes...")
+    print("=" * 60)
+    written = 0
+    unchanged = 0
+    for name in names:
+        scenes, unresolved = map_scene_references(name, args.root, utility_types)
+        materials = collector.collect(scenes)
+        if not materials:
+            continue
+        content = render_warmup_scene(materials, graph.uid_index)
+        path = warmup_scene_path(name, args.root)
+        if os.path.isfile(path) and read_text(path) == content:
+            unchanged += 1
+            continue
+        note = " (%d unresolved cells)" % len(unresolved) if unresolved else ""
+        print(f"{name}: {len(materials)} materials{note}")
+        if not args.dry_run:
+            with open(path, "w", encoding="utf-8", newline="\n") as f:
+                f.write(content)
+        written += 1
+    print("=" * 60)
+    verb = "Would write" if args.dry_run else "Wrote"
+    print(f"{verb} {written} warm-up scenes ({unchanged} unchanged)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for reading the grid map data used by GridSystem:
+- Lenient JSON loading (BOM, trailing commas, stray escapes, // comments)
+- Map discovery mirroring GridDataComponent's name -> path rules
+- Utility codes from UtilityRegistry.gd and artifacts from the JSON registries
+- Map sequences from map_sequences.json
+"""
+
+import json
+import os
+import re
+
+from godot_resources import PROJECT_ROOT, read_text, res_to_file, to_res
+
+MAPS_DIR = "commons/maps"
+MAP_SEQUENCES_JSON = "commons/maps/map_sequences.json"
+UTILITY_REGISTRY_GD = "commons/grid/UtilityRegistry.gd"
+DEFAULT_ARTIFACTS_JSON = "res://commons/artifacts/grid_artifacts.json"
+MAP_OBJECTS_PATH = "res://commons/scenes/mapobjects/"
+
+
+def _sanitize_json(text):
+    """Drop comments, trailing commas and escape sequences outside strings"""
+    out = []
+    i = 0
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c == '"':
+            j = i + 1
+            while j < n and text[j] != '"':
+                j += 2 if text[j] == "\\" else 1
+            out.append(text[i:j + 1])
+            i = j + 1
+        elif c == "/" and text.startswith("//", i):
+            end = text.find("\n", i)
+            i = n if end == -1 else end
+        elif c == "\\":
+            out.append(" ")
+            i += 2
+        else:
+            out.append(c)
+            i += 1
+    return re.sub(r",(?=\s*[\]}])", "", "".join(out))
+
+
+def load_lenient_json(path):
+    """Load JSON the way Godot's parser tolerates it in this project"""
+    text = read_text(path)
+    try:
+        return json.loads(text)
+    except ValueError:
+        return json.loads(_sanitize_json(text))
+
+
+def map_json_path(map_name, root=PROJECT_ROOT):
+    """Filesystem path of a map's JSON (see GridDataComponent._load_json_map)"""
+    if map_name.startswith("Lab/"):
+        rel = "%s/Lab/%s.json" % (MAPS_DIR, map_name[4:])
+    elif map_name == "Lab":
+        rel = "%s/Lab/map_data_one.json" % MAPS_DIR
+    else:
+        rel = "%s/%s/map_data.json" % (MAPS_DIR, map_name)
+    return os.path.join(root, *rel.split("/"))
+
+
+def list_maps(root=PROJECT_ROOT):
+    """All loadable map names, including the Lab/<file> progressive maps"""
+    names = []
+    maps_root = os.path.join(root, *MAPS_DIR.split("/"))
+    for entry in sorted(os.listdir(maps_root)):
+        folder = os.path.join(maps_root, entry)
+        if not os.path.isdir(folder):
+            continue
+        if entry == "Lab":
+            for name in sorted(os.listdir(folder)):
+                if name.endswith(".json"):
+                    names.append("Lab/" + name[:-len(".json")])
+        elif os.path.isfile(os.path.join(folder, "map_data.json")):
+            names.append(entry)
+    return names
+
+
+def load_map(map_name, root=PROJECT_ROOT):
+    path = map_json_path(map_name, root)
+    if not os.path.isfile(path):
+        return None
+    return load_lenient_json(path)
+
+
+def iter_layer_cells(map_data, layer):
+    """Yield (x, z, token) for every non-empty cell of a map layer"""
+    rows = (map_data or {}).get("layers", {}).get(layer, []) or []
+    for z, row in enumerate(rows):
+        if not isinstance(row, list):
+            continue
+        for x, cell in enumerate(row):
+            token = str(cell).strip()
+            if token:
+                yield x, z, token
+
+
+def utility_code(token):
+    """Type code of a utility cell (UtilityRegistry.parse_utility_cell)"""
+    return token.split(":")[0]
+
+
+def artifact_lookup_name(token):
+    """lookup_name of an interactable cell (GridInteractablesComponent._parse_interactable_token)"""
+    return re.split(r"[#:]", token, 1)[0].strip()
+
+
+_UTILITY_ENTRY = re.compile(r'"([^"]*)"\s*:\s*\{[^{}]*?"file"\s*:\s*"([^"]*)"', re.S)
+
+
+def load_utility_types(root=PROJECT_ROOT):
+    """Utility code -> res:// scene path, read from UtilityRegistry.UTILITY_TYPES"""
+    text = read_text(os.path.join(root, *UTILITY_REGISTRY_GD.split("/")))
+    start = text.find("const UTILITY_TYPES")
+    end = text.find("\nconst ", start + 1)
+    block = text[start:end if end != -1 else len(text)]
+    types = {}
+    for code, filename in _UTILITY_ENTRY.findall(block):
+        types[code] = MAP_OBJECTS_PATH + filename if filename else ""
+    return types
+
+
+def map_artifact_registries(map_data):
+    """Artifact registries a map uses (GridInteractablesComponent._get_artifact_registry_paths)"""
+    refs = (map_data or {}).get("external_references", {}) or {}
+    registries = [str(p) for p in refs.get("artifact_registries", []) or []]
+    return registries or [DEFAULT_ARTIFACTS_JSON]
+
+
+_registry_cache = {}
+
+
+def load_artifact_registry(registry_res_path, root=PROJECT_ROOT):
+    """lookup_name -> res:// scene path for one artifact registry JSON"""
+    key = (root, registry_res_path)
+    if key not in _registry_cache:
+        artifacts = {}
+        path = res_to_file(registry_res_path, root)
+        if os.path.isfile(path):
+            data = load_lenient_json(path)
+            for name, entry in (data.get("artifacts", {}) or {}).items():
+                if isinstance(entry, dict) and entry.get("scene"):
+                    artifacts[entry.get("lookup_name", name)] = entry["scene"]
+        _registry_cache[key] = artifacts
+    return _registry_cache[key]
+
+
+def map_scene_references(map_name, root=PROJECT_ROOT, utility_types=None):
+    """Ordered res:// scenes a map instantiates: utilities, then interactables.
+
+    Returns (scenes, unresolved) where unresolved lists tokens that name no
+    known utility code or artifact.
+    """
+    data = load_map(map_name, root)
+    if data is None:
+        return [], []
+    if utility_types is None:
+        utility_types = load_utility_types(root)
+    scenes = []
+    unresolved = []
+    for _x, _z, token in iter_layer_cells(data, "utilities"):
+        path = utility_types.get(utility_code(token))
+        if path:
+            scenes.append(path)
+        elif path is None:
+            unresolved.append(token)
+    artifacts = {}
+    for registry in map_artifact_registries(data):
+        artifacts.update(load_artifact_registry(registry, root))
+    for _x, _z, token in iter_layer_cells(data, "interactables"):
+        scene = artifacts.get(artifact_lookup_name(token))
+        if scene:
+            scenes.append(scene)
+        else:
+            unresolved.append(token)
+    seen = set()
+    ordered = [s for s in scenes if not (s in seen or seen.add(s))]
+    return ordered, unresolved
+
+
+def load_map_sequences(root=PROJECT_ROOT):
+    """Sequence name -> ordered map names (map_sequences.json)"""
+    data = load_lenient_json(os.path.join(root, *MAP_SEQUENCES_JSON.split("/")))
+    return {name: list(seq.get("maps", []) or [])
+            for name, seq in (data.get("sequences", {}) or {}).items()}
+
+
+def map_file_res_path(map_name, root=PROJECT_ROOT):
+    return to_res(os.path.relpath(map_json_path(map_name, root), root).replace(os.sep, "/"))
+
+
+def registry_files(root=PROJECT_ROOT):
+    """Every artifact registry referenced by any map, plus the default one"""
+    found = {DEFAULT_ARTIFACTS_JSON}
+    for name in list_maps(root):
+        for registry in map_artifact_registries(load_map(name, root)):
+            found.add(registry)
+    return sorted(r for r in found if os.path.isfile(res_to_file(r, root)))
@@ -0,0 +1,647 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the project maintenance scripts:
+- Structured parser for Godot 4 text resources (.tscn / .tres)
+- res:// <-> filesystem path helpers and uid:// resolution
+- StatTable: one-walk, case-sensitive file table
+- Reference extraction for scenes, resources, scripts and shaders
+- ResourceGraph: cached dependency graph with ordered closures
+"""
+
+import os
+import posixpath
+import re
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+RES_PREFIX = "res://"
+SKIP_DIRS = {".git", ".godot", ".import", "__pycache__"}
+
+TEXT_RESOURCE_EXTENSIONS = (".tscn", ".tres")
+SCRIPT_EXTENSIONS = (".gd",)
+SHADER_EXTENSIONS = (".gdshader", ".gdshaderinc")
+
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+def iter_project_files(extensions=None, root=PROJECT_ROOT, subdir=""):
+    """Yield project-relative posix paths, sorted, skipping VCS/import dirs"""
+    if isinstance(extensions, str):
+        extensions = (extensions,)
+    start = os.path.join(root, subdir) if subdir else root
+    for dirpath, dirnames, filenames in os.walk(start):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for name in sorted(filenames):
+            if extensions is None or name.endswith(tuple(extensions)):
+                full = os.path.join(dirpath, name)
+                yield os.path.relpath(full, root).replace(os.sep, "/")
+
+
+def to_res(rel_path):
+    """Project-relative path -> res:// path"""
+    if rel_path.startswith(RES_PREFIX):
+        return rel_path
+    return RES_PREFIX + rel_path.replace(os.sep, "/").lstrip("/")
+
+
+def from_res(res_path):
+    """res:// path -> project-relative posix path"""
+    if res_path.startswith(RES_PREFIX):
+        return res_path[len(RES_PREFIX):]
+    return res_path
+
+
+def res_to_file(res_path, root=PROJECT_ROOT):
+    """res:// path -> absolute filesystem path"""
+    return os.path.join(root, *from_res(res_path).split("/"))
+
+
+def resolve_relative(ref, base_res_path):
+    """Resolve a reference that may be relative to the referencing file"""
+    if ref.startswith(RES_PREFIX) or ref.startswith("uid://"):
+        return ref
+    base_dir = from_res(base_res_path).rsplit("/", 1)[0] if "/" in from_res(base_res_path) else ""
+    joined = os.path.normpath(os.path.join(base_dir, ref)).replace(os.sep, "/")
+    return to_res(joined)
+
+
+def join_node_path(base, path):
+    """Scene node path reached by get_node(path) from the node at base
+    ('.' for the root); None for %Unique names and paths leaving the scene"""
+    if not path or path.startswith(("%", "/")):
+        return None
+    joined = posixpath.normpath(path if base == "." else base + "/" + path)
+    return None if joined == ".." or joined.startswith("../") else joined
+
+
+def read_text(path):
+    """Read a project text file; tolerate BOMs and stray bytes"""
+    with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+        return f.read()
+
+
+class StatTable:
+    """(size, mtime_ns) of every project file from one directory walk.
+
+    Lookups are case-sensitive like the exported game on Linux/Android,
+    whatever the host filesystem does; case_variants() finds the paths a
+    wrongly cased reference was probably meant to be.
+    """
+
+    def __init__(self, root=PROJECT_ROOT):
+        self.root = root
+        self.files = {}
+        self._folded = {}
+        self._names = {}
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            for name in sorted(filenames):
+                try:
+                    st = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                rel = os.path.relpath(os.path.join(dirpath, name), root).replace(os.sep, "/")
+                self.files[rel] = (st.st_size, st.st_mtime_ns)
+                self._folded.setdefault(rel.lower(), []).append(rel)
+                self._names.setdefault(name.lower(), []).append(rel)
+
+    def exists(self, path):
+        return from_res(path) in self.files
+
+    def stat(self, path):
+        return self.files.get(from_res(path))
+
+    def case_variants(self, path):
+        """Existing paths that differ from path only in letter case"""
+        rel = from_res(path)
+        return [p for p in self._folded.get(rel.lower(), []) if p != rel]
+
+    def same_name(self, path):
+        """Existing paths with the same file name (case-insensitively) elsewhere"""
+        rel = from_res(path)
+        return [p for p in self._names.get(rel.rsplit("/", 1)[-1].lower(), []) if p != rel]
+
+    def iter_files(self, extensions=None, subdir=""):
+        prefix = subdir.strip("/") + "/" if subdir else ""
+        for rel in self.files:
+            if rel.startswith(prefix) and (extensions is None or rel.endswith(tuple(extensions))):
+                yield rel
+
+
+# ---------------------------------------------------------------------------
+# Text resource parser
+# ---------------------------------------------------------------------------
+
+_OPENERS = {"[": "]", "(": ")", "{": "}"}
+_CLOSERS = {"]", ")", "}"}
+
+
+def _scan_value(text, pos, stop_at_space=False, stop_chars=""):
+    """Return the end offset of a value starting at pos.
+
+    Strings (with escapes) and bracket nesting are honoured, so values may
+    span several lines. At depth 0 the value ends at a newline, or at
+    whitespace / any of stop_chars when scanning header attributes.
+    """
+    depth = 0
+    n = len(text)
+    i = pos
+    while i < n:
+        c = text[i]
+        if c == '"':
+            i += 1
+            while i < n and text[i] != '"':
+                i += 2 if text[i] == "\\" else 1
+            i += 1
+            continue
+        if c in _OPENERS:
+            depth += 1
+        elif c in _CLOSERS:
+            if depth == 0:
+                return i
+            depth -= 1
+        elif depth == 0:
+            if c == "\n":
+                return i
+            if stop_at_space and c in " \t\r":
+                return i
+            if c in stop_chars:
+                return i
+        i += 1
+    return n
+
+
+class Section:
+    """One [tag attr=value ...] block of a text resource plus its properties"""
+
+    def __init__(self, tag, attrs, line, start, end):
+        self.tag = tag
+        self.attrs = attrs
+        self.line = line
+        self.header_span = (start, end)
+        self.properties = {}
+        self.property_spans = {}
+
+    def attr(self, key, default=None):
+        raw = self.attrs.get(key)
+        return default if raw is None else parse_value(raw)
+
+    def get(self, key, default=None):
+        raw = self.properties.get(key)
+        return default if raw is None else parse_value(raw)
+
+    def refs(self, kind="ExtResource"):
+        """Ids of ExtResource/SubResource references in attrs and properties"""
+        found = []
+        for raw in list(self.attrs.values()) + list(self.properties.values()):
+            for ref_kind, ref_id in value_refs(raw):
+                if ref_kind == kind:
+                    found.append(ref_id)
+        return found
+
+    def __repr__(self):
+        return "Section(%s, %r)" % (self.tag, self.attrs)
+
+
+class ResourceDocument:
+    """Parsed .tscn/.tres file"""
+
+    def __init__(self, text, path=""):
+        self.path = path
+        self.text = text
+        self.sections = []
+        self.header = None
+        self.ext_resources = {}
+        self.sub_resources = {}
+        self.nodes = []
+        self.connections = []
+        self.resource = None
+        self._parse()
+
+    @property
+    def kind(self):
+        return self.header.tag if self.header else ""
+
+    @property
+    def uid(self):
+        return self.header.attr("uid") if self.header else None
+
+    def _parse(self):
+        text = self.text
+        n = len(text)
+        i = 0
+        line = 1
+        current = None
+        while i < n:
+            c = text[i]
+            if c == "\n":
+                line += 1
+                i += 1
+                continue
+            if c in " \t\r":
+                i += 1
+                continue
+            if c == ";":
+                end = text.find("\n", i)
+                i = n if end == -1 else end
+                continue
+            if c == "[":
+                end = _scan_value(text, i + 1)
+                while end < n and text[end] != "]":
+                    end = _scan_value(text, end + 1)
+                current = self._add_section(text[i + 1:end], line, i, end + 1)
+                line += text.count("\n", i, end)
+                i = end + 1
+                continue
+            # key = value
+            eq = text.find("=", i)
+            nl = text.find("\n", i)
+            if eq == -1 or (nl != -1 and nl < eq):
+                i = n if nl == -1 else nl
+                continue
+            key = text[i:eq].strip()
+            if len(key) >= 2 and key[0] == key[-1] == '"':
+                key = key[1:-1]
+            vstart = eq + 1
+            while vstart < n and text[vstart] in " \t":
+                vstart += 1
+            vend = _scan_value(text, vstart)
+            if current is not None:
+                current.properties[key] = text[vstart:vend].strip()
+                current.property_spans[key] = (i, vend)
+            line += text.count("\n", i, vend)
+            i = vend
+
+    def _add_section(self, inner, line, start, end):
+        tag, attrs = _parse_header(inner)
+        section = Section(tag, attrs, line, start, end)
+        self.sections.append(section)
+        if self.header is None and tag in ("gd_scene", "gd_resource"):
+            self.header = section
+        elif tag == "ext_resource":
+            self.ext_resources[section.attr("id", "")] = section
+        elif tag == "sub_resource":
+            self.sub_resources[section.attr("id", "")] = section
+        elif tag == "node":
+            self.nodes.append(section)
+        elif tag == "connection":
+            self.connections.append(section)
+        elif tag == "resource":
+            self.resource = section
+        return section
+
+    def ext_resource(self, ref_id):
+        return self.ext_resources.get(ref_id)
+
+    def node_path(self, node):
+        """Scene-relative path of a node section ('.' for the root)"""
+        parent = node.attr("parent")
+        name = node.attr("name", "")
+        if parent is None:
+            return "."
+        if parent == ".":
+            return name
+        return parent + "/" + name
+
+    def root_node(self):
+        for node in self.nodes:
+            if node.attr("parent") is None:
+                return node
+        return None
+
+
+def _parse_header(inner):
+    """Parse 'tag key=value key2="x"' into (tag, {key: raw_value})"""
+    inner = inner.strip()
+    m = re.match(r"[A-Za-z_][A-Za-z0-9_]*", inner)
+    if not m:
+        return "", {}
+    tag = m.group(0)
+    attrs = {}
+    i = m.end()
+    n = len(inner)
+    while i < n:
+        while i < n and inner[i] in " \t\r\n":
+            i += 1
+        eq = inner.find("=", i)
+        if eq == -1:
+            break
+        key = inner[i:eq].strip()
+        end = _scan_value(inner, eq + 1, stop_at_space=True)
+        attrs[key] = inner[eq + 1:end].strip()
+        i = end
+    return tag, attrs
+
+
+_NUMBER = re.compile(r"^[+-]?(\d+\.?\d*(e[+-]?\d+)?|\.\d+(e[+-]?\d+)?|inf|nan)$", re.I)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\"}
+
+
+def parse_value(raw):
+    """Convert simple literal values; anything structured is returned as raw text"""
+    if raw is None:
+        return None
+    raw = raw.strip()
+    if raw == "true":
+        return True
+    if raw == "false":
+        return False
+    if raw == "null":
+        return None
+    if _NUMBER.match(raw):
+        try:
+            return int(raw)
+        except ValueError:
+            return float(raw)
+    prefix = raw[:1] if raw[:1] in "&^" else ""
+    body = raw[len(prefix):]
+    if len(body) >= 2 and body[0] == '"' and body[-1] == '"' and _scan_value(body, 0) >= len(body):
+        return _unescape(body[1:-1])
+    return raw
+
+
+def _unescape(s):
+    out = []
+    i = 0
+    while i < len(s):
+        c = s[i]
+        if c == "\\" and i + 1 < len(s):
+            out.append(_ESCAPES.get(s[i + 1], s[i + 1]))
+            i += 2
+        else:
+            out.append(c)
+            i += 1
+    return "".join(out)
+
+
+def mask_strings(raw):
+    """Replace the contents of "..." literals with spaces (offsets preserved)"""
+    chars = list(raw)
+    i = 0
+    n = len(raw)
+    while i < n:
+        if raw[i] == '"':
+            j = i + 1
+            while j < n and raw[j] != '"':
+                j += 2 if raw[j] == "\\" else 1
+            for k in range(i + 1, min(j, n)):
+                if chars[k] != "\n":
+                    chars[k] = " "
+            i = j + 1
+        else:
+            i += 1
+    return "".join(chars)
+
+
+_REF_CALL = re.compile(r'\b(ExtResource|SubResource)\(\s*"?([^")\s]+)"?\s*\)')
+
+
+def value_refs(raw):
+    """Yield (kind, id) for ExtResource/SubResource calls outside string literals"""
+    masked = mask_strings(raw)
+    for m in _REF_CALL.finditer(raw):
+        if masked[m.start():m.start() + len(m.group(1))] == m.group(1):
+            yield m.group(1), m.group(2)
+
+
+def rewrite_value_refs(raw, ext_map=None, sub_map=None):
+    """Rename ExtResource/SubResource ids in a raw value (ids not in a map are kept)"""
+    masked = mask_strings(raw)
+
+    def _replace(m):
+        if masked[m.start():m.start() + len(m.group(1))] != m.group(1):
+            return m.group(0)
+        mapping = ext_map if m.group(1) == "ExtResource" else sub_map
+        new_id = (mapping or {}).get(m.group(2))
+        return '%s("%s")' % (m.group(1), new_id) if new_id is not None else m.group(0)
+
+    return _REF_CALL.sub(_replace, raw)
+
+
+def parse_resource_text(text, path=""):
+    return ResourceDocument(text, path)
+
+
+def parse_resource_file(path):
+    return ResourceDocument(read_text(path), path)
+
+
+# ---------------------------------------------------------------------------
+# uid:// index
+# ---------------------------------------------------------------------------
+
+_HEADER_UID = re.compile(r'^\[gd_(?:scene|resource)[^\]]*?\buid="(uid://[^"]+)"')
+_IMPORT_UID = re.compile(r'^uid="(uid://[^"]+)"', re.M)
+
+
+def build_uid_index(root=PROJECT_ROOT):
+    """Map uid:// strings to res:// paths using headers, .uid and .import sidecars"""
+    index = {}
+    for rel in iter_project_files((".tscn", ".tres", ".uid", ".import"), root):
+        full = os.path.join(root, rel)
+        try:
+            if rel.endswith(".uid"):
+                uid = read_text(full).strip()
+                if uid.startswith("uid://"):
+                    index[uid] = to_res(rel[:-len(".uid")])
+            elif rel.endswith(".import"):
+                m = _IMPORT_UID.search(read_text(full))
+                if m:
+                    index[m.group(1)] = to_res(rel[:-len(".import")])
+            else:
+                with open(full, "r", encoding="utf-8-sig", errors="replace") as f:
+                    m = _HEADER_UID.match(f.readline())
+                if m:
+                    index[m.group(1)] = to_res(rel)
+        except OSError:
+            continue
+    return index
+
+
+# ---------------------------------------------------------------------------
+# Reference extraction
+# ---------------------------------------------------------------------------
+
+_GD_LOAD_CALL = re.compile(r'\b(?:preload|load|ResourceLoader\.load(?:_threaded_request)?)\(\s*"([^"\n]+)"')
+_GD_RES_LITERAL = re.compile(r'"(res://[^"\n]*)"|\'(res://[^\'\n]*)\'')
+_SHADER_INCLUDE = re.compile(r'^\s*#include\s+"([^"]+)"', re.M)
+_CLASS_NAME = re.compile(r'^\s*class_name\s+([A-Za-z_][A-Za-z0-9_]*)', re.M)
+_CLASS_IDENT = re.compile(r'\b[A-Z][A-Za-z0-9_]*\b')
+_GD_STRING = re.compile(r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'')
+
+
+def strip_gd_comment(line):
+    """Drop a trailing '#' comment from a GDScript line, ignoring '#' in strings"""
+    quote = None
+    i = 0
+    while i < len(line):
+        c = line[i]
+        if quote:
+            if c == "\\":
+                i += 1
+            elif c == quote:
+                quote = None
+        elif c in "\"'":
+            quote = c
+        elif c == "#":
+            return line[:i]
+        i += 1
+    return line
+
+
+def script_references(text, res_path=""):
+    """res:// paths referenced by a GDScript: load/preload calls and path literals"""
+    refs = []
+    for line in text.splitlines():
+        code = strip_gd_comment(line)
+        if "load" in code:
+            for m in _GD_LOAD_CALL.finditer(code):
+                refs.append(resolve_relative(m.group(1), res_path))
+        if "res://" in code:
+            for m in _GD_RES_LITERAL.finditer(code):
+                refs.append(m.group(1) or m.group(2))
+    return _unique(refs)
+
+
+def script_class_references(text, class_index):
+    """Global classes (class_name) a GDScript uses, as res:// script paths"""
+    refs = []
+    for line in text.splitlines():
+        code = _GD_STRING.sub('""', strip_gd_comment(line))
+        for name in _CLASS_IDENT.findall(code):
+            if name in class_index:
+                refs.append(class_index[name])
+    return _unique(refs)
+
+
+def build_class_index(root=PROJECT_ROOT):
+    """class_name -> res:// script path for every GDScript in the project"""
+    index = {}
+    for rel in iter_project_files(SCRIPT_EXTENSIONS, root):
+        m = _CLASS_NAME.search(read_text(os.path.join(root, rel)))
+        if m:
+            index.setdefault(m.group(1), to_res(rel))
+    return index
+
+
+def shader_references(text, res_path=""):
+    return _unique(resolve_relative(m.group(1), res_path) for m in _SHADER_INCLUDE.finditer(text))
+
+
+def document_references(doc, uid_index=None):
+    """res:// targets of every ext_resource in a parsed text resource"""
+    refs = []
+    for section in doc.ext_resources.values():
+        target = ext_resource_target(section, uid_index, doc.path)
+        if target:
+            refs.append(target)
+    return _unique(refs)
+
+
+def ext_resource_target(section, uid_index=None, base_path=""):
+    """Resolve an ext_resource section the way the engine does: uid first, then path"""
+    uid = section.attr("uid")
+    if uid and uid_index and uid in uid_index:
+        return uid_index[uid]
+    path = section.attr("path")
+    if path:
+        return resolve_relative(path, base_path) if base_path else path
+    return None
+
+
+def _unique(items):
+    seen = set()
+    out = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            out.append(item)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Dependency graph
+# ---------------------------------------------------------------------------
+
+class ResourceGraph:
+    """Lazily built res:// dependency graph over the project tree"""
+
+    def __init__(self, root=PROJECT_ROOT, class_edges=True):
+        self.root = root
+        self.uid_index = build_uid_index(root)
+        self.class_index = build_class_index(root) if class_edges else {}
+        self._edges = {}
+        self._documents = {}
+        self.missing = {}
+
+    def exists(self, res_path):
+        return os.path.isfile(res_to_file(res_path, self.root))
+
+    def resolve(self, ref):
+        """Turn a uid:// or res:// reference into a res:// path (or None)"""
+        if ref.startswith("uid://"):
+            return self.uid_index.get(ref)
+        return ref
+
+    def document(self, res_path):
+        """Parsed .tscn/.tres (cached), or None"""
+        if res_path not in self._documents:
+            doc = None
+            if res_path.endswith(TEXT_RESOURCE_EXTENSIONS) and self.exists(res_path):
+                doc = parse_resource_file(res_to_file(res_path, self.root))
+                doc.path = res_path
+            self._documents[res_path] = doc
+        return self._documents[res_path]
+
+    def references(self, res_path):
+        """Direct, existing dependencies of a file in declaration order"""
+        if res_path in self._edges:
+            return self._edges[res_path]
+        raw = []
+        if self.exists(res_path):
+            if res_path.endswith(TEXT_RESOURCE_EXTENSIONS):
+                raw = document_references(self.document(res_path), self.uid_index)
+            elif res_path.endswith(SCRIPT_EXTENSIONS):
+                text = read_text(res_to_file(res_path, self.root))
+                raw = script_references(text, res_path)
+                if self.class_index:
+                    raw = _unique(raw + script_class_references(text, self.class_index))
+            elif res_path.endswith(SHADER_EXTENSIONS):
+                raw = shader_references(read_text(res_to_file(res_path, self.root)), res_path)
+        edges = []
+        for ref in raw:
+            target = self.resolve(ref)
+            if target is None or target == res_path:
+                continue
+            if "." not in target.rsplit("/", 1)[-1]:
+                continue  # directory prefix such as MAP_OBJECTS_PATH
+            if self.exists(target):
+                edges.append(target)
+            else:
+                self.missing.setdefault(res_path, []).append(target)
+        self._edges[res_path] = _unique(edges)
+        return self._edges[res_path]
+
+    def closure(self, roots):
+        """All files reachable from roots, dependencies before dependents"""
+        order = []
+        visited = set()
+        for root_path in roots:
+            if root_path in visited:
+                continue
+            visited.add(root_path)
+            stack = [(root_path, iter(self.references(root_path)))]
+            while stack:
+                node, children = stack[-1]
+                advanced = False
+                for child in children:
+                    if child not in visited:
+                        visited.add(child)
+                        stack.append((child, iter(self.references(child))))
+                        advanced = True
+                        break
+                if not advanced:
+                    stack.pop()
+                    order.append(node)
+        return order
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Lint the per-frame code paths of the project's GDScript.
+
+Godot calls _process, _physics_process and _integrate_forces every frame
+(72-120 times a second on a headset). This lint follows each of them
+into the functions it calls, transitively within the same script (and
+inner class), and reports the work that should happen once instead:
+
+- runtime-load       load("...") (preload is resolved at parse time)
+- instantiate        PackedScene.instantiate()
+- resource-new       StandardMaterial3D.new(), ArrayMesh.new(), ...
+- object-new         any other T.new()
+- print              print/prints/printt/print_debug/print_rich/push_*
+- group-lookup       find_child, get_nodes_in_group, ... (walk the tree)
+- node-lookup        $Path, %Name, get_node(), get_node_or_null(), has_node()
+- array-alloc        [...], {...}, Array(), Packed*Array(), duplicate(),
+                     get_children(), keys(), values(), map(), filter()
+- string-format      "..." % args, .format(), str(), "..." + x
+
+Each finding is ranked by its rule's cost times how often it runs per
+frame: x10 for every enclosing for/while loop, and for a helper, the
+highest rate any per-frame caller calls it at (a call inside a loop of
+_process makes the whole helper run x10). Formatting inside a print()
+(and anything else in its arguments) is part of the print and not
+reported again.
+
+With --baseline the known findings are read from a JSON file and the
+run fails only on new ones; --update-baseline writes the file. Findings
+are matched by script, function, rule and source line (not line number)
+so unrelated edits do not make them "new".
+
+Usage:
+    python lint_hotpath.py                               # all scripts, top 25
+    python lint_hotpath.py algorithms/chaos --top 50
+    python lint_hotpath.py --json hotpath.json
+    python lint_hotpath.py --baseline hotpath_baseline.json --update-baseline
+    python lint_hotpath.py --baseline hotpath_baseline.json   # CI: exit 1 on new findings
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+
+from gdscript_index import block_end
+from gdscript_tokens import (INDENT, KEYWORD, NAME, NODE_PATH, NUMBER, OPERATOR, STRING, LexError, ScriptWalker,
+                             TokenCache, matching_close, statement_end, statement_start)
+from godot_resources import PROJECT_ROOT, iter_project_files
+
+FRAME_CALLBACKS = ("_process", "_physics_process", "_integrate_forces")
+LOOP_FACTOR = 10
+MAX_RATE = 1000
+
+RULES = {
+    "runtime-load": (15, "load() from disk"),
+    "instantiate": (12, "scene instantiated"),
+    "resource-new": (10, "resource allocated"),
+    "object-new": (4, "object allocated"),
+    "print": (6, "printed"),
+    "group-lookup": (6, "tree searched"),
+    "node-lookup": (3, "node looked up by path"),
+    "array-alloc": (2, "array/dictionary built"),
+    "string-format": (2, "string formatted"),
+}
+
+# Resources by name; CollisionShape3D, CSGMesh3D & co. are nodes
+RESOURCE_CLASS = re.compile(r"^(?!Collision|CSG)\w*(Material|Mesh|Texture\w*|Shader|Image|Environment|Sky|Curve|Gradient|"
+                            r"Noise\w*|SurfaceTool|MeshDataTool|StyleBox\w*|Font|Shape|Theme|Animation)([23]D)?$")
+PRINTS = ("print", "prints", "printt", "printraw", "print_debug", "print_rich", "push_warning", "push_error")
+GROUP_LOOKUPS = ("find_child", "find_children", "find_node", "get_nodes_in_group", "get_first_node_in_group")
+NODE_LOOKUPS = ("get_node", "get_node_or_null", "has_node")
+ARRAY_CONSTRUCTORS = ("Array", "Dictionary", "PackedByteArray", "PackedInt32Array", "PackedInt64Array",
+                      "PackedFloat32Array", "PackedFloat64Array", "PackedStringArray", "PackedVector2Array",
+                      "PackedVector3Array", "PackedVector4Array", "PackedColorArray")
+ARRAY_METHODS = ("duplicate", "get_children", "keys", "values", "map", "filter", "slice")
+_OPERAND_END = frozenset({NAME, NUMBER, STRING, NODE_PATH})
+
+
+class Finding:
+    __slots__ = ("script", "line", "function", "via", "rule", "loops", "rate", "snippet")
+
+    def __init__(self, script, line, function, via, rule, loops, rate, snippet):
+        self.script = script
+        self.line = line
+        self.function = function
+        self.via = via
+        self.rule = rule
+        self.loops = loops
+        self.rate = rate
+        self.snippet = snippet
+
+    @property
+    def cost(self):
+        return RULES[self.rule][0] * self.rate
+
+    def key(self):
+        return f"{self.script}|{self.function}|{self.rule}|{self.snippet}"
+
+    def as_dict(self):
+        return {"script": self.script, "line": self.line, "function": self.function, "via": self.via,
+                "rule": self.rule, "cost": self.cost, "loops": self.loops, "rate": self.rate,
+                "snippet": self.snippet}
+
+
+def find_functions(text, tokens):
+    """(owner, name) -> (first, last) token range of every named func"""
+    functions = {}
+
+    def visit(walker, i):
+        if tokens[i + 1].kind == NAME and walker.function == tokens[i + 1].value:
+            functions[(walker.owner, tokens[i + 1].value)] = (i, block_end(tokens, i))
+
+    ScriptWalker(text, tokens).walk({"func": [visit]})
+    return functions
+
+
+def loop_bodies(tokens, first, last):
+    """(start, end) token ranges of the for/while bodies in first..last"""
+    bodies = []
+    for i in range(first, last + 1):
+        token = tokens[i]
+        if token.kind != KEYWORD or token.value not in ("for", "while") or statement_start(tokens, i) != i:
+            continue
+        end = statement_end(tokens, i)
+        body_end = block_end(tokens, i)
+        if tokens[end + 1].kind == INDENT:
+            bodies.append((end + 1, body_end))
+            continue
+        # One-line loop: the body follows the header's ":"
+        j = i + 1
+        while j < end:
+            value = tokens[j].value
+            if tokens[j].kind == OPERATOR and value in "([{":
+                j = matching_close(tokens, j)
+            elif value == ":" and not (tokens[j + 1].kind == NAME and tokens[j + 2].value == "in"):
+                bodies.append((j + 1, end))
+                break
+            j += 1
+    return bodies
+
+
+class ScriptLint:
+    """Per-frame call graph and findings of one script"""
+
+    def __init__(self, rel, text, tokens):
+        self.rel = rel
+        self.text = text
+        self.tokens = tokens
+        self.functions = find_functions(text, tokens)
+        self.loops = {key: loop_bodies(tokens, *span) for key, span in self.functions.items()}
+
+    def loop_depth(self, key, i):
+        return sum(1 for start, end in self.loops[key] if start <= i <= end)
+
+    def calls(self, key):
+        """(callee key, token index) of the calls to same-class functions"""
+        owner = key[0]
+        tokens = self.tokens
+        first, last = self.functions[key]
+        for i in range(first + 2, last):
+            token = tokens[i]
+            if token.kind != NAME or tokens[i + 1].value != "(":
+                continue
+            before = tokens[i - 1]
+            if before.value == "." and tokens[i - 2].value != "self":
+                continue
+            if before.value == "func":
+                continue
+            callee = (owner, token.value)
+            if callee in self.functions and callee != key:
+                yield callee, i
+
+    def rates(self):
+        """key -> (calls per frame, chain from the frame callback)"""
+        rates = {}
+        pending = []
+        for key in self.functions:
+            if key[1] in FRAME_CALLBACKS:
+                rates[key] = (1, key[1])
+                pending.append(key)
+        while pending:
+            key = pending.pop()
+            rate, chain = rates[key]
+            for callee, i in self.calls(key):
+                callee_rate = min(rate * LOOP_FACTOR ** self.loop_depth(key, i), MAX_RATE)
+                if callee not in rates or rates[callee][0] < callee_rate:
+                    rates[callee] = (callee_rate, f"{chain} > {callee[1]}")
+                    pending.append(callee)
+        return rates
+
+    def snippet(self, i):
+        line = self.text.splitlines()[self.tokens[i].line - 1] if self.tokens[i].line else ""
+        return " ".join(line.split())
+
+    def findings(self):
+        found = []
+        for key, (rate, chain) in sorted(self.rates().items(), key=lambda item: self.functions[item[0]]):
+            first, last = self.functions[key]
+            name = f"{key[0]}.{key[1]}" if key[0] else key[1]
+            for i, rule in self.sites(first, last):
+                loops = self.loop_depth(key, i)
+                site_rate = min(rate * LOOP_FACTOR ** loops, MAX_RATE)
+                found.append(Finding(self.rel, self.tokens[i].line, name, chain, rule, loops, site_rate,
+                                     self.snippet(i)))
+        return found
+
+    def sites(self, first, last):
+        """(token index, rule) of every costly construct in first..last"""
+        tokens = self.tokens
+        # Skip the signature: default arguments are not per-frame work
+        i = statement_end(tokens, first) if tokens[first + 1].kind == NAME else first
+        printing_until = -1
+        while i < last:
+            i += 1
+            token = tokens[i]
+            kind, value = token.kind, token.value
+            before = tokens[i - 1]
+            after = tokens[i + 1]
+            called = after.value == "("
+            method = before.value == "." and before.kind == OPERATOR
+            if kind == NODE_PATH:
+                yield i, "node-lookup"
+            elif kind == NAME and called and not method and value in PRINTS:
+                yield i, "print"
+                printing_until = matching_close(tokens, i + 1)
+            elif i <= printing_until:
+                continue
+            elif kind == NAME and called and not method and value == "load":
+                yield i, "runtime-load"
+            elif kind == NAME and called and value == "instantiate":
+                yield i, "instantiate"
+            elif kind == NAME and value == "new" and called and method and tokens[i - 2].kind == NAME:
+                yield i, "resource-new" if RESOURCE_CLASS.match(tokens[i - 2].value) else "object-new"
+            elif kind == NAME and called and value in GROUP_LOOKUPS:
+                yield i, "group-lookup"
+            elif kind == NAME and called and value in NODE_LOOKUPS and (not method or tokens[i - 2].value == "self"):
+                yield i, "node-lookup"
+            elif kind == NAME and called and not method and value in ARRAY_CONSTRUCTORS:
+                yield i, "array-alloc"
+            elif kind == NAME and called and value in ARRAY_METHODS and (method or value == "get_children"):
+                yield i, "array-alloc"
+            elif kind == OPERATOR and value in ("[", "{") and before.kind not in _OPERAND_END \
+                    and before.value not in (")", "]", "}"):
+                yield i, "array-alloc"
+            elif kind == STRING and after.value == "%" and after.kind == OPERATOR:
+                yield i, "string-format"
+            elif kind == NAME and called and ((value == "str" and not method) or (value == "format" and method)):
+                yield i, "string-format"
+            elif kind == STRING and (after.value == "+" or before.value == "+") and value[:1] not in "&^":
+                yield i, "string-format"
+
+
+def load_baseline(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return Counter(json.load(f).get("findings", {}))
+    except (OSError, ValueError):
+        return Counter()
+
+
+def new_findings(findings, baseline):
+    """Findings beyond the number the baseline allows for their key"""
+    allowed = Counter(baseline)
+    fresh = []
+    for finding in findings:
+        key = finding.key()
+        if allowed[key] > 0:
+            allowed[key] -= 1
+        else:
+            fresh.append(finding)
+    return fresh
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find allocations and lookups in per-frame GDScript code")
+    parser.add_argument("paths", nargs="*", help="project-relative folders or scripts (default: all)")
+    parser.add_argument("--top", type=int, default=25, help="hot-list length (default 25)")
+    parser.add_argument("--json", metavar="PATH", help="write the full report as JSON")
+    parser.add_argument("--baseline", metavar="JSON", help="known findings; exit with 1 on any new one")
+    parser.add_argument("--update-baseline", action="store_true", help="write the current findings to --baseline")
+    parser.add_argument("--root", default=PROJECT_ROOT, help="project root")
+    args = parser.parse_args(argv)
+    if args.update_baseline and not args.baseline:
+        parser.error("--update-baseline needs --baseline")
+
+    start = time.monotonic()
+    scope = [p.strip("/") for p in args.paths]
+    scripts = [rel for rel in iter_project_files(".gd", args.root)
+               if not scope or any(rel == p or rel.startswith(p + "/") for p in scope)]
+    cache = TokenCache(args.root)
+    findings = []
+    hot_scripts = 0
+    failed = []
+    for rel in scripts:
+        try:
+            text, tokens = cache.tokens(rel)
+        except LexError as exc:
+            failed.append((rel, str(exc)))
+            continue
+        found = ScriptLint(rel, text, tokens).findings()
+        hot_scripts += bool(found)
+        findings.extend(found)
+    cache.save()
+    findings.sort(key=lambda f: (-f.cost, f.script, f.line))
+
+    print("Linting per-frame GDScript code...")
+    print("=" * 60)
+    print(f"{len(scripts)} scripts, {len(findings)} findings in {hot_scripts} "
+          f"({cache.hits} token streams cached, {cache.misses} tokenized)")
+    by_rule = Counter(f.rule for f in findings)
+    cost_by_rule = Counter()
+    for finding in findings:
+        cost_by_rule[finding.rule] += finding.cost
+    for rule, (cost, summary) in RULES.items():
+        print(f"  {rule:<15} {by_rule[rule]:6d}  total cost {cost_by_rule[rule]:8d}  ({summary}, cost {cost})")
+
+    print(f"\nHot-list (top {min(args.top, len(findings))}):")
+    for finding in findings[:args.top]:
+        loops = f" in {finding.loops} loop{'s' if finding.loops > 1 else ''}" if finding.loops else ""
+        print(f"{finding.cost:7d}  {finding.script}:{finding.line} [{finding.rule}]{loops}")
+        print(f"           {finding.via}: {finding.snippet[:100]}")
+    for rel, message in failed:
+        print(f"  could not tokenize {rel}: {message}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([finding.as_dict() for finding in findings], f, indent=2)
+        print(f"\nReport written to {args.json}")
+
+    fresh = []
+    if args.baseline and args.update_baseline:
+        keys = Counter(finding.key() for finding in findings)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"findings": dict(sorted(keys.items()))}, f, indent=1)
+            f.write("\n")
+        print(f"\nBaseline of {len(findings)} findings written to {args.baseline}")
+    elif args.baseline:
+        if not os.path.exists(args.baseline):
+            print(f"\nNo baseline at {args.baseline}; every finding is new")
+        fresh = new_findings(findings, load_baseline(args.baseline))
+        print(f"\n{len(fresh)} findings not in {args.baseline}")
+        for finding in fresh:
+            print(f"  {finding.script}:{finding.line} [{finding.rule}] {finding.function}: {finding.snippet[:100]}")
+
+    print(f"Done in {time.monotonic() - start:.1f}s")
+    print("=" * 60)
+    return 1 if fresh else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
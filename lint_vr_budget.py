@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Static VR performance budget linter for .tscn scenes.
+
+Every scene is parsed with the shared text resource parser and its node
+tree is walked, including instanced sub-scenes. For each scene it estimates:
+- draw calls: mesh instances x surfaces x material passes (next_pass and
+  material_overlay each add a pass), plus MultiMesh, particles and Label3D
+- dynamic lights (Omni/Spot/Directional) and how many cast shadows
+- shadow-casting geometry (GeometryInstance3D.cast_shadow defaults to on)
+- CSG nodes and RigidBody3D nodes
+- particle systems whose amount exceeds the per-emitter budget of the
+  scene's category, those of instanced sub-scenes included
+
+Counts are compared against budgets for standalone VR (72-90 fps). The
+defaults below can be overridden per category (the first two path
+components, e.g. "algorithms/chaos") with a JSON file:
+
+    {"default": {"draw_calls": 150}, "algorithms/primitives": {"lights": 2}}
+
+Only what is authored in the scene files is counted; nodes created from
+scripts at runtime are invisible to this linter.
+
+Usage:
+    python lint_vr_budget.py                       # lint every scene
+    python lint_vr_budget.py algorithms/chaos      # lint a subtree
+    python lint_vr_budget.py --budgets budgets.json --top 50 --json report.json
+
+Exits with 1 when any scene is over budget, so it can gate CI.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from godot_resources import (PROJECT_ROOT, ResourceGraph, ext_resource_target, iter_project_files,
+                             join_node_path, to_res, value_refs)
+
+DEFAULT_BUDGETS = {
+    "draw_calls": 100,
+    "lights": 4,
+    "shadow_lights": 1,
+    "shadow_casters": 50,
+    "csg_nodes": 10,
+    "rigid_bodies": 30,
+    "particle_amount": 256,
+}
+
+METRICS = list(DEFAULT_BUDGETS)
+
+LIGHT_TYPES = {"OmniLight3D", "SpotLight3D", "DirectionalLight3D"}
+MESH_TYPES = {"MeshInstance3D", "SoftBody3D"}
+PARTICLE_TYPES = {"GPUParticles3D", "CPUParticles3D"}
+BILLBOARD_TYPES = {"Label3D", "Sprite3D", "AnimatedSprite3D"}
+DEFAULT_PARTICLE_AMOUNT = {"GPUParticles3D": 8, "CPUParticles3D": 8}
+
+
+class SceneStats:
+    """Budget counters for one scene (instanced sub-scenes included)"""
+
+    def __init__(self):
+        self.draw_calls = 0
+        self.lights = 0
+        self.shadow_lights = 0
+        self.shadow_casters = 0
+        self.csg_nodes = 0
+        self.rigid_bodies = 0
+        self.particle_amount = 0  # largest single emitter
+        self.particle_systems = []  # (node path, amount) of every emitter
+        self.nodes = 0
+
+    def add(self, other, instance_path="."):
+        """Fold in the stats of a scene instanced at instance_path"""
+        for name in ("draw_calls", "lights", "shadow_lights", "shadow_casters",
+                     "csg_nodes", "rigid_bodies", "nodes"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.particle_amount = max(self.particle_amount, other.particle_amount)
+        self.particle_systems += [(join_node_path(instance_path, path), amount)
+                                  for path, amount in other.particle_systems]
+
+    def metric(self, name):
+        return getattr(self, name)
+
+
+class BudgetLinter:
+    def __init__(self, graph):
+        self.graph = graph
+        self._stats = {}
+        self._active = set()
+        self._node_types = {}
+
+    # -- resource inspection -------------------------------------------------
+
+    def _resource(self, doc, raw):
+        """Resolve a property value to (document, section) of the resource it names"""
+        for kind, ref_id in value_refs(raw or ""):
+            if kind == "SubResource":
+                section = doc.sub_resources.get(ref_id)
+                return (doc, section) if section else (None, None)
+            section = doc.ext_resources.get(ref_id)
+            if section is None:
+                return None, None
+            target = ext_resource_target(section, self.graph.uid_index, doc.path)
+            other = self.graph.document(target) if target else None
+            if other is not None and other.resource is not None:
+                return other, other.resource
+            return None, None
+        return None, None
+
+    def _surface_count(self, doc, raw_mesh):
+        _mesh_doc, mesh = self._resource(doc, raw_mesh)
+        if mesh is None:
+            return 1
+        surfaces = mesh.properties.get("_surfaces")
+        if surfaces:
+            return max(surfaces.count('"format":'), 1)
+        return 1
+
+    def _material_passes(self, doc, raw_material):
+        """1 + the length of the next_pass chain"""
+        passes = 1
+        seen = set()
+        mat_doc, material = self._resource(doc, raw_material)
+        while material is not None and id(material) not in seen:
+            seen.add(id(material))
+            next_raw = material.properties.get("next_pass")
+            if not next_raw:
+                break
+            passes += 1
+            mat_doc, material = self._resource(mat_doc, next_raw)
+        return passes
+
+    def _mesh_draw_calls(self, doc, node):
+        surfaces = self._surface_count(doc, node.properties.get("mesh"))
+        override = node.properties.get("material_override")
+        if override:
+            calls = surfaces * self._material_passes(doc, override)
+        else:
+            calls = 0
+            for i in range(surfaces):
+                raw = node.properties.get("surface_material_override/%d" % i)
+                calls += self._material_passes(doc, raw) if raw else 1
+        if node.properties.get("material_overlay"):
+            calls += surfaces
+        return calls
+
+    # -- scene walk ----------------------------------------------------------
+
+    def scene_stats(self, res_path):
+        """SceneStats for a scene, cached; instanced scenes are expanded"""
+        if res_path in self._stats:
+            return self._stats[res_path]
+        stats = SceneStats()
+        doc = self.graph.document(res_path)
+        if doc is None or doc.kind != "gd_scene" or res_path in self._active:
+            return stats
+        self._active.add(res_path)
+        for node in doc.nodes:
+            self._count_node(doc, node, stats)
+        self._active.discard(res_path)
+        self._stats[res_path] = stats
+        return stats
+
+    def _count_node(self, doc, node, stats):
+        instance = node.attrs.get("instance")
+        if instance:
+            _kind, ref_id = next(value_refs(instance), (None, None))
+            section = doc.ext_resources.get(ref_id)
+            target = ext_resource_target(section, self.graph.uid_index, doc.path) if section else None
+            if target and target.endswith(".tscn") and self.graph.exists(target):
+                stats.add(self.scene_stats(target), doc.node_path(node))
+            return
+
+        node_type = node.attr("type", "")
+        if not node_type:
+            return  # override of a node inside an instanced scene
+        stats.nodes += 1
+        props = node.properties
+
+        if node_type in LIGHT_TYPES:
+            stats.lights += 1
+            if node.get("shadow_enabled", False):
+                stats.shadow_lights += 1
+            return
+        if node_type.startswith("CSG"):
+            stats.csg_nodes += 1
+            # Only the root of a CSG tree produces geometry
+            if self._parent_type(doc, node).startswith("CSG"):
+                return
+            stats.draw_calls += 1
+            if node.get("cast_shadow", 1) != 0:
+                stats.shadow_casters += 1
+            return
+        if node_type == "RigidBody3D":
+            stats.rigid_bodies += 1
+            return
+
+        if node_type in MESH_TYPES:
+            if not props.get("mesh"):
+                return
+            stats.draw_calls += self._mesh_draw_calls(doc, node)
+        elif node_type == "MultiMeshInstance3D":
+            if not props.get("multimesh"):
+                return
+            stats.draw_calls += 1
+        elif node_type in PARTICLE_TYPES:
+            amount = node.get("amount", DEFAULT_PARTICLE_AMOUNT[node_type])
+            if not isinstance(amount, int):
+                amount = DEFAULT_PARTICLE_AMOUNT[node_type]
+            stats.draw_calls += 1
+            stats.particle_amount = max(stats.particle_amount, amount)
+            stats.particle_systems.append((doc.node_path(node), amount))
+        elif node_type in BILLBOARD_TYPES:
+            stats.draw_calls += 1
+        else:
+            return
+        if node.get("cast_shadow", 1) != 0:
+            stats.shadow_casters += 1
+
+    def _parent_type(self, doc, node):
+        types = self._node_types.get(doc.path)
+        if types is None:
+            types = {doc.node_path(n): n.attr("type") or "" for n in doc.nodes}
+            self._node_types[doc.path] = types
+        return types.get(node.attr("parent"), "")
+
+
+# ---------------------------------------------------------------------------
+# Budgets
+# ---------------------------------------------------------------------------
+
+def scene_category(rel_path):
+    parts = rel_path.split("/")
+    return "/".join(parts[:2]) if len(parts) > 2 else parts[0]
+
+
+def load_budgets(path=None):
+    """category -> budget dict; "default" holds the fallback"""
+    budgets = {"default": dict(DEFAULT_BUDGETS)}
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            overrides = json.load(f)
+        for category, values in overrides.items():
+            budgets.setdefault(category, {}).update(values)
+    return budgets
+
+
+def budget_for(budgets, rel_path):
+    """Merge the default budget with the longest matching category prefix"""
+    merged = dict(budgets["default"])
+    matches = [c for c in budgets if c != "default" and (rel_path == c or rel_path.startswith(c.rstrip("/") + "/"))]
+    for category in sorted(matches, key=len):
+        merged.update(budgets[category])
+    return merged
+
+
+def evaluate(stats, budget):
+    """(score, violations) where score sums each metric's share of its budget"""
+    score = 0.0
+    violations = []
+    for name in METRICS:
+        limit = budget.get(name)
+        if not limit:
+            continue
+        value = stats.metric(name)
+        score += value / limit
+        if value > limit:
+            violations.append((name, value, limit))
+    return score, violations
+
+
+def heavy_particle_systems(stats, budget):
+    """(node path, amount) of the emitters over the budget's per-emitter amount"""
+    limit = budget.get("particle_amount")
+    return [(path, amount) for path, amount in stats.particle_systems if limit and amount > limit]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check scenes against VR performance budgets")
+    parser.add_argument("paths", nargs="*", help="project-relative directories or .tscn files (default: all)")
+    parser.add_argument("--budgets", metavar="JSON", help="per-category budget overrides")
+    parser.add_argument("--top", type=int, default=25, help="hot-list length (default 25)")
+    parser.add_argument("--json", metavar="PATH", help="write the full report as JSON")
+    parser.add_argument("--root", default=PROJECT_ROOT, help="project root")
+    args = parser.parse_args(argv)
+
+    budgets = load_budgets(args.budgets)
+    graph = ResourceGraph(args.root, class_edges=False)
+    linter = BudgetLinter(graph)
+
+    scenes = []
+    for target in args.paths or [""]:
+        target = target.replace(os.sep, "/").rstrip("/")
+        if target.endswith(".tscn"):
+            scenes.append(target)
+        else:
+            scenes.extend(iter_project_files(".tscn", args.root, target))
+
+    print("Linting scenes against VR budgets...")
+    print("=" * 60)
+    results = []
+    for rel in scenes:
+        stats = linter.scene_stats(to_res(rel))
+        budget = budget_for(budgets, rel)
+        score, violations = evaluate(stats, budget)
+        results.append((score, rel, stats, violations, heavy_particle_systems(stats, budget)))
+    results.sort(key=lambda r: (-len(r[3]), -r[0], r[1]))
+
+    over = [r for r in results if r[3]]
+    print(f"{len(results)} scenes, {len(over)} over budget")
+    print(f"\nHot-list (top {min(args.top, len(results))}):")
+    for score, rel, stats, violations, heavy in results[:args.top]:
+        flag = "!!" if violations else "  "
+        print(f"{flag} {score:6.1f}  {rel}")
+        print(f"           draws={stats.draw_calls} lights={stats.lights} shadow_lights={stats.shadow_lights} "
+              f"casters={stats.shadow_casters} csg={stats.csg_nodes} rigid={stats.rigid_bodies} "
+              f"particles={stats.particle_amount}")
+        for name, value, limit in violations:
+            print(f"           over budget: {name} {value} > {limit}")
+        for node_path, amount in heavy:
+            print(f"           particles: {node_path} amount={amount}")
+
+    if args.json:
+        report = [{
+            "scene": rel,
+            "score": round(score, 3),
+            "metrics": {name: stats.metric(name) for name in METRICS},
+            "violations": [{"metric": n, "value": v, "budget": b} for n, v, b in violations],
+            "particle_systems": [{"node": p, "amount": a} for p, a in heavy],
+        } for score, rel, stats, violations, heavy in results]
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.json}")
+
+    print("=" * 60)
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Sharded parallel runner for tests/automated_scene_tester.gd.
+
+The tester loads every scene serially in one Godot process (up to
+TEST_TIMEOUT plus the screenshot waits per scene). This script splits the
+scene list into shards and runs one headless Godot per shard, several at
+a time, so wall-clock time drops with the number of cores:
+
+1. Scenes come from algorithms/ (every .tscn), from the categories of
+   ./algorithms.json (--catalog), or from explicit paths.
+2. Shards are balanced by the scene durations of the previous merged
+   report when there is one (longest first onto the least loaded shard),
+   otherwise dealt round robin.
+3. Each shard gets its list through --scene-list=FILE and streams its
+   results to its own --output-dir (shard_N/test_results.jsonl, see
+   scene_stream.py). Output goes to shard_N/godot.log.
+4. A shard that prints nothing for --idle-timeout seconds, or runs past
+   its time budget, is killed and retried (--retries) with --resume. The
+   scene it was testing (the start record without a result) is recorded
+   as failed, with the shard log, and the retry only tests the scenes
+   that never started. Scenes a lost shard never got to are reported as
+   not run rather than failed.
+5. The shard streams are merged into one detailed_test_report.json and
+   test_summary.csv in --output.
+
+The Godot command is configurable (--godot or $GODOT, split like a shell
+command line), so a stub executable can stand in for it.
+
+Usage:
+    python run_scene_tests.py                          # every scene, one shard per core
+    python run_scene_tests.py -j 8 algorithms/chaos    # a subtree on 8 processes
+    python run_scene_tests.py --catalog --godot "/opt/godot/Godot_v4.4-stable_linux.x86_64"
+    python scene_stream.py show scene_test_results/shard_*/test_results.jsonl --follow   # watch it live
+
+Exits with 1 when any scene failed to load or run, or a shard was lost.
+"""
+
+import argparse
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+
+import scene_stream
+from godot_maps import load_lenient_json
+from godot_resources import PROJECT_ROOT, iter_project_files, to_res
+from scene_stream import REPORT_JSON, STREAM_NAME, TESTER_SCRIPT, failed_result
+
+# Matches TEST_TIMEOUT in the tester plus its scene switch delays
+SCENE_BUDGET = 14.0
+STARTUP_BUDGET = 60.0
+
+
+def discover_scenes(paths=None, catalog=False, root=PROJECT_ROOT):
+    """Sorted res:// scene paths to test"""
+    if catalog:
+        data = load_lenient_json(os.path.join(root, "algorithms.json"))
+        scenes = set()
+        for entries in data.get("categories", {}).values():
+            for entry in entries:
+                path = entry if isinstance(entry, str) else entry.get("scene_path", "")
+                if path.endswith(".tscn") and os.path.exists(os.path.join(root, path[len("res://"):])):
+                    scenes.add(path)
+        return sorted(scenes)
+    scenes = []
+    for path in paths or ["algorithms"]:
+        if path.endswith(".tscn"):
+            scenes.append(path if path.startswith("res://") else to_res(path))
+        else:
+            scenes.extend(to_res(p) for p in iter_project_files(".tscn", root=root, subdir=path))
+    return sorted(set(scenes))
+
+
+def load_durations(report_path):
+    """{scene_path: seconds} from a previous merged report"""
+    if not report_path or not os.path.exists(report_path):
+        return {}
+    with open(report_path, encoding="utf-8") as f:
+        report = json.load(f)
+    return {r["scene_path"]: float(r.get("duration", 0.0)) for r in report.get("test_results", [])}
+
+
+def make_shards(scenes, count, durations=None):
+    """Split scenes into count lists; known durations are balanced greedily"""
+    count = max(1, min(count, len(scenes)))
+    shards = [[] for _ in range(count)]
+    if not durations:
+        for i, scene in enumerate(scenes):
+            shards[i % count].append(scene)
+        return shards
+    default = sum(durations.values()) / len(durations)
+    loads = [0.0] * count
+    for scene in sorted(scenes, key=lambda s: -durations.get(s, default)):
+        k = loads.index(min(loads))
+        shards[k].append(scene)
+        loads[k] += durations.get(scene, default)
+    return shards
+
+
+class Shard:
+    """One headless Godot process and its attempts. script, report and
+    the extra arguments let other SceneTree drivers reuse the runner; a
+    .jsonl report is a result stream, complete once it has its end record,
+    and resume_arg is passed on retries to continue it instead of
+    starting over."""
+
+    def __init__(self, index, scenes, output_dir, script=TESTER_SCRIPT, report=STREAM_NAME,
+                 engine_args=(), user_args=(), resume_arg="--resume"):
+        self.index = index
+        self.scenes = scenes
+        self.script = script
+        self.report = report
+        self.engine_args = list(engine_args)
+        self.user_args = list(user_args)
+        self.resume_arg = resume_arg
+        self.dir = os.path.join(output_dir, "shard_%d" % index)
+        self.list_path = os.path.join(self.dir, "scenes.txt")
+        self.log_path = os.path.join(self.dir, "godot.log")
+        self.queued = []
+        self.process = None
+        self.log = None
+        self.attempts = 0
+        self.started = 0.0
+        self.last_output = 0.0
+        self.log_size = 0
+        self.duration = 0.0
+        self.status = "pending"
+
+    @property
+    def report_path(self):
+        return os.path.join(self.dir, self.report)
+
+    def command(self, godot, root, resuming=False):
+        results_dir = os.path.abspath(self.dir) + os.sep
+        return godot + ["--headless", "--path", root] + self.engine_args + ["--script", self.script, "--",
+                        "--scene-list=" + os.path.abspath(self.list_path),
+                        "--output-dir=" + results_dir.replace(os.sep, "/")] + self.user_args + \
+            ([self.resume_arg] if resuming else [])
+
+    def start(self, godot, root):
+        os.makedirs(self.dir, exist_ok=True)
+        resuming = self.resume_arg is not None and self.attempts > 0
+        if not resuming and os.path.exists(self.report_path):
+            os.remove(self.report_path)
+        self.queued = self.untested() if resuming else self.scenes
+        with open(self.list_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(self.queued) + "\n")
+        self.attempts += 1
+        self.log = open(self.log_path, "a" if resuming else "w", encoding="utf-8")
+        self.process = subprocess.Popen(self.command(godot, root, resuming), cwd=root, stdout=self.log,
+                                        stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL)
+        self.started = self.last_output = time.monotonic()
+        self.log_size = os.path.getsize(self.log_path)
+        self.status = "running"
+
+    def poll(self, idle_timeout, budget):
+        """None while running, else 'done', 'failed' or 'hung'"""
+        now = time.monotonic()
+        size = os.path.getsize(self.log_path)
+        if size != self.log_size:
+            self.log_size = size
+            self.last_output = now
+        code = self.process.poll()
+        if code is None:
+            if now - self.last_output > idle_timeout or now - self.started > budget:
+                self.kill()
+                return "hung"
+            return None
+        self.finish()
+        return "done" if self.completed() else "failed"
+
+    def untested(self):
+        """Scenes the stream has no result for (every scene for other reports)"""
+        if not self.report.endswith(".jsonl"):
+            return list(self.scenes)
+        recorded = scene_stream.read_stream(self.report_path).results
+        return [scene for scene in self.scenes if scene not in recorded]
+
+    def record_unfinished(self, outcome):
+        """Record the scene a crashed or hung attempt was testing as failed,
+        so a retry does not run into it again; returns those scenes"""
+        if not self.report.endswith(".jsonl"):
+            return []
+        scenes = scene_stream.read_stream(self.report_path).unfinished()
+        error = "%s shard %d on attempt %d, see %s" % (
+            "Hung" if outcome == "hung" else "Crashed", self.index, self.attempts, self.log_path)
+        scene_stream.append_records(self.report_path, [failed_result(scene, error, crashed=True, log=self.log_path)
+                                                       for scene in scenes])
+        return scenes
+
+    def completed(self):
+        if self.report.endswith(".jsonl"):
+            return scene_stream.read_stream(self.report_path).finished
+        return os.path.exists(self.report_path)
+
+    def kill(self):
+        self.process.kill()
+        self.process.wait()
+        self.finish()
+
+    def finish(self):
+        self.duration += time.monotonic() - self.started
+        self.log.close()
+
+
+def run_shards(shards, godot, root, jobs, retries, idle_timeout, scene_budget):
+    """Run every shard with at most jobs processes at once"""
+    pending = list(shards)
+    running = []
+    while pending or running:
+        while pending and len(running) < jobs:
+            shard = pending.pop(0)
+            shard.start(godot, root)
+            print(f"  shard {shard.index}: {len(shard.queued)} scenes (attempt {shard.attempts})")
+            running.append(shard)
+        time.sleep(0.2)
+        for shard in list(running):
+            budget = STARTUP_BUDGET + scene_budget * len(shard.scenes)
+            outcome = shard.poll(idle_timeout, budget)
+            if outcome is None:
+                continue
+            running.remove(shard)
+            if outcome == "done":
+                shard.status = "done"
+                print(f"  shard {shard.index}: done in {shard.duration:.1f}s")
+                continue
+            for scene in shard.record_unfinished(outcome):
+                print(f"  shard {shard.index}: {'hung' if outcome == 'hung' else 'crashed'} in {scene}, recorded as failed")
+            if not shard.untested():
+                # Every scene has a result, the crashed ones included
+                shard.status = "done"
+                print(f"  shard {shard.index}: {outcome} on its last scene, nothing left to retry")
+            elif shard.attempts <= retries:
+                print(f"  shard {shard.index}: {outcome}, retrying (see {shard.log_path})")
+                pending.append(shard)
+            else:
+                shard.status = outcome
+                print(f"  shard {shard.index}: {outcome} after {shard.attempts} attempts, giving up")
+
+
+def merge_reports(shards, output_dir, wall_time):
+    """Write the merged JSON and CSV; return the merged test results"""
+    results = []
+    godot_version = None
+    for shard in shards:
+        # A lost shard still keeps every scene its stream recorded
+        reader = scene_stream.read_stream(shard.report_path)
+        if reader.runs:
+            godot_version = godot_version or reader.runs[0].get("godot_version")
+        for result in reader.results.values():
+            result["shard"] = shard.index
+            results.append(result)
+        for scene in shard.scenes:
+            if scene in reader.results:
+                continue
+            if shard.status == "done":
+                result = failed_result(scene, "Not reported by shard %d" % shard.index)
+            else:
+                result = failed_result(scene, "Not run: shard %d %s after %d attempts" % (
+                    shard.index, shard.status, shard.attempts), not_run=True)
+            result["shard"] = shard.index
+            results.append(result)
+
+    scene_stream.write_reports(results, output_dir, godot_version=godot_version, wall_time=wall_time,
+                               shards=[{"index": s.index, "scenes": len(s.scenes), "attempts": s.attempts,
+                                        "duration": s.duration, "status": s.status} for s in shards])
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the automated scene tester in parallel shards")
+    parser.add_argument("paths", nargs="*", help="project-relative directories or .tscn files (default: algorithms)")
+    parser.add_argument("--catalog", action="store_true", help="test the scenes listed in ./algorithms.json")
+    parser.add_argument("--godot", default=os.environ.get("GODOT", "godot"),
+                        help="Godot command line, e.g. a full path or a stub (default: $GODOT or godot)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="concurrent Godot processes (default: CPU count)")
+    parser.add_argument("--shards", type=int, help="number of shards (default: --jobs)")
+    parser.add_argument("--retries", type=int, default=1, help="retries for a hung or crashed shard (default 1)")
+    parser.add_argument("--idle-timeout", type=float, default=60.0,
+                        help="kill a shard that prints nothing for this many seconds (default 60)")
+    parser.add_argument("--scene-budget", type=float, default=SCENE_BUDGET,
+                        help="seconds allowed per scene before a shard counts as hung (default %.0f)" % SCENE_BUDGET)
+    parser.add_argument("--output", default="scene_test_results", help="merged report folder (default scene_test_results)")
+    parser.add_argument("--timings", metavar="JSON",
+                        help="report whose scene durations balance the shards (default: the previous merged report)")
+    parser.add_argument("--root", default=PROJECT_ROOT, help="project root")
+    args = parser.parse_args(argv)
+
+    scenes = discover_scenes(args.paths, args.catalog, args.root)
+    if not scenes:
+        print("No scenes to test")
+        return 1
+    os.makedirs(args.output, exist_ok=True)
+    durations = load_durations(args.timings or os.path.join(args.output, REPORT_JSON))
+    shards = [Shard(i, s, args.output) for i, s in
+              enumerate(make_shards(scenes, args.shards or args.jobs, durations))]
+
+    print("=" * 60)
+    print(f"Testing {len(scenes)} scenes in {len(shards)} shards, {args.jobs} at a time")
+    if durations:
+        print(f"Shards balanced by durations of {len(durations)} scenes from the last run")
+    print("=" * 60)
+    start = time.monotonic()
+    run_shards(shards, shlex.split(args.godot), args.root, max(1, args.jobs), args.retries,
+               args.idle_timeout, args.scene_budget)
+    wall_time = time.monotonic() - start
+    results = merge_reports(shards, args.output, wall_time)
+
+    passed = sum(1 for r in results if r.get("load_success") and r.get("runtime_success"))
+    not_run = sum(1 for r in results if r.get("not_run"))
+    crashed = [r for r in results if r.get("crashed")]
+    shard_time = sum(s.duration for s in shards)
+    print("\n" + "=" * 60)
+    print(f"{passed}/{len(results) - not_run} scenes passed" + (f", {not_run} not run" if not_run else ""))
+    for result in crashed:
+        print(f"  crashed: {result['scene_path']}" + (f" (see {result['log']})" if result.get("log") else ""))
+    print(f"Wall time {wall_time:.1f}s, shard time {shard_time:.1f}s "
+          f"({shard_time / wall_time if wall_time else 0:.1f}x parallel)")
+    lost = [s for s in shards if s.status != "done"]
+    if lost:
+        print(f"Lost shards: {', '.join(str(s.index) for s in lost)}")
+    print(f"Merged report: {os.path.join(args.output, REPORT_JSON)}")
+    print("=" * 60)
+    return 0 if passed == len(results) and not lost else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
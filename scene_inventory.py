@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Incremental scene inventory: one JSON Lines record per .tscn.
+
+Every scene is parsed with the shared text resource parser and its nodes
+are listed with resolved types: a node without a type takes the root type
+of the scene it instances, and nodes overridden in an inherited scene or
+under an instance with editable children take the type from the scene
+they come from. Attached scripts are resolved to their res:// path,
+class_name, extends and leading comment block.
+
+    {"scene": "algorithms/chaos/lorenz/lorenz.tscn", "sha256": "...",
+     "dependencies": {"res://algorithms/chaos/lorenz/lorenz.gd": "..."},
+     "root_node": {"name": "Lorenz", "type": "Node3D", "script": "res://...", ...},
+     "child_count": 3, "children": [{"name": "Camera3D", "type": "Camera3D", "parent": ".", ...}],
+     "script_comment": "Lorenz attractor ..."}
+
+A record is reused while the sha256 of its scene and of every file it
+was resolved through (instanced scenes, scripts) is unchanged, so after
+editing one scene only its record (and those of scenes instancing it)
+is rebuilt; stale scenes are parsed in a process pool. The short
+descriptions file is regenerated from the inventory.
+
+Usage:
+    python scene_inventory.py                        # update scene_inventory.jsonl and scene_descriptions.txt
+    python scene_inventory.py algorithms/chaos -j 4  # only these folders; other records are kept
+    python scene_inventory.py --force                # rebuild every record
+    python scene_inventory.py --show algorithms/chaos/lorenz/lorenz.tscn
+"""
+
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import os
+import sys
+import time
+
+from godot_resources import (PROJECT_ROOT, build_uid_index, ext_resource_target, iter_project_files,
+                             parse_resource_text, read_text, res_to_file, to_res, value_refs)
+
+DEFAULT_INVENTORY = "scene_inventory.jsonl"
+DEFAULT_DESCRIPTIONS = "scene_descriptions.txt"
+DESCRIPTION_NODES = 6
+
+_uid_index = {}
+
+
+def file_hash(path):
+    """sha256 of a file, or None when it does not exist"""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def script_summary(text):
+    """(class_name, extends, leading comment block) of a GDScript"""
+    class_name = extends = None
+    comment = []
+    in_header = True
+    for line in text.splitlines():
+        stripped = line.strip()
+        if in_header:
+            if stripped.startswith("#"):
+                comment.append(stripped.lstrip("#").strip())
+                continue
+            if stripped or comment:
+                in_header = False
+        if stripped.startswith("class_name ") and class_name is None:
+            class_name = stripped.split()[1]
+        elif stripped.startswith("extends ") and extends is None:
+            extends = stripped.split(None, 1)[1].split("#")[0].strip()
+        if class_name and extends:
+            break
+    return class_name, extends, " ".join(c for c in comment if c) or None
+
+
+class SceneResolver:
+    """Parses the scenes and scripts one record is built from, caching them
+    by res:// path and remembering the hash of every file it reads"""
+
+    def __init__(self, root):
+        self.root = root
+        self._documents = {}
+        self._scripts = {}
+        self.dependencies = {}
+
+    def _read(self, res_path):
+        path = res_to_file(res_path, self.root)
+        if not os.path.isfile(path):
+            return None
+        self.dependencies[res_path] = file_hash(path)
+        return read_text(path)
+
+    def document(self, res_path):
+        if res_path not in self._documents:
+            text = self._read(res_path)
+            self._documents[res_path] = parse_resource_text(text, res_path) if text is not None else None
+        return self._documents[res_path]
+
+    def script(self, res_path):
+        if res_path not in self._scripts:
+            text = self._read(res_path)
+            self._scripts[res_path] = script_summary(text) if text is not None else (None, None, None)
+        return self._scripts[res_path]
+
+    def ext_target(self, doc, raw_value):
+        """res:// path of an ExtResource("id") value"""
+        refs = [ref_id for kind, ref_id in value_refs(raw_value) if kind == "ExtResource"]
+        if not refs:
+            return None
+        section = doc.ext_resource(refs[0])
+        return ext_resource_target(section, _uid_index, doc.path) if section is not None else None
+
+    def node_type(self, doc, node, seen=()):
+        """Type of a node section, looked up through instances when it has none"""
+        explicit = node.attr("type")
+        if explicit:
+            return explicit
+        if node.attrs.get("instance_placeholder"):
+            return "InstancePlaceholder"
+        if node.attrs.get("instance"):
+            return self.scene_root_type(self.ext_target(doc, node.attrs["instance"]), seen)
+        # An override of a node that comes from an instanced (or inherited) scene
+        path = doc.node_path(node)
+        for other in reversed(doc.nodes):
+            if other is node or not other.attrs.get("instance"):
+                continue
+            base = doc.node_path(other)
+            prefix = "" if base == "." else base + "/"
+            if path.startswith(prefix):
+                sub_path = path[len(prefix):] if base != "." else path
+                return self.scene_node_type(self.ext_target(doc, other.attrs["instance"]), sub_path, seen)
+        return None
+
+    def scene_root_type(self, res_path, seen=()):
+        return self.scene_node_type(res_path, ".", seen)
+
+    def scene_node_type(self, res_path, node_path, seen=()):
+        if not res_path or res_path in seen:
+            return None
+        doc = self.document(res_path)
+        if doc is None:
+            return None
+        for node in doc.nodes:
+            if doc.node_path(node) == node_path:
+                return self.node_type(doc, node, seen + (res_path,))
+        return None
+
+    def node_record(self, doc, node, res_path):
+        record = {
+            "name": node.attr("name", ""),
+            "type": self.node_type(doc, node, (res_path,)),
+        }
+        parent = node.attr("parent")
+        if parent is not None:
+            record["parent"] = parent
+        if node.properties.get("unique_name_in_owner") == "true":
+            record["unique_name"] = True
+        instance = node.attrs.get("instance")
+        record["instance"] = self.ext_target(doc, instance) if instance else None
+        script_raw = node.properties.get("script")
+        script = self.ext_target(doc, script_raw) if script_raw else None
+        record["script"] = script
+        if script:
+            class_name, extends, _comment = self.script(script)
+            record["script_class"] = class_name
+            record["extends"] = extends
+        return record
+
+
+def _init_worker(uid_index):
+    global _uid_index
+    _uid_index = uid_index
+
+
+def inventory_scene(rel_path, root=PROJECT_ROOT):
+    """Inventory record of one project-relative .tscn"""
+    res_path = to_res(rel_path)
+    record = {"scene": rel_path, "sha256": file_hash(os.path.join(root, rel_path))}
+    resolver = SceneResolver(root)
+    try:
+        doc = resolver.document(res_path)
+        root_node = doc.root_node() if doc is not None else None
+        if root_node is None:
+            record["error"] = "no root node"
+        else:
+            record["root_node"] = resolver.node_record(doc, root_node, res_path)
+            children = [resolver.node_record(doc, node, res_path) for node in doc.nodes if node is not root_node]
+            record["child_count"] = len(children)
+            record["children"] = children
+            script = record["root_node"].get("script")
+            record["script_comment"] = resolver.script(script)[2] if script else None
+    except (ValueError, IndexError, KeyError) as exc:
+        record["error"] = "%s: %s" % (type(exc).__name__, exc)
+    resolver.dependencies.pop(res_path, None)
+    record["dependencies"] = dict(sorted(resolver.dependencies.items()))
+    return record
+
+
+def load_inventory(path):
+    """{scene: (record, original line)} of an existing inventory"""
+    records = {}
+    if not os.path.exists(path):
+        return records
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            records[record["scene"]] = (record, line)
+    return records
+
+
+def is_fresh(record, scene_hash, hashes, root):
+    """A cached record is valid while its scene and every dependency are unchanged"""
+    if record.get("sha256") != scene_hash:
+        return False
+    for res_path, digest in record.get("dependencies", {}).items():
+        if res_path not in hashes:
+            hashes[res_path] = file_hash(res_to_file(res_path, root))
+        if hashes[res_path] != digest:
+            return False
+    return True
+
+
+def describe(record):
+    """One-line description: the root script's comment, else the node outline"""
+    if record.get("script_comment"):
+        return record["script_comment"]
+    if "root_node" not in record:
+        return "Unreadable scene (%s)." % record.get("error", "unknown error")
+    names = [child["name"] for child in record.get("children", [])[:DESCRIPTION_NODES]]
+    text = "Root %s scene" % (record["root_node"].get("type") or "instanced")
+    if len(names) > 2:
+        text += " with nodes such as %s, and %s" % (", ".join(names[:-1]), names[-1])
+    elif names:
+        text += " with nodes such as %s" % " and ".join(names)
+    return text + "."
+
+
+def write_if_changed(path, content):
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp, path)
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the incremental scene inventory")
+    parser.add_argument("paths", nargs="*", help="project-relative folders or scenes to update (default: all)")
+    parser.add_argument("--inventory", default=DEFAULT_INVENTORY, help="JSON Lines inventory (default %s)" % DEFAULT_INVENTORY)
+    parser.add_argument("--descriptions", default=DEFAULT_DESCRIPTIONS,
+                        help="short descriptions file (default %s)" % DEFAULT_DESCRIPTIONS)
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="parser processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="rebuild every record in scope")
+    parser.add_argument("--show", metavar="SCENE", help="print the record of one scene and exit")
+    parser.add_argument("--root", default=PROJECT_ROOT, help="project root")
+    args = parser.parse_args(argv)
+
+    cached = load_inventory(args.inventory)
+    if args.show:
+        scene = args.show[len("res://"):] if args.show.startswith("res://") else args.show
+        if scene not in cached:
+            print(f"{scene} is not in {args.inventory}")
+            return 1
+        print(json.dumps(cached[scene][0], indent=2))
+        return 0
+
+    start = time.monotonic()
+    scope = [p.strip("/") for p in args.paths]
+    scenes = [rel for rel in iter_project_files(".tscn", args.root)
+              if not scope or any(rel == p or rel.startswith(p + "/") for p in scope)]
+    in_scope = set(scenes)
+
+    hashes = {}
+    stale = []
+    for rel in scenes:
+        scene_hash = file_hash(os.path.join(args.root, rel))
+        hashes[to_res(rel)] = scene_hash
+        if args.force or rel not in cached or not is_fresh(cached[rel][0], scene_hash, hashes, args.root):
+            stale.append(rel)
+
+    rebuilt = {}
+    if stale:
+        uid_index = build_uid_index(args.root)
+        if args.jobs > 1 and len(stale) > 1:
+            with concurrent.futures.ProcessPoolExecutor(args.jobs, initializer=_init_worker,
+                                                        initargs=(uid_index,)) as pool:
+                chunk = max(1, len(stale) // (args.jobs * 4))
+                for record in pool.map(inventory_scene, stale, [args.root] * len(stale), chunksize=chunk):
+                    rebuilt[record["scene"]] = record
+        else:
+            _init_worker(uid_index)
+            for rel in stale:
+                rebuilt[rel] = inventory_scene(rel, args.root)
+
+    removed = [rel for rel in cached if rel not in in_scope and (not scope or
+               any(rel == p or rel.startswith(p + "/") for p in scope))]
+    lines = {}
+    for rel, (record, line) in cached.items():
+        if rel not in removed:
+            lines[rel] = line
+    changed = []
+    for rel, record in rebuilt.items():
+        line = json.dumps(record, ensure_ascii=False)
+        if lines.get(rel) != line:
+            changed.append(rel)
+        lines[rel] = line
+    write_if_changed(args.inventory, "".join(lines[rel] + "\n" for rel in sorted(lines)))
+
+    descriptions = []
+    for rel in sorted(lines):
+        record = rebuilt[rel] if rel in rebuilt else cached[rel][0]
+        descriptions.append("%s: %s\n" % (rel, describe(record)))
+    write_if_changed(args.descriptions, "".join(descriptions))
+
+    added = sum(1 for rel in changed if rel not in cached)
+    errors = sum(1 for rel in lines if "error" in (rebuilt.get(rel) or cached[rel][0]))
+    print("=" * 60)
+    print(f"{len(scenes)} scenes in scope, {len(lines)} in {args.inventory}")
+    print(f"  parsed {len(stale)}, updated {len(changed) - added}, added {added}, removed {len(removed)}")
+    if errors:
+        print(f"  {errors} scenes could not be read (see their \"error\" field)")
+    print(f"Descriptions: {args.descriptions}")
+    print(f"Done in {time.monotonic() - start:.1f}s")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
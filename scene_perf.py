@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Per-scene runtime performance history with regression detection.
+
+tests/scene_perf_probe.gd runs every scene headless for a fixed number of
+process and physics frames (--fixed-fps, fixed random seed) and records
+Performance monitors as percentiles: process and physics time, object,
+node, resource and orphan node counts, static memory. This script runs
+the probe through the sharded runner of run_scene_tests.py, appends the
+results to a SQLite history keyed by commit, and compares a run against
+a rolling baseline of the runs before it.
+
+The probe streams one record per scene (perf_report.jsonl, the format of
+scene_stream.py), so a shard that crashes or hangs is retried with
+--resume: the scene it was probing is recorded as failed and the retry
+probes only the scenes after it. Every scene that finished is recorded
+in the history, lost shards included.
+
+A scene regresses on a metric when its value is both significantly and
+materially above the baseline: z = (value - mean) / sd over the last
+--window runs of other commits is at least --z, the value is at least
+--min-ratio above the mean and above the metric's absolute noise floor.
+With a single baseline run there is no spread, so only the ratio and
+floor apply. A category regresses when the log ratios of its scenes are
+shifted up as a whole: a one-sample t statistic of at least --t over at
+least three scenes and a geometric mean ratio above --min-ratio.
+
+Usage:
+    python scene_perf.py run algorithms/chaos              # probe, record, compare
+    python scene_perf.py run --catalog -j 2 --frames 600
+    python scene_perf.py import perf/perf_report.json --commit abc123
+    python scene_perf.py import scene_perf_results/shard_0/perf_report.jsonl
+    python scene_perf.py compare                           # latest run vs its baseline
+    python scene_perf.py history res://algorithms/chaos/lorenz/lorenz.tscn
+
+The compare and run commands exit with 1 when something regressed.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import shlex
+import sqlite3
+import subprocess
+import sys
+import time
+
+import run_scene_tests
+import scene_stream
+from godot_resources import PROJECT_ROOT
+
+PROBE_SCRIPT = "res://tests/scene_perf_probe.gd"
+PROBE_STREAM = "perf_report.jsonl"
+PROBE_REPORT = "perf_report.json"
+DEFAULT_DB = "scene_perf_history.sqlite"
+STATS = ("p50", "p95", "p99", "max", "mean")
+
+# Differences below these are noise whatever the statistics say
+NOISE_FLOORS = {
+    "process_ms": 0.05,
+    "physics_ms": 0.05,
+    "static_memory_mb": 0.5,
+    "objects": 1.0,
+    "nodes": 1.0,
+    "resources": 1.0,
+    "orphan_nodes": 1.0,
+}
+DEFAULT_METRICS = ("process_ms", "physics_ms", "static_memory_mb", "nodes", "orphan_nodes")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    commit_hash TEXT NOT NULL,
+    dirty INTEGER NOT NULL DEFAULT 0,
+    created TEXT NOT NULL,
+    host TEXT,
+    engine TEXT,
+    frames INTEGER,
+    warmup INTEGER,
+    seed INTEGER
+);
+CREATE TABLE IF NOT EXISTS scene_metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    scene TEXT NOT NULL,
+    category TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    p50 REAL, p95 REAL, p99 REAL, max REAL, mean REAL, n INTEGER,
+    PRIMARY KEY (run_id, scene, metric)
+);
+CREATE INDEX IF NOT EXISTS scene_metrics_lookup ON scene_metrics (scene, metric, run_id);
+"""
+
+
+def open_db(path):
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    return db
+
+
+def git_commit(root=PROJECT_ROOT):
+    """(commit hash, working tree has tracked changes)"""
+    try:
+        head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, capture_output=True,
+                              text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=root,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        return head, bool(status)
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+def read_report(path):
+    """A probe report, from a merged perf_report.json or a probe stream"""
+    if not path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    if not os.path.exists(path):
+        raise SystemExit(f"No probe stream {path}")
+    reader = scene_stream.read_stream(path)
+    report = {k: v for k, v in (reader.runs[0] if reader.runs else {}).items() if k not in ("type", "scenes")}
+    report["results"] = [{k: v for k, v in r.items() if k != "type"} for r in reader.results.values()]
+    return report
+
+
+def record_run(db, report, commit, dirty):
+    """Append one probe report to the history; return the run id"""
+    version = report.get("godot_version") or {}
+    cursor = db.execute(
+        "INSERT INTO runs (commit_hash, dirty, created, host, engine, frames, warmup, seed) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (commit, int(dirty), time.strftime("%Y-%m-%dT%H:%M:%S"), platform.node(),
+         version.get("string") if isinstance(version, dict) else str(version),
+         report.get("frames"), report.get("warmup"), report.get("seed")))
+    run_id = cursor.lastrowid
+    rows = []
+    for result in report.get("results", []):
+        if not result.get("load_success"):
+            continue
+        scene = result["scene_path"]
+        category = scene_stream.scene_category(scene)
+        for metric, values in result.get("metrics", {}).items():
+            rows.append((run_id, scene, category, metric) + tuple(values.get(s) for s in STATS)
+                        + (values.get("n"),))
+    db.executemany("INSERT OR REPLACE INTO scene_metrics VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    db.commit()
+    return run_id
+
+
+def baseline_runs(db, run_id, window):
+    """Ids of the last window comparable runs before run_id on other commits"""
+    target = db.execute("SELECT commit_hash, frames, warmup, seed FROM runs WHERE id = ?", (run_id,)).fetchone()
+    if target is None:
+        raise SystemExit(f"No run {run_id} in the history")
+    commit, frames, warmup, seed = target
+    rows = db.execute(
+        "SELECT id FROM runs WHERE id < ? AND commit_hash != ? AND frames IS ? AND warmup IS ? AND seed IS ? "
+        "ORDER BY id DESC LIMIT ?", (run_id, commit, frames, warmup, seed, window)).fetchall()
+    return [r[0] for r in rows]
+
+
+def mean_sd(values):
+    mean = sum(values) / len(values)
+    if len(values) < 2:
+        return mean, 0.0
+    return mean, math.sqrt(sum((v - mean) ** 2 for v in values) / (len(values) - 1))
+
+
+def compare_run(db, run_id, window=10, stat="p50", metrics=DEFAULT_METRICS, z=3.0, t=3.0, min_ratio=0.1):
+    """(scene regressions, category regressions, number of baseline runs)"""
+    baseline = baseline_runs(db, run_id, window)
+    if not baseline:
+        return [], [], 0
+    marks = ",".join("?" * len(baseline))
+    history = {}
+    for scene, metric, value in db.execute(
+            f"SELECT scene, metric, {stat} FROM scene_metrics WHERE run_id IN ({marks})", baseline):
+        history.setdefault((scene, metric), []).append(value)
+
+    scene_regressions = []
+    log_ratios = {}
+    for scene, category, metric, value in db.execute(
+            f"SELECT scene, category, metric, {stat} FROM scene_metrics WHERE run_id = ?", (run_id,)):
+        if metric not in metrics or (scene, metric) not in history:
+            continue
+        values = history[(scene, metric)]
+        mean, sd = mean_sd(values)
+        floor = NOISE_FLOORS.get(metric, 0.0)
+        if mean > 0 and value > 0:
+            log_ratios.setdefault((category, metric), []).append(math.log(value / mean))
+        if value - mean <= floor or value < mean * (1.0 + min_ratio):
+            continue
+        # A flat history still has measurement noise of about the floor
+        score = (value - mean) / max(sd, floor) if len(values) > 1 else None
+        if score is None or score >= z:
+            scene_regressions.append({"scene": scene, "category": category, "metric": metric,
+                                      "baseline": mean, "value": value, "z": score, "runs": len(values)})
+
+    category_regressions = []
+    for (category, metric), ratios in sorted(log_ratios.items()):
+        if len(ratios) < 3:
+            continue
+        mean, sd = mean_sd(ratios)
+        score = mean / (sd / math.sqrt(len(ratios))) if sd > 0 else (math.inf if mean > 0 else 0.0)
+        if score >= t and math.exp(mean) >= 1.0 + min_ratio:
+            category_regressions.append({"category": category, "metric": metric, "ratio": math.exp(mean),
+                                         "t": score, "scenes": len(ratios)})
+
+    scene_regressions.sort(key=lambda r: -(r["value"] / r["baseline"] if r["baseline"] else math.inf))
+    category_regressions.sort(key=lambda r: -r["ratio"])
+    return scene_regressions, category_regressions, len(baseline)
+
+
+def print_comparison(db, run_id, args):
+    scenes, categories, runs = compare_run(db, run_id, args.window, args.stat, args.metrics,
+                                           args.z, args.t, args.min_ratio)
+    commit = db.execute("SELECT commit_hash FROM runs WHERE id = ?", (run_id,)).fetchone()[0]
+    print("\n" + "=" * 60)
+    print(f"Run {run_id} ({commit[:10]}) vs {runs} baseline runs, {args.stat}")
+    print("=" * 60)
+    if not runs:
+        print("No earlier comparable runs; nothing to compare")
+        return 0
+    print(f"\nCategory regressions: {len(categories)}")
+    for r in categories:
+        print(f"  {r['category']:<28} {r['metric']:<18} {r['ratio']:6.2f}x  t={r['t']:.1f}  ({r['scenes']} scenes)")
+    print(f"\nScene regressions: {len(scenes)}")
+    for r in scenes[:args.top]:
+        score = "z=%.1f" % r["z"] if r["z"] is not None else "1 run"
+        print(f"  {r['metric']:<18} {r['baseline']:>10.3f} -> {r['value']:>10.3f}  {score:<8} {r['scene']}")
+    if len(scenes) > args.top:
+        print(f"  ... and {len(scenes) - args.top} more")
+    return 1 if scenes or categories else 0
+
+
+def cmd_run(args):
+    scenes = run_scene_tests.discover_scenes(args.paths, args.catalog, args.root)
+    if not scenes:
+        print("No scenes to probe")
+        return 1
+    os.makedirs(args.output, exist_ok=True)
+    user_args = [f"--frames={args.frames}", f"--warmup={args.warmup}", f"--seed={args.seed}"]
+    shards = [run_scene_tests.Shard(i, s, args.output, script=PROBE_SCRIPT, report=PROBE_STREAM,
+                                    engine_args=["--fixed-fps", str(args.fixed_fps)], user_args=user_args)
+              for i, s in enumerate(run_scene_tests.make_shards(scenes, args.jobs))]
+    print(f"Probing {len(scenes)} scenes in {len(shards)} shards ({args.frames} frames, seed {args.seed})")
+    run_scene_tests.run_shards(shards, shlex.split(args.godot), args.root, args.jobs, args.retries,
+                               args.idle_timeout, args.scene_budget)
+
+    merged = None
+    for shard in shards:
+        # A lost shard still keeps every scene its stream recorded
+        if not os.path.exists(shard.report_path):
+            continue
+        report = read_report(shard.report_path)
+        if shard.status != "done":
+            print(f"  shard {shard.index} lost; {len(shard.untested())} of its {len(shard.scenes)} scenes "
+                  "are not recorded")
+        if merged is None:
+            merged = dict(report, results=[])
+        merged["results"].extend(report["results"])
+    if not merged or not merged["results"]:
+        print("No scene was probed")
+        return 1
+    with open(os.path.join(args.output, PROBE_REPORT), "w", encoding="utf-8") as f:
+        json.dump(merged, f, indent="\t")
+
+    commit, dirty = (args.commit, False) if args.commit else git_commit(args.root)
+    db = open_db(args.db)
+    run_id = record_run(db, merged, commit, dirty)
+    probed = sum(1 for r in merged["results"] if r.get("load_success"))
+    print(f"Recorded run {run_id}: {probed} scenes at {commit[:10]}{' (dirty)' if dirty else ''}")
+    return print_comparison(db, run_id, args)
+
+
+def cmd_import(args):
+    db = open_db(args.db)
+    commit, dirty = (args.commit, False) if args.commit else git_commit(args.root)
+    for path in args.reports:
+        run_id = record_run(db, read_report(path), commit, dirty)
+        print(f"Recorded {path} as run {run_id} ({commit[:10]})")
+    return 0
+
+
+def cmd_compare(args):
+    db = open_db(args.db)
+    run_id = args.run or (db.execute("SELECT MAX(id) FROM runs").fetchone()[0])
+    if run_id is None:
+        print("The history is empty")
+        return 1
+    return print_comparison(db, run_id, args)
+
+
+def cmd_history(args):
+    db = open_db(args.db)
+    rows = db.execute(
+        f"SELECT runs.id, runs.commit_hash, runs.created, scene_metrics.{args.stat} FROM scene_metrics "
+        "JOIN runs ON runs.id = scene_metrics.run_id WHERE scene = ? AND metric = ? ORDER BY runs.id",
+        (args.scene, args.metric)).fetchall()
+    if not rows:
+        print(f"No history for {args.scene} {args.metric}")
+        return 1
+    print(f"{args.scene} {args.metric} {args.stat}")
+    for run_id, commit, created, value in rows:
+        print(f"  run {run_id:<5} {commit[:10]:<10} {created}  {value:10.3f}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-scene performance history and regression checks")
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite history (default %s)" % DEFAULT_DB)
+    parser.add_argument("--root", default=PROJECT_ROOT, help="project root")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_compare_options(p):
+        p.add_argument("--window", type=int, default=10, help="baseline runs (default 10)")
+        p.add_argument("--stat", choices=STATS, default="p50", help="statistic compared (default p50)")
+        p.add_argument("--metrics", nargs="+", default=list(DEFAULT_METRICS), help="metrics compared")
+        p.add_argument("--z", type=float, default=3.0, help="scene z-score threshold (default 3)")
+        p.add_argument("--t", type=float, default=3.0, help="category t threshold (default 3)")
+        p.add_argument("--min-ratio", type=float, default=0.1, help="minimum relative increase (default 0.1)")
+        p.add_argument("--top", type=int, default=25, help="scene regressions listed (default 25)")
+
+    run = commands.add_parser("run", help="probe scenes, record the run and compare it")
+    run.add_argument("paths", nargs="*", help="project-relative directories or .tscn files (default: algorithms)")
+    run.add_argument("--catalog", action="store_true", help="probe the scenes listed in ./algorithms.json")
+    run.add_argument("--godot", default=os.environ.get("GODOT", "godot"), help="Godot command line")
+    run.add_argument("-j", "--jobs", type=int, default=1,
+                     help="concurrent Godot processes (default 1; more adds timing noise)")
+    run.add_argument("--frames", type=int, default=300, help="measured frames per scene (default 300)")
+    run.add_argument("--warmup", type=int, default=30, help="frames skipped before measuring (default 30)")
+    run.add_argument("--seed", type=int, default=12345, help="random seed set before each scene")
+    run.add_argument("--fixed-fps", type=int, default=60, help="engine --fixed-fps (default 60)")
+    run.add_argument("--retries", type=int, default=1, help="retries for a hung or crashed shard")
+    run.add_argument("--idle-timeout", type=float, default=60.0, help="kill a shard silent for this long")
+    run.add_argument("--scene-budget", type=float, default=30.0, help="seconds allowed per scene")
+    run.add_argument("--output", default="scene_perf_results", help="probe report folder")
+    run.add_argument("--commit", help="record under this commit instead of git HEAD")
+    add_compare_options(run)
+
+    imp = commands.add_parser("import", help="record existing probe reports")
+    imp.add_argument("reports", nargs="+", help="perf_report.json files or perf_report.jsonl streams")
+    imp.add_argument("--commit", help="commit to record them under (default git HEAD)")
+
+    cmp_ = commands.add_parser("compare", help="compare a recorded run with its baseline")
+    cmp_.add_argument("--run", type=int, help="run id (default: latest)")
+    add_compare_options(cmp_)
+
+    hist = commands.add_parser("history", help="one scene metric across runs")
+    hist.add_argument("scene", help="res:// scene path")
+    hist.add_argument("--metric", default="process_ms", help="metric (default process_ms)")
+    hist.add_argument("--stat", choices=STATS, default="p50", help="statistic (default p50)")
+
+    args = parser.parse_args(argv)
+    handlers = {"run": cmd_run, "import": cmd_import, "compare": cmd_compare, "history": cmd_history}
+    return handlers[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Consumer for the result stream of tests/automated_scene_tester.gd.
+
+The tester appends one JSON record per line to test_results.jsonl in its
+output folder and flushes it as it is written:
+
+    {"type": "run", "scenes": ["res://...", ...], "godot_version": {...}, ...}
+    {"type": "start", "scene_path": "res://..."}
+    {"type": "scene", "scene_path": "res://...", "load_success": true, ...}
+    {"type": "end", "total_scenes": 42, ...}
+
+A stream without an "end" record belongs to a run that is still going or
+was interrupted; everything up to the last complete line is usable. A
+"start" record without a "scene" record after it names the scene being
+tested, or, once the tester is gone, the scene that crashed or hung it.
+A resumed run (--resume) appends a new "run" record to the same file,
+records each such scene as failed ("crashed": true) and skips it.
+
+This script tails one or more streams live (shard streams of
+run_scene_tests.py included), keeping the category breakdown and the
+performance and error summaries up to date as records arrive; resumes an
+interrupted run by recording the crashed scene as failed and starting the
+tester on the scenes the stream does not record yet; and exports a stream as the detailed_test_report.json and
+test_summary.csv the tester used to write at the end of a run.
+
+Usage:
+    python scene_stream.py show results/test_results.jsonl
+    python scene_stream.py show scene_test_results/shard_*/test_results.jsonl --follow
+    python scene_stream.py resume results/test_results.jsonl --godot /opt/godot/godot
+    python scene_stream.py export results/test_results.jsonl --output results/
+
+Exits with 1 when a scene failed or the stream is incomplete.
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+
+from godot_resources import PROJECT_ROOT
+
+STREAM_NAME = "test_results.jsonl"
+TESTER_SCRIPT = "res://tests/automated_scene_tester.gd"
+CRASH_ERROR = "Crashed the tester before its result was recorded"
+REPORT_JSON = "detailed_test_report.json"
+SUMMARY_CSV = "test_summary.csv"
+CSV_HEADER = ["Scene Name", "Category", "Load Success", "Runtime Success", "Node Count", "FPS",
+              "Memory (MB)", "Duration (s)", "Errors", "Warnings"]
+
+
+class StreamReader:
+    """Incremental reader of one result stream. poll() consumes the
+    complete lines appended since the previous call, so a half-written
+    last line is picked up once the tester finishes it."""
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+        self.runs = []
+        self.results = {}
+        self.started = {}
+        self.finished = False
+        self.bad_lines = 0
+
+    def poll(self):
+        """Scene records added since the last call"""
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read()
+        end = data.rfind(b"\n")
+        if end < 0:
+            return []
+        self.offset += end + 1
+        new = []
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # The tail of a crashed write; the resumed run starts a new line
+                self.bad_lines += 1
+                continue
+            kind = record.get("type")
+            if kind == "run":
+                self.runs.append(record)
+                self.finished = False
+            elif kind == "start":
+                self.started[record["scene_path"]] = record
+            elif kind == "scene":
+                self.results[record["scene_path"]] = record
+                self.started.pop(record["scene_path"], None)
+                new.append(record)
+            elif kind == "end":
+                self.finished = True
+        return new
+
+    @property
+    def scenes(self):
+        """Every scene the runs in this stream set out to test, in order"""
+        planned = {}
+        for run in self.runs:
+            planned.update(dict.fromkeys(run.get("scenes", [])))
+        return list(planned)
+
+    def unfinished(self):
+        """Scenes started without a result: the one under test while the
+        tester runs, the ones that crashed or hung it once it is gone"""
+        return list(self.started)
+
+    def remaining(self):
+        """Planned scenes that were never started"""
+        return [scene for scene in self.scenes if scene not in self.results and scene not in self.started]
+
+
+def scene_category(res_path):
+    parts = res_path[len("res://"):].split("/")
+    return parts[1] if len(parts) > 2 and parts[0] == "algorithms" else "unknown"
+
+
+def failed_result(scene_path, error, **fields):
+    """A scene record for a scene that produced no result of its own"""
+    result = {
+        "type": "scene",
+        "scene_path": scene_path,
+        "scene_name": os.path.splitext(os.path.basename(scene_path))[0],
+        "category": scene_category(scene_path),
+        "load_success": False,
+        "runtime_success": False,
+        "screenshot_taken": False,
+        "errors": [error],
+        "warnings": [],
+        "performance": {},
+        "node_count": 0,
+        "duration": 0.0,
+    }
+    result.update(fields)
+    return result
+
+
+def append_records(path, records):
+    """Append records to a stream, on a fresh line if a crash left half of one"""
+    with open(path, "ab+") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell():
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        for record in records:
+            f.write(json.dumps(record).encode("utf-8") + b"\n")
+
+
+def read_stream(path):
+    reader = StreamReader(path)
+    reader.poll()
+    return reader
+
+
+def passed(result):
+    return bool(result.get("load_success") and result.get("runtime_success"))
+
+
+class ResultSummary:
+    """Category breakdown, performance analysis and error summary, updated
+    one result at a time like the tester's own running totals"""
+
+    def __init__(self):
+        self.total = 0
+        self.loads = 0
+        self.runtime = 0
+        self.screenshots = 0
+        self.categories = {}
+        self.fps_total = 0.0
+        self.fps_min = None
+        self.fps_max = 0.0
+        self.memory_total = 0.0
+        self.memory_max = 0.0
+        self.error_counts = {}
+        self.warnings = 0
+
+    def add(self, result):
+        self.total += 1
+        self.loads += bool(result.get("load_success"))
+        self.runtime += bool(result.get("runtime_success"))
+        self.screenshots += bool(result.get("screenshot_taken"))
+        stats = self.categories.setdefault(result.get("category", "unknown"),
+                                           {"total": 0, "successful": 0, "errors": 0})
+        stats["total"] += 1
+        stats["successful"] += passed(result)
+        stats["errors"] += bool(result.get("errors"))
+        # A crashed scene has no measurements to fold in
+        performance = result.get("performance")
+        if performance:
+            fps = performance.get("fps", 0)
+            memory = performance.get("memory_usage_mb", 0)
+            self.fps_total += fps
+            self.fps_min = fps if self.fps_min is None else min(self.fps_min, fps)
+            self.fps_max = max(self.fps_max, fps)
+            self.memory_total += memory
+            self.memory_max = max(self.memory_max, memory)
+        for error in result.get("errors", []):
+            self.error_counts[error] = self.error_counts.get(error, 0) + 1
+        self.warnings += len(result.get("warnings", []))
+
+    def print_report(self):
+        def share(count):
+            return f"{count}/{self.total} ({count * 100.0 / self.total if self.total else 0:.1f}%)"
+        print(f"Scenes tested:      {self.total}")
+        print(f"Successful loads:   {share(self.loads)}")
+        print(f"Successful runtime: {share(self.runtime)}")
+        print(f"Screenshots:        {share(self.screenshots)}")
+        print("\nCategories:")
+        for category, stats in sorted(self.categories.items()):
+            rate = stats["successful"] * 100.0 / stats["total"]
+            print(f"  {category:<28} {stats['total']:>4} scenes {rate:6.1f}% success {stats['errors']:>4} with errors")
+        if self.total:
+            print("\nPerformance:")
+            print(f"  FPS average {self.fps_total / self.total:.1f}, range {self.fps_min or 0:.1f} - {self.fps_max:.1f}")
+            print(f"  Memory average {self.memory_total / self.total:.1f} MB, peak {self.memory_max:.1f} MB")
+        errors = sum(self.error_counts.values())
+        print(f"\nErrors: {errors}, warnings: {self.warnings}")
+        for error, count in sorted(self.error_counts.items(), key=lambda item: -item[1])[:5]:
+            print(f"  {count:>4}x {error}")
+
+
+def result_line(result):
+    status = "PASS" if passed(result) else "FAIL"
+    performance = result.get("performance") or {}
+    line = f"{status} {result.get('scene_path')}  nodes {result.get('node_count', 0)}, fps {performance.get('fps', 0):.1f}"
+    if result.get("errors"):
+        line += "  " + "; ".join(result["errors"])
+    return line
+
+
+def csv_row(result):
+    performance = result.get("performance") or {}
+    return [result.get("scene_name", ""), result.get("category", ""),
+            "true" if result.get("load_success") else "false",
+            "true" if result.get("runtime_success") else "false",
+            "%d" % result.get("node_count", 0), "%.1f" % performance.get("fps", 0),
+            "%.1f" % performance.get("memory_usage_mb", 0), "%.2f" % result.get("duration", 0),
+            "%d" % len(result.get("errors", [])), "%d" % len(result.get("warnings", []))]
+
+
+def write_reports(results, output_dir, **fields):
+    """detailed_test_report.json and test_summary.csv for a list of results"""
+    results = [{k: v for k, v in r.items() if k != "type"} for r in results]
+    report = {"test_timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    report.update(fields)
+    report.update({"total_scenes": len(results), "test_results": results})
+    with open(os.path.join(output_dir, REPORT_JSON), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent="\t")
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(CSV_HEADER)
+    writer.writerows(csv_row(r) for r in results)
+    with open(os.path.join(output_dir, SUMMARY_CSV), "w", encoding="utf-8", newline="") as f:
+        f.write(buffer.getvalue())
+
+
+def watch(readers, summary, follow, process=None, interval=0.5):
+    """Print results as they arrive until every stream has ended (or,
+    without follow, until what is on disk has been read)"""
+    while True:
+        # Checked before reading so the last records of an exited tester are seen
+        exited = process is not None and process.poll() is not None
+        for reader in readers:
+            for result in reader.poll():
+                summary.add(result)
+                print(result_line(result), flush=True)
+        if all(r.finished for r in readers) or exited or (process is None and not follow):
+            return
+        time.sleep(interval)
+
+
+def print_status(readers, summary):
+    print("\n" + "=" * 60)
+    summary.print_report()
+    print("=" * 60)
+    incomplete = [r for r in readers if not r.finished]
+    for reader in incomplete:
+        print(f"Incomplete: {reader.path} ({len(reader.remaining())} scenes not recorded)")
+        for scene in reader.unfinished():
+            print(f"  started without a result: {scene}")
+    for reader in readers:
+        if reader.bad_lines:
+            print(f"Skipped {reader.bad_lines} unreadable line(s) in {reader.path}")
+    return 1 if incomplete or summary.loads < summary.total or summary.runtime < summary.total else 0
+
+
+def cmd_show(args):
+    readers = [StreamReader(path) for path in args.streams]
+    summary = ResultSummary()
+    try:
+        watch(readers, summary, args.follow)
+    except KeyboardInterrupt:
+        pass
+    return print_status(readers, summary)
+
+
+def cmd_resume(args):
+    reader = StreamReader(args.stream)
+    summary = ResultSummary()
+    reader.poll()
+    crashed = reader.unfinished()
+    if crashed:
+        # Recorded here so the tester skips them, and so they stay failed
+        # when nothing is left to test
+        append_records(args.stream, [failed_result(scene, CRASH_ERROR, crashed=True) for scene in crashed])
+        reader.poll()
+    for result in reader.results.values():
+        summary.add(result)
+    remaining = reader.remaining()
+    print(f"{len(reader.results) - len(crashed)} scenes recorded, {len(crashed)} crashed, {len(remaining)} left")
+    for scene in crashed:
+        print(f"  crashed: {scene}")
+    if not remaining:
+        return print_status([reader], summary)
+
+    output_dir = os.path.dirname(os.path.abspath(args.stream))
+    list_path = os.path.join(output_dir, "resume_scenes.txt")
+    with open(list_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(remaining) + "\n")
+    command = shlex.split(args.godot) + ["--headless", "--path", args.root, "--script", TESTER_SCRIPT, "--",
+                                         "--scene-list=" + list_path,
+                                         "--output-dir=" + (output_dir + os.sep).replace(os.sep, "/"), "--resume"]
+    with open(os.path.join(output_dir, "resume.log"), "w", encoding="utf-8") as log:
+        process = subprocess.Popen(command, cwd=args.root, stdout=log, stderr=subprocess.STDOUT,
+                                   stdin=subprocess.DEVNULL)
+        try:
+            watch([reader], summary, True, process)
+        except KeyboardInterrupt:
+            process.kill()
+        process.wait()
+    return print_status([reader], summary)
+
+
+def cmd_export(args):
+    results = []
+    godot_version = None
+    for path in args.streams:
+        reader = read_stream(path)
+        if reader.runs:
+            godot_version = godot_version or reader.runs[0].get("godot_version")
+        results.extend(reader.results.values())
+    os.makedirs(args.output, exist_ok=True)
+    write_reports(results, args.output, godot_version=godot_version)
+    print(f"Exported {len(results)} results to {os.path.join(args.output, REPORT_JSON)} and {SUMMARY_CSV}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tail, resume and export scene tester result streams")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    show = commands.add_parser("show", help="print results and the running summary")
+    show.add_argument("streams", nargs="+", help="test_results.jsonl files")
+    show.add_argument("--follow", "-f", action="store_true", help="keep reading until every stream has ended")
+
+    resume = commands.add_parser("resume", help="test the scenes an interrupted stream does not record")
+    resume.add_argument("stream", help="test_results.jsonl of the interrupted run")
+    resume.add_argument("--godot", default=os.environ.get("GODOT", "godot"), help="Godot command line")
+    resume.add_argument("--root", default=PROJECT_ROOT, help="project root")
+
+    export = commands.add_parser("export", help="write detailed_test_report.json and test_summary.csv")
+    export.add_argument("streams", nargs="+", help="test_results.jsonl files")
+    export.add_argument("--output", required=True, help="folder for the reports")
+
+    args = parser.parse_args(argv)
+    handlers = {"show": cmd_show, "resume": cmd_resume, "export": cmd_export}
+    return handlers[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
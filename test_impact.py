@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test impact analysis for the headless scene tests.
+
+Maps a set of changed files to the scenes whose dependency closure
+contains one of them, using the shared ResourceGraph (ext_resources of
+scenes and resources, load/preload and res:// literals and class_name
+uses in scripts, shader includes), and hands that list to
+run_scene_tests.py.
+
+Changed files come from git (--since REF, default HEAD: committed
+changes since REF plus the working tree and untracked files), from
+modification times (--newer-than FILE, e.g. the last merged report),
+or are listed explicitly (--changed). Sidecars map to their asset
+(icon.png.import -> icon.png, foo.gd.uid -> foo.gd); a deleted file
+affects every scene that still references it.
+
+Everything is retested when:
+- project.godot changes, or an autoload or anything an autoload loads
+- the tester itself (tests/automated_scene_tester.gd) changes
+- a shared script under Helpers/ or core/ changes that no scene reaches
+  through the graph (it can only be used by name at runtime)
+
+Usage:
+    python test_impact.py                          # list scenes affected by uncommitted changes
+    python test_impact.py --since origin/main --run -- -j 8
+    python test_impact.py --changed Helpers/ColorHelper.gd --list affected.txt
+
+Arguments after -- go to run_scene_tests.py.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+import run_scene_tests
+from godot_resources import PROJECT_ROOT, ResourceGraph, from_res, iter_project_files, read_text, to_res
+
+SHARED_DIRS = ("Helpers/", "core/")
+FULL_RUN_FILES = ("project.godot", "tests/automated_scene_tester.gd")
+SIDECAR_EXTENSIONS = (".import", ".uid")
+
+_AUTOLOAD_ENTRY = re.compile(r'^\s*[A-Za-z_][A-Za-z0-9_]*\s*=\s*"\*?((?:res|uid)://[^"]*)"', re.M)
+
+
+def autoload_scripts(graph, root=PROJECT_ROOT):
+    """res:// paths of the autoloads declared in project.godot"""
+    text = read_text(os.path.join(root, "project.godot"))
+    match = re.search(r'^\[autoload\]\s*$(.*?)(?=^\[|\Z)', text, re.M | re.S)
+    if not match:
+        return []
+    paths = []
+    for ref in _AUTOLOAD_ENTRY.findall(match.group(1)):
+        target = graph.resolve(ref)
+        if target:
+            paths.append(target)
+    return paths
+
+
+def git_changed_files(since="HEAD", root=PROJECT_ROOT):
+    """Project-relative paths changed since a revision, working tree included"""
+    def git(*args):
+        result = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True, check=True)
+        return [line for line in result.stdout.splitlines() if line]
+    changed = git("diff", "--name-only", "--no-renames", since)
+    changed += git("ls-files", "--others", "--exclude-standard")
+    return sorted(set(changed))
+
+
+def mtime_changed_files(reference, root=PROJECT_ROOT):
+    """Project files modified after the reference file was written"""
+    cutoff = os.path.getmtime(reference)
+    return [rel for rel in iter_project_files(root=root)
+            if os.path.getmtime(os.path.join(root, rel)) > cutoff]
+
+
+def normalize(rel_path):
+    """Project-relative changed path -> res:// path of the asset it belongs to"""
+    for ext in SIDECAR_EXTENSIONS:
+        if rel_path.endswith(ext):
+            rel_path = rel_path[:-len(ext)]
+    return to_res(rel_path)
+
+
+class ImpactAnalysis:
+    """Which scenes a set of changed files can affect"""
+
+    def __init__(self, scenes, root=PROJECT_ROOT):
+        self.root = root
+        self.scenes = scenes
+        self.graph = ResourceGraph(root)
+        self._closures = {}
+        autoloads = autoload_scripts(self.graph, root)
+        self.global_files = set(self.graph.closure(autoloads)) | {to_res(f) for f in FULL_RUN_FILES}
+        # Missing files an autoload asks for count as global too, should they reappear
+        for node in list(self.global_files):
+            self.global_files.update(self.graph.missing.get(node, ()))
+
+    def scene_closure(self, scene):
+        if scene not in self._closures:
+            self._closures[scene] = set(self.graph.closure([scene]))
+        return self._closures[scene]
+
+    def affected(self, changed):
+        """(scenes to test, reason for a full run or None)"""
+        changed = {normalize(path) for path in changed}
+        for path in sorted(changed):
+            if path in self.global_files:
+                return list(self.scenes), f"{from_res(path)} is loaded globally"
+
+        affected = []
+        reached = set()
+        for scene in self.scenes:
+            closure = self.scene_closure(scene)
+            hits = changed & closure
+            # Deleted dependencies are not in the closure, only in graph.missing
+            if not hits:
+                for node in closure:
+                    hits |= changed.intersection(self.graph.missing.get(node, ()))
+            if hits:
+                affected.append(scene)
+                reached |= hits
+
+        for path in sorted(changed - reached):
+            rel = from_res(path)
+            if rel.startswith(SHARED_DIRS) and rel.endswith(".gd"):
+                return list(self.scenes), f"{rel} is shared but no scene references it statically"
+        return affected, None
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    runner_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, runner_args = argv[:split], argv[split + 1:]
+
+    parser = argparse.ArgumentParser(description="Select the scenes affected by changed files")
+    parser.add_argument("--since", default="HEAD", help="git revision to diff against (default HEAD)")
+    parser.add_argument("--newer-than", metavar="FILE", help="use files modified after FILE instead of git")
+    parser.add_argument("--changed", nargs="+", metavar="PATH", help="explicit project-relative changed files")
+    parser.add_argument("--catalog", action="store_true", help="limit to the scenes listed in ./algorithms.json")
+    parser.add_argument("--list", metavar="FILE", help="write the affected res:// scene paths, one per line")
+    parser.add_argument("--run", action="store_true", help="run the affected scenes with run_scene_tests.py")
+    parser.add_argument("--root", default=PROJECT_ROOT, help="project root")
+    args = parser.parse_args(argv)
+
+    if args.changed:
+        changed = args.changed
+    elif args.newer_than:
+        changed = mtime_changed_files(args.newer_than, args.root)
+    else:
+        changed = git_changed_files(args.since, args.root)
+
+    scenes = run_scene_tests.discover_scenes(catalog=args.catalog, root=args.root)
+    analysis = ImpactAnalysis(scenes, args.root)
+    affected, full_reason = analysis.affected(changed)
+
+    print(f"{len(changed)} changed files")
+    if full_reason:
+        print(f"Full run: {full_reason}")
+    print(f"{len(affected)} of {len(scenes)} scenes affected")
+    for scene in affected[:20]:
+        print(f"  {scene}")
+    if len(affected) > 20:
+        print(f"  ... and {len(affected) - 20} more")
+
+    if args.list:
+        with open(args.list, "w", encoding="utf-8") as f:
+            f.write("".join(scene + "\n" for scene in affected))
+    if args.run:
+        if not affected:
+            print("Nothing to test")
+            return 0
+        return run_scene_tests.main([from_res(scene) for scene in affected] + runner_args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,23 @@
 # automated_scene_tester.gd
 # Comprehensive testing script for VR Algorithm Visualization Library
 # Tests all .tscn files, captures errors, and takes screenshots
+#
+# Results are streamed to <output dir>/test_results.jsonl, one JSON record
+# per line, flushed as it is written: a "run" record with the scene list, a
+# "start" record before each scene is loaded, a "scene" record per tested
+# scene and an "end" record. A crash or hang keeps every scene finished
+# before it, and the "start" record without a "scene" record names the scene
+# that took the tester down; scene_stream.py tails, resumes and exports the
+# stream (detailed_test_report.json, test_summary.csv).
+#
+# Command line (after --, e.g. from run_scene_tests.py):
+#   --scenes=res://a.tscn,res://b.tscn   test only these scenes
+#   --scene-list=/path/to/scenes.txt    one res:// path per line
+#   --output-dir=/path/to/results/      instead of user://test_results/
+#   --resume                            append to an existing stream and
+#                                       skip the scenes it already records;
+#                                       a scene that was started but never
+#                                       recorded is recorded as a crash
 
 class_name AutomatedSceneTester
 extends SceneTree
@@ -10,9 +27,15 @@ const TEST_TIMEOUT = 10.0  # Max seconds per scene
 const SCREENSHOT_DELAY = 2.0  # Seconds to wait before screenshot
 const SCREENSHOT_SIZE = Vector2i(1920, 1080)
 const OUTPUT_DIR = "user://test_results/"
+const STREAM_NAME = "test_results.jsonl"
 
-# Test results storage
-var test_results: Array[Dictionary] = []
+var output_dir: String = OUTPUT_DIR
+var requested_scenes: Array[String] = []
+var resume: bool = false
+
+# Result stream; only the scene under test is kept in memory
+var result_stream: FileAccess = null
+var current_result: Dictionary = {}
 var current_test_index: int = 0
 var scene_paths: Array[String] = []
 var current_scene_instance: Node = null
@@ -22,19 +45,62 @@ var current_viewport: Viewport
 
 # Error tracking
 var error_log: Array[String] = []
-var performance_data: Dictionary = {}
+
+# Running totals for the final report
+var total_scenes: int = 0
+var successful_loads: int = 0
+var successful_runtime: int = 0
+var screenshots_taken: int = 0
+var category_stats: Dictionary = {}
+var fps_total: float = 0.0
+var fps_min: float = INF
+var fps_max: float = 0.0
+var memory_total: float = 0.0
+var memory_max: float = 0.0
+var error_counts: Dictionary = {}
+var total_errors: int = 0
+var total_warnings: int = 0
 
 func _init():
 	print("🧪 Initializing Automated Scene Tester for VR Algorithm Library")
+	parse_command_line()
 	setup_testing_environment()
 
+func _initialize():
+	"""Entry point when run with --script (a SceneTree never gets _ready)"""
+	_ready()
+
 func _ready():
 	print("🚀 Starting comprehensive scene testing...")
 	discover_all_scenes()
 	create_output_directory()
+	open_result_stream()
 	setup_timers()
 	start_testing()
 
+func parse_command_line():
+	"""Read the scene selection and output directory from the user arguments"""
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--scenes="):
+			for path in arg.trim_prefix("--scenes=").split(",", false):
+				requested_scenes.append(path.strip_edges())
+		elif arg.begins_with("--scene-list="):
+			var list_path = arg.trim_prefix("--scene-list=")
+			var list_file = FileAccess.open(list_path, FileAccess.READ)
+			if list_file == null:
+				push_error("Failed to open scene list: " + list_path)
+				continue
+			while not list_file.eof_reached():
+				var line = list_file.get_line().strip_edges()
+				if line != "" and not line.begins_with("#"):
+					requested_scenes.append(line)
+		elif arg.begins_with("--output-dir="):
+			output_dir = arg.trim_prefix("--output-dir=")
+			if not output_dir.ends_with("/"):
+				output_dir += "/"
+		elif arg == "--resume":
+			resume = true
+
 func setup_testing_environment():
 	"""Configure optimal testing environment"""
 	# Disable VSync for consistent timing
@@ -46,11 +112,14 @@ func setup_testing_environment():
 
 func discover_all_scenes():
 	"""Recursively find all .tscn files in the algorithms directory"""
-	print("🔍 Discovering all algorithm scenes...")
 	scene_paths.clear()
-	
-	var algorithms_dir = "res://algorithms/"
-	_scan_directory_recursive(algorithms_dir)
+	if not requested_scenes.is_empty():
+		print("📋 Testing %d scenes from the command line" % requested_scenes.size())
+		scene_paths.append_array(requested_scenes)
+	else:
+		print("🔍 Discovering all algorithm scenes...")
+		var algorithms_dir = "res://algorithms/"
+		_scan_directory_recursive(algorithms_dir)
 	
 	print("📁 Found %d scenes to test:" % scene_paths.size())
 	for i in range(min(5, scene_paths.size())):
@@ -82,13 +151,92 @@ func _scan_directory_recursive(path: String):
 
 func create_output_directory():
 	"""Create directory for test results and screenshots"""
-	var dir = DirAccess.open("user://")
-	if not dir.dir_exists("test_results"):
-		dir.make_dir("test_results")
-	if not dir.dir_exists("test_results/screenshots"):
-		dir.make_dir("test_results/screenshots")
-	if not dir.dir_exists("test_results/error_logs"):
-		dir.make_dir("test_results/error_logs")
+	DirAccess.make_dir_recursive_absolute(output_dir + "screenshots")
+	DirAccess.make_dir_recursive_absolute(output_dir + "error_logs")
+
+func open_result_stream():
+	"""Start the JSON Lines result stream, or continue it with --resume"""
+	var stream_path = output_dir + STREAM_NAME
+	var crashed: Array[String] = []
+	if resume and FileAccess.file_exists(stream_path):
+		var recorded = {}
+		var started = {}
+		var existing = FileAccess.get_file_as_string(stream_path)
+		for line in existing.split("\n", false):
+			var record = JSON.parse_string(line)
+			if not record is Dictionary:
+				continue
+			match record.get("type"):
+				"start":
+					started[record.scene_path] = true
+				"scene":
+					recorded[record.scene_path] = true
+					started.erase(record.scene_path)
+		# Started but never recorded: the scene crashed or hung the tester,
+		# so record it as failed instead of running into it again
+		for path in started:
+			crashed.append(path)
+			recorded[path] = true
+		var remaining = scene_paths.filter(func(path): return not recorded.has(path))
+		print("⏭️ Resuming: %d scenes already recorded, %d crashed, %d left" % [
+			scene_paths.size() - remaining.size() - crashed.size(), crashed.size(), remaining.size()
+		])
+		scene_paths.assign(remaining)
+		result_stream = FileAccess.open(stream_path, FileAccess.READ_WRITE)
+		if result_stream != null:
+			result_stream.seek_end()
+			# A crash can leave half a line; start on a fresh one
+			if existing != "" and not existing.ends_with("\n"):
+				result_stream.store_string("\n")
+	else:
+		result_stream = FileAccess.open(stream_path, FileAccess.WRITE)
+	
+	if result_stream == null:
+		push_error("Failed to open result stream: " + stream_path)
+		return
+	write_record({
+		"type": "run",
+		"test_timestamp": Time.get_datetime_string_from_system(),
+		"godot_version": Engine.get_version_info(),
+		"resumed": resume,
+		"scenes": scene_paths
+	})
+	for path in crashed:
+		print("💥 %s crashed the previous run, recording it as failed" % path)
+		record_result(crashed_result(path))
+	print("📝 Streaming results to %s" % stream_path)
+
+func new_result(scene_path: String) -> Dictionary:
+	"""Blank result for a scene; filled in as the test runs"""
+	return {
+		"scene_path": scene_path,
+		"scene_name": scene_path.get_file().get_basename(),
+		"category": _extract_category_from_path(scene_path),
+		"start_time": Time.get_unix_time_from_system(),
+		"initial_memory": OS.get_static_memory_usage(),
+		"load_success": false,
+		"runtime_success": false,
+		"screenshot_taken": false,
+		"errors": [],
+		"warnings": [],
+		"performance": {},
+		"node_count": 0,
+		"script_attached": false
+	}
+
+func crashed_result(scene_path: String) -> Dictionary:
+	"""Failed result for a scene that was started but never recorded"""
+	var test_result = new_result(scene_path)
+	test_result.crashed = true
+	test_result.errors.append("Crashed the tester before its result was recorded")
+	return test_result
+
+func write_record(record: Dictionary):
+	"""Append one record to the stream and flush it to disk"""
+	if result_stream == null:
+		return
+	result_stream.store_line(JSON.stringify(record))
+	result_stream.flush()
 
 func setup_timers():
 	"""Setup timers for test timeout and screenshot capture"""
@@ -130,25 +278,11 @@ func test_next_scene():
 	cleanup_current_scene()
 	
 	# Start performance monitoring
-	var start_time = Time.get_unix_time_from_system()
-	var initial_memory = OS.get_static_memory_usage()
+	var test_result = new_result(scene_path)
+	current_result = test_result
 	
-	# Attempt to load the scene
-	var test_result = {
-		"scene_path": scene_path,
-		"scene_name": scene_path.get_file().get_basename(),
-		"category": _extract_category_from_path(scene_path),
-		"start_time": start_time,
-		"initial_memory": initial_memory,
-		"load_success": false,
-		"runtime_success": false,
-		"screenshot_taken": false,
-		"errors": [],
-		"warnings": [],
-		"performance": {},
-		"node_count": 0,
-		"script_attached": false
-	}
+	# Flushed before loading so a crash from here on names this scene
+	write_record({"type": "start", "scene_path": scene_path})
 	
 	# Capture any errors during loading
 	var error_count_before = get_error_count()
@@ -157,7 +291,7 @@ func test_next_scene():
 	var scene_resource = load(scene_path)
 	if scene_resource == null:
 		test_result.errors.append("Failed to load scene resource")
-		finalize_test_result(test_result)
+		finalize_current_test()
 		return
 	
 	# Check for loading errors
@@ -169,7 +303,7 @@ func test_next_scene():
 	current_scene_instance = scene_resource.instantiate()
 	if current_scene_instance == null:
 		test_result.errors.append("Failed to instantiate scene")
-		finalize_test_result(test_result)
+		finalize_current_test()
 		return
 	
 	test_result.load_success = true
@@ -184,9 +318,6 @@ func test_next_scene():
 	
 	# Start screenshot timer
 	screenshot_timer.start()
-	
-	# Store current test result
-	test_results.append(test_result)
 
 func cleanup_current_scene():
 	"""Remove current scene and free memory"""
@@ -200,7 +331,7 @@ func cleanup_current_scene():
 
 func _take_screenshot():
 	"""Capture screenshot of current scene"""
-	if current_scene_instance == null:
+	if current_scene_instance == null or current_result.is_empty():
 		return
 	
 	var viewport = root.get_viewport()
@@ -212,18 +343,18 @@ func _take_screenshot():
 	var image = viewport.get_texture().get_image()
 	if image != null:
 		var scene_name = scene_paths[current_test_index].get_file().get_basename()
-		var screenshot_path = OUTPUT_DIR + "screenshots/" + scene_name + ".png"
+		var screenshot_path = output_dir + "screenshots/" + scene_name + ".png"
 		var error = image.save_png(screenshot_path)
 		
 		if error == OK:
-			test_results[current_test_index].screenshot_taken = true
+			current_result.screenshot_taken = true
 			print("📸 Screenshot saved: %s" % screenshot_path)
 		else:
-			test_results[current_test_index].warnings.append("Failed to save screenshot")
+			current_result.warnings.append("Failed to save screenshot")
 			print("⚠️ Failed to save screenshot for %s" % scene_name)
 	
 	# Mark runtime as successful if we got this far
-	test_results[current_test_index].runtime_success = true
+	current_result.runtime_success = true
 	
 	# Wait a bit more for any initialization to complete
 	await root.create_timer(1.0).timeout
@@ -233,15 +364,21 @@ func _take_screenshot():
 
 func _on_test_timeout():
 	"""Handle test timeout"""
+	if current_result.is_empty():
+		return
 	print("⏰ Test timeout for scene: %s" % scene_paths[current_test_index])
-	test_results[current_test_index].errors.append("Test timeout after %s seconds" % TEST_TIMEOUT)
+	current_result.errors.append("Test timeout after %s seconds" % TEST_TIMEOUT)
 	finalize_current_test()
 
 func finalize_current_test():
 	"""Complete current test and move to next"""
-	if current_test_index < test_results.size():
-		var test_result = test_results[current_test_index]
-		finalize_test_result(test_result)
+	# The timeout and the screenshot path can both get here for one scene
+	if current_result.is_empty():
+		return
+	test_timer.stop()
+	screenshot_timer.stop()
+	finalize_test_result(current_result)
+	current_result = {}
 	
 	current_test_index += 1
 	
@@ -263,6 +400,8 @@ func finalize_test_result(test_result: Dictionary):
 		"memory_delta_mb": test_result.memory_delta / 1024.0 / 1024.0
 	}
 	
+	record_result(test_result)
+	
 	# Print test summary
 	var status_icon = "✅" if (test_result.load_success and test_result.runtime_success) else "❌"
 	print("%s %s - Load: %s, Runtime: %s, Nodes: %d, FPS: %.1f" % [
@@ -274,6 +413,44 @@ func finalize_test_result(test_result: Dictionary):
 		test_result.performance.fps
 	])
 
+func record_result(test_result: Dictionary):
+	"""Stream a finished result and fold it into the running totals"""
+	var record = {"type": "scene"}
+	record.merge(test_result)
+	write_record(record)
+	
+	total_scenes += 1
+	if test_result.load_success:
+		successful_loads += 1
+	if test_result.runtime_success:
+		successful_runtime += 1
+	if test_result.screenshot_taken:
+		screenshots_taken += 1
+	
+	var category = test_result.category
+	if not category_stats.has(category):
+		category_stats[category] = {"total": 0, "successful": 0, "errors": 0}
+	category_stats[category].total += 1
+	if test_result.load_success and test_result.runtime_success:
+		category_stats[category].successful += 1
+	if test_result.errors.size() > 0:
+		category_stats[category].errors += 1
+	
+	# A crashed scene has no measurements to fold in
+	if not test_result.performance.is_empty():
+		var fps = test_result.performance.get("fps", 0)
+		var memory = test_result.performance.get("memory_usage_mb", 0)
+		fps_total += fps
+		fps_min = min(fps_min, fps)
+		fps_max = max(fps_max, fps)
+		memory_total += memory
+		memory_max = max(memory_max, memory)
+	
+	for error in test_result.errors:
+		error_counts[error] = error_counts.get(error, 0) + 1
+	total_errors += test_result.errors.size()
+	total_warnings += test_result.warnings.size()
+
 func count_nodes_recursive(node: Node) -> int:
 	"""Count total nodes in scene tree"""
 	var count = 1
@@ -302,11 +479,6 @@ func generate_final_report():
 	print(separator)
 	
 	# Summary statistics
-	var total_scenes = test_results.size()
-	var successful_loads = test_results.filter(func(r): return r.load_success).size()
-	var successful_runtime = test_results.filter(func(r): return r.runtime_success).size()
-	var screenshots_taken = test_results.filter(func(r): return r.screenshot_taken).size()
-	
 	print("📈 SUMMARY STATISTICS:")
 	print("   Total Scenes Tested: ", total_scenes)
 	print("   Successful Loads: ", successful_loads, "/", total_scenes, " (", ("%.1f" % ((successful_loads * 100.0 / total_scenes) if total_scenes > 0 else 0)), "%)")
@@ -322,30 +494,18 @@ func generate_final_report():
 	# Error summary
 	generate_error_summary()
 	
-	# Save detailed report
-	save_detailed_report()
+	# Close the result stream
+	close_result_stream()
 	
-	print("\n🎉 Testing complete! Results saved to: %s" % OUTPUT_DIR)
+	print("\n🎉 Testing complete! Results saved to: %s" % output_dir)
 	quit()
 
 func generate_category_breakdown():
 	"""Generate breakdown by algorithm category"""
 	print("\n📁 CATEGORY BREAKDOWN:")
 	
-	var categories = {}
-	for result in test_results:
-		var category = result.category
-		if not categories.has(category):
-			categories[category] = {"total": 0, "successful": 0, "errors": 0}
-		
-		categories[category].total += 1
-		if result.load_success and result.runtime_success:
-			categories[category].successful += 1
-		if result.errors.size() > 0:
-			categories[category].errors += 1
-	
-	for category in categories.keys():
-		var data = categories[category]
+	for category in category_stats.keys():
+		var data = category_stats[category]
 		var success_rate = (data.successful * 100.0 / data.total) if data.total > 0 else 0
 		print("   %s: %d scenes, %.1f%% success, %d errors" % [
 			category.capitalize(),
@@ -358,42 +518,19 @@ func generate_performance_analysis():
 	"""Analyze performance across all tests"""
 	print("\n⚡ PERFORMANCE ANALYSIS:")
 	
-	var fps_values = test_results.map(func(r): return r.performance.get("fps", 0))
-	var memory_values = test_results.map(func(r): return r.performance.get("memory_usage_mb", 0))
-	
-	if fps_values.size() > 0:
-		var avg_fps = fps_values.reduce(func(a, b): return a + b, 0) / fps_values.size()
-		var min_fps = fps_values.min()
-		var max_fps = fps_values.max()
-		
-		print("   Average FPS: %.1f" % avg_fps)
-		print("   FPS Range: %.1f - %.1f" % [min_fps, max_fps])
-	
-	if memory_values.size() > 0:
-		var avg_memory = memory_values.reduce(func(a, b): return a + b, 0) / memory_values.size()
-		var max_memory = memory_values.max()
-		
-		print("   Average Memory: %.1f MB" % avg_memory)
-		print("   Peak Memory: %.1f MB" % max_memory)
+	if total_scenes > 0:
+		print("   Average FPS: %.1f" % (fps_total / total_scenes))
+		print("   FPS Range: %.1f - %.1f" % [fps_min, fps_max])
+		print("   Average Memory: %.1f MB" % (memory_total / total_scenes))
+		print("   Peak Memory: %.1f MB" % memory_max)
 
 func generate_error_summary():
 	"""Summarize all errors and warnings"""
 	print("\n❌ ERROR SUMMARY:")
 	
-	var all_errors = []
-	var all_warnings = []
-	
-	for result in test_results:
-		all_errors.append_array(result.errors)
-		all_warnings.append_array(result.warnings)
-	
-	if all_errors.size() > 0:
-		print("   Total Errors: %d" % all_errors.size())
+	if total_errors > 0:
+		print("   Total Errors: %d" % total_errors)
 		# Show most common errors
-		var error_counts = {}
-		for error in all_errors:
-			error_counts[error] = error_counts.get(error, 0) + 1
-		
 		print("   Most Common Errors:")
 		var sorted_errors = error_counts.keys()
 		sorted_errors.sort_custom(func(a, b): return error_counts[a] > error_counts[b])
@@ -404,50 +541,21 @@ func generate_error_summary():
 	else:
 		print("   🎉 No errors detected!")
 	
-	if all_warnings.size() > 0:
-		print("   Total Warnings: %d" % all_warnings.size())
-
-func save_detailed_report():
-	"""Save detailed JSON report and CSV summary"""
-	# Save JSON report
-	var json_path = OUTPUT_DIR + "detailed_test_report.json"
-	var json_file = FileAccess.open(json_path, FileAccess.WRITE)
-	if json_file != null:
-		var report_data = {
-			"test_timestamp": Time.get_datetime_string_from_system(),
-			"godot_version": Engine.get_version_info(),
-			"total_scenes": test_results.size(),
-			"test_results": test_results
-		}
-		json_file.store_string(JSON.stringify(report_data, "\t"))
-		json_file.close()
-		print("💾 Detailed report saved: %s" % json_path)
-	
-	# Save CSV summary
-	var csv_path = OUTPUT_DIR + "test_summary.csv"
-	var csv_file = FileAccess.open(csv_path, FileAccess.WRITE)
-	if csv_file != null:
-		# CSV header
-		csv_file.store_line("Scene Name,Category,Load Success,Runtime Success,Node Count,FPS,Memory (MB),Duration (s),Errors,Warnings")
-		
-		# CSV data
-		for result in test_results:
-			var line = "%s,%s,%s,%s,%d,%.1f,%.1f,%.2f,%d,%d" % [
-				result.scene_name,
-				result.category,
-				result.load_success,
-				result.runtime_success,
-				result.node_count,
-				result.performance.get("fps", 0),
-				result.performance.get("memory_usage_mb", 0),
-				result.get("duration", 0),
-				result.errors.size(),
-				result.warnings.size()
-			]
-			csv_file.store_line(line)
-		
-		csv_file.close()
-		print("📊 CSV summary saved: %s" % csv_path)
+	if total_warnings > 0:
+		print("   Total Warnings: %d" % total_warnings)
+
+func close_result_stream():
+	"""Mark the stream complete; `scene_stream.py export` writes the JSON and CSV reports"""
+	if result_stream == null:
+		return
+	write_record({
+		"type": "end",
+		"test_timestamp": Time.get_datetime_string_from_system(),
+		"total_scenes": total_scenes
+	})
+	result_stream.close()
+	result_stream = null
+	print("💾 Result stream complete: %s" % (output_dir + STREAM_NAME))
 
 
 # Entry point for command line usage
@@ -0,0 +1,14 @@
+"""Put the project's Python tools on sys.path for the tests in this folder"""
+
+import os
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOOL_DIRS = (
+    PROJECT_DIR,
+    os.path.join(PROJECT_DIR, "algorithms", "proceduralgeneration", "marchingsquares"),
+)
+
+for path in TOOL_DIRS:
+    if path not in sys.path:
+        sys.path.insert(0, path)
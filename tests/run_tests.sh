@@ -50,14 +50,20 @@ echo "⏳ Executing tests (this may take several minutes)..."
 godot --headless --script temp_test_script.gd
 
 # Check if test results were generated
-if [ -d "$HOME/.local/share/godot/app_userdata/[YourProjectName]/test_results" ] || [ -d "$(godot --print-user-data-dir)/test_results" 2>/dev/null ]; then
+RESULTS_DIR="$(godot --print-user-data-dir 2>/dev/null)/test_results"
+if [ ! -d "$RESULTS_DIR" ]; then
+    RESULTS_DIR="$HOME/.local/share/godot/app_userdata/[YourProjectName]/test_results"
+fi
+if [ -f "$RESULTS_DIR/test_results.jsonl" ]; then
     echo ""
     echo "✅ Testing completed successfully!"
-    echo "📊 Results saved to user data directory"
+    # The tester only streams results; the JSON and CSV reports come from the stream
+    python3 scene_stream.py export "$RESULTS_DIR/test_results.jsonl" --output "$RESULTS_DIR"
+    echo "📊 Results saved to $RESULTS_DIR"
     echo "🔍 Check the test_results folder for:"
     echo "   • Screenshots of each scene"
-    echo "   • Detailed JSON report"
-    echo "   • CSV summary for analysis"
+    echo "   • test_results.jsonl, the result stream"
+    echo "   • detailed_test_report.json and test_summary.csv"
 else
     echo ""
     echo "⚠️ Testing completed but results directory not found"
@@ -126,7 +132,8 @@ godot --headless --script temp_test_script.gd
 echo.
 echo ✅ Testing completed!
 echo 📊 Check the user data directory for results
-echo 🔍 Look for test_results folder with screenshots and reports
+echo 🔍 Look for test_results folder with screenshots and test_results.jsonl
+echo 📄 For the JSON and CSV reports run: python scene_stream.py export ^<test_results folder^>\test_results.jsonl --output ^<test_results folder^>
 
 REM Cleanup
 del temp_test_script.gd
@@ -0,0 +1,260 @@
+# scene_perf_probe.gd
+# Runtime performance probe for VR Algorithm Visualization Library scenes
+# Runs each scene for a fixed number of process and physics frames with a
+# fixed random seed and records Performance monitors as percentiles.
+#
+# Results are streamed to <output dir>/perf_report.jsonl in the format of
+# tests/automated_scene_tester.gd, flushed as each record is written: a
+# "run" record with the probe settings, a "start" record before each scene
+# is loaded, a "scene" record per probed scene and an "end" record. A crash
+# or hang keeps every scene finished before it; --resume appends to the
+# stream, records the scene that was started without a result as failed
+# ("crashed": true) and probes only the scenes it does not record yet.
+#
+# Run through scene_perf.py, or directly:
+#   godot --headless --fixed-fps 60 --script res://tests/scene_perf_probe.gd -- \
+#     --scenes=res://a.tscn --output-dir=/tmp/perf/ --frames=300 --warmup=30 --seed=12345 [--resume]
+
+extends SceneTree
+
+const REPORT_NAME = "perf_report.jsonl"
+const DEFAULT_FRAMES = 300
+const DEFAULT_WARMUP = 30
+const DEFAULT_SEED = 12345
+
+# Monitors sampled every process frame: name -> [monitor, scale]
+const MONITORS = {
+	"process_ms": [Performance.TIME_PROCESS, 1000.0],
+	"physics_ms": [Performance.TIME_PHYSICS_PROCESS, 1000.0],
+	"objects": [Performance.OBJECT_COUNT, 1.0],
+	"nodes": [Performance.OBJECT_NODE_COUNT, 1.0],
+	"resources": [Performance.OBJECT_RESOURCE_COUNT, 1.0],
+	"orphan_nodes": [Performance.OBJECT_ORPHAN_NODE_COUNT, 1.0],
+	"static_memory_mb": [Performance.MEMORY_STATIC, 1.0 / 1048576.0]
+}
+
+var output_dir: String = "user://perf_results/"
+var scene_paths: Array[String] = []
+var frames: int = DEFAULT_FRAMES
+var warmup: int = DEFAULT_WARMUP
+var probe_seed: int = DEFAULT_SEED
+var resume: bool = false
+
+var result_stream: FileAccess = null
+var scene_index: int = -1
+var current_scene: Node = null
+var current_result: Dictionary = {}
+var samples: Dictionary = {}
+var process_frames: int = 0
+var physics_frames: int = 0
+
+func _initialize():
+	"""Read the arguments and start with the first scene"""
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--scenes="):
+			for path in arg.trim_prefix("--scenes=").split(",", false):
+				scene_paths.append(path.strip_edges())
+		elif arg.begins_with("--scene-list="):
+			var list_file = FileAccess.open(arg.trim_prefix("--scene-list="), FileAccess.READ)
+			if list_file == null:
+				push_error("Failed to open scene list: " + arg)
+				continue
+			while not list_file.eof_reached():
+				var line = list_file.get_line().strip_edges()
+				if line != "" and not line.begins_with("#"):
+					scene_paths.append(line)
+		elif arg.begins_with("--output-dir="):
+			output_dir = arg.trim_prefix("--output-dir=")
+			if not output_dir.ends_with("/"):
+				output_dir += "/"
+		elif arg.begins_with("--frames="):
+			frames = int(arg.trim_prefix("--frames="))
+		elif arg.begins_with("--warmup="):
+			warmup = int(arg.trim_prefix("--warmup="))
+		elif arg.begins_with("--seed="):
+			probe_seed = int(arg.trim_prefix("--seed="))
+		elif arg == "--resume":
+			resume = true
+	
+	open_result_stream()
+	print("⏱️ Probing %d scenes: %d frames after %d warm-up frames, seed %d" % [
+		scene_paths.size(), frames, warmup, probe_seed
+	])
+	start_next_scene()
+
+func open_result_stream():
+	"""Start the JSON Lines result stream, or continue it with --resume"""
+	DirAccess.make_dir_recursive_absolute(output_dir)
+	var stream_path = output_dir + REPORT_NAME
+	var crashed: Array[String] = []
+	if resume and FileAccess.file_exists(stream_path):
+		var recorded = {}
+		var started = {}
+		var existing = FileAccess.get_file_as_string(stream_path)
+		for line in existing.split("\n", false):
+			var record = JSON.parse_string(line)
+			if not record is Dictionary:
+				continue
+			match record.get("type"):
+				"start":
+					started[record.scene_path] = true
+				"scene":
+					recorded[record.scene_path] = true
+					started.erase(record.scene_path)
+		# Started but never recorded: the scene crashed or hung the probe
+		for path in started:
+			crashed.append(path)
+			recorded[path] = true
+		var remaining = scene_paths.filter(func(path): return not recorded.has(path))
+		print("⏭️ Resuming: %d scenes already recorded, %d crashed, %d left" % [
+			scene_paths.size() - remaining.size() - crashed.size(), crashed.size(), remaining.size()
+		])
+		scene_paths.assign(remaining)
+		result_stream = FileAccess.open(stream_path, FileAccess.READ_WRITE)
+		if result_stream != null:
+			result_stream.seek_end()
+			# A crash can leave half a line; start on a fresh one
+			if existing != "" and not existing.ends_with("\n"):
+				result_stream.store_string("\n")
+	else:
+		result_stream = FileAccess.open(stream_path, FileAccess.WRITE)
+	
+	if result_stream == null:
+		push_error("Failed to open result stream: " + stream_path)
+		return
+	write_record({
+		"type": "run",
+		"godot_version": Engine.get_version_info(),
+		"frames": frames,
+		"warmup": warmup,
+		"seed": probe_seed,
+		"physics_ticks_per_second": Engine.physics_ticks_per_second,
+		"resumed": resume,
+		"scenes": scene_paths
+	})
+	for path in crashed:
+		print("💥 %s crashed the previous run, recording it as failed" % path)
+		var crashed_result = new_result(path)
+		crashed_result.crashed = true
+		write_record(crashed_result)
+	print("📝 Streaming results to %s" % stream_path)
+
+func write_record(record: Dictionary):
+	"""Append one record to the stream and flush it to disk"""
+	if result_stream == null:
+		return
+	result_stream.store_line(JSON.stringify(record))
+	result_stream.flush()
+
+func new_result(scene_path: String) -> Dictionary:
+	return {
+		"type": "scene",
+		"scene_path": scene_path,
+		"load_success": false,
+		"process_frames": 0,
+		"physics_frames": 0,
+		"metrics": {}
+	}
+
+func start_next_scene():
+	"""Free the current scene and load the next one that loads"""
+	if current_scene != null:
+		current_scene.queue_free()
+		current_scene = null
+	
+	while current_scene == null:
+		scene_index += 1
+		if scene_index >= scene_paths.size():
+			close_result_stream()
+			quit()
+			return
+		load_scene(scene_paths[scene_index])
+	
+	samples.clear()
+	for metric in MONITORS:
+		samples[metric] = PackedFloat64Array()
+	process_frames = 0
+	physics_frames = 0
+	root.add_child(current_scene)
+
+func load_scene(scene_path: String):
+	"""Instantiate a scene into current_scene (stays null on failure)"""
+	print("🧪 [%d/%d] %s" % [scene_index + 1, scene_paths.size(), scene_path])
+	current_result = new_result(scene_path)
+	
+	# Flushed before loading so a crash from here on names this scene
+	write_record({"type": "start", "scene_path": scene_path})
+	var scene_resource = load(scene_path)
+	if scene_resource == null or not scene_resource is PackedScene:
+		print("❌ Failed to load %s" % scene_path)
+		write_record(current_result)
+		return
+	
+	# Same random state for every run of the scene
+	seed(probe_seed)
+	current_scene = scene_resource.instantiate()
+	if current_scene == null:
+		print("❌ Failed to instantiate %s" % scene_path)
+		write_record(current_result)
+		return
+	current_result.load_success = true
+
+func _physics_process(_delta: float) -> bool:
+	if current_scene != null:
+		physics_frames += 1
+	return false
+
+func _process(_delta: float) -> bool:
+	if current_scene == null:
+		return false
+	
+	process_frames += 1
+	if process_frames > warmup:
+		for metric in MONITORS:
+			var monitor = MONITORS[metric]
+			samples[metric].append(Performance.get_monitor(monitor[0]) * monitor[1])
+	
+	# Both loops must have run the fixed number of frames
+	var target = warmup + frames
+	if process_frames >= target and physics_frames >= target:
+		finish_scene()
+		start_next_scene()
+	return false
+
+func finish_scene():
+	"""Reduce the samples of the current scene to percentiles"""
+	current_result.process_frames = process_frames
+	current_result.physics_frames = physics_frames
+	for metric in samples:
+		current_result.metrics[metric] = summarize(samples[metric])
+	write_record(current_result)
+	var process_ms = current_result.metrics["process_ms"]
+	print("   process p50 %.3f ms, p95 %.3f ms, %d nodes" % [
+		process_ms.p50, process_ms.p95, current_result.metrics["nodes"].p50
+	])
+
+func summarize(values: PackedFloat64Array) -> Dictionary:
+	if values.is_empty():
+		return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0, "mean": 0.0, "n": 0}
+	var sorted_values = values.duplicate()
+	sorted_values.sort()
+	var total = 0.0
+	for value in sorted_values:
+		total += value
+	var count = sorted_values.size()
+	return {
+		"p50": sorted_values[int(round(0.50 * (count - 1)))],
+		"p95": sorted_values[int(round(0.95 * (count - 1)))],
+		"p99": sorted_values[int(round(0.99 * (count - 1)))],
+		"max": sorted_values[count - 1],
+		"mean": total / count,
+		"n": count
+	}
+
+func close_result_stream():
+	"""Write the end record; the stream is complete from here on"""
+	write_record({"type": "end", "total_scenes": scene_paths.size()})
+	if result_stream != null:
+		result_stream.close()
+		result_stream = null
+	print("💾 Performance results saved: %s" % (output_dir + REPORT_NAME))
@@ -0,0 +1,34 @@
+"""Tests for the member annotations the GDScript index records"""
+
+from gdscript_index import ScriptIndexer
+from gdscript_tokens import tokenize
+
+SCRIPT = """@tool
+extends Node3D
+
+@export_category("Editor")
+@export_group("Grid Settings", "grid_")
+@export var grid_size: Vector3i = Vector3i(5, 4, 5)
+@export_subgroup("Spacing")
+@export_range(0.5, 8.0) var spacing: float = 4.0
+@export_group("")
+@onready var label = $Label
+"""
+
+
+def symbols(text):
+    indexer = ScriptIndexer("res://editor.gd", text, tokenize(text)).run()
+    return [(kind, name, line, annotations, value)
+            for _, _, kind, name, line, _, _, _, annotations, value, _ in indexer.symbols]
+
+
+def test_export_sections_are_standalone_symbols():
+    assert symbols(SCRIPT) == [
+        ("section", "Editor", 4, "@export_category", '"Editor"'),
+        ("section", "Grid Settings", 5, "@export_group", '"Grid Settings", "grid_"'),
+        ("var", "grid_size", 6, "@export", "Vector3i(5, 4, 5)"),
+        ("section", "Spacing", 7, "@export_subgroup", '"Spacing"'),
+        ("var", "spacing", 8, "@export_range(0.5, 8.0)", "4.0"),
+        ("section", "", 9, "@export_group", '""'),
+        ("var", "label", 10, "@onready", "$Label"),
+    ]
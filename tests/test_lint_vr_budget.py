@@ -0,0 +1,75 @@
+"""Tests for the VR budget linter's particle checks"""
+
+import json
+import os
+
+import pytest
+
+import lint_vr_budget
+from godot_resources import ResourceGraph
+
+EMITTER_SCENE = """[gd_scene format=3]
+
+[node name="Sparks" type="Node3D"]
+
+[node name="Emitter" type="GPUParticles3D" parent="."]
+amount = 1000
+"""
+
+MAIN_SCENE = """[gd_scene load_steps=2 format=3]
+
+[ext_resource type="PackedScene" path="res://algorithms/fx/sparks.tscn" id="1_sparks"]
+
+[node name="Main" type="Node3D"]
+
+[node name="Effects" type="Node3D" parent="."]
+
+[node name="Sparks" parent="Effects" instance=ExtResource("1_sparks")]
+
+[node name="Small" type="CPUParticles3D" parent="."]
+amount = 16
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "project.godot").write_text("config_version=5\n", encoding="utf-8")
+    scenes = tmp_path / "algorithms" / "fx"
+    scenes.mkdir(parents=True)
+    (scenes / "sparks.tscn").write_text(EMITTER_SCENE, encoding="utf-8")
+    (scenes / "main.tscn").write_text(MAIN_SCENE, encoding="utf-8")
+    return tmp_path
+
+
+def test_instanced_emitter_reaches_the_scene_stats(project):
+    linter = lint_vr_budget.BudgetLinter(ResourceGraph(str(project), class_edges=False))
+    stats = linter.scene_stats("res://algorithms/fx/main.tscn")
+    assert stats.particle_amount == 1000
+    assert sorted(stats.particle_systems) == [("Effects/Sparks/Emitter", 1000), ("Small", 16)]
+
+
+def test_heavy_particle_systems_use_the_category_budget(project):
+    linter = lint_vr_budget.BudgetLinter(ResourceGraph(str(project), class_edges=False))
+    stats = linter.scene_stats("res://algorithms/fx/main.tscn")
+    budgets = lint_vr_budget.load_budgets()
+    budgets["algorithms/fx"] = {"particle_amount": 8}
+    default = lint_vr_budget.budget_for(budgets, "algorithms/other/main.tscn")
+    fx = lint_vr_budget.budget_for(budgets, "algorithms/fx/main.tscn")
+    assert lint_vr_budget.heavy_particle_systems(stats, default) == [("Effects/Sparks/Emitter", 1000)]
+    assert sorted(lint_vr_budget.heavy_particle_systems(stats, fx)) == [("Effects/Sparks/Emitter", 1000),
+                                                                        ("Small", 16)]
+
+
+def test_report_lists_the_instanced_emitter(project, tmp_path_factory, capsys):
+    report_path = os.path.join(str(tmp_path_factory.mktemp("report")), "report.json")
+    budgets_path = os.path.join(str(project), "budgets.json")
+    with open(budgets_path, "w", encoding="utf-8") as f:
+        json.dump({"algorithms/fx": {"particle_amount": 500}}, f)
+    code = lint_vr_budget.main(["algorithms/fx/main.tscn", "--root", str(project), "--budgets", budgets_path,
+                                "--json", report_path])
+    assert code == 1
+    assert "particles: Effects/Sparks/Emitter amount=1000" in capsys.readouterr().out
+    with open(report_path, encoding="utf-8") as f:
+        (entry,) = json.load(f)
+    assert entry["particle_systems"] == [{"node": "Effects/Sparks/Emitter", "amount": 1000}]
+    assert {"metric": "particle_amount", "value": 1000, "budget": 500} in entry["violations"]
@@ -0,0 +1,151 @@
+"""Tests for the marching squares case tables and their GDScript emission"""
+
+import os
+import re
+
+import pytest
+
+import marching_squares_tables as mst
+from marching_squares_tables import A, B, C, D, FEATURE, POINTS, X_MAX, X_MIN, Y_MAX, Y_MIN
+
+TABLES_GD = os.path.join(os.path.dirname(mst.__file__), "marching_squares_tables.gd")
+
+# Crossings sit at edge midpoints, so every case covers a fixed area
+EXPECTED_AREA = {
+    0: 0.0, 1: 0.125, 2: 0.125, 3: 0.5, 4: 0.125, 5: 0.5, 6: 0.25, 7: 0.875,
+    8: 0.125, 9: 0.25, 10: 0.5, 11: 0.875, 12: 0.5, 13: 0.875, 14: 0.875, 15: 1.0,
+}
+EDGE_CORNERS = {X_MIN: (A, B), Y_MIN: (A, C), X_MAX: (C, D), Y_MAX: (B, D)}
+SADDLES = (6, 9)
+
+
+def triangles(tables, prefix, case):
+    flat = tables[prefix + "_TRIANGLES"][tables[prefix + "_OFFSETS"][case]:tables[prefix + "_OFFSETS"][case + 1]]
+    return [tuple(flat[k:k + 3]) for k in range(0, len(flat), 3)]
+
+
+def signed_area(points, tri):
+    (ax, ay), (bx, by), (cx, cy) = (points[p] for p in tri)
+    return ((bx - ax) * (cy - ay) - (cx - ax) * (by - ay)) / 2.0
+
+
+@pytest.fixture(scope="module")
+def tables():
+    return mst.build_tables()
+
+
+def test_offsets_cover_all_16_cases(tables):
+    for prefix in ("CASE", "FEATURE"):
+        offsets = tables[prefix + "_OFFSETS"]
+        assert len(offsets) == 17
+        assert offsets[0] == 0 and offsets[-1] == len(tables[prefix + "_TRIANGLES"])
+        assert all(b >= a and (b - a) % 3 == 0 for a, b in zip(offsets, offsets[1:]))
+    assert len(tables["FEATURE_EDGES"]) == 32
+    assert len(tables["FEATURE_ANCHORS"]) == 16
+    assert tables["MAX_CELL_INDICES"] == max(
+        b - a for prefix in ("CASE", "FEATURE")
+        for a, b in zip(tables[prefix + "_OFFSETS"], tables[prefix + "_OFFSETS"][1:]))
+
+
+@pytest.mark.parametrize("case", range(16))
+def test_case_uses_filled_corners_and_crossed_edges(tables, case):
+    filled = mst.filled_corners(case)
+    used = {p for tri in triangles(tables, "CASE", case) for p in tri}
+    assert used & {A, B, C, D} == (filled if case else set())
+    crossed = {edge for edge, (c1, c2) in EDGE_CORNERS.items() if (c1 in filled) != (c2 in filled)}
+    assert used - {A, B, C, D} == crossed
+    assert FEATURE not in used
+
+
+@pytest.mark.parametrize("case", range(16))
+def test_case_triangles_are_clockwise(tables, case):
+    for tri in triangles(tables, "CASE", case):
+        assert signed_area(POINTS, tri) < 0, tri
+
+
+@pytest.mark.parametrize("case", range(16))
+def test_case_polygons_are_clockwise(case):
+    for polygon in mst.case_polygons(case):
+        area = sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in
+                   zip((POINTS[p] for p in polygon), (POINTS[p] for p in polygon[1:] + polygon[:1])))
+        assert area < 0, polygon
+
+
+@pytest.mark.parametrize("case", range(16))
+def test_case_area(tables, case):
+    area = -sum(signed_area(POINTS, tri) for tri in triangles(tables, "CASE", case))
+    assert area == pytest.approx(EXPECTED_AREA[case])
+
+
+@pytest.mark.parametrize("case", SADDLES)
+def test_saddles_stay_separated(tables, case):
+    polygons = mst.case_polygons(case)
+    assert len(polygons) == 2
+    # One corner triangle per filled corner, never joined across the centre
+    assert sorted(len(p) for p in polygons) == [3, 3]
+    assert sorted(p for polygon in polygons for p in polygon if p < 4) == sorted(mst.filled_corners(case))
+    assert len(mst.case_segments(case)) == 2
+    assert tables["FEATURE_EDGES"][2 * case:2 * case + 2] == [-1, -1]
+    assert tables["FEATURE_ANCHORS"][case] == -1
+    assert triangles(tables, "FEATURE", case) == []
+
+
+def test_segments_keep_the_filled_side_on_the_right():
+    for case in range(1, 15):
+        filled = mst.filled_corners(case)
+        for e_out, e_in in mst.case_segments(case):
+            (x1, y1), (x2, y2) = POINTS[e_out], POINTS[e_in]
+            for corner in range(4):
+                x, y = POINTS[corner]
+                side = (x2 - x1) * (y - y1) - (y2 - y1) * (x - x1)
+                if side < 0:
+                    assert corner in filled, (case, e_out, e_in, corner)
+
+
+@pytest.mark.parametrize("case", [c for c in range(1, 15) if c not in SADDLES])
+def test_feature_variant(tables, case):
+    filled = mst.filled_corners(case)
+    e1, e2 = tables["FEATURE_EDGES"][2 * case:2 * case + 2]
+    assert {e1, e2} == {p for p in mst.case_polygons(case)[0] if p >= 4}
+    assert tables["FEATURE_ANCHORS"][case] in filled
+    feature_tris = triangles(tables, "FEATURE", case)
+    assert any(FEATURE in tri for tri in feature_tris)
+    # A feature on the empty side of the chord adds area without flipping a triangle
+    (x1, y1), (x2, y2) = POINTS[e1], POINTS[e2]
+    anchor = POINTS[tables["FEATURE_ANCHORS"][case]]
+    mid = ((x1 + x2) / 2.0, (y1 + y2) / 2.0)
+    points = dict(POINTS)
+    points[FEATURE] = (mid[0] + (mid[0] - anchor[0]) * 0.2, mid[1] + (mid[1] - anchor[1]) * 0.2)
+    area = 0.0
+    for tri in feature_tris:
+        assert signed_area(points, tri) < 0, tri
+        area -= signed_area(points, tri)
+    assert area > EXPECTED_AREA[case]
+
+
+def test_no_feature_variant_without_a_chord(tables):
+    for case in (0, 15):
+        assert triangles(tables, "FEATURE", case) == []
+        assert tables["FEATURE_ANCHORS"][case] == -1
+
+
+def test_verify_reports_nothing():
+    assert mst.verify(samples=320) == []
+
+
+def parse_gdscript_consts(source):
+    consts = {}
+    for name, value in re.findall(r"^const (\w+) = (.+)$", source, re.M):
+        consts[name] = [int(v) for v in value.strip("[]").split(",")] if value.startswith("[") else int(value)
+    return consts
+
+
+def test_gdscript_tables_match_the_generator(tables):
+    consts = parse_gdscript_consts(mst.gdscript_tables())
+    assert consts == tables
+    assert "class_name MarchingSquaresTables" in mst.gdscript_tables()
+
+
+def test_committed_gdscript_tables_are_current():
+    with open(TABLES_GD, encoding="utf-8") as f:
+        assert f.read() == mst.gdscript_tables()
@@ -0,0 +1,123 @@
+"""Tests for the sharded scene test runner, with a Python stub for Godot"""
+
+import csv
+import json
+import os
+import sys
+
+import pytest
+
+import run_scene_tests
+import scene_stream
+
+# Streams results like the tester: exits in a "boom" scene and goes quiet
+# in a "hang" scene, in both cases after its start record
+STUB_GODOT = """import json
+import sys
+import time
+
+options = dict(arg.split("=", 1) for arg in sys.argv if arg.startswith("--") and "=" in arg)
+with open(options["--scene-list"], encoding="utf-8") as f:
+    scenes = f.read().split()
+with open(options["--output-dir"] + "test_results.jsonl", "a", encoding="utf-8") as stream:
+    def write(record):
+        stream.write(json.dumps(record) + "\\n")
+        stream.flush()
+    write({"type": "run", "scenes": scenes})
+    for scene in scenes:
+        write({"type": "start", "scene_path": scene})
+        if "boom" in scene:
+            sys.exit(1)
+        if "hang" in scene:
+            time.sleep(60)
+        write({"type": "scene", "scene_path": scene, "scene_name": scene.rsplit("/", 1)[-1][:-5],
+               "category": "demo", "load_success": True, "runtime_success": True,
+               "performance": {"fps": 72.0, "memory_usage_mb": 10.0}, "node_count": 3, "duration": 0.1,
+               "errors": [], "warnings": []})
+        print("tested " + scene, flush=True)
+    write({"type": "end", "total_scenes": len(scenes)})
+"""
+
+
+def scene(name):
+    return "res://algorithms/demo/%s.tscn" % name
+
+
+@pytest.fixture
+def godot(tmp_path):
+    stub = tmp_path / "stub_godot.py"
+    stub.write_text(STUB_GODOT, encoding="utf-8")
+    return [sys.executable, str(stub)]
+
+
+def run(shards, godot, root, retries=1, idle_timeout=5.0):
+    run_scene_tests.run_shards(shards, godot, str(root), jobs=len(shards), retries=retries,
+                               idle_timeout=idle_timeout, scene_budget=run_scene_tests.SCENE_BUDGET)
+
+
+def test_shards_are_dealt_round_robin_without_timings():
+    scenes = [scene(name) for name in "abcde"]
+    assert run_scene_tests.make_shards(scenes, 2) == [[scene("a"), scene("c"), scene("e")],
+                                                      [scene("b"), scene("d")]]
+    assert run_scene_tests.make_shards(scenes[:1], 4) == [[scene("a")]]
+
+
+def test_shards_are_balanced_by_previous_durations():
+    durations = {scene("a"): 10.0, scene("b"): 6.0, scene("c"): 5.0, scene("d"): 1.0}
+    shards = run_scene_tests.make_shards(list(durations), 2, durations)
+    assert shards == [[scene("a"), scene("d")], [scene("b"), scene("c")]]
+
+
+def test_crash_fails_only_that_scene_and_the_retry_runs_the_rest(tmp_path, godot):
+    scenes = [scene("first"), scene("boom"), scene("last")]
+    shard = run_scene_tests.Shard(0, scenes, str(tmp_path / "out"))
+    run([shard], godot, tmp_path)
+
+    assert shard.status == "done"
+    assert shard.attempts == 2
+    assert shard.queued == [scene("last")]
+    results = scene_stream.read_stream(shard.report_path).results
+    assert results[scene("first")]["runtime_success"]
+    assert results[scene("last")]["runtime_success"]
+    crashed = results[scene("boom")]
+    assert crashed["crashed"] and not crashed["load_success"]
+    assert crashed["errors"][0].startswith("Crashed shard 0 on attempt 1")
+
+
+def test_hung_shard_is_killed_and_its_scene_failed(tmp_path, godot):
+    scenes = [scene("first"), scene("hang"), scene("last")]
+    shard = run_scene_tests.Shard(0, scenes, str(tmp_path / "out"))
+    run([shard], godot, tmp_path, retries=0, idle_timeout=1.0)
+
+    assert shard.process.returncode is not None
+    assert shard.status == "hung"
+    results = run_scene_tests.merge_reports([shard], str(tmp_path / "out"), wall_time=1.0)
+    by_scene = {r["scene_path"]: r for r in results}
+    assert by_scene[scene("first")]["runtime_success"]
+    assert by_scene[scene("hang")]["crashed"]
+    assert by_scene[scene("hang")]["errors"][0].startswith("Hung shard 0 on attempt 1")
+    assert by_scene[scene("last")]["not_run"]
+
+
+def test_shard_reports_merge_into_one_json_and_csv(tmp_path, godot):
+    output = tmp_path / "out"
+    scenes = [scene(name) for name in ("a", "b", "boom", "c")]
+    shards = [run_scene_tests.Shard(i, s, str(output))
+              for i, s in enumerate(run_scene_tests.make_shards(scenes, 2))]
+    run(shards, godot, tmp_path)
+    run_scene_tests.merge_reports(shards, str(output), wall_time=2.0)
+
+    with open(output / scene_stream.REPORT_JSON, encoding="utf-8") as f:
+        report = json.load(f)
+    assert report["total_scenes"] == 4
+    assert [s["status"] for s in report["shards"]] == ["done", "done"]
+    shard_of = {r["scene_path"]: r["shard"] for r in report["test_results"]}
+    assert shard_of == {scene("a"): 0, scene("boom"): 0, scene("b"): 1, scene("c"): 1}
+    assert all("type" not in r for r in report["test_results"])
+
+    with open(output / scene_stream.SUMMARY_CSV, encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == scene_stream.CSV_HEADER
+    assert sorted(row[0] for row in rows[1:]) == ["a", "b", "boom", "c"]
+    assert {row[0]: row[3] for row in rows[1:]}["boom"] == "false"
+    assert os.path.exists(output / "shard_0" / "godot.log")
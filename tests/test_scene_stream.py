@@ -0,0 +1,100 @@
+"""Tests for reading, appending to and resuming tester result streams"""
+
+import json
+import shlex
+import sys
+
+import scene_stream
+
+# Appends a resumed run to the stream like the tester does with --resume
+STUB_GODOT = """import json
+import sys
+
+options = dict(arg.split("=", 1) for arg in sys.argv if arg.startswith("--") and "=" in arg)
+assert "--resume" in sys.argv
+with open(options["--scene-list"], encoding="utf-8") as f:
+    scenes = f.read().split()
+with open(options["--output-dir"] + "test_results.jsonl", "a", encoding="utf-8") as stream:
+    stream.write(json.dumps({"type": "run", "scenes": scenes}) + "\\n")
+    for scene in scenes:
+        stream.write(json.dumps({"type": "start", "scene_path": scene}) + "\\n")
+        stream.write(json.dumps({"type": "scene", "scene_path": scene, "load_success": True,
+                                 "runtime_success": True}) + "\\n")
+    stream.write(json.dumps({"type": "end"}) + "\\n")
+"""
+
+A = "res://algorithms/demo/a.tscn"
+B = "res://algorithms/demo/b.tscn"
+C = "res://algorithms/demo/c.tscn"
+
+
+def line(record):
+    return json.dumps(record) + "\n"
+
+
+def passed(scene):
+    return {"type": "scene", "scene_path": scene, "load_success": True, "runtime_success": True}
+
+
+def interrupted_stream(path):
+    """A run over A, B and C that died in B, halfway through a line"""
+    path.write_text(line({"type": "run", "scenes": [A, B, C]}) + line({"type": "start", "scene_path": A}) +
+                    line(passed(A)) + line({"type": "start", "scene_path": B}) + '{"type": "sce',
+                    encoding="utf-8")
+
+
+def test_half_written_line_is_read_once_it_is_finished(tmp_path):
+    stream = tmp_path / "test_results.jsonl"
+    stream.write_text(line({"type": "run", "scenes": [A]}) + '{"type": "scene", "scene_pa', encoding="utf-8")
+    reader = scene_stream.StreamReader(str(stream))
+    assert reader.poll() == []
+    assert reader.results == {}
+
+    with open(stream, "a", encoding="utf-8") as f:
+        f.write('th": "%s", "load_success": true}\n' % A)
+        f.write(line({"type": "end"}))
+    assert [r["scene_path"] for r in reader.poll()] == [A]
+    assert reader.finished
+    assert reader.bad_lines == 0
+
+
+def test_start_without_result_is_unfinished(tmp_path):
+    stream = tmp_path / "test_results.jsonl"
+    interrupted_stream(stream)
+    reader = scene_stream.read_stream(str(stream))
+    assert not reader.finished
+    assert list(reader.results) == [A]
+    assert reader.unfinished() == [B]
+    assert reader.remaining() == [C]
+
+
+def test_append_records_starts_a_fresh_line_after_a_crash(tmp_path):
+    stream = tmp_path / "test_results.jsonl"
+    interrupted_stream(stream)
+    scene_stream.append_records(str(stream), [scene_stream.failed_result(B, scene_stream.CRASH_ERROR, crashed=True)])
+
+    reader = scene_stream.read_stream(str(stream))
+    assert reader.bad_lines == 1
+    assert reader.unfinished() == []
+    assert reader.results[B]["crashed"]
+    assert reader.results[B]["errors"] == [scene_stream.CRASH_ERROR]
+    assert stream.read_text(encoding="utf-8").endswith("\n")
+
+
+def test_resume_records_the_crash_and_appends_a_new_run(tmp_path):
+    stream = tmp_path / "test_results.jsonl"
+    interrupted_stream(stream)
+    stub = tmp_path / "stub_godot.py"
+    stub.write_text(STUB_GODOT, encoding="utf-8")
+    godot = " ".join(shlex.quote(part) for part in (sys.executable, str(stub)))
+
+    code = scene_stream.main(["resume", str(stream), "--godot", godot, "--root", str(tmp_path)])
+
+    reader = scene_stream.read_stream(str(stream))
+    assert [run["scenes"] for run in reader.runs] == [[A, B, C], [C]]
+    assert reader.finished
+    assert reader.results[B]["crashed"]
+    assert reader.results[C]["runtime_success"]
+    assert (tmp_path / "resume_scenes.txt").read_text(encoding="utf-8").split() == [C]
+    # B stays failed, so the resumed stream still reports a failure
+    assert code == 1
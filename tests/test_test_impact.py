@@ -0,0 +1,79 @@
+"""Tests for mapping changed files to the scenes the test impact analysis selects"""
+
+import pytest
+
+from test_impact import ImpactAnalysis
+
+PROJECT = """config_version=5
+
+[autoload]
+
+Settings="*res://core/settings.gd"
+"""
+
+SPRITE_SCENE = """[gd_scene load_steps=3 format=3]
+
+[ext_resource type="Script" path="res://algorithms/sprites/sprite.gd" id="1_script"]
+[ext_resource type="Texture2D" path="res://assets/icon.png" id="2_icon"]
+
+[node name="Sprite" type="Node3D"]
+script = ExtResource("1_script")
+"""
+
+GRID_SCENE = """[gd_scene load_steps=2 format=3]
+
+[ext_resource type="Texture2D" path="res://assets/old_tiles.png" id="1_tiles"]
+
+[node name="Grid" type="Node3D"]
+"""
+
+SCENES = ["res://algorithms/grid/grid.tscn", "res://algorithms/sprites/sprite.tscn"]
+
+
+@pytest.fixture
+def project(tmp_path):
+    files = {
+        "project.godot": PROJECT,
+        "core/settings.gd": 'extends Node\nconst PALETTE = preload("res://core/palette.gd")\n',
+        "core/palette.gd": "extends RefCounted\n",
+        "Helpers/ColorHelper.gd": "extends RefCounted\n",
+        "Helpers/MathHelper.gd": "extends RefCounted\n",
+        "algorithms/sprites/sprite.gd": 'extends Node3D\nconst MathHelper = preload("res://Helpers/MathHelper.gd")\n',
+        "algorithms/sprites/sprite.tscn": SPRITE_SCENE,
+        "algorithms/grid/grid.tscn": GRID_SCENE,
+        "assets/icon.png": "",
+    }
+    for rel, text in files.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return ImpactAnalysis(SCENES, str(tmp_path))
+
+
+@pytest.mark.parametrize("changed", ["project.godot", "core/settings.gd", "core/palette.gd",
+                                     "tests/automated_scene_tester.gd"])
+def test_global_changes_run_everything(project, changed):
+    scenes, reason = project.affected([changed])
+    assert scenes == SCENES
+    assert reason.startswith(changed)
+
+
+def test_scene_dependency_selects_only_its_scenes(project):
+    assert project.affected(["algorithms/sprites/sprite.gd"]) == (["res://algorithms/sprites/sprite.tscn"], None)
+    assert project.affected(["Helpers/MathHelper.gd"]) == (["res://algorithms/sprites/sprite.tscn"], None)
+    assert project.affected(["README.md"]) == ([], None)
+
+
+def test_deleted_dependency_is_matched_through_missing(project):
+    assert project.affected(["assets/old_tiles.png"]) == (["res://algorithms/grid/grid.tscn"], None)
+
+
+@pytest.mark.parametrize("sidecar", ["assets/icon.png.import", "algorithms/sprites/sprite.gd.uid"])
+def test_sidecars_map_to_their_asset(project, sidecar):
+    assert project.affected([sidecar]) == (["res://algorithms/sprites/sprite.tscn"], None)
+
+
+def test_unreferenced_shared_script_runs_everything(project):
+    scenes, reason = project.affected(["Helpers/ColorHelper.gd"])
+    assert scenes == SCENES
+    assert reason == "Helpers/ColorHelper.gd is shared but no scene references it statically"